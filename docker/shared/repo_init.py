@@ -4,7 +4,8 @@ Features:
 - Optional repo bootstrap from agent config.
 - SSH/HTTPS remote support with auth preflight checks.
 - Concurrency-safe init via file lock for multi-agent startup.
-- Optional context indexing to `/workspace/context`.
+- Optional context indexing to `/workspace/context`, regenerated
+  incrementally from `git diff` when HEAD moves.
 """
 
 from __future__ import annotations
@@ -17,13 +18,14 @@ import re
 import subprocess
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Iterator
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, ValidationError, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,20 @@ DEFAULT_LOCK_TIMEOUT_S = 120.0
 CONTEXT_FILENAMES = ("structure.md", "patterns.md", "dependencies.md")
 _SSH_STRICT_ENV = "GIT_SSH_STRICT_HOST_KEY_CHECKING"
 
+# Directories never descended into when indexing (hidden dirs are skipped too).
+_IGNORED_DIRS = frozenset(
+    {".git", ".venv", "venv", "__pycache__", "node_modules", "dist", "build"}
+)
+_STRUCTURE_MAX_DEPTH = 3
+_STRUCTURE_MAX_LINES = 220
+_STRUCTURE_MAX_FILES_PER_DIR = 12
+_DEPENDENCY_MANIFESTS = (
+    "pyproject.toml",
+    "requirements.txt",
+    "package.json",
+    "go.mod",
+)
+
 
 class RepoConfig(BaseModel):
     """Repository initialization configuration.
@@ -81,6 +97,36 @@ class RepoConfig(BaseModel):
         return val or None
 
 
+class RepoFileStats(BaseModel):
+    """File statistics behind ``patterns.md``.
+
+    Persisted in the init metadata so a HEAD change can update the counts
+    from ``git diff`` instead of rescanning the whole tree.
+    """
+
+    total_files: int = 0
+    test_files: int = 0
+    ext_counts: dict[str, int] = Field(default_factory=dict)
+
+    def add(self, file_name: str) -> None:
+        self._apply(file_name, 1)
+
+    def remove(self, file_name: str) -> None:
+        self._apply(file_name, -1)
+
+    def _apply(self, file_name: str, delta: int) -> None:
+        self.total_files = max(0, self.total_files + delta)
+        ext = Path(file_name).suffix.lower() or "<no_ext>"
+        count = self.ext_counts.get(ext, 0) + delta
+        if count > 0:
+            self.ext_counts[ext] = count
+        else:
+            self.ext_counts.pop(ext, None)
+        lower_name = file_name.lower()
+        if lower_name.startswith("test_") or lower_name.endswith("_test.py"):
+            self.test_files = max(0, self.test_files + delta)
+
+
 class RepoInitMetadata(BaseModel):
     """Persisted repo initialization metadata."""
 
@@ -91,6 +137,7 @@ class RepoInitMetadata(BaseModel):
     index_enabled: bool
     indexed_at: str | None = None
     context_files: dict[str, str]
+    file_stats: RepoFileStats | None = None
 
 
 class RepoInitResult(BaseModel):
@@ -180,10 +227,12 @@ def initialize_repo(
 
         metadata = _read_metadata(meta_path)
         indexed = False
+        file_stats: RepoFileStats | None = None
         if repo.index and _should_reindex(repo, metadata, head_commit, context_dir):
-            _generate_context(repo_path, context_dir)
+            file_stats = _reindex(repo, repo_path, context_dir, metadata, head_commit)
             indexed = True
-            logger.info("Generated repository context files at %s", context_dir)
+        elif repo.index and metadata is not None:
+            file_stats = metadata.file_stats
 
         _write_metadata(
             meta_path,
@@ -199,6 +248,7 @@ def initialize_repo(
                     else None
                 ),
                 context_files=_hash_context_files(context_dir),
+                file_stats=file_stats,
             ),
         )
 
@@ -429,49 +479,188 @@ def _should_reindex(
     return False
 
 
-def _generate_context(repo_path: Path, context_dir: Path) -> None:
-    structure = _build_structure_doc(repo_path)
-    patterns = _build_patterns_doc(repo_path)
-    dependencies = _build_dependencies_doc(repo_path)
+def _reindex(
+    repo: RepoConfig,
+    repo_path: Path,
+    context_dir: Path,
+    metadata: RepoInitMetadata | None,
+    head_commit: str,
+) -> RepoFileStats:
+    """Refresh context docs, incrementally when the previous index is usable."""
+    if (
+        metadata is not None
+        and metadata.index_enabled
+        and metadata.file_stats is not None
+        and metadata.repo_url == (repo.url or "")
+        and metadata.repo_path == repo.path
+        and metadata.head_commit != head_commit
+        and all((context_dir / name).exists() for name in CONTEXT_FILENAMES)
+    ):
+        try:
+            changes = _diff_name_status(repo_path, metadata.head_commit, head_commit)
+        except ValueError as exc:
+            logger.info("Incremental reindex unavailable, rescanning: %s", exc)
+        else:
+            stats = _update_context(
+                repo_path, context_dir, metadata.file_stats, changes
+            )
+            logger.info(
+                "Updated repository context files at %s from %d changed paths",
+                context_dir,
+                len(changes),
+            )
+            return stats
+
+    stats = _generate_context(repo_path, context_dir)
+    logger.info("Generated repository context files at %s", context_dir)
+    return stats
+
+
+def _generate_context(repo_path: Path, context_dir: Path) -> RepoFileStats:
+    structure_lines, stats = _scan_repo(repo_path)
+
+    _write_text_atomic(
+        context_dir / "structure.md", _render_structure_doc(structure_lines)
+    )
+    _write_text_atomic(context_dir / "patterns.md", _render_patterns_doc(stats))
+    _write_text_atomic(
+        context_dir / "dependencies.md", _build_dependencies_doc(repo_path)
+    )
+    return stats
+
+
+def _update_context(
+    repo_path: Path,
+    context_dir: Path,
+    previous: RepoFileStats,
+    changes: list[tuple[str, list[str]]],
+) -> RepoFileStats:
+    """Apply ``git diff --name-status`` changes to the existing context docs."""
+    stats = previous.model_copy(deep=True)
+    tree_changed = False
+    manifests_changed = False
+
+    for status, paths in changes:
+        if any(path in _DEPENDENCY_MANIFESTS for path in paths):
+            manifests_changed = True
+        if status == "R":
+            removed, added = paths[:1], paths[1:]
+        elif status == "C":
+            removed, added = [], paths[1:]
+        elif status == "A":
+            removed, added = [], paths
+        elif status == "D":
+            removed, added = paths, []
+        else:
+            continue
+        for path in removed:
+            if _is_indexed_path(path):
+                stats.remove(Path(path).name)
+                tree_changed = True
+        for path in added:
+            if _is_indexed_path(path):
+                stats.add(Path(path).name)
+                tree_changed = True
+
+    if tree_changed:
+        # The structure snapshot is depth- and line-limited, so rebuilding it
+        # only visits the top of the tree.
+        structure_lines, _ = _scan_repo(repo_path, max_depth=_STRUCTURE_MAX_DEPTH)
+        _write_text_atomic(
+            context_dir / "structure.md", _render_structure_doc(structure_lines)
+        )
+        _write_text_atomic(context_dir / "patterns.md", _render_patterns_doc(stats))
+    if manifests_changed:
+        _write_text_atomic(
+            context_dir / "dependencies.md", _build_dependencies_doc(repo_path)
+        )
+    return stats
+
+
+def _diff_name_status(
+    repo_path: Path, old_commit: str, new_commit: str
+) -> list[tuple[str, list[str]]]:
+    """Return ``(status, paths)`` pairs for files changed between two commits.
+
+    ``status`` is the single-letter git status; renames and copies carry
+    ``[old_path, new_path]``.
+    """
+    output = _git(
+        repo_path, "diff", "--name-status", "-M", "-z", old_commit, new_commit
+    )
+    tokens = output.split("\0")
+    changes: list[tuple[str, list[str]]] = []
+    i = 0
+    while i < len(tokens) and tokens[i]:
+        status = tokens[i][0]
+        path_count = 2 if status in ("R", "C") else 1
+        changes.append((status, tokens[i + 1 : i + 1 + path_count]))
+        i += 1 + path_count
+    return changes
+
+
+def _is_indexed_path(rel_path: str) -> bool:
+    return not any(
+        part.startswith(".") or part in _IGNORED_DIRS for part in Path(rel_path).parts
+    )
 
-    _write_text_atomic(context_dir / "structure.md", structure)
-    _write_text_atomic(context_dir / "patterns.md", patterns)
-    _write_text_atomic(context_dir / "dependencies.md", dependencies)
 
+def _scan_repo(
+    repo_path: Path, *, max_depth: int | None = None
+) -> tuple[list[str], RepoFileStats]:
+    """Walk the repository once, collecting the structure listing and file stats.
 
-def _build_structure_doc(repo_path: Path) -> str:
-    ignored_dirs = {
-        ".git",
-        ".venv",
-        "venv",
-        "__pycache__",
-        "node_modules",
-        "dist",
-        "build",
-    }
+    Ignored and hidden directories are pruned before they are entered. When
+    ``max_depth`` is set, deeper directories are not visited and the walk
+    stops once the structure listing is full; the returned stats then only
+    cover the visited part of the tree.
+    """
     lines: list[str] = []
-    max_lines = 220
+    stats = RepoFileStats()
+    stack: list[tuple[str, str, int]] = [(str(repo_path), repo_path.name, 0)]
 
-    for root, dirs, files in os.walk(repo_path):
-        rel_root = Path(root).relative_to(repo_path)
-        depth = len(rel_root.parts)
-        if depth > 3:
-            dirs[:] = []
+    while stack:
+        dir_path, dir_name, depth = stack.pop()
+        subdirs: list[str] = []
+        files: list[str] = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _IGNORED_DIRS:
+                                subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
             continue
 
-        dirs[:] = [d for d in dirs if d not in ignored_dirs and not d.startswith(".")]
-        indent = "  " * depth
-        folder = rel_root.name if rel_root.parts else repo_path.name
-        lines.append(f"{indent}{folder}/")
+        for file_name in files:
+            stats.add(file_name)
 
-        visible_files = sorted([f for f in files if not f.startswith(".")])[:12]
-        for file_name in visible_files:
-            lines.append(f"{indent}  {file_name}")
+        if depth <= _STRUCTURE_MAX_DEPTH and len(lines) < _STRUCTURE_MAX_LINES:
+            indent = "  " * depth
+            lines.append(f"{indent}{dir_name}/")
+            for file_name in sorted(files)[:_STRUCTURE_MAX_FILES_PER_DIR]:
+                lines.append(f"{indent}  {file_name}")
 
-        if len(lines) >= max_lines:
-            break
+        if max_depth is not None:
+            if len(lines) >= _STRUCTURE_MAX_LINES:
+                break
+            if depth >= max_depth:
+                continue
+        for name in sorted(subdirs, reverse=True):
+            stack.append((os.path.join(dir_path, name), name, depth + 1))
 
-    tree_block = "\n".join(lines[:max_lines])
+    return lines[:_STRUCTURE_MAX_LINES], stats
+
+
+def _render_structure_doc(lines: list[str]) -> str:
+    tree_block = "\n".join(lines)
     return (
         "# Architecture Overview\n\n"
         "Repository structure (depth-limited snapshot):\n\n"
@@ -479,50 +668,23 @@ def _build_structure_doc(repo_path: Path) -> str:
     )
 
 
-def _build_patterns_doc(repo_path: Path) -> str:
-    ext_counts: Counter[str] = Counter()
-    test_files = 0
-    total_files = 0
-
-    for path in repo_path.rglob("*"):
-        if not path.is_file():
-            continue
-        if any(part.startswith(".") for part in path.parts):
-            continue
-        if any(
-            part in {"node_modules", ".venv", "venv", "__pycache__"}
-            for part in path.parts
-        ):
-            continue
-        total_files += 1
-        ext = path.suffix.lower() or "<no_ext>"
-        ext_counts[ext] += 1
-        lower_name = path.name.lower()
-        if lower_name.startswith("test_") or lower_name.endswith("_test.py"):
-            test_files += 1
-
-    top_exts = ext_counts.most_common(8)
+def _render_patterns_doc(stats: RepoFileStats) -> str:
+    top_exts = Counter(stats.ext_counts).most_common(8)
     ext_lines = "\n".join(f"- `{ext}`: {count} files" for ext, count in top_exts)
     return (
         "# Coding Patterns & Conventions\n\n"
         "Static repository signals:\n\n"
-        f"- Total files scanned: {total_files}\n"
-        f"- Test-like files: {test_files}\n\n"
+        f"- Total files scanned: {stats.total_files}\n"
+        f"- Test-like files: {stats.test_files}\n\n"
         "Most common file types:\n\n"
         f"{ext_lines}\n"
     )
 
 
 def _build_dependencies_doc(repo_path: Path) -> str:
-    manifests = [
-        "pyproject.toml",
-        "requirements.txt",
-        "package.json",
-        "go.mod",
-    ]
     sections: list[str] = ["# Dependencies\n"]
 
-    for name in manifests:
+    for name in _DEPENDENCY_MANIFESTS:
         path = repo_path / name
         if not path.exists():
             continue
@@ -537,13 +699,16 @@ def _build_dependencies_doc(repo_path: Path) -> str:
 
 
 def _hash_context_files(context_dir: Path) -> dict[str, str]:
-    hashes: dict[str, str] = {}
-    for name in CONTEXT_FILENAMES:
-        path = context_dir / name
-        if not path.exists():
-            continue
-        hashes[name] = _sha256(path)
-    return hashes
+    paths = [
+        (name, context_dir / name)
+        for name in CONTEXT_FILENAMES
+        if (context_dir / name).exists()
+    ]
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        digests = pool.map(_sha256, [path for _, path in paths])
+        return {name: digest for (name, _), digest in zip(paths, digests)}
 
 
 def _sha256(path: Path) -> str:
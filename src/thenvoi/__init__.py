@@ -5,6 +5,10 @@ Platform Layer:
     ThenvoiLink: WebSocket + REST transport
     PlatformEvent: Typed events from the platform
 
+Composition:
+    Agent: Runtime + preprocessor + adapter for one agent identity
+    AgentHost: Many Agents in one process over a shared HTTP pool
+
 Runtime Layer:
     AgentRuntime: Convenience wrapper (RoomPresence + Execution)
     RoomPresence: Cross-room lifecycle management
@@ -44,6 +48,7 @@ from importlib.metadata import version as _get_version, PackageNotFoundError
 
 # Composition layer (new pattern)
 from .agent import Agent
+from .host import AgentHost, AgentMetrics
 
 # Core types (v0.3.0)
 from .core.types import AdapterFeatures, Capability, Emit
@@ -93,6 +98,8 @@ from .runtime import (
 __all__ = [
     # Composition
     "Agent",
+    "AgentHost",
+    "AgentMetrics",
     # Core types (v0.3.0)
     "AdapterFeatures",
     "Capability",
@@ -6,15 +6,25 @@ Extracted from thenvoi.integrations.anthropic.agent.ThenvoiAnthropicAgent.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import warnings
+from dataclasses import dataclass
 from typing import Any, ClassVar, cast
 
 from anthropic import AsyncAnthropic
-from anthropic.types import Message, MessageParam, ToolParam, ToolUseBlock
+from anthropic.types import (
+    Message,
+    MessageParam,
+    TextBlock,
+    ThinkingBlock,
+    ToolParam,
+    ToolUseBlock,
+)
 
 from thenvoi.core.exceptions import ThenvoiConfigError
+from thenvoi.core.history_store import HistoryStore
 from thenvoi.core.protocols import AgentToolsProtocol
 from thenvoi.core.simple_adapter import SimpleAdapter
 from thenvoi.core.types import (
@@ -26,6 +36,7 @@ from thenvoi.core.types import (
 from thenvoi.converters.anthropic import AnthropicHistoryConverter, AnthropicMessages
 from thenvoi.runtime.custom_tools import (
     CustomToolDef,
+    build_custom_tool_index,
     custom_tools_to_schemas,
     execute_custom_tool,
     find_custom_tool,
@@ -34,6 +45,46 @@ from thenvoi.runtime.prompts import render_system_prompt
 
 logger = logging.getLogger(__name__)
 
+_EPHEMERAL_CACHE: dict[str, str] = {"type": "ephemeral"}
+
+
+class _StreamInterrupted(Exception):
+    """A streamed response failed after some of its tool calls had run."""
+
+    def __init__(
+        self,
+        error: Exception,
+        tool_uses: list[ToolUseBlock],
+        tool_results: list[dict[str, Any]],
+    ) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.tool_uses = tool_uses
+        self.tool_results = tool_results
+
+
+@dataclass
+class TokenUsage:
+    """Cumulative token usage reported by the Anthropic API."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    def record(self, usage: Any) -> None:
+        """Add one response's ``usage`` block to the totals."""
+        self.requests += 1
+        self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+        self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+        self.cache_creation_input_tokens += (
+            getattr(usage, "cache_creation_input_tokens", 0) or 0
+        )
+        self.cache_read_input_tokens += (
+            getattr(usage, "cache_read_input_tokens", 0) or 0
+        )
+
 
 class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
     """
@@ -53,9 +104,32 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         )
         agent = Agent.create(adapter=adapter, agent_id="...", api_key="...")
         await agent.run()
+
+    Set ``prompt_caching=True`` to mark the system prompt, the tool block
+    and the conversation so far with ``cache_control`` breakpoints. Each
+    tool-loop iteration then re-reads the previous request's prefix from
+    Anthropic's prompt cache instead of reprocessing it. Cache reads and
+    writes are accumulated in ``token_usage``.
+
+    Set ``streaming=True`` to use the streaming Messages API. Each
+    ``tool_use`` block starts executing as soon as its input is complete,
+    while the rest of the response is still being generated. If the stream
+    then fails, the tool calls that already ran are kept in the room's
+    history with their results, so retrying the message does not repeat
+    them.
+
+    With ``Emit.THOUGHTS`` enabled, thinking and text blocks are relayed as
+    ``thought`` events: as each block finishes when streaming, and after
+    each response otherwise.
+
+    Pass ``history_store=SQLiteHistoryStore(path)`` to persist each room's
+    history. After a restart a room resumes from it and fetches only the
+    messages newer than its last processed one.
     """
 
-    SUPPORTED_EMIT: ClassVar[frozenset[Emit]] = frozenset({Emit.EXECUTION})
+    SUPPORTED_EMIT: ClassVar[frozenset[Emit]] = frozenset(
+        {Emit.EXECUTION, Emit.THOUGHTS}
+    )
     SUPPORTED_CAPABILITIES: ClassVar[frozenset[Capability]] = frozenset(
         {Capability.MEMORY, Capability.CONTACTS}
     )
@@ -71,6 +145,9 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         additional_tools: list[CustomToolDef] | None = None,
         features: AdapterFeatures | None = None,
         include_base_instructions: bool = True,
+        prompt_caching: bool = False,
+        streaming: bool = False,
+        history_store: HistoryStore | None = None,
         # --- Deprecated (one release, then remove) ---
         anthropic_api_key: str | None = None,
         custom_section: str | None = None,
@@ -125,6 +202,7 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         super().__init__(
             history_converter=history_converter or AnthropicHistoryConverter(),
             features=features,
+            history_store=history_store,
         )
 
         self.model = model
@@ -132,6 +210,9 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         self._prompt = prompt
         self._include_base_instructions = include_base_instructions
         self.max_tokens = max_tokens
+        self.prompt_caching = prompt_caching
+        self.streaming = streaming
+        self.token_usage = TokenUsage()
 
         # Anthropic client (uses ANTHROPIC_API_KEY env var if not provided)
         self.client = AsyncAnthropic(api_key=api_key)
@@ -142,6 +223,15 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         self._system_prompt: str = ""
         # Custom tools (user-provided)
         self._custom_tools: list[CustomToolDef] = additional_tools or []
+        self._custom_tool_index = build_custom_tool_index(self._custom_tools)
+        # Custom tool schemas are static; build them once so every request
+        # carries the same objects.
+        self._custom_tool_schemas: list[ToolParam] = cast(
+            list[ToolParam],
+            custom_tools_to_schemas(self._custom_tools, "anthropic")
+            if self._custom_tools
+            else [],
+        )
 
     # --- Copied from ThenvoiAnthropicAgent._on_started ---
     async def on_started(self, agent_name: str, agent_description: str) -> None:
@@ -247,30 +337,75 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         # Get tool schemas in Anthropic format (typed helper)
         include_memory = Capability.MEMORY in self.features.capabilities
         include_contacts = Capability.CONTACTS in self.features.capabilities
-        tool_schemas = tools.get_anthropic_tool_schemas(
-            include_memory=include_memory,
-            include_contacts=include_contacts,
-        )
+        # Shared cached schemas keep the tool block byte-stable for prompt
+        # caching. Never modified here: cache breakpoints go on copies.
+        # Tools implementations written before get_shared_tool_schemas()
+        # existed get fresh copies instead.
+        if hasattr(tools, "get_shared_tool_schemas"):
+            tool_schemas = cast(
+                list[ToolParam],
+                tools.get_shared_tool_schemas(
+                    "anthropic",
+                    include_memory=include_memory,
+                    include_contacts=include_contacts,
+                ),
+            )
+        else:
+            tool_schemas = tools.get_anthropic_tool_schemas(
+                include_memory=include_memory,
+                include_contacts=include_contacts,
+            )
         # Merge custom tool schemas
-        if self._custom_tools:
-            tool_schemas = list(tool_schemas)  # Make mutable copy
-            custom_schemas = custom_tools_to_schemas(self._custom_tools, "anthropic")
-            tool_schemas.extend(cast(list[ToolParam], custom_schemas))
+        if self._custom_tool_schemas:
+            tool_schemas = [*tool_schemas, *self._custom_tool_schemas]
 
         # Tool loop - let LLM decide when to stop
         while True:
+            # Streaming runs tools while the response is still generating and
+            # returns their results; otherwise they run after the response.
+            tool_results: list[dict[str, Any]] | None = None
             try:
-                response = await self._call_anthropic(
-                    messages=self._message_history[room_id],
-                    tools=tool_schemas,
+                if self.streaming:
+                    response, tool_results = await self._stream_anthropic(
+                        messages=self._message_history[room_id],
+                        tools=tool_schemas,
+                        agent_tools=tools,
+                    )
+                else:
+                    response = await self._call_anthropic(
+                        messages=self._message_history[room_id],
+                        tools=tool_schemas,
+                    )
+                    for block in response.content:
+                        await self._relay_block(tools, block)
+            except _StreamInterrupted as e:
+                # Tools that already ran (messages sent, participants added)
+                # stay in history with their results so the retry of this
+                # message does not run them again.
+                self._message_history[room_id].append(
+                    {
+                        "role": "assistant",
+                        "content": self._serialize_content_blocks(e.tool_uses),
+                    }
+                )
+                self._message_history[room_id].append(
+                    {"role": "user", "content": e.tool_results}
                 )
+                logger.error(
+                    "Error streaming from Anthropic after %s tool call(s): %s",
+                    len(e.tool_uses),
+                    e.error,
+                    exc_info=e.error,
+                )
+                await self._report_error(tools, str(e.error))
+                raise e.error from None  # Message is marked as failed
             except Exception as e:
                 logger.error("Error calling Anthropic: %s", e, exc_info=True)
                 await self._report_error(tools, str(e))
                 raise  # Re-raise so message is marked as failed
 
-            # Check for tool use
-            if response.stop_reason != "tool_use":
+            # Check for tool use (tools that already ran must see their results)
+            if response.stop_reason != "tool_use" and not tool_results:
                 # No more tool calls - extract text content if any
                 text_content = self._extract_text_content(response.content)
                 if text_content:
@@ -297,7 +432,8 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
             )
 
             # Process tool calls
-            tool_results = await self._process_tool_calls(response, tools)
+            if tool_results is None:
+                tool_results = await self._process_tool_calls(response, tools)
 
             # Add tool results to history
             self._message_history[room_id].append(
@@ -320,6 +456,11 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
             del self._message_history[room_id]
             logger.debug("Room %s: Cleaned up message history", room_id)
 
+    def dump_history(self, room_id: str) -> list[dict[str, Any]] | None:
+        """Message history is already plain dicts; persist a copy."""
+        history = self._message_history.get(room_id)
+        return list(history) if history is not None else None
+
     # --- Copied from ThenvoiAnthropicAgent._call_anthropic ---
     async def _call_anthropic(
         self,
@@ -336,19 +477,136 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         Returns:
             Anthropic Message response
         """
-        return await self.client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            system=self._system_prompt,
-            messages=cast(list[MessageParam], messages),
-            tools=tools,
+        response = await self.client.messages.create(
+            **self._request_params(messages, tools)
         )
+        self._record_usage(response)
+        return response
+
+    async def _stream_anthropic(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[ToolParam],
+        agent_tools: AgentToolsProtocol,
+    ) -> tuple[Message, list[dict[str, Any]]]:
+        """
+        Stream an Anthropic response, executing tools as their blocks complete.
+
+        Tool calls run one at a time in response order, overlapping with
+        generation of the blocks that follow them. If the stream fails after
+        tool calls were received, those calls are finished and
+        _StreamInterrupted carries them with their results.
+
+        Args:
+            messages: Conversation history
+            tools: Tool schemas in Anthropic format
+            agent_tools: AgentToolsProtocol instance for execution
+
+        Returns:
+            The final Message and the tool_result blocks for its tool calls
+        """
+        pending: asyncio.Queue[ToolUseBlock | None] = asyncio.Queue()
+        tool_uses: list[ToolUseBlock] = []
+        tool_results: list[dict[str, Any]] = []
+
+        async def run_tools() -> None:
+            while (block := await pending.get()) is not None:
+                tool_results.append(await self._execute_tool_use(block, agent_tools))
+
+        runner = asyncio.create_task(run_tools())
+        try:
+            try:
+                async with self.client.messages.stream(
+                    **self._request_params(messages, tools)
+                ) as stream:
+                    async for event in stream:
+                        if event.type != "content_block_stop":
+                            continue
+                        block = event.content_block
+                        if isinstance(block, ToolUseBlock):
+                            tool_uses.append(block)
+                            pending.put_nowait(block)
+                        else:
+                            await self._relay_block(agent_tools, block)
+                    response = await stream.get_final_message()
+            except Exception as e:
+                # Finish the calls already received rather than abandoning
+                # them mid-way; the caller keeps them so they are not repeated.
+                pending.put_nowait(None)
+                await runner
+                if not tool_uses:
+                    raise
+                raise _StreamInterrupted(e, tool_uses, tool_results) from e
+            pending.put_nowait(None)
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
+                try:
+                    await runner
+                except asyncio.CancelledError:
+                    pass
+
+        self._record_usage(response)
+        return response, tool_results
+
+    def _request_params(
+        self, messages: list[dict[str, Any]], tools: list[ToolParam]
+    ) -> dict[str, Any]:
+        """Build Messages API parameters, adding cache breakpoints if enabled."""
+        if self.prompt_caching:
+            system: Any = [
+                {
+                    "type": "text",
+                    "text": self._system_prompt,
+                    "cache_control": _EPHEMERAL_CACHE,
+                }
+            ]
+            tools = _with_cache_breakpoint_on_last_tool(tools)
+            messages = _with_cache_breakpoint_on_last_message(messages)
+        else:
+            system = self._system_prompt
+
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "system": system,
+            "messages": cast(list[MessageParam], messages),
+            "tools": tools,
+        }
+
+    def _record_usage(self, response: Message) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        self.token_usage.record(usage)
+        logger.debug(
+            "Anthropic usage: input=%s output=%s cache_write=%s cache_read=%s",
+            getattr(usage, "input_tokens", None),
+            getattr(usage, "output_tokens", None),
+            getattr(usage, "cache_creation_input_tokens", None),
+            getattr(usage, "cache_read_input_tokens", None),
+        )
+
+    async def _relay_block(self, tools: AgentToolsProtocol, block: Any) -> None:
+        """Relay a completed thinking or text block as a thought event."""
+        if isinstance(block, ThinkingBlock):
+            await self._relay_thought(tools, block.thinking)
+        elif isinstance(block, TextBlock):
+            await self._relay_thought(tools, block.text)
+
+    async def _relay_thought(self, tools: AgentToolsProtocol, text: str) -> None:
+        """Send a thought event if enabled (best effort)."""
+        if not text or Emit.THOUGHTS not in self.features.emit:
+            return
+        try:
+            await tools.send_event(content=text, message_type="thought")
+        except Exception as e:
+            logger.warning("Failed to send thought event: %s", e)
 
     # --- Copied from ThenvoiAnthropicAgent._extract_text_content ---
     def _extract_text_content(self, content: list) -> str:
         """Extract text content from response content blocks."""
-        from anthropic.types import TextBlock
-
         texts = []
         for block in content:
             if isinstance(block, TextBlock) and block.text:
@@ -358,8 +616,6 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
     # --- Copied from ThenvoiAnthropicAgent._serialize_content_blocks ---
     def _serialize_content_blocks(self, content: list) -> list[dict[str, Any]]:
         """Serialize content blocks to dict format for message history."""
-        from anthropic.types import TextBlock
-
         serialized = []
         for block in content:
             if isinstance(block, ToolUseBlock):
@@ -400,81 +656,84 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
         for block in response.content:
             if not isinstance(block, ToolUseBlock):
                 continue
+            tool_results.append(await self._execute_tool_use(block, tools))
 
-            tool_name = block.name
-            tool_input = block.input
-            tool_use_id = block.id
+        return tool_results
 
-            logger.debug("Executing tool: %s with input: %s", tool_name, tool_input)
+    async def _execute_tool_use(
+        self, block: ToolUseBlock, tools: AgentToolsProtocol
+    ) -> dict[str, Any]:
+        """Execute one tool_use block and return its tool_result block."""
+        tool_name = block.name
+        tool_input = block.input
+        tool_use_id = block.id
 
-            # Report tool call if enabled (JSON format with tool_call_id for linking)
-            # Best-effort: event reporting must never crash tool execution
-            if Emit.EXECUTION in self.features.emit:
-                try:
-                    await tools.send_event(
-                        content=json.dumps(
-                            {
-                                "name": tool_name,
-                                "args": tool_input,
-                                "tool_call_id": tool_use_id,
-                            }
-                        ),
-                        message_type="tool_call",
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to send tool_call event: %s",
-                        e,
-                    )
+        logger.debug("Executing tool: %s with input: %s", tool_name, tool_input)
 
-            # Execute tool (check custom tools first, then platform tools)
+        # Report tool call if enabled (JSON format with tool_call_id for linking)
+        # Best-effort: event reporting must never crash tool execution
+        if Emit.EXECUTION in self.features.emit:
             try:
-                custom_tool = find_custom_tool(self._custom_tools, tool_name)
-                if custom_tool:
-                    result = await execute_custom_tool(custom_tool, tool_input)
-                else:
-                    result = await tools.execute_tool_call(tool_name, tool_input)
-                result_str = (
-                    json.dumps(result, default=str)
-                    if not isinstance(result, str)
-                    else result
+                await tools.send_event(
+                    content=json.dumps(
+                        {
+                            "name": tool_name,
+                            "args": tool_input,
+                            "tool_call_id": tool_use_id,
+                        }
+                    ),
+                    message_type="tool_call",
                 )
-                is_error = False
             except Exception as e:
-                result_str = f"Error: {e}"
-                is_error = True
-                logger.error("Tool %s failed: %s", tool_name, e)
-
-            # Report tool result if enabled (JSON format with tool_call_id for linking)
-            # Best-effort: event reporting must never crash tool execution
-            if Emit.EXECUTION in self.features.emit:
-                try:
-                    await tools.send_event(
-                        content=json.dumps(
-                            {
-                                "name": tool_name,
-                                "output": result_str,
-                                "tool_call_id": tool_use_id,
-                            }
-                        ),
-                        message_type="tool_result",
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to send tool_result event: %s",
-                        e,
-                    )
+                logger.warning(
+                    "Failed to send tool_call event: %s",
+                    e,
+                )
 
-            tool_results.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": tool_use_id,
-                    "content": result_str,
-                    "is_error": is_error,
-                }
+        # Execute tool (check custom tools first, then platform tools)
+        try:
+            custom_tool = find_custom_tool(self._custom_tool_index, tool_name)
+            if custom_tool:
+                result = await execute_custom_tool(custom_tool, tool_input)
+            else:
+                result = await tools.execute_tool_call(tool_name, tool_input)
+            result_str = (
+                json.dumps(result, default=str)
+                if not isinstance(result, str)
+                else result
             )
+            is_error = False
+        except Exception as e:
+            result_str = f"Error: {e}"
+            is_error = True
+            logger.error("Tool %s failed: %s", tool_name, e)
 
-        return tool_results
+        # Report tool result if enabled (JSON format with tool_call_id for linking)
+        # Best-effort: event reporting must never crash tool execution
+        if Emit.EXECUTION in self.features.emit:
+            try:
+                await tools.send_event(
+                    content=json.dumps(
+                        {
+                            "name": tool_name,
+                            "output": result_str,
+                            "tool_call_id": tool_use_id,
+                        }
+                    ),
+                    message_type="tool_result",
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to send tool_result event: %s",
+                    e,
+                )
+
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_use_id,
+            "content": result_str,
+            "is_error": is_error,
+        }
 
     # --- Copied from BaseFrameworkAgent._report_error ---
     async def _report_error(self, tools: AgentToolsProtocol, error: str) -> None:
@@ -483,3 +742,37 @@ class AnthropicAdapter(SimpleAdapter[AnthropicMessages]):
             await tools.send_event(content=f"Error: {error}", message_type="error")
         except Exception as e:
             logger.warning("Failed to send error event: %s", e)
+
+
+def _with_cache_breakpoint_on_last_tool(tools: list[ToolParam]) -> list[ToolParam]:
+    """Copy ``tools`` with a cache breakpoint on the last schema.
+
+    The shared schema objects themselves are never modified.
+    """
+    if not tools:
+        return tools
+    last = cast(ToolParam, {**tools[-1], "cache_control": _EPHEMERAL_CACHE})
+    return [*tools[:-1], last]
+
+
+def _with_cache_breakpoint_on_last_message(
+    messages: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Copy ``messages`` with a cache breakpoint on the final content block.
+
+    Moving the breakpoint to the end of every request makes the whole
+    conversation so far a cache prefix for the next tool-loop iteration.
+    The room history itself is left untouched.
+    """
+    if not messages:
+        return messages
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str) and content:
+        blocks: list[Any] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = list(content)
+    else:
+        return messages
+    blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL_CACHE}
+    return [*messages[:-1], {**last, "content": blocks}]
@@ -15,6 +15,7 @@ import json
 import logging
 import re
 import warnings
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -59,7 +60,10 @@ from thenvoi.integrations.mcp.backends import (
     ThenvoiMCPBackend,
     create_thenvoi_mcp_backend,
 )
-from thenvoi.integrations.claude_sdk.session_manager import ClaudeSessionManager
+from thenvoi.integrations.claude_sdk.session_manager import (
+    DEFAULT_MAX_CONCURRENT_CONNECTS,
+    ClaudeSessionManager,
+)
 from thenvoi.integrations.claude_sdk.prompts import generate_claude_sdk_agent_prompt
 from thenvoi.runtime.custom_tools import CustomToolDef
 from thenvoi.runtime.tools import (
@@ -189,6 +193,11 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
         max_pending_approvals_per_room: int = 50,
         approval_authorized_senders: set[str] | None = None,
         features: AdapterFeatures | None = None,
+        # Session pool tuning
+        max_concurrent_connects: int = DEFAULT_MAX_CONCURRENT_CONNECTS,
+        max_sessions: int | None = None,
+        session_idle_timeout_s: float | None = None,
+        prewarm_rooms: Iterable[str] | None = None,
     ):
         """
         Initialize the Claude SDK adapter.
@@ -230,6 +239,17 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
             features: Unified adapter feature settings. When provided alongside
                 deprecated ``enable_execution_reporting`` or ``enable_memory_tools``,
                 raises ``ThenvoiConfigError``.
+            max_concurrent_connects: Maximum number of Claude Code CLI
+                subprocesses being spawned at once across all rooms.
+            max_sessions: Optional cap on live room sessions; the least
+                recently used room is disconnected when exceeded.
+            session_idle_timeout_s: Optional idle time after which a room's
+                session is disconnected, counted from the end of its last
+                turn.  It reconnects (resuming the session) on the next
+                message.
+            prewarm_rooms: Optional room IDs expected to be busy soon.  Their
+                sessions are spawned in the background after start (see
+                ``prewarm()``).
         """
         if not _CLAUDE_SDK_AVAILABLE:
             raise ImportError(
@@ -296,6 +316,13 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
         self.max_pending_approvals_per_room = max_pending_approvals_per_room
         self.approval_authorized_senders: set[str] | None = approval_authorized_senders
 
+        # Session pool config
+        self._max_concurrent_connects = max_concurrent_connects
+        self._max_sessions = max_sessions
+        self._session_idle_timeout_s = session_idle_timeout_s
+        self._prewarm_rooms = list(prewarm_rooms or [])
+        self._prewarm_task: asyncio.Task[None] | None = None
+
         # Session manager and MCP server (created after start)
         self._session_manager: ClaudeSessionManager | None = None
         self._mcp_server = None
@@ -373,7 +400,12 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
         self._session_manager = ClaudeSessionManager(
             sdk_options,
             can_use_tool_factory=can_use_tool_factory,
+            max_concurrent_connects=self._max_concurrent_connects,
+            max_sessions=self._max_sessions,
+            idle_timeout_s=self._session_idle_timeout_s,
         )
+        if self._prewarm_rooms:
+            self._prewarm_task = asyncio.create_task(self.prewarm(self._prewarm_rooms))
 
         logger.info(
             "Claude SDK adapter started for agent: %s (model=%s, thinking=%s, approval=%s)",
@@ -383,6 +415,24 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
             self.approval_mode,
         )
 
+    async def prewarm(self, room_ids: Iterable[str]) -> None:
+        """
+        Spawn Claude SDK sessions for rooms expected to receive messages soon.
+
+        The first message in a prewarmed room skips CLI start-up.  Prewarmed
+        sessions start fresh: a session ID saved in the room's history is
+        not resumed, though the history text is still sent on bootstrap.
+        Failures are logged and the room connects on its first message.
+
+        Args:
+            room_ids: Thenvoi chat room IDs to warm up
+        """
+        if not self._session_manager:
+            raise RuntimeError(
+                "ClaudeSDKAdapter session manager not initialized — was on_started() called?"
+            )
+        await self._session_manager.prewarm(room_ids)
+
     async def _create_mcp_backend(self) -> ThenvoiMCPBackend:
         """Create shared MCP backend that uses stored room tools."""
         include_memory = Capability.MEMORY in self.features.capabilities
@@ -465,108 +515,114 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
                     )
                     return
 
-        # Determine session_id for resume: prefer history (persisted) then
-        # in-memory cache.  Only used on bootstrap/reconnect.
-        stored_session_id: str | None = None
-        if is_session_bootstrap:
-            stored_session_id = history.session_id or self._session_ids.get(room_id)
-
-        # Get or create Claude SDK client for this room (optionally resuming)
-        try:
-            client = await self._session_manager.get_or_create_session(
-                room_id, resume_session_id=stored_session_id
-            )
-        except Exception as resume_exc:
-            if stored_session_id:
-                logger.warning(
-                    "Room %s: Session resume failed (session_id=%s): %s. "
-                    "Creating new session",
-                    room_id,
-                    stored_session_id,
-                    resume_exc,
-                )
+        # Keep the session from being evicted (LRU or idle) until the
+        # response has been fully streamed
+        with self._session_manager.turn(room_id):
+            # Determine session_id for resume: prefer history (persisted) then
+            # in-memory cache.  Only used on bootstrap/reconnect, including
+            # after the session manager evicted an idle or LRU session.
+            stored_session_id: str | None = None
+            if is_session_bootstrap:
+                stored_session_id = history.session_id or self._session_ids.get(room_id)
+            elif not self._session_manager.has_session(room_id):
+                stored_session_id = self._session_ids.get(room_id)
+
+            # Get or create Claude SDK client for this room (optionally resuming)
+            try:
                 client = await self._session_manager.get_or_create_session(
-                    room_id, resume_session_id=None
+                    room_id, resume_session_id=stored_session_id
                 )
-            else:
-                raise
-
-        # Add room_id context (Claude needs this for tool calls)
-        room_context = f"[room_id: {room_id}]"
-
-        # Initialize history for this room on first message
-        if is_session_bootstrap:
-            if history.text:  # Already converted to text by SimpleAdapter
-                self._session_context[room_id] = history.text
-                logger.info(
-                    "Room %s: Loaded historical context (%s chars)",
-                    room_id,
-                    len(history.text),
-                )
-            else:
+            except Exception as resume_exc:
+                if stored_session_id:
+                    logger.warning(
+                        "Room %s: Session resume failed (session_id=%s): %s. "
+                        "Creating new session",
+                        room_id,
+                        stored_session_id,
+                        resume_exc,
+                    )
+                    client = await self._session_manager.get_or_create_session(
+                        room_id, resume_session_id=None
+                    )
+                else:
+                    raise
+
+            # Add room_id context (Claude needs this for tool calls)
+            room_context = f"[room_id: {room_id}]"
+
+            # Initialize history for this room on first message
+            if is_session_bootstrap:
+                if history.text:  # Already converted to text by SimpleAdapter
+                    self._session_context[room_id] = history.text
+                    logger.info(
+                        "Room %s: Loaded historical context (%s chars)",
+                        room_id,
+                        len(history.text),
+                    )
+                else:
+                    self._session_context[room_id] = ""
+            elif room_id not in self._session_context:
+                # Safety: ensure context exists even if not first message
                 self._session_context[room_id] = ""
-        elif room_id not in self._session_context:
-            # Safety: ensure context exists even if not first message
-            self._session_context[room_id] = ""
 
-        # Build message with context
-        messages_to_send = []
+            # Build message with context
+            messages_to_send = []
 
-        # Include historical context on first message
-        if is_session_bootstrap and self._session_context.get(room_id):
-            messages_to_send.append(
-                f"[Previous conversation context:]\n{self._session_context[room_id]}"
-            )
+            # Include historical context on first message
+            if is_session_bootstrap and self._session_context.get(room_id):
+                messages_to_send.append(
+                    f"[Previous conversation context:]\n{self._session_context[room_id]}"
+                )
 
-        # Inject participants message if changed
-        if participants_msg:
-            messages_to_send.append(f"{room_context}[System]: {participants_msg}")
-            logger.info("Room %s: Participants updated", room_id)
+            # Inject participants message if changed
+            if participants_msg:
+                messages_to_send.append(f"{room_context}[System]: {participants_msg}")
+                logger.info("Room %s: Participants updated", room_id)
 
-        # Inject contacts message if present
-        if contacts_msg:
-            messages_to_send.append(f"{room_context}[System]: {contacts_msg}")
-            logger.info("Room %s: Contacts broadcast received", room_id)
+            # Inject contacts message if present
+            if contacts_msg:
+                messages_to_send.append(f"{room_context}[System]: {contacts_msg}")
+                logger.info("Room %s: Contacts broadcast received", room_id)
 
-        # Add current message with room_id context
-        user_message = f"{room_context}{msg.format_for_llm()}"
-        messages_to_send.append(user_message)
+            # Add current message with room_id context
+            user_message = f"{room_context}{msg.format_for_llm()}"
+            messages_to_send.append(user_message)
 
-        # Send combined message to Claude
-        full_message = "\n\n".join(messages_to_send)
+            # Send combined message to Claude
+            full_message = "\n\n".join(messages_to_send)
 
-        logger.info(
-            "Room %s: Sending query to Claude SDK (first_msg=%s, parts=%s)",
-            room_id,
-            is_session_bootstrap,
-            len(messages_to_send),
-        )
+            logger.info(
+                "Room %s: Sending query to Claude SDK (first_msg=%s, parts=%s)",
+                room_id,
+                is_session_bootstrap,
+                len(messages_to_send),
+            )
 
-        try:
-            # Send query to Claude
-            await client.query(full_message)
+            try:
+                # Send query to Claude
+                await client.query(full_message)
 
-            # Process streaming response (MCP tools handle execution)
-            await self._process_response(client, room_id, tools)
+                # Process streaming response (MCP tools handle execution)
+                await self._process_response(client, room_id, tools)
 
-        except CLIConnectionError as e:
-            # CLI process is dead — evict the cached session so the next
-            # message creates a fresh one instead of reusing the corpse.
-            logger.error(
-                "Room %s: CLI process terminated: %s — invalidating session",
-                room_id,
-                e,
-            )
-            await self._session_manager.invalidate_session(room_id)
-            self._session_ids.pop(room_id, None)
+            except CLIConnectionError as e:
+                # CLI process is dead — evict the cached session so the next
+                # message creates a fresh one instead of reusing the corpse.
+                logger.error(
+                    "Room %s: CLI process terminated: %s — invalidating session",
+                    room_id,
+                    e,
+                )
+                await self._session_manager.invalidate_session(room_id)
+                self._session_ids.pop(room_id, None)
 
-            await self._report_error(tools, str(e))
-            raise
+                await self._report_error(tools, str(e))
+                raise
 
-        except Exception as e:
-            logger.exception("Error processing message: %s", e)
-            await self._report_error(tools, str(e))
-            raise
+            except Exception as e:
+                logger.exception("Error processing message: %s", e)
+                await self._report_error(tools, str(e))
+                raise
 
         logger.debug("Message %s processed successfully", msg.id)
 
@@ -711,6 +767,10 @@ class ClaudeSDKAdapter(SimpleAdapter[ClaudeSDKSessionState]):
         # Decline all pending approvals across rooms
         for room_id in list(self._pending_approvals):
             self._clear_pending_approvals_for_room(room_id)
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            await asyncio.gather(self._prewarm_task, return_exceptions=True)
+            self._prewarm_task = None
         if self._session_manager:
             await self._session_manager.stop()
         if self._mcp_backend:
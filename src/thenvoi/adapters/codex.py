@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
 import time as _time
 import warnings
 from collections import OrderedDict
@@ -26,7 +27,10 @@ from thenvoi.core.types import (
     PlatformMessage,
 )
 from thenvoi.integrations.codex import (
+    CodexClientPool,
     CodexJsonRpcError,
+    CodexPoolMember,
+    CodexProcessStats,
     CodexStdioClient,
     CodexWebSocketClient,
     RpcEvent,
@@ -34,6 +38,7 @@ from thenvoi.integrations.codex import (
 from thenvoi.integrations.codex.types import CodexSessionState
 from thenvoi.runtime.custom_tools import (
     CustomToolDef,
+    build_custom_tool_index,
     custom_tool_to_openai_schema,
     execute_custom_tool,
     find_custom_tool,
@@ -88,6 +93,19 @@ class SetReasoningInput(BaseModel):
 # Override at runtime via CodexAdapterConfig.model or CODEX_MODEL env var.
 _DEFAULT_MODEL = "gpt-5.3-codex"
 
+# Notifications on_message acts on; the transport clients drop the rest.
+# Keep in sync with the event loop in CodexAdapter.on_message.
+_SUBSCRIBED_NOTIFICATIONS = frozenset(
+    {
+        "codex/event/task_started",
+        "codex/event/task_complete",
+        "error",
+        "item/agentMessage/delta",
+        "item/completed",
+        "turn/completed",
+    }
+)
+
 
 class _CodexClientProtocol(Protocol):
     async def connect(self) -> None: ...
@@ -178,6 +196,9 @@ class CodexAdapterConfig:
     # Update when OpenAI rotates model IDs.
     fallback_models: tuple[str, ...] = ("gpt-5.2", "gpt-5.3-codex")
     max_pending_approvals_per_room: int = 50
+    # Number of app-server connections (processes, for stdio). Rooms are
+    # pinned to one connection; turns on different connections run in parallel.
+    pool_size: int = 1
 
 
 class CodexAdapter(SimpleAdapter[CodexSessionState]):
@@ -186,6 +207,11 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
 
     One Thenvoi room maps to one Codex thread. Mapping is persisted in task
     events metadata and restored via CodexHistoryConverter on bootstrap.
+
+    With ``pool_size > 1`` the adapter runs several app-server connections.
+    Each room is pinned to the connection serving the fewest rooms, and a
+    crashed connection is rebuilt without affecting rooms on the others;
+    its rooms resume their threads on the next message.
     """
 
     SUPPORTED_EMIT: ClassVar[frozenset[Emit]] = frozenset(
@@ -206,6 +232,10 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         features: AdapterFeatures | None = None,
     ) -> None:
         self._config = config or CodexAdapterConfig()
+        if self._config.pool_size < 1:
+            raise ThenvoiConfigError(
+                f"pool_size must be >= 1, got: {self._config.pool_size}"
+            )
 
         # --- Deprecation shim: boolean → features migration ---
         # Only trigger for non-default booleans (enable_task_events defaults
@@ -249,66 +279,74 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         self._custom_tools: list[CustomToolDef] = list(additional_tools or [])
         if self.config.enable_self_config_tools:
             self._custom_tools.extend(self._build_self_config_tools())
+        self._custom_tool_index = build_custom_tool_index(self._custom_tools)
         self._client_factory = client_factory
-        self._client: _CodexClientProtocol | None = None
-        self._initialized = False
+        self._pool = CodexClientPool(self.config.pool_size)
+        # Guards the model/reasoning settings every pool member's turns read
+        # (config.model, config.reasoning_*, _selected_model,
+        # _model_explicitly_set). Turns in different rooms run concurrently,
+        # and the self-config tools run in the custom-tool thread pool, so
+        # this is a thread lock; it is never held across an await.
+        self._settings_lock = threading.Lock()
         self._selected_model: str | None = None
         self._model_explicitly_set: bool = bool(self.config.model)
         self._system_prompt: str = ""
         self._room_threads: dict[str, str] = {}
+        # Threads whose app-server died; resumed on the room's next message.
+        self._orphaned_threads: dict[str, str] = {}
         self._prompt_injected_rooms: set[str] = set()
-        self._task_titles_by_id: OrderedDict[str, str] = OrderedDict()
+        # Keyed by (room_id, task_id): task ids are only unique per app-server
+        self._task_titles_by_id: OrderedDict[tuple[str, str], str] = OrderedDict()
         self._max_task_titles: int = 500
+        # Keyed by room, so concurrent turns on other members never share an
+        # entry; only read and written on the event loop.
         self._pending_approvals: dict[str, dict[str, _PendingApproval]] = {}
         self._raw_history_by_room: dict[str, list[dict[str, Any]]] = {}
         self._needs_history_injection: set[str] = set()
-        # Single client receive queue means turn processing must be serialized.
-        self._rpc_lock = asyncio.Lock()
 
     def _build_self_config_tools(self) -> list[CustomToolDef]:
         """Build custom tools that let Codex change its own model/reasoning.
 
         Note: ``_handle_set_model`` and ``_handle_set_reasoning`` closures
-        mutate adapter state (``config.model``, ``_selected_model``, etc.).
-        They are safe because they are always called inside the
-        ``_handle_server_request`` path which holds ``_rpc_lock``.
+        mutate adapter-wide settings (``config.model``, ``_selected_model``,
+        etc.) while turns in other rooms may be running on other pool
+        members. They make their changes under ``_settings_lock``; turns read
+        a consistent snapshot in ``_apply_turn_overrides``.
         """
         adapter = self
 
         def _handle_set_model(inp: SetModelInput) -> str:
-            if not adapter._rpc_lock.locked():
-                raise RuntimeError("_handle_set_model must run under _rpc_lock")
-            adapter.config.model = inp.model
-            adapter._selected_model = inp.model
-            adapter._model_explicitly_set = True
+            with adapter._settings_lock:
+                adapter.config.model = inp.model
+                adapter._selected_model = inp.model
+                adapter._model_explicitly_set = True
             return f"Model changed to {inp.model} for subsequent turns."
 
         def _handle_set_reasoning(inp: SetReasoningInput) -> str:
-            if not adapter._rpc_lock.locked():
-                raise RuntimeError("_handle_set_reasoning must run under _rpc_lock")
-            parts: list[str] = []
-            if inp.effort is not None:
-                if inp.effort not in _REASONING_EFFORTS:
-                    return (
-                        f"Invalid reasoning effort '{inp.effort}'. "
-                        f"Valid: {', '.join(sorted(_REASONING_EFFORTS))}."
-                    )
-                adapter.config.reasoning_effort = inp.effort  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
-                parts.append(f"effort={inp.effort}")
-            if inp.summary is not None:
-                if inp.summary not in _REASONING_SUMMARIES:
+            with adapter._settings_lock:
+                parts: list[str] = []
+                if inp.effort is not None:
+                    if inp.effort not in _REASONING_EFFORTS:
+                        return (
+                            f"Invalid reasoning effort '{inp.effort}'. "
+                            f"Valid: {', '.join(sorted(_REASONING_EFFORTS))}."
+                        )
+                    adapter.config.reasoning_effort = inp.effort  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
+                    parts.append(f"effort={inp.effort}")
+                if inp.summary is not None:
+                    if inp.summary not in _REASONING_SUMMARIES:
+                        return (
+                            f"Invalid reasoning summary '{inp.summary}'. "
+                            f"Valid: {', '.join(sorted(_REASONING_SUMMARIES))}."
+                        )
+                    adapter.config.reasoning_summary = inp.summary  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
+                    parts.append(f"summary={inp.summary}")
+                if not parts:
                     return (
-                        f"Invalid reasoning summary '{inp.summary}'. "
-                        f"Valid: {', '.join(sorted(_REASONING_SUMMARIES))}."
+                        f"No changes. Current: effort={adapter.config.reasoning_effort or 'default'}, "
+                        f"summary={adapter.config.reasoning_summary or 'default'}."
                     )
-                adapter.config.reasoning_summary = inp.summary  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
-                parts.append(f"summary={inp.summary}")
-            if not parts:
-                return (
-                    f"No changes. Current: effort={adapter.config.reasoning_effort or 'default'}, "
-                    f"summary={adapter.config.reasoning_summary or 'default'}."
-                )
-            return f"Reasoning updated: {', '.join(parts)}."
+                return f"Reasoning updated: {', '.join(parts)}."
 
         return [
             (SetModelInput, _handle_set_model),
@@ -318,8 +356,10 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
     async def on_started(self, agent_name: str, agent_description: str) -> None:
         await super().on_started(agent_name, agent_description)
         self._build_system_prompt()
-        async with self._rpc_lock:
-            await self._ensure_client_ready()
+        # Start one connection eagerly to fail fast; the rest start on demand.
+        member = self._pool.members[0]
+        async with member.lock:
+            await self._ensure_client_ready(member)
         self._log_startup_config(agent_name)
 
     def _log_startup_config(self, agent_name: str) -> None:
@@ -372,15 +412,13 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
             if handled:
                 return
 
-        async with self._rpc_lock:
-            await self._ensure_client_ready()
-            if self._client is None:
-                raise RuntimeError(
-                    "Codex client not initialized after _ensure_client_ready"
-                )
+        member = self._pool.assign(room_id)
+        async with member.lock:
+            client = await self._ensure_client_ready(member)
 
             if command is not None:
                 handled = await self._handle_local_command(
+                    client=client,
                     tools=tools,
                     msg=msg,
                     history=history,
@@ -392,6 +430,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     return
 
             thread_id = await self._ensure_thread(
+                client=client,
                 room_id=room_id,
                 history=history,
                 tools=tools,
@@ -411,7 +450,9 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
             }
             self._apply_turn_overrides(turn_params)
 
-            turn_started = await self._start_turn_with_model_fallback(turn_params)
+            turn_started = await self._start_turn_with_model_fallback(
+                client, turn_params
+            )
             if has_pending_prompt_injection:
                 self._prompt_injected_rooms.add(room_id)
             turn = turn_started.get("turn") if isinstance(turn_started, dict) else {}
@@ -448,9 +489,10 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                         0.0,
                         self.config.turn_timeout_s - (_time.monotonic() - _turn_start),
                     )
-                    event = await self._client.recv_event(timeout_s=_remaining)
+                    event = await client.recv_event(timeout_s=_remaining)
                     if event.kind == "request":
                         used_send_message = await self._handle_server_request(
+                            client=client,
                             tools=tools,
                             msg=msg,
                             room_id=room_id,
@@ -529,10 +571,9 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     if event.method == "transport/closed":
                         turn_status = "failed"
                         turn_error = "Codex transport closed unexpectedly"
-                        # Reset client state so _ensure_client_ready() rebuilds
-                        # on the next message instead of reusing a dead client.
-                        self._client = None
-                        self._initialized = False
+                        # Reset this member so _ensure_client_ready() rebuilds
+                        # it on the next message instead of reusing a dead client.
+                        self._on_member_failed(member)
                         break
 
                     if event.method == "turn/completed":
@@ -556,9 +597,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 )
                 if turn_id:
                     try:
-                        await self._client.request(
-                            "turn/interrupt", {"turnId": turn_id}
-                        )
+                        await client.request("turn/interrupt", {"turnId": turn_id})
                     except Exception:
                         logger.warning(
                             "Failed to send turn/interrupt after timeout",
@@ -580,61 +619,115 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
             )
 
     async def on_cleanup(self, room_id: str) -> None:
-        async with self._rpc_lock:
-            self._room_threads.pop(room_id, None)
-            self._prompt_injected_rooms.discard(room_id)
-            self._raw_history_by_room.pop(room_id, None)
-            self._needs_history_injection.discard(room_id)
-            self._clear_pending_approvals_for_room(room_id)
-            if self._room_threads:
-                return
-            if self._client is None:
-                return
+        member = self._pool.member_for(room_id)
+        if member is None:
+            self._forget_room(room_id)
+        else:
+            async with member.lock:
+                self._forget_room(room_id)
+                self._pool.release(room_id)
+        if self._pool.has_rooms():
+            # Close only members left without rooms; others keep serving.
+            for idle in self._pool.members:
+                if not idle.rooms:
+                    await self._close_member(idle)
+            return
+
+        closed = False
+        for idle in self._pool.members:
+            closed = await self._close_member(idle) or closed
+        if closed:
+            with self._settings_lock:
+                self._selected_model = None
+            self._task_titles_by_id.clear()
+            self._pending_approvals.clear()
+
+    def pool_stats(self) -> list[CodexProcessStats]:
+        """Per-connection resource snapshot (pid, rooms, queued events, RSS)."""
+        return self._pool.stats()
+
+    def _forget_room(self, room_id: str) -> None:
+        self._room_threads.pop(room_id, None)
+        self._orphaned_threads.pop(room_id, None)
+        self._prompt_injected_rooms.discard(room_id)
+        self._raw_history_by_room.pop(room_id, None)
+        self._needs_history_injection.discard(room_id)
+        self._clear_pending_approvals_for_room(room_id)
+
+    async def _close_member(self, member: CodexPoolMember) -> bool:
+        """Close an idle member's client. Returns whether one was closed."""
+        async with member.lock:
+            # A room may have been assigned while we waited for the lock.
+            if member.rooms or member.client is None:
+                return False
             try:
-                await self._client.close()
+                await member.client.close()
             finally:
-                self._client = None
-                self._initialized = False
-                self._selected_model = None
-                self._task_titles_by_id.clear()
-                self._pending_approvals.clear()
+                member.client = None
+                member.initialized = False
+        return True
 
-    async def _ensure_client_ready(self) -> None:
-        if self._client is None:
-            self._client = self._build_client(self.config)
+    def _on_member_failed(self, member: CodexPoolMember) -> None:
+        """Reset a member whose transport closed; its rooms resume later."""
+        member.mark_failed()
+        for room_id in member.rooms:
+            thread_id = self._room_threads.pop(room_id, None)
+            if thread_id:
+                self._orphaned_threads[room_id] = thread_id
+        logger.warning(
+            "Codex process %s closed; restart #%s on next message (%s room(s))",
+            member.index,
+            member.restarts,
+            len(member.rooms),
+        )
+
+    async def _ensure_client_ready(
+        self, member: CodexPoolMember
+    ) -> _CodexClientProtocol:
+        if member.client is None:
+            member.client = self._build_client(self.config)
+        client: _CodexClientProtocol = member.client
 
-        if not self._initialized:
-            await self._client.connect()
-            await self._client.initialize(
+        if not member.initialized:
+            await client.connect()
+            await client.initialize(
                 client_name=self.config.client_name,
                 client_title=self.config.client_title,
                 client_version=self.config.client_version,
                 experimental_api=self.config.experimental_api,
             )
-            self._selected_model = await self._select_model()
-            self._initialized = True
+            if self._selected_model is None:
+                selected = await self._select_model(client)
+                with self._settings_lock:
+                    # Another member may have selected one (or a tool set one)
+                    if self._selected_model is None:
+                        self._selected_model = selected
+            member.initialized = True
+        return client
 
     def _build_client(self, config: CodexAdapterConfig) -> _CodexClientProtocol:
         if self._client_factory is not None:
             return self._client_factory(config)
 
         if config.transport == "ws":
-            return CodexWebSocketClient(ws_url=config.codex_ws_url)
+            return CodexWebSocketClient(
+                ws_url=config.codex_ws_url,
+                notification_methods=_SUBSCRIBED_NOTIFICATIONS,
+            )
 
         return CodexStdioClient(
             command=config.codex_command,
             cwd=config.cwd,
             env=config.codex_env,
+            notification_methods=_SUBSCRIBED_NOTIFICATIONS,
         )
 
-    async def _select_model(self) -> str:
+    async def _select_model(self, client: _CodexClientProtocol) -> str:
         if self.config.model:
             return self.config.model
 
-        if self._client is None:
-            raise RuntimeError("Codex client not initialized")
         try:
-            result = await self._client.request("model/list", {})
+            result = await client.request("model/list", {})
         except Exception:
             logger.warning("model/list failed; using fallback model id", exc_info=True)
             return _DEFAULT_MODEL
@@ -661,6 +754,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
     async def _ensure_thread(
         self,
         *,
+        client: _CodexClientProtocol,
         room_id: str,
         history: CodexSessionState,
         tools: AgentToolsProtocol,
@@ -670,20 +764,23 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         if thread_id:
             return thread_id
 
-        if self._client is None:
-            raise RuntimeError("Codex client not initialized")
+        # A thread orphaned by a crashed app-server is resumed like a
+        # bootstrap thread, on whichever process now serves the room.
+        resume_thread_id = self._orphaned_threads.pop(room_id, None)
+        if resume_thread_id is None and is_session_bootstrap and history.has_thread():
+            resume_thread_id = history.thread_id
 
-        if is_session_bootstrap and history.has_thread():
+        if resume_thread_id:
             try:
-                result = await self._client.request(
+                result = await client.request(
                     "thread/resume",
                     {
-                        "threadId": history.thread_id,
+                        "threadId": resume_thread_id,
                         "personality": self.config.personality,
                     },
                 )
                 resumed = result.get("thread", {}) if isinstance(result, dict) else {}
-                thread_id = str(resumed.get("id") or history.thread_id or "")
+                thread_id = str(resumed.get("id") or resume_thread_id)
                 if thread_id:
                     self._room_threads[room_id] = thread_id
                     self._raw_history_by_room.pop(room_id, None)
@@ -707,7 +804,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 logger.warning(
                     "thread/resume failed for room %s thread %s: %s",
                     room_id,
-                    history.thread_id,
+                    resume_thread_id,
                     exc,
                 )
                 if self.config.inject_history_on_resume_failure:
@@ -726,7 +823,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         }
         self._apply_thread_sandbox(start_params)
 
-        started = await self._client.request("thread/start", start_params)
+        started = await client.request("thread/start", start_params)
         thread = started.get("thread") if isinstance(started, dict) else {}
         thread_id = str((thread or {}).get("id") or "")
         if not thread_id:
@@ -888,13 +985,12 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
     async def _handle_server_request(
         self,
         *,
+        client: _CodexClientProtocol,
         tools: AgentToolsProtocol,
         msg: PlatformMessage,
         room_id: str,
         event: RpcEvent,
     ) -> bool:
-        if self._client is None:
-            raise RuntimeError("CodexAdapter client is None — was on_started() called?")
         if event.id is None:
             return False
 
@@ -924,7 +1020,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 )
 
             try:
-                custom_tool = find_custom_tool(self._custom_tools, tool_name)
+                custom_tool = find_custom_tool(self._custom_tool_index, tool_name)
                 if custom_tool:
                     result = await execute_custom_tool(custom_tool, arguments)
                 else:
@@ -935,7 +1031,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     else json.dumps(result, default=str)
                 )
                 success = True
-                await self._client.respond(
+                await client.respond(
                     event.id,
                     {
                         "contentItems": [{"type": "inputText", "text": text_result}],
@@ -960,7 +1056,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 )
                 error_text = f"Invalid arguments for {tool_name}: {errors}"
                 logger.error("Validation error for tool %s: %s", tool_name, exc)
-                await self._client.respond(
+                await client.respond(
                     event.id,
                     {
                         "contentItems": [{"type": "inputText", "text": error_text}],
@@ -981,7 +1077,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
             except Exception as exc:
                 error_text = f"Error: {exc}"
                 logger.exception("Tool execution failed for %s", tool_name)
-                await self._client.respond(
+                await client.respond(
                     event.id,
                     {
                         "contentItems": [{"type": "inputText", "text": error_text}],
@@ -1030,7 +1126,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     if self.config.approval_mode == "auto_accept"
                     else "decline"
                 )
-            await self._client.respond(event.id, {"decision": decision})
+            await client.respond(event.id, {"decision": decision})
 
             if (
                 self.config.approval_mode != "manual"
@@ -1061,7 +1157,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     logger.exception("Failed to emit approval thought event")
             return False
 
-        await self._client.respond_error(
+        await client.respond_error(
             event.id,
             code=-32601,
             message=f"Unhandled server request: {event.method}",
@@ -1408,11 +1504,11 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         task_id = self._task_event_id(params)
         title = self._task_event_title(params)
         if task_id and title and is_started:
-            self._task_titles_by_id[task_id] = title
+            self._task_titles_by_id[(room_id, task_id)] = title
             if len(self._task_titles_by_id) > self._max_task_titles:
                 self._task_titles_by_id.popitem(last=False)
         if task_id and not title:
-            title = self._task_titles_by_id.get(task_id)
+            title = self._task_titles_by_id.get((room_id, task_id))
         summary = self._task_event_summary(params)
         if not title:
             title = "Codex task lifecycle event"
@@ -1443,11 +1539,12 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
             metadata=metadata,
         )
         if not is_started and task_id:
-            self._task_titles_by_id.pop(task_id, None)
+            self._task_titles_by_id.pop((room_id, task_id), None)
 
     async def _handle_local_command(
         self,
         *,
+        client: _CodexClientProtocol,
         tools: AgentToolsProtocol,
         msg: PlatformMessage,
         history: CodexSessionState,
@@ -1500,9 +1597,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 return True
 
             if model_arg.lower() in {"list", "ls"}:
-                if self._client is None:
-                    raise RuntimeError("Codex client not initialized")
-                result = await self._client.request("model/list", {})
+                result = await client.request("model/list", {})
                 models = self._visible_model_ids(result)
                 if models:
                     preview = ", ".join(models[:10])
@@ -1519,9 +1614,10 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     )
                 return True
 
-            self.config.model = model_arg
-            self._selected_model = model_arg
-            self._model_explicitly_set = True
+            with self._settings_lock:
+                self.config.model = model_arg
+                self._selected_model = model_arg
+                self._model_explicitly_set = True
             await tools.send_message(
                 f"Model override set to `{model_arg}` for subsequent turns.",
                 mentions=mention,
@@ -1545,7 +1641,8 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                     mentions=mention,
                 )
                 return True
-            self.config.reasoning_effort = effort_arg  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
+            with self._settings_lock:
+                self.config.reasoning_effort = effort_arg  # type: ignore[assignment]  # Literal narrowed by Pydantic validation
             await tools.send_message(
                 f"Reasoning effort set to `{effort_arg}` for subsequent turns.",
                 mentions=mention,
@@ -1634,18 +1731,19 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         )
 
     def _apply_turn_overrides(self, params: dict[str, Any]) -> None:
-        params["model"] = self._selected_model
+        with self._settings_lock:
+            params["model"] = self._selected_model
+            if self.config.reasoning_effort is not None:
+                params["effort"] = self.config.reasoning_effort
+            if self.config.reasoning_summary is not None:
+                params["summary"] = self.config.reasoning_summary
         params["cwd"] = self.config.cwd
         params["approvalPolicy"] = self.config.approval_policy
         params["personality"] = self.config.personality
-        if self.config.reasoning_effort is not None:
-            params["effort"] = self.config.reasoning_effort
-        if self.config.reasoning_summary is not None:
-            params["summary"] = self.config.reasoning_summary
         self._apply_turn_sandbox(params)
 
     async def _start_turn_with_model_fallback(
-        self, params: dict[str, Any]
+        self, client: _CodexClientProtocol, params: dict[str, Any]
     ) -> dict[str, Any]:
         """Start a turn, falling back to an available model if the auto-selected one is unavailable.
 
@@ -1653,10 +1751,8 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
         When the user explicitly configured a model, the error propagates — they may
         be using unlisted models that model/list doesn't report.
         """
-        if self._client is None:
-            raise RuntimeError("CodexAdapter client is None — was on_started() called?")
         try:
-            return await self._client.request("turn/start", params)
+            return await client.request("turn/start", params)
         except CodexJsonRpcError as exc:
             if self._model_explicitly_set:
                 raise
@@ -1669,7 +1765,7 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 exc.code,
                 exc.message,
             )
-            fallback = await self._find_fallback_model(exclude=original_model)
+            fallback = await self._find_fallback_model(client, exclude=original_model)
             if fallback is None:
                 raise
             logger.warning(
@@ -1677,17 +1773,24 @@ class CodexAdapter(SimpleAdapter[CodexSessionState]):
                 original_model,
                 fallback,
             )
-            self._selected_model = fallback
+            with self._settings_lock:
+                # Keep a model chosen meanwhile (by a tool or another room's
+                # fallback); only replace the one that failed.
+                if (
+                    not self._model_explicitly_set
+                    and self._selected_model == original_model
+                ):
+                    self._selected_model = fallback
             params["model"] = fallback
-            return await self._client.request("turn/start", params)
+            return await client.request("turn/start", params)
 
-    async def _find_fallback_model(self, exclude: Any = None) -> str | None:
+    async def _find_fallback_model(
+        self, client: _CodexClientProtocol, exclude: Any = None
+    ) -> str | None:
         """Query model/list and return a fallback model, or None if unavailable."""
-        if self._client is None:
-            raise RuntimeError("CodexAdapter client is None — was on_started() called?")
         fallbacks = self.config.fallback_models
         try:
-            result = await self._client.request("model/list", {})
+            result = await client.request("model/list", {})
         except Exception:
             logger.warning("model/list failed during fallback lookup", exc_info=True)
             for model_id in fallbacks:
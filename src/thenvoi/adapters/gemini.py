@@ -9,7 +9,7 @@ import warnings
 from typing import Any, ClassVar, cast
 
 import httpx
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 try:
     from google import genai  # type: ignore[missing-module-attribute]
@@ -23,6 +23,7 @@ except ImportError as e:
     ) from e
 
 from thenvoi.core.exceptions import ThenvoiConfigError
+from thenvoi.core.history_store import HistoryStore
 from thenvoi.core.protocols import AgentToolsProtocol
 from thenvoi.core.simple_adapter import SimpleAdapter
 from thenvoi.core.types import (
@@ -34,6 +35,7 @@ from thenvoi.core.types import (
 from thenvoi.converters.gemini import GeminiHistoryConverter, GeminiMessages
 from thenvoi.runtime.custom_tools import (
     CustomToolDef,
+    build_custom_tool_index,
     execute_custom_tool,
     find_custom_tool,
     get_custom_tool_name,
@@ -42,6 +44,10 @@ from thenvoi.runtime.prompts import render_system_prompt
 
 logger = logging.getLogger(__name__)
 
+# (De)serializes room history for history_store; bytes fields such as
+# thought signatures round-trip through JSON as base64.
+_CONTENTS_ADAPTER = TypeAdapter(list[types.Content])
+
 
 class GeminiAdapter(SimpleAdapter[GeminiMessages]):
     """
@@ -83,6 +89,7 @@ class GeminiAdapter(SimpleAdapter[GeminiMessages]):
         additional_tools: list[CustomToolDef] | None = None,
         features: AdapterFeatures | None = None,
         include_base_instructions: bool = True,
+        history_store: HistoryStore | None = None,
         # --- Deprecated (one release, then remove) ---
         gemini_api_key: str | None = None,
         custom_section: str | None = None,
@@ -135,6 +142,7 @@ class GeminiAdapter(SimpleAdapter[GeminiMessages]):
         super().__init__(
             history_converter=history_converter or GeminiHistoryConverter(),
             features=features,
+            history_store=history_store,
         )
 
         self.model = model
@@ -153,6 +161,7 @@ class GeminiAdapter(SimpleAdapter[GeminiMessages]):
         self._message_history: dict[str, GeminiMessages] = {}
         self._system_prompt: str = ""
         self._custom_tools: list[CustomToolDef] = additional_tools or []
+        self._custom_tool_index = build_custom_tool_index(self._custom_tools)
 
     async def on_started(self, agent_name: str, agent_description: str) -> None:
         """Render system prompt after agent metadata is fetched.
@@ -262,6 +271,17 @@ class GeminiAdapter(SimpleAdapter[GeminiMessages]):
         self._message_history.pop(room_id, None)
         logger.debug("Room %s: Cleaned up Gemini history", room_id)
 
+    def dump_history(self, room_id: str) -> list[Any] | None:
+        """Serialize Content objects to JSON-compatible dicts."""
+        history = self._message_history.get(room_id)
+        if history is None:
+            return None
+        return json.loads(_CONTENTS_ADAPTER.dump_json(history, exclude_none=True))
+
+    def restore_history(self, data: list[Any]) -> GeminiMessages:
+        """Rebuild Content objects saved by dump_history()."""
+        return _CONTENTS_ADAPTER.validate_json(json.dumps(data))
+
     def _trim_history(self, room_id: str) -> None:
         """Trim message history to stay within ``max_history_messages``.
 
@@ -480,7 +500,7 @@ class GeminiAdapter(SimpleAdapter[GeminiMessages]):
                     logger.warning("Failed to send tool_call event: %s", e)
 
             try:
-                custom_tool = find_custom_tool(self._custom_tools, tool_name)
+                custom_tool = find_custom_tool(self._custom_tool_index, tool_name)
                 if custom_tool:
                     result = await execute_custom_tool(custom_tool, tool_input)
                 else:
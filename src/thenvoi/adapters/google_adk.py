@@ -13,6 +13,7 @@ import json
 import logging
 import uuid
 import warnings
+from collections.abc import Mapping
 from typing import ClassVar, TYPE_CHECKING, Any
 
 from pydantic import ValidationError
@@ -24,6 +25,7 @@ from thenvoi.core.types import AdapterFeatures, Capability, Emit, PlatformMessag
 from thenvoi.converters.google_adk import GoogleADKHistoryConverter, GoogleADKMessages
 from thenvoi.runtime.custom_tools import (
     CustomToolDef,
+    build_custom_tool_index,
     custom_tools_to_schemas,
     execute_custom_tool,
     find_custom_tool,
@@ -166,7 +168,7 @@ def _get_tool_bridge_class() -> type:
             tool_description: str,
             parameters_schema: dict[str, Any],
             tools: AgentToolsProtocol,
-            custom_tools: list[CustomToolDef],
+            custom_tools: Mapping[str, CustomToolDef] | list[CustomToolDef],
         ):
             super().__init__(name=tool_name, description=tool_description)
             self._parameters_schema = parameters_schema
@@ -344,6 +346,7 @@ class GoogleADKAdapter(SimpleAdapter[GoogleADKMessages]):
 
         # Custom tools (user-provided)
         self._custom_tools: list[CustomToolDef] = additional_tools or []
+        self._custom_tool_index = build_custom_tool_index(self._custom_tools)
 
         # Effective system prompt (rendered in on_started)
         self._system_prompt: str = ""
@@ -397,7 +400,7 @@ class GoogleADKAdapter(SimpleAdapter[GoogleADKMessages]):
                     tool_description=func_def.get("description", ""),
                     parameters_schema=func_def.get("parameters", {}),
                     tools=tools,
-                    custom_tools=self._custom_tools,
+                    custom_tools=self._custom_tool_index,
                 )
             )
 
@@ -412,7 +415,7 @@ class GoogleADKAdapter(SimpleAdapter[GoogleADKMessages]):
                         tool_description=func_def.get("description", ""),
                         parameters_schema=func_def.get("parameters", {}),
                         tools=tools,
-                        custom_tools=self._custom_tools,
+                        custom_tools=self._custom_tool_index,
                     )
                 )
 
@@ -29,6 +29,10 @@ logger = logging.getLogger(__name__)
 # Parlant preamble message tag - used to identify acknowledgment messages before tool execution
 PARLANT_PREAMBLE_TAG = "__preamble__"
 
+# Limits for the digest that replaces history beyond max_history_messages
+_HISTORY_DIGEST_LINE_CHARS = 200
+_HISTORY_DIGEST_MAX_CHARS = 4000
+
 
 class ParlantAdapter(SimpleAdapter[ParlantMessages]):
     """
@@ -72,6 +76,7 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         history_converter: ParlantHistoryConverter | None = None,
         additional_tools: list[CustomToolDef] | None = None,
         features: AdapterFeatures | None = None,
+        max_history_messages: int | None = None,
     ):
         """
         Initialize the Parlant SDK adapter.
@@ -84,7 +89,13 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
             history_converter: Custom history converter (optional)
             additional_tools: List of custom tools as (InputModel, callable) tuples
             features: Shared adapter feature settings (capabilities, emit, tool filters).
+            max_history_messages: Cap on historical messages injected on bootstrap.
+                Older messages are folded into a single digest event. None
+                injects the full history.
         """
+        if max_history_messages is not None and max_history_messages < 0:
+            raise ValueError("max_history_messages must be >= 0")
+
         super().__init__(
             history_converter=history_converter or ParlantHistoryConverter(),
             features=features,
@@ -94,6 +105,7 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         self._parlant_agent = parlant_agent
         self.system_prompt = system_prompt
         self.custom_section = custom_section
+        self.max_history_messages = max_history_messages
 
         # Parlant application (accessed via container)
         self._app: Application | None = None
@@ -104,6 +116,9 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         # Per-room customer mapping (room_id -> parlant customer_id)
         self._room_customers: dict[str, str] = {}
 
+        # Sessions that already received history (skip reinjection on reconnect)
+        self._injected_sessions: set[str] = set()
+
         # Rendered system prompt (set after start)
         self._system_prompt: str = ""
 
@@ -174,9 +189,18 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         set_session_tools(session_id_str, tools)
         logger.info("Room %s: Set tools for session_id=%s", room_id, session_id_str)
 
-        # On bootstrap, inject historical context
-        if is_session_bootstrap and history:
-            injected = await self._inject_history(session_id, history)
+        # On bootstrap, inject historical context (once per Parlant session)
+        if (
+            is_session_bootstrap
+            and history
+            and session_id_str not in self._injected_sessions
+        ):
+            injected = await self._inject_history(
+                session_id,
+                history,
+                customer_id=self._room_customers.get(room_id),
+            )
+            self._injected_sessions.add(session_id_str)
             logger.info("Room %s: Injected %s messages from history", room_id, injected)
 
         # Build user message, prepending updates if present
@@ -289,6 +313,8 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         self,
         session_id: SessionId,
         history: ParlantMessages,
+        *,
+        customer_id: str | None = None,
     ) -> int:
         """Inject historical messages into a Parlant session.
 
@@ -296,6 +322,11 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         User messages without a following assistant response are NOT injected,
         as they represent pending/unanswered questions that should be handled
         by the current message flow.
+
+        Events are written straight to the session with prebuilt participant
+        data, skipping the per-message session/customer lookups and moderation
+        of create_customer_message. When max_history_messages is set, only the
+        most recent messages are injected and older ones become one digest.
         """
         if not self._app:
             return 0
@@ -304,10 +335,89 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
             return 0
 
         app = self._app
-        from parlant.core.app_modules.sessions import Moderation
         from parlant.core.sessions import EventKind, EventSource
 
-        # First, filter to only complete exchanges
+        complete_history = self._filter_complete_exchanges(history)
+
+        overflow: ParlantMessages = []
+        if (
+            self.max_history_messages is not None
+            and len(complete_history) > self.max_history_messages
+        ):
+            split = len(complete_history) - self.max_history_messages
+            overflow = complete_history[:split]
+            complete_history = complete_history[split:]
+
+        events: list[tuple[Any, dict[str, Any], dict[str, Any]]] = []
+        if overflow:
+            events.append(
+                (
+                    EventSource.CUSTOMER,
+                    {
+                        "message": self._build_history_digest(overflow),
+                        "participant": {"id": customer_id, "display_name": "History"},
+                        "flagged": False,
+                        "tags": [],
+                    },
+                    {"historical": True, "digest": True},
+                )
+            )
+
+        for hist in complete_history:
+            role = hist.get("role", "user")
+            content = hist.get("content", "")
+            if not content:
+                continue
+            if role == "user":
+                sender = hist.get("sender") or "User"
+                events.append(
+                    (
+                        EventSource.CUSTOMER,
+                        {
+                            "message": content,
+                            "participant": {"id": customer_id, "display_name": sender},
+                            "flagged": False,
+                            "tags": [],
+                        },
+                        {"historical": True},
+                    )
+                )
+            else:
+                # Parlant requires participant info for AI_AGENT messages
+                sender = hist.get("sender", self.agent_name or "Assistant")
+                events.append(
+                    (
+                        EventSource.AI_AGENT,
+                        {
+                            "message": content,
+                            "participant": {"display_name": sender},
+                        },
+                        {"historical": True},
+                    )
+                )
+
+        # Parlant assigns offsets under the session writer lock, so events are
+        # created sequentially to keep the transcript in order.
+        count = 0
+        for source, data, metadata in events:
+            try:
+                await app.sessions.create_event(
+                    session_id=session_id,
+                    kind=EventKind.MESSAGE,
+                    source=source,
+                    data=data,
+                    metadata=metadata,
+                    trigger_processing=False,
+                )
+                count += 1
+            except Exception as e:
+                logger.warning("Failed to inject history message (%s): %s", source, e)
+
+        return count
+
+    @staticmethod
+    def _filter_complete_exchanges(history: ParlantMessages) -> ParlantMessages:
+        """Keep answered user messages and assistant messages, in order."""
         # A user message is only injected if it has a following assistant response
         complete_history: ParlantMessages = []
         i = 0
@@ -336,45 +446,36 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
             else:
                 i += 1
 
-        # Now inject the filtered history
-        count = 0
-        for hist in complete_history:
-            role = hist.get("role", "user")
-            content = hist.get("content", "")
+        return complete_history
+
+    @staticmethod
+    def _build_history_digest(messages: ParlantMessages) -> str:
+        """Condense older history into a single bounded context message.
 
+        Keeps the most recent lines that fit within the digest budget; each
+        line is truncated so one long message can't crowd out the rest.
+        """
+        lines: list[str] = []
+        budget = _HISTORY_DIGEST_MAX_CHARS
+        for hist in reversed(messages):
+            content = hist.get("content", "")
             if not content:
                 continue
-
-            try:
-                if role == "user":
-                    await app.sessions.create_customer_message(
-                        session_id=session_id,
-                        moderation=Moderation.NONE,
-                        message=content,
-                        source=EventSource.CUSTOMER,
-                        trigger_processing=False,
-                        metadata={"historical": True},
-                    )
-                    count += 1
-                elif role == "assistant":
-                    # Parlant requires participant info for AI_AGENT messages
-                    sender = hist.get("sender", self.agent_name or "Assistant")
-                    await app.sessions.create_event(
-                        session_id=session_id,
-                        kind=EventKind.MESSAGE,
-                        source=EventSource.AI_AGENT,
-                        data={
-                            "message": content,
-                            "participant": {"display_name": sender},
-                        },
-                        metadata={"historical": True},
-                        trigger_processing=False,
-                    )
-                    count += 1
-            except Exception as e:
-                logger.warning("Failed to inject history message (%s): %s", role, e)
-
-        return count
+            if hist.get("role") == "assistant":
+                sender = hist.get("sender") or "Assistant"
+                content = f"[{sender}]: {content}"
+            line = " ".join(content.split())
+            if len(line) > _HISTORY_DIGEST_LINE_CHARS:
+                line = line[: _HISTORY_DIGEST_LINE_CHARS - 3] + "..."
+            if len(line) + 1 > budget:
+                break
+            lines.append(line)
+            budget -= len(line) + 1
+
+        omitted = len(messages) - len(lines)
+        header = f"[Earlier conversation: {len(messages)} messages"
+        header += f", {omitted} oldest omitted]" if omitted else "]"
+        return "\n".join([header, *reversed(lines)])
 
     async def _process_agent_response(
         self,
@@ -595,6 +696,7 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
     async def on_cleanup(self, room_id: str) -> None:
         """Clean up session when agent leaves a room."""
         if room_id in self._room_sessions:
+            self._injected_sessions.discard(str(self._room_sessions[room_id]))
             del self._room_sessions[room_id]
         if room_id in self._room_customers:
             del self._room_customers[room_id]
@@ -612,4 +714,5 @@ class ParlantAdapter(SimpleAdapter[ParlantMessages]):
         """Cleanup all sessions (call on stop)."""
         self._room_sessions.clear()
         self._room_customers.clear()
+        self._injected_sessions.clear()
         logger.info("Parlant adapter cleanup complete")
@@ -19,11 +19,14 @@ from pydantic_ai import (
     RunContext,
 )
 from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
     ModelRequest,
     UserPromptPart,
 )
 
 from thenvoi.core.exceptions import ThenvoiConfigError
+from thenvoi.core.history_store import HistoryStore
 from thenvoi.core.protocols import AgentToolsProtocol
 from thenvoi.core.simple_adapter import SimpleAdapter
 from thenvoi.core.types import AdapterFeatures, Capability, Emit, PlatformMessage
@@ -68,6 +71,7 @@ class PydanticAIAdapter(SimpleAdapter[PydanticAIMessages]):
         history_converter: PydanticAIHistoryConverter | None = None,
         additional_tools: list[Callable[..., Any]] | None = None,
         features: AdapterFeatures | None = None,
+        history_store: HistoryStore | None = None,
     ):
         """
         Initialize the Pydantic AI adapter.
@@ -84,6 +88,8 @@ class PydanticAIAdapter(SimpleAdapter[PydanticAIMessages]):
                 `def my_tool(ctx: RunContext[AgentToolsProtocol], arg1: str, ...) -> T`
                 These are registered via agent.tool() alongside platform tools.
             features: Shared adapter feature settings (capabilities, emit, tool filters).
+            history_store: Optional store that persists per-room history across
+                restarts (e.g. SQLiteHistoryStore).
         """
         # --- Deprecation shim: boolean → features migration ---
         _has_legacy_booleans = enable_execution_reporting or enable_memory_tools
@@ -114,6 +120,7 @@ class PydanticAIAdapter(SimpleAdapter[PydanticAIMessages]):
         super().__init__(
             history_converter=history_converter or PydanticAIHistoryConverter(),
             features=features,
+            history_store=history_store,
         )
 
         self.model = model
@@ -568,3 +575,14 @@ class PydanticAIAdapter(SimpleAdapter[PydanticAIMessages]):
         if room_id in self._message_history:
             del self._message_history[room_id]
             logger.debug("Room %s: Cleaned up message history", room_id)
+
+    def dump_history(self, room_id: str) -> list[Any] | None:
+        """Serialize ModelMessages to JSON-compatible dicts."""
+        history = self._message_history.get(room_id)
+        if history is None:
+            return None
+        return json.loads(ModelMessagesTypeAdapter.dump_json(history))
+
+    def restore_history(self, data: list[Any]) -> list[ModelMessage]:
+        """Rebuild ModelMessages saved by dump_history()."""
+        return ModelMessagesTypeAdapter.validate_json(json.dumps(data))
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _get_version
 from pathlib import Path
@@ -11,6 +12,10 @@ from typing import TYPE_CHECKING, Any, cast
 
 from thenvoi.core.protocols import FrameworkAdapter, Preprocessor
 from thenvoi.core.simple_adapter import SimpleAdapter
+from thenvoi.runtime.custom_tools import (
+    release_custom_tool_executor,
+    retain_custom_tool_executor,
+)
 from thenvoi.runtime.platform_runtime import PlatformRuntime
 from thenvoi.runtime.types import (
     AgentConfig,
@@ -22,8 +27,13 @@ from thenvoi.runtime.types import (
 from thenvoi.preprocessing.default import DefaultPreprocessor
 
 if TYPE_CHECKING:
+    import httpx
+
     from thenvoi.platform.event import PlatformEvent
+    from thenvoi.platform.transport import HttpTransportConfig
     from thenvoi.runtime.execution import ExecutionContext
+    from thenvoi.runtime.metrics import RuntimeMetrics
+    from thenvoi.runtime.scheduler import FairScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -83,10 +93,13 @@ class Agent:
         runtime: PlatformRuntime,
         adapter: FrameworkAdapter | SimpleAdapter,
         preprocessor: Preprocessor | None = None,
+        scheduler: "FairScheduler | None" = None,
     ):
         self._runtime = runtime
         self._adapter = adapter
         self._preprocessor = preprocessor or DefaultPreprocessor()
+        # Optional shared turn scheduler (set by AgentHost)
+        self._scheduler = scheduler
         self._started = False
         # Tracks shutdown_timeout from run() for use in __aexit__
         # Uses sentinel to distinguish "not set" from "explicitly set to None"
@@ -106,6 +119,9 @@ class Agent:
         on_participant_added: ParticipantAddedCallback | None = None,
         on_participant_removed: ParticipantRemovedCallback | None = None,
         preprocessor: Preprocessor | None = None,
+        metrics: "RuntimeMetrics | None" = None,
+        transport: "HttpTransportConfig | None" = None,
+        httpx_client: "httpx.AsyncClient | None" = None,
     ) -> "Agent":
         """
         Create agent with default runtime.
@@ -126,6 +142,13 @@ class Agent:
             on_participant_added: Optional callback for participant_added events.
             on_participant_removed: Optional callback for participant_removed events.
             preprocessor: Custom event preprocessor (default: DefaultPreprocessor)
+            metrics: Optional metrics hooks for stage latency, queue depth,
+                     event-loop lag and REST latency. See thenvoi.runtime.metrics.
+            transport: Optional REST connection pool, HTTP/2 and timeout
+                       settings. Ignored when httpx_client is given.
+            httpx_client: Optional caller-owned HTTP client for REST calls,
+                          e.g. one built with HttpTransportConfig.build_client()
+                          and shared with an A2A gateway adapter.
         """
         runtime = PlatformRuntime(
             agent_id=agent_id,
@@ -137,6 +160,9 @@ class Agent:
             contact_config=contact_config,
             on_participant_added=on_participant_added,
             on_participant_removed=on_participant_removed,
+            metrics=metrics,
+            transport=transport,
+            httpx_client=httpx_client,
         )
         return cls(
             runtime=runtime,
@@ -221,6 +247,12 @@ class Agent:
             self._runtime.agent_description,
         )
 
+        # Rooms resume from the adapter's saved history instead of
+        # re-downloading their full context
+        history_store = getattr(self._adapter, "history_store", None)
+        if isinstance(self._adapter, SimpleAdapter) and history_store is not None:
+            self._runtime.link.history_store = history_store
+
         # 3. NOW start message processing (connects WebSocket)
         await self._runtime.start(
             on_execute=self._on_execute,
@@ -228,6 +260,7 @@ class Agent:
         )
 
         self._started = True
+        retain_custom_tool_executor()
         logger.info(
             "Agent started: %s (thenvoi-sdk %s)", self._runtime.agent_name, _SDK_VERSION
         )
@@ -251,8 +284,13 @@ class Agent:
         if not self._started:
             return True
 
-        graceful = await self._runtime.stop(timeout=timeout)
-        self._started = False
+        try:
+            graceful = await self._runtime.stop(timeout=timeout)
+        finally:
+            self._started = False
+            # Shut the sync custom-tool pool down once no agent uses it, so
+            # its worker threads do not keep the interpreter alive
+            release_custom_tool_executor()
         logger.info(
             "Agent stopped: %s (graceful=%s)", self._runtime.agent_name, graceful
         )
@@ -334,6 +372,9 @@ class Agent:
         event: "PlatformEvent",
     ) -> None:
         """Handle platform event."""
+        metrics = ctx.link.metrics
+        start = time.perf_counter() if metrics.enabled else 0.0
+
         # Preprocessor is the single source of truth for event filtering.
         # It returns None for non-MessageEvent types.
         inp = await self._preprocessor.process(
@@ -342,7 +383,23 @@ class Agent:
             agent_id=self._runtime.agent_id,
         )
 
+        if metrics.enabled:
+            now = time.perf_counter()
+            metrics.record_stage("preprocess", now - start, room_id=ctx.room_id)
+            start = now
+
         if inp is None:
             return
 
-        await self._adapter.on_event(inp)
+        try:
+            if self._scheduler is None:
+                await self._adapter.on_event(inp)
+                return
+
+            async with self._scheduler.slot(self._runtime.agent_id):
+                await self._adapter.on_event(inp)
+        finally:
+            if metrics.enabled:
+                metrics.record_stage(
+                    "adapter", time.perf_counter() - start, room_id=ctx.room_id
+                )
@@ -27,16 +27,26 @@ Examples:
     # Using environment variables
     THENVOI_API_KEY=key THENVOI_TARGET_HANDLE=@owner/agent \\
         thenvoi-trigger --message "Hello"
+
+    # Batch mode: one job per JSONL line ({"target": ..., "message": ...}),
+    # or a CSV file with "target,message" columns. Use "-" for stdin.
+    # Prints one JSON result per job to stdout; exits 1 if any job failed.
+    thenvoi-trigger --batch jobs.jsonl --concurrency 16
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import csv
+import json
 import logging
 import os
 import sys
-from typing import Final
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import IO, Any, Final, TypeVar
 
 from thenvoi.runtime.types import normalize_handle
 from thenvoi_rest import (
@@ -57,6 +67,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_REST_URL = "https://app.thenvoi.com/"
 DEFAULT_REQUEST_OPTIONS: Final[RequestOptions] = {"max_retries": 3}
 DEFAULT_TIMEOUT: Final[int] = 120
+DEFAULT_CONCURRENCY: Final[int] = 8
+RATE_LIMIT_MAX_RETRIES: Final[int] = 5
+
+T = TypeVar("T")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -108,6 +122,27 @@ def build_parser() -> argparse.ArgumentParser:
             f"(env: THENVOI_TRIGGER_TIMEOUT, default: {DEFAULT_TIMEOUT})"
         ),
     )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Run many triggers from a JSONL or CSV file of (target, message) "
+            "jobs; use '-' for stdin. --target-handle/--message are ignored."
+        ),
+    )
+    parser.add_argument(
+        "--batch-format",
+        choices=["auto", "jsonl", "csv"],
+        default="auto",
+        help="Batch input format (default: auto, CSV if the path ends in .csv)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max jobs in flight in batch mode (default: {DEFAULT_CONCURRENCY})",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -127,50 +162,98 @@ def _format_api_error(err: ApiError, action: str) -> str:
     return f"Failed to {action}: HTTP {err.status_code}"
 
 
-async def find_peer_by_handle(
-    client: AsyncRestClient,
-    handle: str,
-    auth_mode: str,
-) -> dict[str, str] | None:
+class RateLimitGate:
     """
-    Paginate through peers to find one matching the given handle.
+    Shared 429 back-off for concurrent batch jobs.
 
-    Returns dict with 'id', 'name', 'handle' or None if not found.
+    When any call is rate limited (after the client's own retries), every
+    job pauses until the Retry-After deadline before its next call, so the
+    batch slows down as a whole instead of each job hammering the API.
     """
-    normalized = (normalize_handle(handle) or "").lower()
+
+    def __init__(self, max_retries: int = RATE_LIMIT_MAX_RETRIES):
+        self._max_retries = max_retries
+        self._resume_at = 0.0
+        self.throttled_count = 0
+
+    async def wait(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def backoff(self, seconds: float) -> None:
+        self.throttled_count += 1
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def call(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory()``, retrying on HTTP 429 after a shared back-off."""
+        attempt = 0
+        while True:
+            await self.wait()
+            try:
+                return await factory()
+            except ApiError as e:
+                if e.status_code != 429 or attempt >= self._max_retries:
+                    raise
+                delay = _retry_after_seconds(e) or float(2**attempt)
+                logger.warning("Rate limited; pausing all jobs for %.1fs", delay)
+                self.backoff(delay)
+                attempt += 1
+
+
+def _retry_after_seconds(err: ApiError) -> float | None:
+    """Read a numeric Retry-After header from an ApiError, if present."""
+    headers = getattr(err, "headers", None) or {}
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+async def _call(gate: RateLimitGate | None, factory: Callable[[], Awaitable[T]]) -> T:
+    """Await a REST call, routed through the rate-limit gate when given."""
+    if gate is None:
+        return await factory()
+    return await gate.call(factory)
+
+
+async def _iter_peers(
+    client: AsyncRestClient,
+    auth_mode: str,
+    gate: RateLimitGate | None = None,
+) -> AsyncIterator[Any]:
+    """Yield peers page by page (100 per page) until the last page."""
     page = 1
     while True:
         if auth_mode == "agent":
-            response = await client.agent_api_peers.list_agent_peers(
-                page=page,
-                page_size=100,
-                request_options=DEFAULT_REQUEST_OPTIONS,
+            response = await _call(
+                gate,
+                lambda: client.agent_api_peers.list_agent_peers(
+                    page=page,
+                    page_size=100,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
             )
         else:
-            response = await client.human_api_peers.list_my_peers(
-                page=page,
-                page_size=100,
-                request_options=DEFAULT_REQUEST_OPTIONS,
+            response = await _call(
+                gate,
+                lambda: client.human_api_peers.list_my_peers(
+                    page=page,
+                    page_size=100,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
             )
 
         if not response.data:
-            break
+            return
 
         for peer in response.data:
-            peer_handle = getattr(peer, "handle", None) or ""
-            if (normalize_handle(peer_handle) or "").lower() == normalized:
-                return {
-                    "id": peer.id,
-                    "name": peer.name,
-                    "handle": peer_handle,
-                }
+            yield peer
 
-        logger.debug(
-            "Scanned %d peers on page %d, no match for '%s'",
-            len(response.data),
-            page,
-            normalized,
-        )
+        logger.debug("Scanned %d peers on page %d", len(response.data), page)
 
         total_pages = (
             getattr(response.metadata, "total_pages", None) or 1
@@ -178,12 +261,150 @@ async def find_peer_by_handle(
             else 1
         )
         if page >= total_pages:
-            break
+            return
         page += 1
 
+
+def _peer_key(handle: str | None) -> str:
+    return (normalize_handle(handle) or "").lower()
+
+
+def _peer_dict(peer: Any) -> dict[str, str]:
+    return {
+        "id": peer.id,
+        "name": peer.name,
+        "handle": getattr(peer, "handle", None) or "",
+    }
+
+
+async def find_peer_by_handle(
+    client: AsyncRestClient,
+    handle: str,
+    auth_mode: str,
+) -> dict[str, str] | None:
+    """
+    Paginate through peers to find one matching the given handle.
+
+    Returns dict with 'id', 'name', 'handle' or None if not found.
+    """
+    normalized = _peer_key(handle)
+    async for peer in _iter_peers(client, auth_mode):
+        if _peer_key(getattr(peer, "handle", None)) == normalized:
+            return _peer_dict(peer)
+
+    logger.debug("No peer matched '%s'", normalized)
     return None
 
 
+async def _create_room_and_send(
+    client: AsyncRestClient,
+    peer: dict[str, str],
+    message: str,
+    auth_mode: str,
+    gate: RateLimitGate | None = None,
+) -> str:
+    """
+    Create a chatroom, add ``peer`` and send ``message`` mentioning it.
+
+    Returns the chatroom ID. Raises RuntimeError with a readable message
+    on API failure.
+    """
+    # Create a new chatroom
+    logger.info("Creating chatroom...")
+    try:
+        if auth_mode == "agent":
+            chat_response = await _call(
+                gate,
+                lambda: client.agent_api_chats.create_agent_chat(
+                    chat=ChatRoomRequest(),
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+        else:
+            chat_response = await _call(
+                gate,
+                lambda: client.human_api_chats.create_my_chat_room(
+                    chat=CreateMyChatRoomRequestChat(),
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+    except ApiError as e:
+        raise RuntimeError(_format_api_error(e, "create chatroom")) from e
+    room_id = chat_response.data.id
+    logger.info("Created chatroom: %s", room_id)
+
+    # Add the target agent as a participant, then send the message
+    # mentioning it.
+    # Wrapped in try/except so we log the orphan room ID on partial failure.
+    try:
+        logger.info("Adding %s to chatroom...", peer["name"])
+        participant = ParticipantRequest(participant_id=peer["id"])
+        if auth_mode == "agent":
+            await _call(
+                gate,
+                lambda: client.agent_api_participants.add_agent_chat_participant(
+                    chat_id=room_id,
+                    participant=participant,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+        else:
+            await _call(
+                gate,
+                lambda: client.human_api_participants.add_my_chat_participant(
+                    chat_id=room_id,
+                    participant=participant,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+        logger.info("Added participant: %s", peer["name"])
+
+        logger.info("Sending message...")
+        mention = ChatMessageRequestMentionsItem(
+            id=peer["id"],
+            handle=peer["handle"],
+        )
+        message_request = ChatMessageRequest(
+            content=message,
+            mentions=[mention],
+        )
+        if auth_mode == "agent":
+            await _call(
+                gate,
+                lambda: client.agent_api_messages.create_agent_chat_message(
+                    chat_id=room_id,
+                    message=message_request,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+        else:
+            await _call(
+                gate,
+                lambda: client.human_api_messages.send_my_chat_message(
+                    chat_id=room_id,
+                    message=message_request,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                ),
+            )
+        logger.info("Message sent successfully")
+    except ApiError as e:
+        logger.warning(
+            "Failed after creating room %s — room may need manual cleanup",
+            room_id,
+        )
+        raise RuntimeError(
+            f"{_format_api_error(e, 'complete trigger')} (orphan room: {room_id})"
+        ) from e
+    except Exception:
+        logger.warning(
+            "Failed after creating room %s — room may need manual cleanup",
+            room_id,
+        )
+        raise
+
+    return room_id
+
+
 async def run(args: argparse.Namespace) -> str:
     """
     Execute the trigger flow.
@@ -218,79 +439,10 @@ async def run(args: argparse.Namespace) -> str:
             )
         logger.info("Found peer: %s (id=%s)", peer["name"], peer["id"])
 
-        # Step 2: Create a new chatroom
-        logger.info("Creating chatroom...")
-        try:
-            if args.auth_mode == "agent":
-                chat_response = await client.agent_api_chats.create_agent_chat(
-                    chat=ChatRoomRequest(),
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-            else:
-                chat_response = await client.human_api_chats.create_my_chat_room(
-                    chat=CreateMyChatRoomRequestChat(),
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-        except ApiError as e:
-            raise RuntimeError(_format_api_error(e, "create chatroom")) from e
-        room_id = chat_response.data.id
-        logger.info("Created chatroom: %s", room_id)
-
-        # Step 3: Add the target agent as a participant
-        # Step 4: Send the message mentioning the target agent
-        # Wrapped in try/except so we log the orphan room ID on partial failure.
-        try:
-            logger.info("Adding %s to chatroom...", peer["name"])
-            if args.auth_mode == "agent":
-                await client.agent_api_participants.add_agent_chat_participant(
-                    chat_id=room_id,
-                    participant=ParticipantRequest(participant_id=peer["id"]),
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-            else:
-                await client.human_api_participants.add_my_chat_participant(
-                    chat_id=room_id,
-                    participant=ParticipantRequest(participant_id=peer["id"]),
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-            logger.info("Added participant: %s", peer["name"])
-
-            logger.info("Sending message...")
-            mention = ChatMessageRequestMentionsItem(
-                id=peer["id"],
-                handle=peer["handle"],
-            )
-            message_request = ChatMessageRequest(
-                content=args.message,
-                mentions=[mention],
-            )
-            if args.auth_mode == "agent":
-                await client.agent_api_messages.create_agent_chat_message(
-                    chat_id=room_id,
-                    message=message_request,
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-            else:
-                await client.human_api_messages.send_my_chat_message(
-                    chat_id=room_id,
-                    message=message_request,
-                    request_options=DEFAULT_REQUEST_OPTIONS,
-                )
-            logger.info("Message sent successfully")
-        except ApiError as e:
-            logger.warning(
-                "Failed after creating room %s — room may need manual cleanup",
-                room_id,
-            )
-            raise RuntimeError(
-                f"{_format_api_error(e, 'complete trigger')} (orphan room: {room_id})"
-            ) from e
-        except Exception:
-            logger.warning(
-                "Failed after creating room %s — room may need manual cleanup",
-                room_id,
-            )
-            raise
+        # Step 2: Create a chatroom, add the peer and send the message
+        room_id = await _create_room_and_send(
+            client, peer, args.message, args.auth_mode
+        )
     finally:
         await client._client_wrapper.httpx_client.httpx_client.aclose()
 
@@ -302,6 +454,208 @@ async def run_with_timeout(args: argparse.Namespace) -> str:
     return await asyncio.wait_for(run(args), timeout=args.timeout)
 
 
+# --- Batch mode ---
+
+
+@dataclass
+class TriggerJob:
+    """One (target, message) pair from a batch input."""
+
+    index: int
+    target: str
+    message: str
+
+
+def read_jobs(
+    stream: IO[str], fmt: str = "jsonl"
+) -> tuple[list[TriggerJob], list[dict[str, Any]]]:
+    """
+    Parse batch input into jobs.
+
+    JSONL lines are objects with ``target`` (or ``target_handle``) and
+    ``message``. CSV input needs a header row with the same column names.
+    Blank JSONL lines are skipped. Job indexes are 1-based input positions.
+
+    Returns:
+        (jobs, errors) where errors are ready-to-emit result dicts for
+        malformed entries.
+    """
+    jobs: list[TriggerJob] = []
+    errors: list[dict[str, Any]] = []
+
+    if fmt == "csv":
+        rows: list[tuple[int, Any]] = list(enumerate(csv.DictReader(stream), start=1))
+    else:
+        rows = []
+        for index, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append((index, json.loads(line)))
+            except json.JSONDecodeError as e:
+                errors.append(
+                    {"index": index, "status": "error", "error": f"Invalid JSON: {e}"}
+                )
+
+    for index, row in rows:
+        if not isinstance(row, dict):
+            errors.append(
+                {"index": index, "status": "error", "error": "Job must be an object"}
+            )
+            continue
+        target = row.get("target") or row.get("target_handle")
+        message = row.get("message")
+        if not target or not message:
+            errors.append(
+                {
+                    "index": index,
+                    "target": target,
+                    "status": "error",
+                    "error": "Job requires 'target' and 'message'",
+                }
+            )
+            continue
+        jobs.append(TriggerJob(index=index, target=str(target), message=str(message)))
+
+    return jobs, errors
+
+
+class PeerCache:
+    """
+    Resolves peer handles with a single shared peer scan.
+
+    The first lookup starts one background scan that pages through all
+    peers and indexes them by normalized handle; every lookup waits for
+    that scan instead of starting its own. A lookup that is cancelled (e.g.
+    by its job's timeout) does not cancel the scan. If the scan fails, all
+    lookups fail with its error without scanning again.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRestClient,
+        auth_mode: str,
+        gate: RateLimitGate | None = None,
+    ):
+        self._client = client
+        self._auth_mode = auth_mode
+        self._gate = gate
+        self._scan: asyncio.Task[dict[str, dict[str, str]]] | None = None
+
+    async def resolve(self, handle: str) -> dict[str, str] | None:
+        if self._scan is None:
+            self._scan = asyncio.create_task(self._load_peers())
+        peers = await asyncio.shield(self._scan)
+        return peers.get(_peer_key(handle))
+
+    async def close(self) -> None:
+        """Cancel the peer scan if it is still running."""
+        if self._scan is not None and not self._scan.done():
+            self._scan.cancel()
+            try:
+                await self._scan
+            except asyncio.CancelledError:
+                pass
+
+    async def _load_peers(self) -> dict[str, dict[str, str]]:
+        peers: dict[str, dict[str, str]] = {}
+        async for peer in _iter_peers(self._client, self._auth_mode, self._gate):
+            key = _peer_key(getattr(peer, "handle", None))
+            if key:
+                peers.setdefault(key, _peer_dict(peer))
+        logger.info("Indexed %d peers", len(peers))
+        return peers
+
+
+async def _run_job(
+    job: TriggerJob,
+    client: AsyncRestClient,
+    peers: PeerCache,
+    gate: RateLimitGate,
+    auth_mode: str,
+    timeout: float,
+) -> dict[str, Any]:
+    result: dict[str, Any] = {"index": job.index, "target": job.target}
+
+    async def resolve_and_send() -> str:
+        peer = await peers.resolve(job.target)
+        if not peer:
+            raise ValueError(f"Target agent with handle '{job.target}' not found")
+        return await _create_room_and_send(client, peer, job.message, auth_mode, gate)
+
+    try:
+        result["room_id"] = await asyncio.wait_for(resolve_and_send(), timeout=timeout)
+        result["status"] = "ok"
+    except asyncio.TimeoutError:
+        result.update(status="error", error=f"timed out after {timeout} seconds")
+    except Exception as e:
+        result.update(status="error", error=str(e) or type(e).__name__)
+    return result
+
+
+async def run_batch(args: argparse.Namespace, out: IO[str] | None = None) -> int:
+    """
+    Execute many triggers from ``args.batch`` with bounded concurrency.
+
+    Writes one JSON result per job to ``out`` (stdout by default) as jobs
+    complete. Returns the number of failed jobs.
+    """
+    if not args.api_key:
+        raise ValueError(
+            "API key is required. Provide --api-key or set THENVOI_API_KEY."
+        )
+    if args.concurrency < 1:
+        raise ValueError("--concurrency must be >= 1")
+
+    out = out or sys.stdout
+    fmt = args.batch_format
+    if fmt == "auto":
+        fmt = "csv" if args.batch.lower().endswith(".csv") else "jsonl"
+
+    if args.batch == "-":
+        jobs, errors = read_jobs(sys.stdin, fmt)
+    else:
+        with open(args.batch, encoding="utf-8", newline="") as f:
+            jobs, errors = read_jobs(f, fmt)
+
+    def emit(result: dict[str, Any]) -> None:
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    for error in errors:
+        emit(error)
+    failures = len(errors)
+
+    client = AsyncRestClient(api_key=args.api_key, base_url=args.rest_url.rstrip("/"))
+    gate = RateLimitGate()
+    peers = PeerCache(client, args.auth_mode, gate)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def worker(job: TriggerJob) -> dict[str, Any]:
+        async with semaphore:
+            return await _run_job(
+                job, client, peers, gate, args.auth_mode, args.timeout
+            )
+
+    try:
+        for next_result in asyncio.as_completed([worker(job) for job in jobs]):
+            result = await next_result
+            if result["status"] != "ok":
+                failures += 1
+            emit(result)
+    finally:
+        await peers.close()
+        await client._client_wrapper.httpx_client.httpx_client.aclose()
+
+    logger.info(
+        "Batch complete: %d job(s), %d failed, %d rate-limit pause(s)",
+        len(jobs) + len(errors),
+        failures,
+        gate.throttled_count,
+    )
+    return failures
+
+
 def main() -> None:
     """CLI entry point."""
     parser = build_parser()
@@ -314,6 +668,14 @@ def main() -> None:
         stream=sys.stderr,
     )
 
+    if args.batch:
+        try:
+            failures = asyncio.run(run_batch(args))
+        except (ValueError, OSError) as e:
+            sys.stderr.write(f"Error: {e}\n")
+            sys.exit(1)
+        sys.exit(1 if failures else 0)
+
     try:
         room_id = asyncio.run(run_with_timeout(args))
     except asyncio.TimeoutError:
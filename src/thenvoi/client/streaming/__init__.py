@@ -8,6 +8,7 @@ Usage:
 
 from thenvoi.client.streaming.client import (
     WebSocketClient,
+    PayloadValidationMode,
     MessageCreatedPayload,
     RoomAddedPayload,
     RoomRemovedPayload,
@@ -24,6 +25,7 @@ from thenvoi.client.streaming.client import (
 
 __all__ = [
     "WebSocketClient",
+    "PayloadValidationMode",
     "MessageCreatedPayload",
     "RoomAddedPayload",
     "RoomRemovedPayload",
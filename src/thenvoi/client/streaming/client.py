@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable
 import logging
+from typing import Any, Literal
 
 from phoenix_channels_python_client.client import (
     PHXChannelsClient,
@@ -164,6 +165,14 @@ class ContactRemovedPayload(BaseModel):
     id: str
 
 
+PayloadValidationMode = Literal["strict", "trust_server"]
+"""How WebSocketClient decodes known event payloads.
+
+- ``"strict"``: full Pydantic validation of every field (default).
+- ``"trust_server"``: only check that required fields are present and
+  non-null, then build the payload model without type validation.
+"""
+
 _PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
     "message_created": MessageCreatedPayload,
     "room_added": RoomAddedPayload,
@@ -177,6 +186,53 @@ _PAYLOAD_MODELS: dict[str, type[BaseModel]] = {
     "contact_removed": ContactRemovedPayload,
 }
 
+# Required field names per payload model, computed once at import time so the
+# trust_server fast path never introspects model fields per event.
+_REQUIRED_FIELDS: dict[type[BaseModel], frozenset[str]] = {
+    model: frozenset(
+        name for name, field in model.model_fields.items() if field.is_required()
+    )
+    for model in _PAYLOAD_MODELS.values()
+}
+
+
+def _construct_metadata(raw: Any) -> Any:
+    """Build MessageMetadata (and nested mentions) without validation."""
+    if not isinstance(raw, dict):
+        return raw
+    data = dict(raw)
+    mentions = data.get("mentions")
+    if isinstance(mentions, list):
+        data["mentions"] = [
+            Mention.model_construct(**m) if isinstance(m, dict) else m for m in mentions
+        ]
+    return MessageMetadata.model_construct(**data)
+
+
+def _construct_payload(model: type[BaseModel], payload: dict[str, Any]) -> BaseModel:
+    """Build a payload model after a minimal required-field check.
+
+    Used by the ``"trust_server"`` validation mode. Only presence of required
+    fields is checked; types are not validated or coerced. Nested
+    ``MessageCreatedPayload.metadata`` is still built as ``MessageMetadata``
+    so attribute access downstream behaves the same as in strict mode.
+
+    Raises:
+        ValueError: If the payload is not an object or a required field is
+            missing or null.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("payload is not an object")
+    missing = [name for name in _REQUIRED_FIELDS[model] if payload.get(name) is None]
+    if missing:
+        raise ValueError(f"missing required fields: {', '.join(sorted(missing))}")
+
+    if model is MessageCreatedPayload and "metadata" in payload:
+        data = dict(payload)
+        data["metadata"] = _construct_metadata(data["metadata"])
+        return model.model_construct(**data)
+    return model.model_construct(**payload)
+
 
 class WebSocketClient:
     def __init__(
@@ -186,12 +242,16 @@ class WebSocketClient:
         agent_id: str | None = None,
         on_reconnect: Callable[[], Awaitable[None]] | None = None,
         on_disconnect: Callable[[Exception | None], Awaitable[None]] | None = None,
+        payload_validation: PayloadValidationMode = "strict",
     ):
+        if payload_validation not in ("strict", "trust_server"):
+            raise ValueError(f"Unknown payload_validation mode: {payload_validation!r}")
         self.ws_url = ws_url
         self.api_key = api_key
         self.agent_id = agent_id
         self._on_reconnect = on_reconnect
         self._on_disconnect = on_disconnect
+        self.payload_validation: PayloadValidationMode = payload_validation
         self._validation_error_count: int = 0
 
     @property
@@ -245,12 +305,15 @@ class WebSocketClient:
         model = _PAYLOAD_MODELS.get(message.event)
         if model is not None:
             try:
-                validated = model(**message.payload)
-            except ValidationError as e:
-                errors = "; ".join(
-                    f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}"
-                    for err in e.errors()
-                )
+                validated = self.decode_payload(model, message.payload)
+            except (ValidationError, ValueError) as e:
+                if isinstance(e, ValidationError):
+                    errors = "; ".join(
+                        f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}"
+                        for err in e.errors()
+                    )
+                else:
+                    errors = str(e)
                 logger.error(
                     "[WebSocket] Invalid %s payload: %s",
                     message.event,
@@ -278,6 +341,15 @@ class WebSocketClient:
                     "[WebSocket] Callback error for %s event", message.event
                 )
 
+    def decode_payload(
+        self, model: type[BaseModel], payload: dict[str, Any]
+    ) -> BaseModel:
+        """Decode a raw event payload into ``model`` per the validation mode."""
+        if self.payload_validation == "trust_server":
+            return _construct_payload(model, payload)
+        # model_validate skips the kwargs copy that model(**payload) makes.
+        return model.model_validate(payload)
+
     async def join_agent_rooms_channel(
         self,
         agent_id: str,
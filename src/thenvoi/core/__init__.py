@@ -1,5 +1,10 @@
 """Core protocols and types for composition-based architecture."""
 
+from thenvoi.core.history_store import (
+    HistoryStore,
+    RoomHistoryState,
+    SQLiteHistoryStore,
+)
 from thenvoi.core.protocols import (
     AgentToolsProtocol,
     FrameworkAdapter,
@@ -15,7 +20,10 @@ __all__ = [
     "FrameworkAdapter",
     "HistoryConverter",
     "HistoryProvider",
+    "HistoryStore",
     "PlatformMessage",
     "Preprocessor",
+    "RoomHistoryState",
+    "SQLiteHistoryStore",
     "SimpleAdapter",
 ]
@@ -0,0 +1,183 @@
+"""Process-pool offload for large history conversions.
+
+Converting a long room history (``json.loads`` per tool event, message
+grouping, framework object construction) is pure CPU work. Above a
+configurable size it is shipped to a worker process so the event loop --
+and with it every other room and the WebSocket heartbeat -- keeps running.
+
+Raw history is pickled once on the loop. The pickle doubles as the
+conversion's version fingerprint, and results are kept pickled per room so
+every cache hit hands the adapter a fresh copy it is free to mutate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from thenvoi.core.protocols import HistoryConverter
+
+logger = logging.getLogger(__name__)
+
+# Rooms whose converted history is kept; least recently used rooms are evicted
+DEFAULT_CACHE_ROOMS = 64
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+# Converter types checked for offload support: False when the converter or
+# its output cannot be pickled, so those rooms convert inline from then on.
+_offloadable: dict[type, bool] = {}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs an event loop and client
+            # threads is unsafe, and spawn behaves the same on every platform.
+            _pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_history_pool() -> None:
+    """Shut down the shared worker pool (it is recreated on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _can_offload(converter: HistoryConverter[Any]) -> bool:
+    """Whether the converter can be shipped to a worker (checked once per type)."""
+    converter_type = type(converter)
+    offloadable = _offloadable.get(converter_type)
+    if offloadable is None:
+        try:
+            pickle.dumps(converter, protocol=pickle.HIGHEST_PROTOCOL)
+            offloadable = True
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(
+                "%s is not picklable, converting history inline: %s",
+                converter_type.__name__,
+                e,
+            )
+            offloadable = False
+        _offloadable[converter_type] = offloadable
+    return offloadable
+
+
+def _convert_pickled(converter: HistoryConverter[Any], payload: bytes) -> bytes | None:
+    """Worker entry point: unpickle raw history, convert, pickle the result.
+
+    Returns None when the result cannot be pickled. Errors raised by the
+    converter itself propagate to the caller.
+    """
+    result = converter.convert(pickle.loads(payload))
+    try:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+class HistoryConversionCache:
+    """Per-room cache of pickled conversion results, keyed by history version."""
+
+    def __init__(self, max_rooms: int = DEFAULT_CACHE_ROOMS):
+        self._max_rooms = max_rooms
+        self._entries: OrderedDict[str, tuple[bytes, bytes]] = OrderedDict()
+
+    def get(self, room_id: str, version: bytes) -> bytes | None:
+        entry = self._entries.get(room_id)
+        if entry is None or entry[0] != version:
+            return None
+        self._entries.move_to_end(room_id)
+        return entry[1]
+
+    def put(self, room_id: str, version: bytes, result: bytes) -> None:
+        self._entries[room_id] = (version, result)
+        self._entries.move_to_end(room_id)
+        while len(self._entries) > self._max_rooms:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+async def convert_history(
+    converter: HistoryConverter[Any],
+    raw: list[dict[str, Any]],
+    *,
+    room_id: str,
+    threshold: int | None,
+    cache: HistoryConversionCache,
+) -> Any:
+    """Convert raw history, offloading to the worker pool above ``threshold``.
+
+    Falls back to converting inline when the converter or its output cannot
+    be pickled, or when the pool is unavailable. Errors raised by the
+    converter in the worker propagate.
+    """
+    if threshold is None or len(raw) <= threshold or not _can_offload(converter):
+        return converter.convert(raw)
+
+    start = time.perf_counter()
+    try:
+        payload = pickle.dumps(raw, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning(
+            "Room %s: History not picklable, converting inline: %s", room_id, e
+        )
+        return converter.convert(raw)
+
+    version = hashlib.blake2b(payload, digest_size=16).digest()
+    cached = cache.get(room_id, version)
+    if cached is not None:
+        logger.debug("Room %s: History conversion cache hit", room_id)
+        return pickle.loads(cached)
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(
+            _get_pool(), _convert_pickled, converter, payload
+        )
+    except BrokenProcessPool as e:
+        shutdown_history_pool()
+        logger.warning(
+            "Room %s: History offload failed, converting inline: %s", room_id, e
+        )
+        return converter.convert(raw)
+
+    if result is None:
+        _offloadable[type(converter)] = False
+        logger.warning(
+            "Room %s: %s output is not picklable, converting inline",
+            room_id,
+            type(converter).__name__,
+        )
+        return converter.convert(raw)
+
+    cache.put(room_id, version, result)
+    logger.debug(
+        "Room %s: Converted %s history messages in worker (%.1f ms)",
+        room_id,
+        len(raw),
+        (time.perf_counter() - start) * 1000,
+    )
+    return pickle.loads(result)
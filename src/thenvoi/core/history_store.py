@@ -0,0 +1,230 @@
+"""
+Durable per-room adapter history.
+
+Adapters that keep conversation history in memory (Anthropic, PydanticAI,
+Gemini) lose it on restart, and every room then re-downloads its full
+platform context and re-converts it on the next message. A HistoryStore
+persists each room's converted history together with the ID of the last
+message the adapter processed. On bootstrap the runtime loads that state
+lazily and asks the platform only for messages newer than the checkpoint.
+
+Example:
+    adapter = AnthropicAdapter(
+        model="claude-sonnet-4-5-20250929",
+        history_store=SQLiteHistoryStore("agent-state.db"),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class RoomHistoryState:
+    """Persisted adapter history for one room."""
+
+    history: list[Any]
+    """Adapter-format history, JSON-serializable (see SimpleAdapter.dump_history)."""
+    last_message_id: str
+    """ID of the last platform message the adapter finished processing."""
+
+
+@runtime_checkable
+class HistoryStore(Protocol):
+    """Storage for per-room adapter history checkpoints."""
+
+    async def load(self, room_id: str) -> RoomHistoryState | None:
+        """Return the saved state for a room, or None if there is none."""
+        ...
+
+    async def save(self, room_id: str, state: RoomHistoryState) -> None:
+        """Replace the saved state for a room."""
+        ...
+
+    async def delete(self, room_id: str) -> None:
+        """Forget a room's saved state (called when the agent leaves the room)."""
+        ...
+
+    async def close(self) -> None:
+        """Release resources. The store may be used again afterwards."""
+        ...
+
+
+@dataclass(frozen=True)
+class _SavedEntries:
+    """What a SQLiteHistoryStore last wrote for a room."""
+
+    count: int
+    first: str
+    last: str
+
+
+def _encode(entry: Any) -> str:
+    return json.dumps(entry, default=str)
+
+
+class SQLiteHistoryStore:
+    """HistoryStore backed by a SQLite file.
+
+    Entries are stored one row each and appended: a save writes only the
+    entries added since the room's previous save, so a turn costs its own
+    size rather than the whole history's. If the history got shorter or
+    its first or last previously saved entry changed (e.g. the adapter
+    trimmed it), the room's entries are rewritten.
+
+    Encoding and queries run in a worker thread so large histories do not
+    block the event loop. The connection is opened on first use and
+    reopened after ``close()``.
+
+    Use one database file per agent; rows are keyed by room ID only.
+
+    Args:
+        path: Database file path (created if missing).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = str(path)
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+        # Rooms whose stored entries are known; others are rewritten on save
+        self._saved: dict[str, _SavedEntries] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            with conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS history_checkpoints ("
+                    "room_id TEXT PRIMARY KEY, "
+                    "last_message_id TEXT NOT NULL, "
+                    "entries INTEGER NOT NULL, "
+                    "updated_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS history_entries ("
+                    "room_id TEXT NOT NULL, "
+                    "seq INTEGER NOT NULL, "
+                    "entry TEXT NOT NULL, "
+                    "PRIMARY KEY (room_id, seq))"
+                )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run ``fn(conn, *args)`` in a worker thread inside a transaction."""
+
+        def locked() -> _T:
+            with self._conn_lock:
+                conn = self._connect()
+                with conn:
+                    return fn(conn, *args)
+
+        return await asyncio.to_thread(locked)
+
+    def _load(self, conn: sqlite3.Connection, room_id: str) -> RoomHistoryState | None:
+        self._saved.pop(room_id, None)
+        row = conn.execute(
+            "SELECT last_message_id, entries FROM history_checkpoints "
+            "WHERE room_id = ?",
+            (room_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        last_message_id, count = row
+        entries = [
+            entry
+            for (entry,) in conn.execute(
+                "SELECT entry FROM history_entries "
+                "WHERE room_id = ? AND seq < ? ORDER BY seq",
+                (room_id, count),
+            )
+        ]
+        if len(entries) != count:
+            raise ValueError(
+                f"Saved history for room {room_id} has {len(entries)} of "
+                f"{count} entries"
+            )
+        if entries:
+            self._saved[room_id] = _SavedEntries(count, entries[0], entries[-1])
+        return RoomHistoryState(
+            history=[json.loads(entry) for entry in entries],
+            last_message_id=last_message_id,
+        )
+
+    def _save(
+        self, conn: sqlite3.Connection, room_id: str, state: RoomHistoryState
+    ) -> _SavedEntries | None:
+        history = state.history
+        saved = self._saved.pop(room_id, None)
+        first = _encode(history[0]) if history else None
+        start = 0
+        if (
+            saved is not None
+            and saved.count <= len(history)
+            and first == saved.first
+            and _encode(history[saved.count - 1]) == saved.last
+        ):
+            start = saved.count
+        else:
+            conn.execute("DELETE FROM history_entries WHERE room_id = ?", (room_id,))
+
+        encoded = [_encode(entry) for entry in history[start:]]
+        conn.executemany(
+            "INSERT INTO history_entries (room_id, seq, entry) VALUES (?, ?, ?)",
+            [(room_id, start + i, entry) for i, entry in enumerate(encoded)],
+        )
+        conn.execute(
+            "INSERT INTO history_checkpoints "
+            "(room_id, last_message_id, entries, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (room_id) DO UPDATE SET "
+            "last_message_id = excluded.last_message_id, "
+            "entries = excluded.entries, "
+            "updated_at = excluded.updated_at",
+            (room_id, state.last_message_id, len(history), time.time()),
+        )
+        if first is None:
+            return None
+        return _SavedEntries(
+            count=len(history),
+            first=first,
+            last=encoded[-1] if encoded else _encode(history[-1]),
+        )
+
+    def _delete(self, conn: sqlite3.Connection, room_id: str) -> None:
+        self._saved.pop(room_id, None)
+        conn.execute("DELETE FROM history_checkpoints WHERE room_id = ?", (room_id,))
+        conn.execute("DELETE FROM history_entries WHERE room_id = ?", (room_id,))
+
+    async def load(self, room_id: str) -> RoomHistoryState | None:
+        return await self._run(self._load, room_id)
+
+    async def save(self, room_id: str, state: RoomHistoryState) -> None:
+        # Recorded only once the transaction has committed
+        saved = await self._run(self._save, room_id, state)
+        if saved is not None:
+            self._saved[room_id] = saved
+
+    async def delete(self, room_id: str) -> None:
+        await self._run(self._delete, room_id)
+
+    async def close(self) -> None:
+        with self._conn_lock:
+            self._saved.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
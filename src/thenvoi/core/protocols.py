@@ -100,6 +100,16 @@ class AgentToolsProtocol(Protocol):
         """Get tool schemas in provider-specific format (openai/anthropic)."""
         ...
 
+    def get_shared_tool_schemas(
+        self,
+        format: str,
+        *,
+        include_memory: bool = False,
+        include_contacts: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Get tool schemas as shared objects that must not be modified."""
+        ...
+
     def get_anthropic_tool_schemas(
         self, *, include_memory: bool = False, include_contacts: bool = True
     ) -> list["ToolParam"]:
@@ -6,6 +6,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Generic, TypeVar, cast
 
+from thenvoi.core._history_offload import HistoryConversionCache, convert_history
+from thenvoi.core.history_store import HistoryStore, RoomHistoryState
 from thenvoi.core.protocols import AgentToolsProtocol, HistoryConverter
 from thenvoi.core.types import (
     AdapterFeatures,
@@ -62,6 +64,7 @@ class SimpleAdapter(Generic[H], ABC):
         *,
         history_converter: HistoryConverter[H] | None = None,
         features: AdapterFeatures | None = None,
+        history_store: HistoryStore | None = None,
     ):
         """
         Initialize adapter.
@@ -71,12 +74,18 @@ class SimpleAdapter(Generic[H], ABC):
                               Pass via __init__ to avoid shared state issues.
             features: Shared adapter feature settings (capabilities, emit, tool filters).
                      Defaults to empty AdapterFeatures().
+            history_store: Optional durable store for per-room history. Only
+                          used by adapters that implement dump_history().
         """
         self.history_converter = history_converter
         self.features = features or AdapterFeatures()
+        self.history_store = history_store
         self.agent_name: str = ""
         self.agent_description: str = ""
 
+        # Offloaded history conversions, per room (see history_offload_threshold)
+        self._history_cache = HistoryConversionCache()
+
     @abstractmethod
     async def on_message(
         self,
@@ -107,6 +116,20 @@ class SimpleAdapter(Generic[H], ABC):
         """Override for session cleanup."""
         pass
 
+    def dump_history(self, room_id: str) -> list[Any] | None:
+        """
+        Return a room's history in JSON-serializable form for history_store.
+
+        Adapters that keep per-room history override this together with
+        restore_history(). The default returns None, which disables
+        persistence.
+        """
+        return None
+
+    def restore_history(self, data: list[Any]) -> H:
+        """Rebuild history saved by dump_history(). Default: use as-is."""
+        return cast("H", list(data))
+
     async def on_started(self, agent_name: str, agent_description: str) -> None:
         """Override for post-start setup."""
         self.agent_name = agent_name
@@ -128,6 +151,15 @@ class SimpleAdapter(Generic[H], ABC):
                 ", ".join(sorted(c.value for c in unsupported_caps)),
             )
 
+        if (
+            self.history_store is not None
+            and type(self).dump_history is SimpleAdapter.dump_history
+        ):
+            logger.warning(
+                "%s does not support history_store (history will not be persisted)",
+                type(self).__name__,
+            )
+
         # Propagate agent name to converter if it supports it
         if self.history_converter and hasattr(self.history_converter, "set_agent_name"):
             self.history_converter.set_agent_name(agent_name)
@@ -138,12 +170,25 @@ class SimpleAdapter(Generic[H], ABC):
         """Implements FrameworkAdapter.on_event()."""
         # Convert history if converter is set
         if self.history_converter:
-            converted_history: Any = inp.history.convert(self.history_converter)
+            converted_history: Any = await convert_history(
+                self.history_converter,
+                inp.history.raw,
+                room_id=inp.room_id,
+                threshold=self.features.history_offload_threshold,
+                cache=self._history_cache,
+            )
         else:
             # No converter: pass raw HistoryProvider as H
             # Adapters without converters should type as SimpleAdapter[HistoryProvider]
             converted_history = inp.history
 
+        # Resumed from history_store: inp.history holds only newer messages
+        if inp.restored_history is not None and self.history_converter:
+            converted_history = [
+                *cast("list[Any]", self.restore_history(inp.restored_history)),
+                *converted_history,
+            ]
+
         await self.on_message(
             msg=inp.msg,
             tools=inp.tools,
@@ -153,3 +198,19 @@ class SimpleAdapter(Generic[H], ABC):
             is_session_bootstrap=inp.is_session_bootstrap,
             room_id=inp.room_id,
         )
+
+        if self.history_store is not None:
+            await self._save_history(inp.room_id, inp.last_message_id or inp.msg.id)
+
+    async def _save_history(self, room_id: str, last_message_id: str) -> None:
+        """Checkpoint a room's history after a message is handled."""
+        history = self.dump_history(room_id)
+        if history is None or self.history_store is None:
+            return
+        try:
+            await self.history_store.save(
+                room_id,
+                RoomHistoryState(history=history, last_message_id=last_message_id),
+            )
+        except Exception as e:
+            logger.warning("Room %s: Failed to save history: %s", room_id, e)
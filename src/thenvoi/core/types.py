@@ -43,6 +43,11 @@ class AdapterFeatures:
 
     Accepts list/set inputs for convenience; normalizes to frozen types
     internally.
+
+    history_offload_threshold: histories longer than this many messages are
+    converted in a worker process instead of on the event loop. None (the
+    default) always converts inline. The converter and its output must be
+    picklable; otherwise conversion falls back to inline.
     """
 
     capabilities: frozenset[Capability] = frozenset()
@@ -50,6 +55,7 @@ class AdapterFeatures:
     include_tools: tuple[str, ...] | None = None
     exclude_tools: tuple[str, ...] | None = None
     include_categories: tuple[str, ...] | None = None
+    history_offload_threshold: int | None = None
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "capabilities", frozenset(self.capabilities))
@@ -130,3 +136,10 @@ class AgentInput:
     contacts_msg: str | None  # Contact changes broadcast message
     is_session_bootstrap: bool
     room_id: str
+    # Adapter history restored from a HistoryStore on bootstrap; when set,
+    # ``history`` holds only the platform messages newer than the checkpoint.
+    restored_history: list[Any] | None = None
+    # ID of the newest message this turn covers: the last message of a
+    # coalesced batch, whose combined ``msg`` keeps the first message's ID.
+    # None means ``msg.id``.
+    last_message_id: str | None = None
@@ -0,0 +1,261 @@
+"""AgentHost - run many agent identities in one process."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from thenvoi.agent import DEFAULT_SHUTDOWN_TIMEOUT, Agent
+from thenvoi.platform.transport import HttpTransportConfig
+from thenvoi.preprocessing.default import DefaultPreprocessor
+from thenvoi.runtime.execution import ExecutionContext
+from thenvoi.runtime.platform_runtime import PlatformRuntime
+from thenvoi.runtime.scheduler import FairScheduler, SchedulerStats
+
+if TYPE_CHECKING:
+    from thenvoi.core.protocols import FrameworkAdapter, Preprocessor
+    from thenvoi.core.simple_adapter import SimpleAdapter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AgentMetrics:
+    """Point-in-time metrics for one hosted agent."""
+
+    agent_id: str
+    running: bool
+    active_rooms: int = 0
+    queued_events: int = 0
+    ws_validation_errors: int = 0
+    scheduler: SchedulerStats = field(default_factory=SchedulerStats)
+
+
+class AgentHost:
+    """
+    Runs many Agents in one event loop over shared transports.
+
+    All hosted agents share a single ``httpx.AsyncClient`` connection pool
+    for REST calls and, optionally, a FairScheduler that caps concurrent
+    agent turns across the whole process with round-robin fairness between
+    agents. Each agent still authenticates its own WebSocket, because the
+    platform binds a socket to one agent identity.
+
+    Example:
+        host = AgentHost(max_concurrent_turns=16)
+        for agent_id, api_key in credentials:
+            host.add_agent(adapter=MyAdapter(), agent_id=agent_id, api_key=api_key)
+
+        await host.run()
+    """
+
+    def __init__(
+        self,
+        ws_url: str = "wss://app.thenvoi.com/api/v1/socket/websocket",
+        rest_url: str = "https://app.thenvoi.com",
+        max_concurrent_turns: int | None = None,
+        httpx_client: httpx.AsyncClient | None = None,
+        transport: HttpTransportConfig | None = None,
+    ):
+        """
+        Initialize the host.
+
+        Args:
+            ws_url: Default WebSocket URL for hosted agents
+            rest_url: Default REST API URL for hosted agents
+            max_concurrent_turns: Cap on concurrent adapter turns across all
+                agents. None disables the shared scheduler.
+            httpx_client: Shared HTTP client. If None, the host creates one
+                and closes it on stop().
+            transport: Pool, HTTP/2 and timeout settings for the client the
+                host creates. Ignored when httpx_client is given.
+        """
+        self._ws_url = ws_url
+        self._rest_url = rest_url
+        self._owns_http = httpx_client is None
+        self._http = httpx_client or (transport or HttpTransportConfig()).build_client()
+        self._scheduler = (
+            FairScheduler(max_concurrent_turns)
+            if max_concurrent_turns is not None
+            else None
+        )
+        self._agents: dict[str, Agent] = {}
+        self._started = False
+
+    @property
+    def agents(self) -> dict[str, Agent]:
+        """Hosted agents by agent_id (copy)."""
+        return self._agents.copy()
+
+    @property
+    def scheduler(self) -> FairScheduler | None:
+        return self._scheduler
+
+    @property
+    def is_running(self) -> bool:
+        return self._started
+
+    def add_agent(
+        self,
+        adapter: "FrameworkAdapter | SimpleAdapter",
+        agent_id: str,
+        api_key: str,
+        preprocessor: "Preprocessor | None" = None,
+        **runtime_kwargs: Any,
+    ) -> Agent:
+        """
+        Register an agent identity with the host.
+
+        Args:
+            adapter: Framework adapter for this agent
+            agent_id: UUID of the agent
+            api_key: API key for this agent
+            preprocessor: Custom event preprocessor (default: DefaultPreprocessor)
+            **runtime_kwargs: Forwarded to PlatformRuntime (config,
+                session_config, contact_config, ws_url, rest_url, ...)
+
+        Returns:
+            The hosted Agent.
+        """
+        if agent_id in self._agents:
+            raise ValueError(f"Agent {agent_id} is already hosted")
+        if self._started:
+            raise RuntimeError("Cannot add agents after the host has started")
+
+        runtime_kwargs.setdefault("ws_url", self._ws_url)
+        runtime_kwargs.setdefault("rest_url", self._rest_url)
+        runtime = PlatformRuntime(
+            agent_id=agent_id,
+            api_key=api_key,
+            httpx_client=self._http,
+            **runtime_kwargs,
+        )
+        agent = Agent(
+            runtime=runtime,
+            adapter=adapter,
+            preprocessor=preprocessor or DefaultPreprocessor(),
+            scheduler=self._scheduler,
+        )
+        self._agents[agent_id] = agent
+        return agent
+
+    async def start(self) -> None:
+        """Start all hosted agents concurrently.
+
+        If any agent fails to start, the ones that did start are stopped
+        and the first error is raised. A host that closed its own HTTP
+        client on stop() cannot be started again.
+        """
+        if self._started:
+            logger.warning("AgentHost already started")
+            return
+        # Hosted runtimes hold the shared client, so a closed one cannot be
+        # swapped out here.
+        if self._owns_http and self._http.is_closed:
+            raise RuntimeError(
+                "AgentHost cannot be restarted after stop(); create a new host"
+            )
+
+        agents = list(self._agents.values())
+        results = await asyncio.gather(
+            *(agent.start() for agent in agents), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            await asyncio.gather(
+                *(agent.stop() for agent in agents), return_exceptions=True
+            )
+            raise errors[0]
+
+        self._started = True
+        logger.info("AgentHost started %s agent(s)", len(agents))
+
+    async def stop(self, timeout: float | None = None) -> bool:
+        """
+        Stop all hosted agents and close the shared HTTP client.
+
+        Returns:
+            True if every agent stopped gracefully.
+        """
+        results = await asyncio.gather(
+            *(agent.stop(timeout=timeout) for agent in self._agents.values()),
+            return_exceptions=True,
+        )
+        graceful = True
+        for agent_id, result in zip(self._agents, results):
+            if isinstance(result, BaseException):
+                logger.warning("Error stopping agent %s: %s", agent_id, result)
+                graceful = False
+            else:
+                graceful = graceful and result
+
+        if self._owns_http:
+            await self._http.aclose()
+        self._started = False
+        logger.info("AgentHost stopped (graceful=%s)", graceful)
+        return graceful
+
+    async def run_forever(self) -> None:
+        """Keep all hosted agents running until one connection exits."""
+        await asyncio.gather(*(a.run_forever() for a in self._agents.values()))
+
+    async def run(
+        self, shutdown_timeout: float | None = DEFAULT_SHUTDOWN_TIMEOUT
+    ) -> None:
+        """Start, run until interrupted, then stop all agents."""
+        await self.start()
+        try:
+            await self.run_forever()
+        finally:
+            await self.stop(timeout=shutdown_timeout)
+
+    async def __aenter__(self) -> "AgentHost":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop(timeout=DEFAULT_SHUTDOWN_TIMEOUT)
+
+    # --- Metrics ---
+
+    def metrics(self) -> dict[str, AgentMetrics]:
+        """Combined metrics for every hosted agent, keyed by agent_id."""
+        scheduler_stats = self._scheduler.stats() if self._scheduler else {}
+        return {
+            agent_id: self._agent_metrics(agent_id, agent, scheduler_stats)
+            for agent_id, agent in self._agents.items()
+        }
+
+    @staticmethod
+    def _agent_metrics(
+        agent_id: str,
+        agent: Agent,
+        scheduler_stats: dict[str, SchedulerStats],
+    ) -> AgentMetrics:
+        metrics = AgentMetrics(
+            agent_id=agent_id,
+            running=agent.is_running,
+            scheduler=scheduler_stats.get(agent_id, SchedulerStats()),
+        )
+        if not agent.is_running:
+            return metrics
+
+        sessions = agent.runtime.runtime.active_sessions
+        metrics.active_rooms = len(sessions)
+        metrics.queued_events = sum(
+            execution.queue.qsize()
+            for execution in sessions.values()
+            if isinstance(execution, ExecutionContext)
+        )
+        metrics.ws_validation_errors = agent.runtime.link.ws_validation_error_count
+        return metrics
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import re
 from collections.abc import AsyncIterator
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 from uuid import uuid4
 
 from a2a.types import (
@@ -36,12 +36,16 @@ from thenvoi.core.simple_adapter import SimpleAdapter
 from thenvoi.core.types import AdapterFeatures, Capability, Emit, PlatformMessage
 from thenvoi.integrations.a2a.gateway.server import GatewayServer
 from thenvoi.integrations.a2a.gateway.types import GatewaySessionState, PendingA2ATask
+from thenvoi.runtime.peer_index import PeerIndex
 from thenvoi_rest import Peer
 from thenvoi_rest.agent_api_peers.types.list_agent_peers_response import (
     ListAgentPeersResponse,
 )
 from thenvoi_rest.core.api_error import ApiError
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,6 +106,8 @@ class A2AGatewayAdapter(SimpleAdapter[GatewaySessionState]):
         gateway_url: str = "http://localhost:10000",
         port: int = 10000,
         features: AdapterFeatures | None = None,
+        peer_cache_path: str | None = None,
+        httpx_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize gateway adapter.
 
@@ -110,6 +116,11 @@ class A2AGatewayAdapter(SimpleAdapter[GatewaySessionState]):
             api_key: API key for authentication (same as Agent.create()).
             gateway_url: Base URL for A2A endpoints exposed by this gateway.
             port: Port for HTTP server to listen on.
+            peer_cache_path: Optional JSON file for warm-starting peer
+                discovery from the last known peer list.
+            httpx_client: Optional HTTP client to share with the agent's
+                link (pass the same client to Agent.create()) so gateway
+                calls draw on one connection pool.
         """
         super().__init__(
             history_converter=GatewayHistoryConverter(),
@@ -119,7 +130,12 @@ class A2AGatewayAdapter(SimpleAdapter[GatewaySessionState]):
         self.port = port
 
         # Direct REST client for room/message operations
-        self._rest = AsyncRestClient(base_url=rest_url, api_key=api_key)
+        if httpx_client is not None:
+            self._rest = AsyncRestClient(
+                base_url=rest_url, api_key=api_key, httpx_client=httpx_client
+            )
+        else:
+            self._rest = AsyncRestClient(base_url=rest_url, api_key=api_key)
 
         # Peers keyed by slug (primary) and UUID (fallback)
         self._peers: dict[str, Peer] = {}  # slug → Peer
@@ -139,6 +155,11 @@ class A2AGatewayAdapter(SimpleAdapter[GatewaySessionState]):
             8.0,
             16.0,
         )
+        self._peer_index = PeerIndex(
+            self._fetch_peer_page,
+            peer_model=Peer,
+            cache_path=peer_cache_path,
+        )
 
     async def on_started(self, agent_name: str, agent_description: str) -> None:
         """Fetch peers via REST and start HTTP server.
@@ -174,20 +195,17 @@ class A2AGatewayAdapter(SimpleAdapter[GatewaySessionState]):
 
     async def _fetch_all_peers_with_retry(self) -> list[Peer]:
         """Fetch all peer pages, retrying if the platform rate-limits startup."""
-        all_peers: list[Peer] = []
-        page = 1
-        page_size = 100
-
-        while True:
-            response = await self._list_peers_page_with_retry(
-                page=page,
-                page_size=page_size,
-            )
-            all_peers.extend(response.data)
-
-            if len(response.data) < page_size:
-                return all_peers
-            page += 1
+        await self._peer_index.ensure_loaded()
+        return self._peer_index.peers
+
+    async def _fetch_peer_page(
+        self, page: int, page_size: int
+    ) -> tuple[list[Peer], int | None]:
+        """PeerIndex page source; stops on the first short page."""
+        response = await self._list_peers_page_with_retry(
+            page=page, page_size=page_size
+        )
+        return list(response.data), None
 
     async def _list_peers_page_with_retry(
         self, *, page: int, page_size: int
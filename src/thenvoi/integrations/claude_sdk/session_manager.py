@@ -4,8 +4,11 @@ Session manager for Claude Agent SDK clients.
 Maintains one ClaudeSDKClient instance per Thenvoi chat room to ensure
 conversation continuity within each room.
 
-Uses a dedicated background task for all session operations to ensure
-connect() and disconnect() are always called from the same task context.
+Each room's session operations run on a dedicated per-room task, so
+connect() and disconnect() for a client are always called from the same
+task context while different rooms connect in parallel. The adapter drives a client on
+its own task, so it wraps each query/response turn in ``turn()`` to keep
+the session from being evicted while the turn streams.
 """
 
 from __future__ import annotations
@@ -13,8 +16,10 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Any
 
 try:
@@ -27,17 +32,27 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENT_CONNECTS = 8
+
 
 @dataclass
 class _SessionCommand:
-    """Command to be processed by the session manager task."""
+    """Command to be processed by a room's session task."""
 
-    action: str  # "create", "cleanup", "cleanup_all", "invalidate", "stop"
+    action: str  # "create", "cleanup", "evict", "invalidate", "touch"
     room_id: str | None = None
     resume_session_id: str | None = None
     result_future: asyncio.Future[Any] | None = None
 
 
+@dataclass
+class _RoomWorker:
+    """Per-room command queue and the task that drains it."""
+
+    queue: asyncio.Queue[_SessionCommand] = field(default_factory=asyncio.Queue)
+    task: asyncio.Task[None] | None = None
+
+
 class ClaudeSessionManager:
     """
     Manages ClaudeSDKClient instances per chat room.
@@ -49,33 +64,42 @@ class ClaudeSessionManager:
     - Lazy initialization (clients created on first message)
     - Session reuse (same client for all messages in a room)
     - Graceful cleanup on room leave/disconnect
-    - All session operations run in a single background task to avoid
-      cross-task asyncio issues with connect/disconnect
+    - Commands for one room run in order on that room's own task, so
+      connect/disconnect never cross tasks; rooms run in parallel, with
+      CLI subprocess spawns capped by ``max_concurrent_connects``
+    - Optional LRU cap on live sessions and idle disconnect; sessions
+      with a turn in progress (see ``turn()``) are never evicted
+    - ``prewarm()`` to spawn clients for rooms expected to be busy soon
 
     Example:
         import logging
         logger = logging.getLogger(__name__)
 
         manager = ClaudeSessionManager(base_options)
-        await manager.start()  # Start background task
+        await manager.start()
 
-        # Get client for room (creates if doesn't exist)
-        client = await manager.get_or_create_session("room-123")
+        with manager.turn("room-123"):
+            # Get client for room (creates if doesn't exist)
+            client = await manager.get_or_create_session("room-123")
 
-        # Use client
-        await client.query("Hello")
-        async for msg in client.receive_response():
-            logger.info("%s", msg)
+            # Use client
+            await client.query("Hello")
+            async for msg in client.receive_response():
+                logger.info("%s", msg)
 
         # Cleanup when done
         await manager.cleanup_session("room-123")
-        await manager.stop()  # Stop background task
+        await manager.stop()
     """
 
     def __init__(
         self,
         base_options: ClaudeAgentOptions,
         can_use_tool_factory: Callable[[str], CanUseTool] | None = None,
+        *,
+        max_concurrent_connects: int = DEFAULT_MAX_CONCURRENT_CONNECTS,
+        max_sessions: int | None = None,
+        idle_timeout_s: float | None = None,
     ):
         """
         Initialize session manager.
@@ -86,97 +110,149 @@ class ClaudeSessionManager:
             can_use_tool_factory: Optional factory that creates a room-specific
                 ``can_use_tool`` callback.  When set, each new session receives
                 its own callback bound to the room_id.
+            max_concurrent_connects: Maximum number of ``connect()`` calls
+                (CLI subprocess spawns) in flight at once across all rooms.
+            max_sessions: Optional cap on live sessions.  When exceeded, the
+                least recently used room's client is disconnected.
+            idle_timeout_s: Optional idle time after which a room's client is
+                disconnected.  Idle time is measured from the end of the
+                room's last ``turn()`` (or from session creation if it has
+                had none); a session is never idle while a turn is open.
         """
+        if max_concurrent_connects < 1:
+            raise ValueError("max_concurrent_connects must be >= 1")
         self.base_options = base_options
         self._can_use_tool_factory = can_use_tool_factory
-        self._sessions: dict[str, ClaudeSDKClient] = {}
-        self._command_queue: asyncio.Queue[_SessionCommand] = asyncio.Queue()
-        self._task: asyncio.Task[None] | None = None
+        self._max_sessions = max_sessions
+        self._idle_timeout_s = idle_timeout_s
+        # Insertion order doubles as recency order for LRU eviction
+        self._sessions: OrderedDict[str, ClaudeSDKClient] = OrderedDict()
+        self._workers: dict[str, _RoomWorker] = {}
+        self._evicting: set[str] = set()
+        # Open turns per room; these sessions are skipped by eviction
+        self._turns: dict[str, int] = {}
+        self._connect_semaphore = asyncio.Semaphore(max_concurrent_connects)
         self._started = False
         logger.info("ClaudeSessionManager initialized")
 
     async def start(self) -> None:
-        """Start the background task that manages all sessions."""
+        """Mark the manager as running. Room tasks are started on demand."""
         if self._started:
             return
 
-        self._task = asyncio.create_task(self._run_session_loop())
         self._started = True
-        logger.info("ClaudeSessionManager background task started")
+        logger.info("ClaudeSessionManager started")
 
     async def stop(self) -> None:
-        """Stop the background task and cleanup all sessions."""
+        """Cleanup all sessions and stop every room task."""
         if not self._started:
             return
 
-        # Send stop command
-        stop_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-        await self._command_queue.put(
-            _SessionCommand(action="stop", result_future=stop_future)
-        )
-
-        # Wait for cleanup to complete
-        await stop_future
+        await self.cleanup_all()
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+        workers = list(self._workers.values())
+        self._workers.clear()
+        for worker in workers:
+            if worker.task is not None:
+                worker.task.cancel()
+        await asyncio.gather(
+            *(w.task for w in workers if w.task is not None), return_exceptions=True
+        )
 
         self._started = False
-        logger.info("ClaudeSessionManager background task stopped")
+        logger.info("ClaudeSessionManager stopped")
+
+    def _submit(self, cmd: _SessionCommand) -> None:
+        """Queue a command on its room's task, starting the task if needed."""
+        room_key = cmd.room_id or ""
+        worker = self._workers.get(room_key)
+        if worker is None:
+            worker = _RoomWorker()
+            worker.task = asyncio.create_task(self._run_room_loop(room_key, worker))
+            self._workers[room_key] = worker
+        worker.queue.put_nowait(cmd)
+
+    async def _request(
+        self,
+        action: str,
+        room_id: str,
+        resume_session_id: str | None = None,
+    ) -> Any:
+        result_future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._submit(
+            _SessionCommand(
+                action=action,
+                room_id=room_id,
+                resume_session_id=resume_session_id,
+                result_future=result_future,
+            )
+        )
+        return await result_future
 
-    async def _run_session_loop(self) -> None:
-        """Background task that processes all session commands."""
-        logger.debug("Session loop started")
+    async def _run_room_loop(self, room_id: str, worker: _RoomWorker) -> None:
+        """Process one room's commands in order (runs in the room's task)."""
+        logger.debug("Session task started for room %s", room_id)
 
         while True:
+            idle_timeout = (
+                self._idle_timeout_s
+                if room_id in self._sessions and room_id not in self._turns
+                else None
+            )
             cmd: _SessionCommand | None = None
             try:
-                cmd = await self._command_queue.get()
-
-                if cmd.action == "create":
-                    client = await self._do_create_session(
-                        cmd.room_id, cmd.resume_session_id
-                    )
-                    if cmd.result_future:
-                        cmd.result_future.set_result(client)
-
-                elif cmd.action == "cleanup":
-                    await self._do_cleanup_session(cmd.room_id)
-                    if cmd.result_future:
-                        cmd.result_future.set_result(None)
-
-                elif cmd.action == "invalidate":
-                    self._do_invalidate_session(cmd.room_id)
-                    if cmd.result_future:
-                        cmd.result_future.set_result(None)
-
-                elif cmd.action == "cleanup_all":
-                    await self._do_cleanup_all()
-                    if cmd.result_future:
-                        cmd.result_future.set_result(None)
-
-                elif cmd.action == "stop":
-                    await self._do_cleanup_all()
-                    if cmd.result_future:
-                        cmd.result_future.set_result(None)
-                    break
-
-                self._command_queue.task_done()
-
+                cmd = await asyncio.wait_for(worker.queue.get(), idle_timeout)
+                result = await self._dispatch(cmd)
+                if cmd.result_future and not cmd.result_future.done():
+                    cmd.result_future.set_result(result)
+            except asyncio.TimeoutError:
+                if room_id in self._turns:
+                    # A turn began while we waited; its end restarts the timer
+                    continue
+                logger.info("Disconnecting idle session for room %s", room_id)
+                await self._do_cleanup_session(room_id)
             except asyncio.CancelledError:
-                logger.debug("Session loop cancelled")
+                logger.debug("Session task cancelled for room %s", room_id)
+                if cmd and cmd.result_future and not cmd.result_future.done():
+                    cmd.result_future.cancel()
                 break
             except Exception as e:
-                logger.error("Error in session loop: %s", e, exc_info=True)
+                logger.error(
+                    "Error in session task for room %s: %s", room_id, e, exc_info=True
+                )
                 if cmd and cmd.result_future and not cmd.result_future.done():
                     cmd.result_future.set_exception(e)
 
-        logger.debug("Session loop exited")
+            # No client left to own and nothing queued: let the task end.
+            # This check and _submit() never await, so no command is lost.
+            if room_id not in self._sessions and worker.queue.empty():
+                if self._workers.get(room_id) is worker:
+                    del self._workers[room_id]
+                break
+
+        logger.debug("Session task exited for room %s", room_id)
+
+    async def _dispatch(self, cmd: _SessionCommand) -> Any:
+        if cmd.action == "create":
+            return await self._do_create_session(cmd.room_id, cmd.resume_session_id)
+        if cmd.action == "cleanup":
+            await self._do_cleanup_session(cmd.room_id)
+            return None
+        if cmd.action == "evict":
+            if cmd.room_id in self._turns:
+                # A turn began after the eviction was queued; its end
+                # re-checks the cap.
+                self._evicting.discard(cmd.room_id)
+            else:
+                await self._do_cleanup_session(cmd.room_id)
+            return None
+        if cmd.action == "invalidate":
+            self._do_invalidate_session(cmd.room_id)
+            return None
+        if cmd.action == "touch":
+            # Waking the loop is enough to restart the idle timer
+            return None
+        raise ValueError(f"Unknown session command: {cmd.action}")
 
     def _build_options(
         self, room_id: str, resume_session_id: str | None = None
@@ -199,7 +275,7 @@ class ClaudeSessionManager:
     async def _do_create_session(
         self, room_id: str | None, resume_session_id: str | None
     ) -> ClaudeSDKClient:
-        """Create or get session (runs in background task)."""
+        """Create or get session (runs in the room's task)."""
         if not room_id:
             raise ValueError("room_id is required")
 
@@ -218,8 +294,9 @@ class ClaudeSessionManager:
             # Create new client with options
             client = ClaudeSDKClient(options=options)
 
-            # Connect the client (establishes session with Claude)
-            await client.connect()
+            # Connect the client (spawns the CLI subprocess)
+            async with self._connect_semaphore:
+                await client.connect()
 
             # Store for reuse
             self._sessions[room_id] = client
@@ -229,13 +306,31 @@ class ClaudeSessionManager:
                 room_id,
                 len(self._sessions),
             )
+            self._evict_over_capacity(keep=room_id)
         else:
             logger.debug("Reusing existing session for room: %s", room_id)
+            self._sessions.move_to_end(room_id)
 
         return self._sessions[room_id]
 
+    def _evict_over_capacity(self, keep: str) -> None:
+        """Queue cleanup of least recently used sessions beyond max_sessions."""
+        if self._max_sessions is None:
+            return
+
+        excess = len(self._sessions) - len(self._evicting) - self._max_sessions
+        for room_id in list(self._sessions):
+            if excess <= 0:
+                break
+            if room_id == keep or room_id in self._evicting or room_id in self._turns:
+                continue
+            logger.info("Evicting least recently used session for room %s", room_id)
+            self._evicting.add(room_id)
+            self._submit(_SessionCommand(action="evict", room_id=room_id))
+            excess -= 1
+
     def _do_invalidate_session(self, room_id: str | None) -> None:
-        """Evict a dead session without calling disconnect() (runs in background task).
+        """Evict a dead session without calling disconnect() (runs in the room's task).
 
         Use this when the CLI process has already terminated — calling
         disconnect() on a dead process would raise or hang.
@@ -245,6 +340,7 @@ class ClaudeSessionManager:
             return
 
         del self._sessions[room_id]
+        self._evicting.discard(room_id)
         logger.info(
             "Invalidated dead session for room %s (remaining sessions: %s)",
             room_id,
@@ -252,7 +348,9 @@ class ClaudeSessionManager:
         )
 
     async def _do_cleanup_session(self, room_id: str | None) -> None:
-        """Cleanup single session (runs in background task)."""
+        """Cleanup single session (runs in the room's task)."""
+        if room_id:
+            self._evicting.discard(room_id)
         if not room_id or room_id not in self._sessions:
             logger.debug("No session to cleanup for room: %s", room_id)
             return
@@ -273,15 +371,35 @@ class ClaudeSessionManager:
             len(self._sessions),
         )
 
-    async def _do_cleanup_all(self) -> None:
-        """Cleanup all sessions (runs in background task)."""
-        logger.info("Cleaning up all sessions (count: %s)", len(self._sessions))
+    @contextmanager
+    def turn(self, room_id: str) -> Iterator[None]:
+        """
+        Mark a room's session as in use for one query/response turn.
 
-        room_ids = list(self._sessions.keys())
-        for room_id in room_ids:
-            await self._do_cleanup_session(room_id)
+        The client is driven outside the room's task, so the manager cannot
+        otherwise tell a streaming turn from an idle session.  While a turn
+        is open the session is skipped by LRU and idle eviction; when the
+        room's last open turn ends, its idle timer restarts and the
+        ``max_sessions`` cap is enforced again.
 
-        logger.info("All sessions cleaned up")
+        Args:
+            room_id: Thenvoi chat room ID
+        """
+        self._turns[room_id] = self._turns.get(room_id, 0) + 1
+        try:
+            yield
+        finally:
+            self._turns[room_id] -= 1
+            if not self._turns[room_id]:
+                del self._turns[room_id]
+                self._end_turn(room_id)
+
+    def _end_turn(self, room_id: str) -> None:
+        if room_id in self._sessions:
+            self._sessions.move_to_end(room_id)
+            if room_id in self._workers:
+                self._submit(_SessionCommand(action="touch", room_id=room_id))
+        self._evict_over_capacity(keep=room_id)
 
     async def get_or_create_session(
         self, room_id: str, resume_session_id: str | None = None
@@ -303,18 +421,31 @@ class ClaudeSessionManager:
         if not self._started:
             await self.start()
 
-        result_future: asyncio.Future[ClaudeSDKClient] = (
-            asyncio.get_running_loop().create_future()
-        )
-        await self._command_queue.put(
-            _SessionCommand(
-                action="create",
-                room_id=room_id,
-                resume_session_id=resume_session_id,
-                result_future=result_future,
-            )
+        return await self._request("create", room_id, resume_session_id)
+
+    async def prewarm(self, room_ids: Iterable[str]) -> None:
+        """
+        Spawn clients ahead of time for rooms expected to receive messages.
+
+        Rooms connect in parallel (bounded by ``max_concurrent_connects``).
+        Failures are logged; the room simply connects lazily later.
+
+        Args:
+            room_ids: Thenvoi chat room IDs to warm up
+        """
+        if not self._started:
+            await self.start()
+
+        room_ids = list(dict.fromkeys(room_ids))
+        results = await asyncio.gather(
+            *(self._request("create", room_id) for room_id in room_ids),
+            return_exceptions=True,
         )
-        return await result_future
+        for room_id, result in zip(room_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to prewarm session for room %s: %s", room_id, result
+                )
 
     async def cleanup_session(self, room_id: str) -> None:
         """
@@ -331,15 +462,7 @@ class ClaudeSessionManager:
         if not self._started:
             return
 
-        result_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-        await self._command_queue.put(
-            _SessionCommand(
-                action="cleanup",
-                room_id=room_id,
-                result_future=result_future,
-            )
-        )
-        await result_future
+        await self._request("cleanup", room_id)
 
     async def invalidate_session(self, room_id: str) -> None:
         """
@@ -355,34 +478,26 @@ class ClaudeSessionManager:
         if not self._started:
             return
 
-        result_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-        await self._command_queue.put(
-            _SessionCommand(
-                action="invalidate",
-                room_id=room_id,
-                result_future=result_future,
-            )
-        )
-        await result_future
+        await self._request("invalidate", room_id)
 
     async def cleanup_all(self) -> None:
         """
         Disconnect all sessions.
 
         This should be called when the adapter is shutting down to ensure
-        all Claude SDK clients are properly disconnected.
+        all Claude SDK clients are properly disconnected.  Each room
+        disconnects on its own task, so rooms shut down in parallel.
         """
         if not self._started:
             return
 
-        result_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
-        await self._command_queue.put(
-            _SessionCommand(
-                action="cleanup_all",
-                result_future=result_future,
-            )
+        room_ids = list(dict.fromkeys([*self._sessions, *self._workers]))
+        logger.info("Cleaning up all sessions (count: %s)", len(self._sessions))
+        await asyncio.gather(
+            *(self._request("cleanup", room_id) for room_id in room_ids),
+            return_exceptions=True,
         )
-        await result_future
+        logger.info("All sessions cleaned up")
 
     def has_session(self, room_id: str) -> bool:
         """Check if session exists for room."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .pool import CodexClientPool, CodexPoolMember, CodexProcessStats
 from .rpc_base import (
     CodexJsonRpcError,
     OverloadRetryPolicy,
@@ -12,7 +13,10 @@ from .types import CodexSessionState
 from .websocket_client import CodexWebSocketClient
 
 __all__ = [
+    "CodexClientPool",
     "CodexJsonRpcError",
+    "CodexPoolMember",
+    "CodexProcessStats",
     "CodexStdioClient",
     "CodexWebSocketClient",
     "CodexSessionState",
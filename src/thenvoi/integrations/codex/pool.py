@@ -0,0 +1,129 @@
+"""Pool of Codex app-server connections with room affinity.
+
+A single app-server process serializes every room's turns behind one event
+stream. ``CodexClientPool`` keeps N independent members, each owning one
+client (one app-server process for stdio), its own event queue and its own
+turn lock. A room is pinned to one member for as long as it is active;
+new rooms go to the member serving the fewest rooms. When a member's
+transport dies only that member is reset and rebuilt, so rooms on other
+members keep running.
+
+The pool does not build clients itself. Callers create a client for a
+member on first use and call ``mark_failed`` when its transport closes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CodexProcessStats:
+    """Point-in-time resource snapshot for one pool member."""
+
+    index: int
+    pid: int | None
+    rooms: int
+    queued_events: int
+    restarts: int
+    busy: bool
+    rss_bytes: int | None
+
+
+@dataclass
+class CodexPoolMember:
+    """One app-server connection and the rooms pinned to it."""
+
+    index: int
+    client: Any | None = None
+    initialized: bool = False
+    rooms: set[str] = field(default_factory=set)
+    restarts: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def mark_failed(self) -> None:
+        """Drop the dead client so the next turn on this member rebuilds it."""
+        if self.client is None and not self.initialized:
+            return
+        self.client = None
+        self.initialized = False
+        self.restarts += 1
+
+    def stats(self) -> CodexProcessStats:
+        pid = getattr(self.client, "pid", None)
+        return CodexProcessStats(
+            index=self.index,
+            pid=pid,
+            rooms=len(self.rooms),
+            queued_events=getattr(self.client, "queued_events", 0),
+            restarts=self.restarts,
+            busy=self.lock.locked(),
+            rss_bytes=_process_rss_bytes(pid),
+        )
+
+
+class CodexClientPool:
+    """Fixed-size set of pool members with sticky, least-loaded room placement."""
+
+    def __init__(self, size: int = 1) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got: {size}")
+        self.members = [CodexPoolMember(index=i) for i in range(size)]
+        self._room_members: dict[str, CodexPoolMember] = {}
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def member_for(self, room_id: str) -> CodexPoolMember | None:
+        """Return the member a room is pinned to, if any."""
+        return self._room_members.get(room_id)
+
+    def assign(self, room_id: str) -> CodexPoolMember:
+        """Return the room's member, pinning it to the least-loaded one first."""
+        member = self._room_members.get(room_id)
+        if member is None:
+            member = min(self.members, key=lambda m: (len(m.rooms), m.index))
+            member.rooms.add(room_id)
+            self._room_members[room_id] = member
+            logger.debug("Codex room %s assigned to process %s", room_id, member.index)
+        return member
+
+    def release(self, room_id: str) -> CodexPoolMember | None:
+        """Unpin a room. Returns the member it was on, or None."""
+        member = self._room_members.pop(room_id, None)
+        if member is not None:
+            member.rooms.discard(room_id)
+        return member
+
+    def busy(self) -> bool:
+        """Whether any member is currently running a turn."""
+        return any(member.lock.locked() for member in self.members)
+
+    def has_rooms(self) -> bool:
+        return bool(self._room_members)
+
+    def stats(self) -> list[CodexProcessStats]:
+        """Per-member resource snapshot, ordered by member index."""
+        return [member.stats() for member in self.members]
+
+
+def _process_rss_bytes(pid: int | None) -> int | None:
+    """Resident set size of a process, where /proc is available."""
+    if pid is None:
+        return None
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                return int(parts[1]) * 1024
+    return None
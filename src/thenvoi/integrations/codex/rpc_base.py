@@ -6,7 +6,9 @@ import asyncio
 import json
 import logging
 import random
-from collections.abc import Awaitable, Callable
+import re
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -14,6 +16,23 @@ logger = logging.getLogger(__name__)
 
 JsonRpcId = int | str
 
+DEFAULT_MAX_QUEUED_EVENTS = 10_000
+DEFAULT_ENQUEUE_TIMEOUT_S = 30.0
+
+# Streaming notifications whose ``delta`` strings can be concatenated.
+DELTA_NOTIFICATION_METHODS = frozenset(
+    {
+        "item/agentMessage/delta",
+        "item/reasoning/textDelta",
+        "item/reasoning/summaryTextDelta",
+        "item/commandExecution/outputDelta",
+        "item/fileChange/outputDelta",
+    }
+)
+
+# Leading ``{"method":"..."`` of a notification line, read without decoding it.
+_LEADING_METHOD = re.compile(r'\{\s*"method"\s*:\s*"([^"\\]+)"')
+
 
 class CodexJsonRpcError(RuntimeError):
     """JSON-RPC error returned by codex app-server."""
@@ -59,12 +78,50 @@ class RpcEvent:
     raw: dict[str, Any]
 
 
+def _coalesce_delta(queued: RpcEvent, event: RpcEvent) -> RpcEvent | None:
+    """Merge two delta notifications for the same item, or return None."""
+    if (
+        queued.kind != "notification"
+        or queued.method != event.method
+        or not isinstance(queued.params, dict)
+        or not isinstance(event.params, dict)
+    ):
+        return None
+    before, after = queued.params.get("delta"), event.params.get("delta")
+    if not isinstance(before, str) or not isinstance(after, str):
+        return None
+    for key in ("itemId", "turnId", "threadId"):
+        if queued.params.get(key) != event.params.get(key):
+            return None
+    params = {**event.params, "delta": before + after}
+    return RpcEvent(
+        kind="notification",
+        method=event.method,
+        params=params,
+        id=None,
+        raw={**event.raw, "params": params},
+    )
+
+
 class BaseJsonRpcClient:
     """Abstract bidirectional JSON-RPC client with shared protocol logic.
 
     Subclasses implement transport-specific ``connect``, ``close``, and
     ``_send_json`` methods.  Read loops in subclasses should call
     ``_dispatch_rpc_message`` for each incoming text frame/line.
+
+    Server events are buffered in a bounded queue. When it is full the read
+    loop waits for the consumer instead of dropping events, which in turn
+    stops reading from the transport and pushes back on the server. An
+    event that cannot be queued within ``enqueue_timeout_s`` is dropped so
+    that a consumer that stopped reading cannot wedge pending requests.
+
+    ``notification_methods`` restricts which notifications are queued at
+    all; ``None`` keeps every one. Server requests and responses are never
+    filtered. Notifications that are clearly unwanted are recognised from
+    their leading ``"method"`` key and skipped without a full JSON decode.
+    Delta notifications (``coalesce_methods``) for the same item are merged
+    into the queued event while the consumer has not picked it up yet.
     """
 
     def __init__(
@@ -72,12 +129,28 @@ class BaseJsonRpcClient:
         *,
         retry_policy: OverloadRetryPolicy | None = None,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+        enqueue_timeout_s: float = DEFAULT_ENQUEUE_TIMEOUT_S,
+        notification_methods: Collection[str] | None = None,
+        coalesce_methods: Collection[str] = DELTA_NOTIFICATION_METHODS,
     ) -> None:
         self.retry_policy = retry_policy or OverloadRetryPolicy()
         self._sleep = sleep
+        self._enqueue_timeout_s = enqueue_timeout_s
+        self._notification_methods = (
+            frozenset(notification_methods)
+            if notification_methods is not None
+            else None
+        )
+        self._coalesce_methods = frozenset(coalesce_methods)
 
         self._pending: dict[JsonRpcId, asyncio.Future[dict[str, Any]]] = {}
-        self._events: asyncio.Queue[RpcEvent] = asyncio.Queue(maxsize=10_000)
+        # Bounded event buffer: the read loop waits on the condition for
+        # room, recv_event() waits on it for events.
+        self._events: deque[RpcEvent] = deque()
+        self._max_queued_events = max_queued_events
+        self._events_changed = asyncio.Condition()
+        self._notify_tasks: set[asyncio.Task[None]] = set()
         self._request_id = 0
         self._connected = False
         self._transport_label = "payload"  # overridden by subclasses for diagnostics
@@ -98,6 +171,11 @@ class BaseJsonRpcClient:
         """Serialize *payload* as JSON and send over the transport."""
         raise NotImplementedError
 
+    @property
+    def queued_events(self) -> int:
+        """Number of server events waiting for ``recv_event``."""
+        return len(self._events)
+
     # ------------------------------------------------------------------
     # Protocol methods (shared)
     # ------------------------------------------------------------------
@@ -189,8 +267,8 @@ class BaseJsonRpcClient:
     async def recv_event(self, timeout_s: float | None = None) -> RpcEvent:
         """Receive next notification/request emitted by server."""
         if timeout_s is None:
-            return await self._events.get()
-        return await asyncio.wait_for(self._events.get(), timeout=timeout_s)
+            return await self._next_event()
+        return await asyncio.wait_for(self._next_event(), timeout=timeout_s)
 
     # ------------------------------------------------------------------
     # Internal helpers (shared)
@@ -231,18 +309,75 @@ class BaseJsonRpcClient:
             if not future.done():
                 future.set_exception(error)
         self._pending.clear()
-        try:
-            self._events.put_nowait(
-                RpcEvent(
-                    kind="notification",
-                    method="transport/closed",
-                    params={"reason": reason},
-                    id=None,
-                    raw={"method": "transport/closed", "params": {"reason": reason}},
-                )
+        if len(self._events) >= self._max_queued_events:
+            # The consumer must see the disconnect; give up the oldest event.
+            self._events.popleft()
+            logger.warning("Event queue full; dropped oldest event for disconnect")
+        self._events.append(
+            RpcEvent(
+                kind="notification",
+                method="transport/closed",
+                params={"reason": reason},
+                id=None,
+                raw={"method": "transport/closed", "params": {"reason": reason}},
             )
-        except asyncio.QueueFull:
-            logger.warning("Event queue full; disconnect event dropped")
+        )
+        # Waking waiters needs the condition's lock, which this synchronous
+        # caller cannot take.
+        task = asyncio.get_running_loop().create_task(self._notify_events_changed())
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    async def _notify_events_changed(self) -> None:
+        async with self._events_changed:
+            self._events_changed.notify_all()
+
+    async def _next_event(self) -> RpcEvent:
+        """Take the oldest queued event, waiting until one arrives."""
+        async with self._events_changed:
+            await self._events_changed.wait_for(lambda: self._events)
+            event = self._events.popleft()
+            self._events_changed.notify_all()
+            return event
+
+    def _merge_into_tail(self, event: RpcEvent) -> bool:
+        """Fold a delta into the newest queued event. Returns whether it did."""
+        if not self._events:
+            return False
+        merged = _coalesce_delta(self._events[-1], event)
+        if merged is None:
+            return False
+        self._events[-1] = merged
+        return True
+
+    async def _enqueue_event(self, event: RpcEvent) -> None:
+        """Queue a server event, waiting for room when the queue is full."""
+        async with self._events_changed:
+            if event.method in self._coalesce_methods and self._merge_into_tail(event):
+                return
+            if len(self._events) >= self._max_queued_events:
+                logger.debug(
+                    "Event queue full (%s); pausing %s reads",
+                    self._max_queued_events,
+                    self._transport_label,
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._events_changed.wait_for(
+                            lambda: len(self._events) < self._max_queued_events
+                        ),
+                        timeout=self._enqueue_timeout_s,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "Event queue full for %.1fs; dropping %s %s",
+                        self._enqueue_timeout_s,
+                        event.kind,
+                        event.method,
+                    )
+                    return
+            self._events.append(event)
+            self._events_changed.notify_all()
 
     async def _dispatch_rpc_message(self, text: str) -> None:
         """Parse a raw JSON-RPC text frame and route it."""
@@ -250,6 +385,17 @@ class BaseJsonRpcClient:
         if not text:
             return
 
+        if self._notification_methods is not None:
+            leading = _LEADING_METHOD.match(text)
+            if (
+                leading is not None
+                and leading.group(1) not in self._notification_methods
+                and '"id"' not in text
+            ):
+                # Unsubscribed notification; anything with an "id" key
+                # might be a request and gets the full decode below.
+                return
+
         try:
             message = json.loads(text)
         except json.JSONDecodeError:
@@ -264,33 +410,32 @@ class BaseJsonRpcClient:
         method = message.get("method")
 
         if method and msg_id is not None:
-            try:
-                self._events.put_nowait(
-                    RpcEvent(
-                        kind="request",
-                        method=str(method),
-                        params=message.get("params"),
-                        id=msg_id,
-                        raw=message,
-                    )
+            await self._enqueue_event(
+                RpcEvent(
+                    kind="request",
+                    method=str(method),
+                    params=message.get("params"),
+                    id=msg_id,
+                    raw=message,
                 )
-            except asyncio.QueueFull:
-                logger.warning("Event queue full; dropping server request %s", method)
+            )
             return
 
         if method:
-            try:
-                self._events.put_nowait(
-                    RpcEvent(
-                        kind="notification",
-                        method=str(method),
-                        params=message.get("params"),
-                        id=None,
-                        raw=message,
-                    )
+            if (
+                self._notification_methods is not None
+                and method not in self._notification_methods
+            ):
+                return
+            await self._enqueue_event(
+                RpcEvent(
+                    kind="notification",
+                    method=str(method),
+                    params=message.get("params"),
+                    id=None,
+                    raw=message,
                 )
-            except asyncio.QueueFull:
-                logger.warning("Event queue full; dropping notification %s", method)
+            )
             return
 
         if msg_id is not None:
@@ -7,10 +7,16 @@ import json
 import logging
 import os
 import shutil
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Collection, Mapping, Sequence
 from typing import Any
 
-from .rpc_base import BaseJsonRpcClient, OverloadRetryPolicy
+from .rpc_base import (
+    DEFAULT_ENQUEUE_TIMEOUT_S,
+    DEFAULT_MAX_QUEUED_EVENTS,
+    DELTA_NOTIFICATION_METHODS,
+    BaseJsonRpcClient,
+    OverloadRetryPolicy,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +32,19 @@ class CodexStdioClient(BaseJsonRpcClient):
         env: Mapping[str, str] | None = None,
         retry_policy: OverloadRetryPolicy | None = None,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+        enqueue_timeout_s: float = DEFAULT_ENQUEUE_TIMEOUT_S,
+        notification_methods: Collection[str] | None = None,
+        coalesce_methods: Collection[str] = DELTA_NOTIFICATION_METHODS,
     ) -> None:
-        super().__init__(retry_policy=retry_policy, sleep=sleep)
+        super().__init__(
+            retry_policy=retry_policy,
+            sleep=sleep,
+            max_queued_events=max_queued_events,
+            enqueue_timeout_s=enqueue_timeout_s,
+            notification_methods=notification_methods,
+            coalesce_methods=coalesce_methods,
+        )
         self._transport_label = "codex output line"
         self.command = tuple(command) if command else self._default_codex_command()
         self.cwd = cwd
@@ -54,6 +71,13 @@ class CodexStdioClient(BaseJsonRpcClient):
                 return (resolved, "app-server", "--listen", "stdio://")
         return ("codex", "app-server", "--listen", "stdio://")
 
+    @property
+    def pid(self) -> int | None:
+        """Process ID of the running app-server, or None when not started."""
+        if self._proc is None or self._proc.returncode is not None:
+            return None
+        return self._proc.pid
+
     async def connect(self) -> None:
         """Start the codex app-server process and reader tasks."""
         if self._connected:
@@ -5,10 +5,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Collection
 from typing import Any
 
-from .rpc_base import BaseJsonRpcClient, OverloadRetryPolicy
+from .rpc_base import (
+    DEFAULT_ENQUEUE_TIMEOUT_S,
+    DEFAULT_MAX_QUEUED_EVENTS,
+    DELTA_NOTIFICATION_METHODS,
+    BaseJsonRpcClient,
+    OverloadRetryPolicy,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +29,19 @@ class CodexWebSocketClient(BaseJsonRpcClient):
         retry_policy: OverloadRetryPolicy | None = None,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
         connect_timeout_s: float = 10.0,
+        max_queued_events: int = DEFAULT_MAX_QUEUED_EVENTS,
+        enqueue_timeout_s: float = DEFAULT_ENQUEUE_TIMEOUT_S,
+        notification_methods: Collection[str] | None = None,
+        coalesce_methods: Collection[str] = DELTA_NOTIFICATION_METHODS,
     ) -> None:
-        super().__init__(retry_policy=retry_policy, sleep=sleep)
+        super().__init__(
+            retry_policy=retry_policy,
+            sleep=sleep,
+            max_queued_events=max_queued_events,
+            enqueue_timeout_s=enqueue_timeout_s,
+            notification_methods=notification_methods,
+            coalesce_methods=coalesce_methods,
+        )
         self._transport_label = "websocket payload"
         self.ws_url = ws_url
         self._connect_timeout_s = connect_timeout_s
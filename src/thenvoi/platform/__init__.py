@@ -4,12 +4,19 @@ Thenvoi Platform Layer - Wire-level connection to Thenvoi platform.
 Components:
     ThenvoiLink: WebSocket connection + event dispatch (REST via .rest)
     PlatformEvent: Single event type for all platform events
+    RestRateLimiter: Shared, priority-aware pacing of REST calls after 429s
+    HttpTransportConfig: Pool, HTTP/2 and timeout settings for REST calls
 """
 
 from .event import PlatformEvent
 from .link import ThenvoiLink
+from .rate_limit import RateLimitStats, RestRateLimiter
+from .transport import HttpTransportConfig
 
 __all__ = [
     "ThenvoiLink",
     "PlatformEvent",
+    "RestRateLimiter",
+    "RateLimitStats",
+    "HttpTransportConfig",
 ]
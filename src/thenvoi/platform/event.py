@@ -27,12 +27,18 @@ from thenvoi.client.streaming import (
 
 @dataclass
 class MessageEvent:
-    """Message created event."""
+    """Message created event.
+
+    When ``SessionConfig.coalesce_messages`` folds several queued messages
+    into one turn, ``payload`` holds the combined message and ``batch`` the
+    original payloads in arrival order.
+    """
 
     type: Literal["message_created"] = "message_created"
     room_id: str | None = None
     payload: MessageCreatedPayload | None = None
     raw: dict[str, Any] | None = None
+    batch: list[MessageCreatedPayload] | None = None
 
 
 @dataclass
@@ -9,14 +9,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from thenvoi.client.rest import AsyncRestClient, DEFAULT_REQUEST_OPTIONS
-from thenvoi.client.streaming import WebSocketClient
+from thenvoi.client.streaming import PayloadValidationMode, WebSocketClient
+from thenvoi.core.history_store import HistoryStore
+from thenvoi.runtime.metrics import (
+    NOOP_METRICS,
+    RuntimeMetrics,
+    instrument_httpx_client,
+)
+from thenvoi.runtime.memory_cache import MemoryCache
+from thenvoi.runtime.participant_cache import ParticipantCache
+from thenvoi.runtime.peer_index import PeerIndex
 from thenvoi.runtime.types import PlatformMessage
 from thenvoi_rest.core.api_error import ApiError
 
+from .rate_limit import RestRateLimiter, install_rate_limiter
+from .transport import HttpTransportConfig
 from .event import (
     MessageEvent,
     RoomAddedEvent,
@@ -33,6 +46,8 @@ from .event import (
 )
 
 if TYPE_CHECKING:
+    import httpx
+
     from thenvoi.client.streaming import (
         MessageCreatedPayload,
         ParticipantAddedPayload,
@@ -78,14 +93,64 @@ class ThenvoiLink:
         api_key: str,
         ws_url: str = "wss://app.thenvoi.com/api/v1/socket/websocket",
         rest_url: str = "https://app.thenvoi.com",
+        payload_validation: PayloadValidationMode = "strict",
+        httpx_client: "httpx.AsyncClient | None" = None,
+        metrics: RuntimeMetrics | None = None,
+        rate_limiter: RestRateLimiter | None = None,
+        transport: HttpTransportConfig | None = None,
     ):
         self.agent_id = agent_id
         self.api_key = api_key
         self.ws_url = ws_url
         self.rest_url = rest_url
+        self.payload_validation: PayloadValidationMode = payload_validation
+
+        # REST client - exposed directly (from ThenvoiAgent._api_client).
+        # A caller-owned httpx client lets several links share one pool;
+        # otherwise a transport config builds a tuned client that this link
+        # owns and closes on disconnect().
+        self._owned_httpx_client: httpx.AsyncClient | None = None
+        if httpx_client is None and transport is not None:
+            httpx_client = self._owned_httpx_client = transport.build_client()
+        if httpx_client is not None:
+            self.rest = AsyncRestClient(
+                api_key=api_key, base_url=rest_url, httpx_client=httpx_client
+            )
+        else:
+            self.rest = AsyncRestClient(api_key=api_key, base_url=rest_url)
+
+        # Optional shared REST rate limiter; links sharing an httpx client
+        # share the limiter installed on it first.
+        # Installed before the metrics hooks so REST latency and pool wait
+        # do not include time spent throttled.
+        self.rate_limiter: RestRateLimiter | None = None
+        if rate_limiter is not None:
+            self.rate_limiter = install_rate_limiter(
+                self.rest._client_wrapper.httpx_client.httpx_client, rate_limiter
+            )
+
+        # Metrics hooks (no-op unless configured): REST latency, queue wait
+        self.metrics: RuntimeMetrics = metrics or NOOP_METRICS
+        if self.metrics.enabled:
+            instrument_httpx_client(
+                self.rest._client_wrapper.httpx_client.httpx_client, self.metrics
+            )
+
+        # Shared peer directory for lookups; loaded lazily on first use and
+        # refreshed when contact events change the reachable peers.
+        self.peer_index = PeerIndex.for_agent(self.rest)
 
-        # REST client - exposed directly (from ThenvoiAgent._api_client)
-        self.rest = AsyncRestClient(api_key=api_key, base_url=rest_url)
+        # Shared participant lists: one in-flight fetch per room, reused
+        # briefly and invalidated by participant events.
+        self.participant_cache = ParticipantCache.for_agent(self.rest)
+
+        # Opt-in memory cache (AgentConfig.memory_cache_ttl); None means
+        # memory tools always call the platform.
+        self.memory_cache: MemoryCache | None = None
+
+        # Adapter history store (set by Agent when the adapter has one);
+        # lets rooms hydrate only messages newer than their checkpoint.
+        self.history_store: HistoryStore | None = None
 
         # WebSocket client (from ThenvoiAgent._ws_client)
         self._ws: WebSocketClient | None = None
@@ -96,11 +161,18 @@ class ThenvoiLink:
 
         # Event queue for async iteration
         self._event_queue: asyncio.Queue[PlatformEvent] = asyncio.Queue(maxsize=1000)
+        # Enqueue times, in queue order (only tracked when metrics are enabled)
+        self._enqueued_at: deque[float] = deque()
 
     @property
     def is_connected(self) -> bool:
         return self._is_connected
 
+    @property
+    def ws_validation_error_count(self) -> int:
+        """Events the current WebSocket dropped for failing payload validation."""
+        return self._ws.validation_error_count if self._ws is not None else 0
+
     # --- Async iterator protocol ---
 
     def __aiter__(self):
@@ -109,7 +181,12 @@ class ThenvoiLink:
 
     async def __anext__(self) -> PlatformEvent:
         """Get next event from the queue. Blocks until an event is available."""
-        return await self._event_queue.get()
+        event = await self._event_queue.get()
+        if self._enqueued_at:
+            self.metrics.record_queue_wait(
+                time.perf_counter() - self._enqueued_at.popleft()
+            )
+        return event
 
     # --- Connection lifecycle (from ThenvoiAgent.start/stop/run) ---
 
@@ -129,6 +206,7 @@ class ThenvoiLink:
             self.agent_id,
             on_reconnect=self._on_reconnected,
             on_disconnect=self._on_disconnected,
+            payload_validation=self.payload_validation,
         )
         await self._ws.__aenter__()
         self._is_connected = True
@@ -141,14 +219,28 @@ class ThenvoiLink:
         Extracted from ThenvoiAgent.stop() lines 193-195.
         """
         if not self._is_connected or not self._ws:
+            await self._close_owned_httpx_client()
             return
 
         await self._ws.__aexit__(None, None, None)
         self._ws = None
         self._is_connected = False
         self._subscribed_rooms.clear()
+        await self.peer_index.close()
+        await self.participant_cache.close()
+        if self.memory_cache is not None:
+            await self.memory_cache.close()
+        if self.history_store is not None:
+            await self.history_store.close()
+        await self._close_owned_httpx_client()
         logger.info("Disconnected from platform")
 
+    async def _close_owned_httpx_client(self) -> None:
+        """Close the REST client built from the transport config, if any."""
+        if self._owned_httpx_client is not None:
+            await self._owned_httpx_client.aclose()
+            self._owned_httpx_client = None
+
     async def run_forever(self) -> None:
         """
         Run until interrupted.
@@ -285,6 +377,8 @@ class ThenvoiLink:
         without leaking channels or replaying duplicate room joins.
         """
         logger.info("WebSocket reconnected — reconciling room state")
+        # Participant events may have been missed while disconnected
+        self.participant_cache.invalidate()
         self._queue_event(ReconnectedEvent())
 
     async def _on_disconnected(self, error: Exception | None) -> None:
@@ -295,6 +389,8 @@ class ThenvoiLink:
         """Queue event for async iteration. Logs warning if queue is full."""
         try:
             self._event_queue.put_nowait(event)
+            if self.metrics.enabled:
+                self._enqueued_at.append(time.perf_counter())
         except asyncio.QueueFull:
             logger.warning(
                 "Event queue full, dropping %s event for room %s",
@@ -325,6 +421,7 @@ class ThenvoiLink:
 
         From ThenvoiAgent._on_room_removed() lines 632-643.
         """
+        self.participant_cache.forget(payload.id)
         event = RoomRemovedEvent(
             room_id=payload.id,
             payload=payload,
@@ -354,6 +451,7 @@ class ThenvoiLink:
 
         Room deletions arrive on room_participants:{room_id} with a minimal payload.
         """
+        self.participant_cache.forget(room_id or payload.id)
         event = RoomDeletedEvent(
             room_id=room_id or payload.id,
             payload=payload,
@@ -369,6 +467,7 @@ class ThenvoiLink:
         From ThenvoiAgent._on_participant_added() lines 771-786.
         Payload is already validated by WebSocketClient._handle_events().
         """
+        self.participant_cache.invalidate(room_id)
         event = ParticipantAddedEvent(
             room_id=room_id,
             payload=payload,
@@ -384,6 +483,7 @@ class ThenvoiLink:
         From ThenvoiAgent._on_participant_removed() lines 788-805.
         Payload is already validated by WebSocketClient._handle_events().
         """
+        self.participant_cache.invalidate(room_id)
         event = ParticipantRemovedEvent(
             room_id=room_id,
             payload=payload,
@@ -429,6 +529,7 @@ class ThenvoiLink:
             payload.handle,
             payload.id,
         )
+        self.peer_index.invalidate()
         event = ContactAddedEvent(
             room_id=None,
             payload=payload,
@@ -438,6 +539,7 @@ class ThenvoiLink:
     async def _on_contact_removed(self, payload: "ContactRemovedPayload") -> None:
         """Handle contact_removed from WebSocket."""
         logger.debug("WebSocket: contact_removed contact_id=%s", payload.id)
+        self.peer_index.invalidate()
         event = ContactRemovedEvent(
             room_id=None,
             payload=payload,
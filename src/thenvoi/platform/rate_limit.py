@@ -0,0 +1,310 @@
+"""
+Shared client-side rate limiting for the platform REST API.
+
+Every REST call is sent with ``max_retries=3``, so when the platform
+answers 429 each room retries on its own and the retries add to the load
+that caused the 429s. A RestRateLimiter sits on the httpx client behind
+``ThenvoiLink.rest`` and is shared by every room (and by every link that
+shares the client):
+
+- It sends requests unthrottled until the first 429. From then on it
+  paces requests with a token bucket. The bucket pauses for the
+  Retry-After period and halves its rate on each new wave of 429s. It
+  adds back about one request/s per second of successes, and it switches
+  off once no 429 has arrived for ``recover_after`` seconds.
+- While throttled, waiting requests go out by priority class: chat
+  messages first, then execution events, then other calls, then
+  lifecycle marks (``mark_processing`` / ``processed`` / ``failed``).
+- It keeps a global retry budget. Each 429 spends one retry and each
+  success refunds part of one. With the budget empty, a 429 is raised to
+  the caller straight away instead of being retried.
+
+Example:
+    link = ThenvoiLink(agent_id, api_key, rate_limiter=RestRateLimiter())
+    link.rate_limiter.stats()["message"].throttled
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Literal
+
+from thenvoi_rest.core.api_error import ApiError
+
+if TYPE_CHECKING:
+    import httpx
+
+    from thenvoi.runtime.metrics import RuntimeMetrics
+
+logger = logging.getLogger(__name__)
+
+RequestClass = Literal["message", "event", "other", "lifecycle"]
+
+# Highest priority first
+REQUEST_CLASSES: tuple[RequestClass, ...] = ("message", "event", "other", "lifecycle")
+
+_LIFECYCLE_SUFFIXES = ("/processing", "/processed", "/failed")
+_DEFAULT_BACKOFF_S = 1.0
+
+
+def classify_request(method: str, path: str) -> RequestClass:
+    """Map a REST request to its priority class."""
+    path = path.rstrip("/")
+    if method == "POST":
+        if path.endswith("/messages"):
+            return "message"
+        if path.endswith("/events"):
+            return "event"
+        if path.endswith(_LIFECYCLE_SUFFIXES):
+            return "lifecycle"
+    return "other"
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Read a numeric Retry-After header, if present."""
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return max(float(value), 0.0)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+@dataclass
+class RateLimitStats:
+    """Per-class rate limiter counters."""
+
+    requests: int = 0
+    throttled: int = 0
+    """Requests that had to wait for the limiter."""
+    total_wait_seconds: float = 0.0
+    rate_limited: int = 0
+    """429 responses received."""
+    rejected: int = 0
+    """429s raised without a retry because the retry budget was empty."""
+
+
+class RestRateLimiter:
+    """Adaptive token bucket with priority classes and a retry budget."""
+
+    def __init__(
+        self,
+        *,
+        min_rate: float = 1.0,
+        retry_budget: float = 20.0,
+        budget_refill: float = 0.1,
+        recover_after: float = 60.0,
+        metrics: RuntimeMetrics | None = None,
+    ):
+        """
+        Args:
+            min_rate: Lowest pace (requests/second) repeated 429s can push
+                      the limiter down to.
+            retry_budget: Retries of 429 responses allowed in a burst.
+            budget_refill: Retries refunded per successful response.
+            recover_after: Seconds without a 429 after which requests are
+                           no longer paced.
+            metrics: Optional metrics hooks; receives per-class wait times.
+        """
+        if min_rate <= 0:
+            raise ValueError(f"min_rate must be positive, got: {min_rate}")
+        if retry_budget < 0:
+            raise ValueError(f"retry_budget must be >= 0, got: {retry_budget}")
+        self._min_rate = min_rate
+        self._max_budget = retry_budget
+        self._budget = retry_budget
+        self._budget_refill = budget_refill
+        self._recover_after = recover_after
+        self._metrics = metrics
+
+        # None = not throttled; requests go out as soon as the pause ends
+        self._rate: float | None = None
+        self._tokens = 0.0
+        self._refilled_at = 0.0
+        self._resume_at = 0.0
+        self._last_limited_at = 0.0
+        # Request start times over the last second, to seed the rate
+        self._recent: deque[float] = deque()
+
+        self._waiters: dict[RequestClass, deque[asyncio.Future[None]]] = {
+            request_class: deque() for request_class in REQUEST_CLASSES
+        }
+        self._pump_task: asyncio.Task[None] | None = None
+        self._stats = {
+            request_class: RateLimitStats() for request_class in REQUEST_CLASSES
+        }
+
+    @property
+    def rate(self) -> float | None:
+        """Current pace in requests/second, or None when not throttled."""
+        return self._rate
+
+    @property
+    def retry_budget(self) -> float:
+        """Retries of 429 responses currently available."""
+        return self._budget
+
+    def stats(self) -> dict[RequestClass, RateLimitStats]:
+        """Snapshot of per-class counters."""
+        return {key: replace(stats) for key, stats in self._stats.items()}
+
+    async def acquire(self, request_class: RequestClass) -> None:
+        """Wait until a request of this class may be sent."""
+        stats = self._stats[request_class]
+        stats.requests += 1
+        now = time.monotonic()
+        self._recent.append(now)
+        while self._recent and now - self._recent[0] > 1.0:
+            self._recent.popleft()
+
+        if not self._has_waiters() and self._take_token(now):
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[request_class].append(future)
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump(), name="rest-rate-limit")
+        try:
+            await future
+        finally:
+            if not future.done():
+                future.cancel()
+        waited = time.monotonic() - now
+        stats.throttled += 1
+        stats.total_wait_seconds += waited
+        if self._metrics is not None and self._metrics.enabled:
+            self._metrics.record_rest_throttle(request_class, waited)
+
+    def on_response(
+        self, request_class: RequestClass, status: int, headers: Mapping[str, str]
+    ) -> bool:
+        """
+        Learn from a response.
+
+        Returns:
+            False if the response is a 429 that must not be retried because
+            the retry budget is empty; True otherwise.
+        """
+        now = time.monotonic()
+        if status != 429:
+            if status < 400:
+                self._on_success(now)
+            return True
+
+        stats = self._stats[request_class]
+        stats.rate_limited += 1
+        # Requests already in flight when the first 429 arrived come back
+        # limited too; halve the rate once per pause, not once per response.
+        if now >= self._resume_at:
+            if self._rate is None:
+                logger.warning("REST rate limited; pacing requests")
+                self._rate = max(self._min_rate, len(self._recent) / 2)
+            else:
+                self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = 0.0
+            self._refilled_at = now
+        delay = retry_after_seconds(headers)
+        self._resume_at = max(
+            self._resume_at, now + (_DEFAULT_BACKOFF_S if delay is None else delay)
+        )
+        self._last_limited_at = now
+
+        if self._budget >= 1:
+            self._budget -= 1
+            return True
+        stats.rejected += 1
+        return False
+
+    def _on_success(self, now: float) -> None:
+        self._budget = min(self._max_budget, self._budget + self._budget_refill)
+        if self._rate is None:
+            return
+        if now - self._last_limited_at >= self._recover_after:
+            logger.info("REST rate limit lifted")
+            self._rate = None
+        else:
+            # Additive increase: about +1 request/s per second at full pace
+            self._rate += 1 / self._rate
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiters.values())
+
+    def _take_token(self, now: float) -> bool:
+        if now < self._resume_at:
+            return False
+        if self._rate is None:
+            return True
+        burst = max(1.0, self._rate)
+        elapsed = max(0.0, now - max(self._refilled_at, self._resume_at))
+        self._tokens = min(burst, self._tokens + elapsed * self._rate)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _next_token_delay(self, now: float) -> float:
+        if now < self._resume_at:
+            return self._resume_at - now
+        if self._rate is None:
+            return 0.0
+        return max(0.0, (1 - self._tokens) / self._rate)
+
+    def _next_waiter(self) -> asyncio.Future[None] | None:
+        for request_class in REQUEST_CLASSES:
+            waiters = self._waiters[request_class]
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    return future
+        return None
+
+    async def _pump(self) -> None:
+        """Release waiters in priority order as tokens become available."""
+        while self._has_waiters():
+            now = time.monotonic()
+            if not self._take_token(now):
+                await asyncio.sleep(self._next_token_delay(now))
+                continue
+            future = self._next_waiter()
+            if future is not None:
+                future.set_result(None)
+
+
+def install_rate_limiter(
+    client: httpx.AsyncClient, limiter: RestRateLimiter
+) -> RestRateLimiter:
+    """Route every request made through ``client`` via a rate limiter.
+
+    Adds request/response event hooks. A client that already has a limiter
+    keeps it, so links sharing one pool share one limiter; the installed
+    limiter is returned.
+    """
+    installed: RestRateLimiter | None = getattr(client, "_thenvoi_rate_limiter", None)
+    if installed is not None:
+        return installed
+
+    async def on_request(request: httpx.Request) -> None:
+        request_class = classify_request(request.method, request.url.path)
+        request.extensions["thenvoi_request_class"] = request_class
+        await limiter.acquire(request_class)
+
+    async def on_response(response: httpx.Response) -> None:
+        request_class = response.request.extensions.get(
+            "thenvoi_request_class", "other"
+        )
+        if not limiter.on_response(
+            request_class, response.status_code, response.headers
+        ):
+            raise ApiError(status_code=429, headers=dict(response.headers), body=None)
+
+    client.event_hooks["request"].append(on_request)
+    client.event_hooks["response"].append(on_response)
+    client._thenvoi_rate_limiter = limiter  # type: ignore[attr-defined]
+    return limiter
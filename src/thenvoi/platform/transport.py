@@ -0,0 +1,98 @@
+"""
+HTTP transport settings for the platform REST client.
+
+By default every ``AsyncRestClient`` builds its own httpx client with
+httpx's default pool (100 connections, 20 kept alive for 5 seconds) and
+one timeout for all phases. With hundreds of active rooms, requests queue
+for a connection and pay connection setup again and again.
+HttpTransportConfig builds one tuned ``httpx.AsyncClient`` to share
+between the link (and with it AgentTools and the contact handler) and
+other components that call the platform, such as the A2A gateway.
+
+Example:
+    transport = HttpTransportConfig(
+        max_connections=400,
+        http2=True,
+        endpoint_timeouts={"/api/v1/agent/chats/{id}/context": 120.0},
+    )
+    agent = Agent.create(adapter=adapter, ..., transport=transport)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from thenvoi.runtime.metrics import endpoint_template
+
+
+@dataclass(frozen=True)
+class HttpTransportConfig:
+    """Connection pool, protocol and timeout settings for REST calls."""
+
+    max_connections: int | None = 100
+    """Most open connections; further requests wait for one (None: no limit)."""
+    max_keepalive_connections: int | None = 20
+    """Most idle connections kept open for reuse."""
+    keepalive_expiry: float | None = 5.0
+    """Seconds an idle connection is kept before it is closed."""
+    http2: bool = False
+    """Multiplex requests over HTTP/2 connections. Requires ``h2``
+    (``pip install 'httpx[http2]'``)."""
+    timeout: float = 60.0
+    """Read/write timeout in seconds for requests without an endpoint override."""
+    connect_timeout: float = 10.0
+    """Seconds allowed to open a connection."""
+    pool_timeout: float | None = 60.0
+    """Seconds a request may wait for a free pool connection (None: no limit)."""
+    endpoint_timeouts: Mapping[str, float] = field(default_factory=dict)
+    """Read/write timeouts keyed by endpoint template, e.g.
+    ``"/api/v1/agent/chats/{id}/context"`` (IDs collapsed to ``{id}``)."""
+
+    def build_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create an httpx client with these settings.
+
+        Extra keyword arguments are passed to ``httpx.AsyncClient`` (e.g. a
+        custom ``transport``). The caller owns the client and closes it
+        with ``aclose()``.
+        """
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        try:
+            client = httpx.AsyncClient(
+                limits=limits,
+                http2=self.http2,
+                timeout=httpx.Timeout(
+                    self.timeout, connect=self.connect_timeout, pool=self.pool_timeout
+                ),
+                **kwargs,
+            )
+        except ImportError as e:
+            raise ImportError(
+                "h2 is required for HTTP/2.\n"
+                "Install with: pip install 'httpx[http2]'\n"
+                "Or: uv add 'httpx[http2]'"
+            ) from e
+
+        async def apply_timeouts(request: httpx.Request) -> None:
+            # The REST client passes one timeout for every phase; keep its
+            # read/write value but use ours for connect and pool waits.
+            current = request.extensions.get("timeout") or {}
+            override = self.endpoint_timeouts.get(endpoint_template(request.url.path))
+            read = override if override is not None else current.get("read")
+            write = override if override is not None else current.get("write")
+            request.extensions["timeout"] = {
+                "connect": self.connect_timeout,
+                "read": read,
+                "write": write,
+                "pool": self.pool_timeout,
+            }
+
+        client.event_hooks["request"].append(apply_timeouts)
+        return client
@@ -38,7 +38,7 @@ class DefaultPreprocessor(Preprocessor):
         """Process platform event into AgentInput."""
         # Pattern match on tagged union - only handle MessageEvent
         match event:
-            case MessageEvent(room_id=room_id, payload=msg_data):
+            case MessageEvent(room_id=room_id, payload=msg_data, batch=batch):
                 pass  # Continue processing
             case _:
                 return None  # Skip non-message events
@@ -79,9 +79,16 @@ class DefaultPreprocessor(Preprocessor):
 
         # Load history on session bootstrap (if hydration enabled)
         raw_history: list[dict[str, Any]] = []
+        restored_history: list[Any] | None = None
         if is_bootstrap:
             if ctx.config.enable_context_hydration:
-                raw_history = await self._load_history(ctx, msg)
+                # A coalesced turn covers several messages; none of them
+                # belong in the history the LLM is primed with.
+                batch_ids = {p.id for p in batch} if batch else set()
+                raw_history = await self._load_history(ctx, msg, batch_ids)
+                # Resumed from a history checkpoint: raw_history is only the
+                # messages newer than it
+                restored_history = ctx.pop_restored_history()
             ctx.mark_llm_initialized()
 
         # Check participants
@@ -101,6 +108,8 @@ class DefaultPreprocessor(Preprocessor):
             contacts_msg=contacts_msg,
             is_session_bootstrap=is_bootstrap,
             room_id=room_id,
+            restored_history=restored_history,
+            last_message_id=batch[-1].id if batch else None,
         )
 
     def _drain_system_messages(self, ctx: ExecutionContext) -> str | None:
@@ -125,13 +134,17 @@ class DefaultPreprocessor(Preprocessor):
         self,
         ctx: ExecutionContext,
         msg: PlatformMessage,
+        exclude_ids: set[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Load platform history for session bootstrap."""
         try:
             logger.info("Room %s: Loading history...", ctx.room_id)
             context = await ctx.get_context()
+            messages = context.messages
+            if exclude_ids:
+                messages = [m for m in messages if m.get("id") not in exclude_ids]
             history = format_history_for_llm(
-                context.messages,
+                messages,
                 exclude_id=msg.id,
                 participants=ctx.participants,
             )
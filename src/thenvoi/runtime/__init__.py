@@ -13,6 +13,14 @@ Utilities:
     prompts: System prompt rendering
     ParticipantTracker: Participant tracking with change detection
     MessageRetryTracker: Message retry tracking
+    FairScheduler: Shared turn concurrency limit with per-agent fairness
+    PeerIndex: Cached peer directory with handle/name/ID lookup
+    BroadcastLog: Shared broadcast log with per-room read cursors
+    MemoryCache: Write-through cache of agent memories
+    ParticipantCache: Single-flight cache of room participant lists
+    EventEmitter: Ordered background delivery of execution events
+    tool_options: Per-tool timeout and concurrency limits for custom tools
+    configure_custom_tool_executor: Size of the sync custom-tool thread pool
 
 Shutdown:
     GracefulShutdown: Signal handler for graceful agent termination
@@ -54,7 +62,19 @@ from .formatters import (
 )
 from .prompts import render_system_prompt, BASE_INSTRUCTIONS, TEMPLATES
 from .participant_tracker import ParticipantTracker
+from .peer_index import PeerIndex
+from .broadcast_log import BroadcastLog
+from .memory_cache import MemoryCache
+from .participant_cache import ParticipantCache
+from .event_emitter import EventEmitter
+from .custom_tools import (
+    ToolOptions,
+    configure_custom_tool_executor,
+    shutdown_custom_tool_executor,
+    tool_options,
+)
 from .retry_tracker import MessageRetryTracker
+from .scheduler import FairScheduler, SchedulerStats
 from .shutdown import GracefulShutdown, run_with_graceful_shutdown
 
 __all__ = [
@@ -91,6 +111,19 @@ __all__ = [
     # Trackers
     "ParticipantTracker",
     "MessageRetryTracker",
+    "PeerIndex",
+    "BroadcastLog",
+    "MemoryCache",
+    "ParticipantCache",
+    "EventEmitter",
+    # Custom tools
+    "ToolOptions",
+    "tool_options",
+    "configure_custom_tool_executor",
+    "shutdown_custom_tool_executor",
+    # Scheduling
+    "FairScheduler",
+    "SchedulerStats",
     # Shutdown
     "GracefulShutdown",
     "run_with_graceful_shutdown",
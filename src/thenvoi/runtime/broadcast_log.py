@@ -0,0 +1,119 @@
+"""
+BroadcastLog - Shared append-only log of messages broadcast to every room.
+
+Contact changes are announced to all active rooms. Instead of copying each
+message into every room's pending list, the runtime appends it once to a
+shared log and each room keeps a read cursor (a sequence number) into it.
+A room reads what it has not seen the next time it processes a message.
+
+The log is compacted past the slowest cursor. If dormant rooms hold it
+back for too long, the oldest entries are dropped anyway; a room whose
+cursor falls behind the log, or whose unread backlog exceeds
+``max_backlog``, gets the newest entries plus a one-line summary of how
+many it missed.
+"""
+
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BACKLOG = 20
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_SUMMARY = "{count} earlier update(s) omitted"
+
+
+class BroadcastLog:
+    """Append-only broadcast log with per-room read cursors."""
+
+    def __init__(
+        self,
+        summary: str = DEFAULT_SUMMARY,
+        max_backlog: int = DEFAULT_MAX_BACKLOG,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            summary: Format string for the line that replaces omitted
+                     messages; ``{count}`` is the number omitted.
+            max_backlog: Most messages one room receives per read; older
+                         unread messages are summarized.
+            max_entries: Log size that triggers compaction.
+        """
+        if max_backlog < 1:
+            raise ValueError(f"max_backlog must be >= 1, got: {max_backlog}")
+        if max_entries < 2 * max_backlog:
+            raise ValueError(
+                "max_entries must be at least twice max_backlog, "
+                f"got: {max_entries} < 2 * {max_backlog}"
+            )
+        self._summary = summary
+        self._max_backlog = max_backlog
+        self._max_entries = max_entries
+        self._entries: list[str] = []
+        self._first_seq = 0  # Sequence number of _entries[0]
+        self._cursors: dict[str, int] = {}
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended message will get."""
+        return self._first_seq + len(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, room_id: object) -> bool:
+        return room_id in self._cursors
+
+    def subscribe(self, room_id: str) -> None:
+        """Start tracking a room. It sees only messages appended from now on."""
+        self._cursors.setdefault(room_id, self.next_seq)
+
+    def unsubscribe(self, room_id: str) -> None:
+        """Stop tracking a room."""
+        self._cursors.pop(room_id, None)
+
+    def append(self, message: str) -> None:
+        """Broadcast a message to every subscribed room."""
+        self._entries.append(message)
+        if len(self._entries) > self._max_entries:
+            self._compact()
+
+    def read(self, room_id: str) -> list[str]:
+        """Return the room's unread messages and advance its cursor.
+
+        Returns an empty list for rooms that are not subscribed.
+        """
+        cursor = self._cursors.get(room_id)
+        if cursor is None:
+            return []
+        end = self.next_seq
+        self._cursors[room_id] = end
+        if cursor == end:
+            return []
+
+        start = max(cursor, self._first_seq, end - self._max_backlog)
+        messages = self._entries[start - self._first_seq :]
+        missed = start - cursor
+        if missed:
+            messages.insert(0, self._summary.format(count=missed))
+        return messages
+
+    def _compact(self) -> None:
+        """Drop entries every room has read, keeping at most half of max_entries.
+
+        Rooms further behind than that lose only entries they would get
+        summarized anyway (``max_entries // 2 >= max_backlog``). Leaving the
+        log half empty keeps the O(rooms) cursor scan amortized O(1) per append.
+        """
+        keep_from = max(
+            min(self._cursors.values(), default=self.next_seq),
+            self.next_seq - self._max_entries // 2,
+        )
+        drop = keep_from - self._first_seq
+        if drop <= 0:
+            return
+        del self._entries[:drop]
+        self._first_seq = keep_from
+        logger.debug("Compacted broadcast log: dropped %s entries", drop)
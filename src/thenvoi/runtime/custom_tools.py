@@ -3,13 +3,24 @@ Custom tools utilities for adapters.
 
 Provides helper functions to convert Pydantic models to tool schemas
 and execute custom tools with validation.
+
+Synchronous tool functions run in a bounded thread pool so a blocking
+tool (HTTP call, dataframe work) does not stall the event loop. Per-tool
+timeouts and concurrency limits are set with the ``tool_options``
+decorator; the pool size with ``configure_custom_tool_executor``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextvars
 import logging
-from typing import Any, Callable
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -18,6 +29,149 @@ logger = logging.getLogger(__name__)
 # Type alias for custom tool definition: (InputModel, callable)
 CustomToolDef = tuple[type[BaseModel], Callable[..., Any]]
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+DEFAULT_SYNC_TOOL_WORKERS = 8
+
+_OPTIONS_ATTR = "__thenvoi_tool_options__"
+
+_executor: ThreadPoolExecutor | None = None
+_executor_workers = DEFAULT_SYNC_TOOL_WORKERS
+_executor_lock = threading.Lock()
+# Running agents sharing the pool; the last one to stop shuts it down
+_executor_users = 0
+
+
+@dataclass
+class ToolOptions:
+    """Execution options for one custom tool function.
+
+    Attributes:
+        timeout: Seconds before the call fails with TimeoutError. A timed-out
+            sync tool cannot be interrupted; its thread runs to completion and
+            keeps its concurrency slot until then.
+        max_concurrency: Most calls of this tool running at once (across all
+            rooms). None means unlimited.
+        run_in_thread: Run a sync tool in the shared thread pool. Disable only
+            for trivial tools that must run on the event loop thread; such
+            calls ignore ``timeout`` and ``max_concurrency``.
+    """
+
+    timeout: float | None = None
+    max_concurrency: int | None = None
+    run_in_thread: bool = True
+    _semaphore: asyncio.Semaphore | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError(f"timeout must be positive, got: {self.timeout}")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be >= 1, got: {self.max_concurrency}"
+            )
+
+    def semaphore(self) -> asyncio.Semaphore | None:
+        if self.max_concurrency is None:
+            return None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+
+_DEFAULT_OPTIONS = ToolOptions()
+
+
+def tool_options(
+    *,
+    timeout: float | None = None,
+    max_concurrency: int | None = None,
+    run_in_thread: bool = True,
+) -> Callable[[_F], _F]:
+    """
+    Decorator setting execution options on a custom tool function.
+
+    Example:
+        @tool_options(timeout=30, max_concurrency=2)
+        def fetch_report(args: ReportInput) -> str:
+            return requests.get(args.url, timeout=25).text
+
+        adapter = AnthropicAdapter(additional_tools=[(ReportInput, fetch_report)])
+    """
+    options = ToolOptions(
+        timeout=timeout,
+        max_concurrency=max_concurrency,
+        run_in_thread=run_in_thread,
+    )
+
+    def decorator(func: _F) -> _F:
+        setattr(func, _OPTIONS_ATTR, options)
+        return func
+
+    return decorator
+
+
+def get_tool_options(func: Callable[..., Any]) -> ToolOptions:
+    """Return the options set with ``tool_options``, or the defaults."""
+    return getattr(func, _OPTIONS_ATTR, _DEFAULT_OPTIONS)
+
+
+def configure_custom_tool_executor(max_workers: int) -> None:
+    """
+    Set the size of the thread pool that runs synchronous custom tools.
+
+    Takes effect for the next pool created; call before the agent starts.
+    """
+    global _executor_workers
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got: {max_workers}")
+    with _executor_lock:
+        _executor_workers = max_workers
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared sync-tool pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_workers,
+                thread_name_prefix="thenvoi-tool",
+            )
+        return _executor
+
+
+def shutdown_custom_tool_executor() -> None:
+    """
+    Shut down the sync-tool pool (it is recreated on next use).
+
+    Queued calls are cancelled. A call that is already running (e.g. one
+    that timed out) keeps its thread until the tool function returns.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def retain_custom_tool_executor() -> None:
+    """Register a started agent as a user of the sync-tool pool."""
+    global _executor_users
+    with _executor_lock:
+        _executor_users += 1
+
+
+def release_custom_tool_executor() -> None:
+    """Unregister a stopped agent; the last one shuts the pool down."""
+    global _executor_users
+    with _executor_lock:
+        _executor_users = max(0, _executor_users - 1)
+        last = _executor_users == 0
+    if last:
+        shutdown_custom_tool_executor()
+
 
 def custom_tool_to_mcp_schema(
     input_model: type[BaseModel],
@@ -126,20 +280,36 @@ def custom_tools_to_schemas(
     return [converter(model) for model, _ in tools]
 
 
+def build_custom_tool_index(tools: list[CustomToolDef]) -> dict[str, CustomToolDef]:
+    """
+    Index custom tools by name for O(1) lookup.
+
+    Build once per adapter and pass to ``find_custom_tool``. When two tools
+    share a name the first one wins, as with a linear search.
+    """
+    index: dict[str, CustomToolDef] = {}
+    for model, func in tools:
+        index.setdefault(get_custom_tool_name(model), (model, func))
+    return index
+
+
 def find_custom_tool(
-    tools: list[CustomToolDef],
+    tools: list[CustomToolDef] | Mapping[str, CustomToolDef],
     name: str,
 ) -> CustomToolDef | None:
     """
     Find custom tool by name.
 
     Args:
-        tools: List of (InputModel, callable) tuples
+        tools: Index from build_custom_tool_index, or a list of
+               (InputModel, callable) tuples (searched linearly)
         name: Tool name to find
 
     Returns:
         Matching (InputModel, callable) tuple, or None if not found
     """
+    if isinstance(tools, Mapping):
+        return tools.get(name)
     for model, func in tools:
         if get_custom_tool_name(model) == name:
             return (model, func)
@@ -153,6 +323,9 @@ async def execute_custom_tool(
     """
     Execute custom tool with Pydantic validation.
 
+    Sync tool functions run in the shared thread pool. Options set with
+    ``tool_options`` (timeout, concurrency limit) apply to both kinds.
+
     Args:
         tool: (InputModel, callable) tuple
         arguments: Raw arguments dict from LLM
@@ -162,6 +335,7 @@ async def execute_custom_tool(
 
     Raises:
         ValueError: If arguments don't match InputModel schema (formatted for LLM)
+        TimeoutError: If the tool exceeds its configured timeout
         Exception: Any exception from tool function (for adapter to catch)
     """
     model, func = tool
@@ -179,6 +353,60 @@ async def execute_custom_tool(
             f"Invalid arguments for {tool_name}: {', '.join(errors)}"
         ) from e
 
-    if asyncio.iscoroutinefunction(func):
-        return await func(validated)
-    return func(validated)
+    options = get_tool_options(func)
+    is_async = asyncio.iscoroutinefunction(func)
+    if not is_async and not options.run_in_thread:
+        return func(validated)
+
+    semaphore = options.semaphore()
+    if semaphore is not None:
+        await semaphore.acquire()
+    try:
+        call = _start_call(func, validated, is_async, semaphore)
+    except BaseException:
+        if semaphore is not None:
+            semaphore.release()
+        raise
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(call), options.timeout)
+    except TimeoutError:
+        call.cancel()
+        raise TimeoutError(
+            f"Tool {get_custom_tool_name(model)} timed out after {options.timeout}s"
+        ) from None
+    except asyncio.CancelledError:
+        call.cancel()
+        raise
+
+
+def _start_call(
+    func: Callable[..., Any],
+    validated: BaseModel,
+    is_async: bool,
+    semaphore: asyncio.Semaphore | None,
+) -> asyncio.Future[Any]:
+    """Start a tool call; the semaphore is released when the call finishes.
+
+    A thread that is already running cannot be cancelled, so for sync tools
+    the slot is released by the worker's own completion rather than by the
+    awaiting side giving up (timeout or cancellation).
+    """
+    if is_async:
+        task = asyncio.ensure_future(func(validated))
+        if semaphore is not None:
+            task.add_done_callback(lambda _: semaphore.release())
+        return task
+
+    loop = asyncio.get_running_loop()
+    # Propagate contextvars (e.g. tracing) like asyncio.to_thread
+    ctx = contextvars.copy_context()
+    future = _get_executor().submit(ctx.run, func, validated)
+    if semaphore is not None:
+
+        def release(_: concurrent.futures.Future[Any]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        future.add_done_callback(release)
+    return asyncio.wrap_future(future)
@@ -0,0 +1,179 @@
+"""
+EventEmitter - Ordered, non-blocking delivery of execution events.
+
+Adapters report ``tool_call``, ``tool_result``, ``thought`` and ``task``
+events while a turn is running. Awaiting each report puts one REST
+round-trip per event on the turn's critical path. The emitter queues the
+event and returns immediately; one background task per room sends queued
+events in the order they were emitted.
+
+The events endpoint accepts one event per request, so events are sent one
+at a time rather than batched. The queue is bounded: once ``max_pending``
+events are waiting, new thoughts are dropped (or an older queued thought is
+evicted to make room for a tool or task event) and a single summary thought
+reports how many were omitted. Tool and task events are never dropped.
+
+Callers that need their event or message to land after the queued ones
+(errors, the final chat message) ``flush()`` first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
+
+if TYPE_CHECKING:
+    from thenvoi.client.rest import AsyncRestClient
+
+logger = logging.getLogger(__name__)
+
+# (content, message_type, metadata) -> created event
+SendEvent = Callable[[str, str, "dict[str, Any] | None"], Awaitable[Any]]
+
+DEFAULT_MAX_PENDING = 100
+DEFAULT_SUMMARY = "{count} thought(s) omitted"
+
+# Event types that may be delivered in the background
+DEFERRABLE_EVENT_TYPES = frozenset({"tool_call", "tool_result", "thought", "task"})
+
+_Event = tuple[str, str, "dict[str, Any] | None"]
+
+
+class EventEmitter:
+    """
+    Per-room queue of execution events with one ordered background sender.
+
+    Example:
+        emitter = EventEmitter.for_room(link.rest, room_id)
+        emitter.emit("Searching...", "thought")
+        await emitter.flush()
+    """
+
+    def __init__(
+        self,
+        send: SendEvent,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        summary: str = DEFAULT_SUMMARY,
+    ):
+        """
+        Args:
+            send: Coroutine that posts one event to the room.
+            max_pending: Queued events at which thoughts start being dropped.
+            summary: Format string for the thought that replaces dropped
+                     thoughts; ``{count}`` is the number dropped.
+        """
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got: {max_pending}")
+        self._send = send
+        self._max_pending = max_pending
+        self._summary = summary
+        self._queue: deque[_Event] = deque()
+        self._omitted = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def for_room(
+        cls, rest: "AsyncRestClient", room_id: str, **kwargs: Any
+    ) -> "EventEmitter":
+        """Build an emitter over ``agent_api_events.create_agent_chat_event``."""
+        from thenvoi.client.rest import ChatEventRequest
+
+        async def send(
+            content: str, message_type: str, metadata: dict[str, Any] | None
+        ) -> Any:
+            return await rest.agent_api_events.create_agent_chat_event(
+                chat_id=room_id,
+                event=ChatEventRequest(
+                    content=content,
+                    message_type=message_type,
+                    metadata=metadata,
+                ),
+                request_options=DEFAULT_REQUEST_OPTIONS,
+            )
+
+        return cls(send, **kwargs)
+
+    @property
+    def pending(self) -> int:
+        """Events queued but not yet sent."""
+        return len(self._queue)
+
+    def emit(
+        self,
+        content: str,
+        message_type: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue an event for background delivery. Never blocks."""
+        if len(self._queue) >= self._max_pending and not self._make_room(message_type):
+            self._omitted += 1
+        else:
+            self._queue.append((content, message_type, metadata))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="event-emitter")
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been sent (or failed)."""
+        task = self._task
+        if task is not None and not task.done():
+            # Shield: a cancelled caller must not stop delivery for the room
+            await asyncio.shield(task)
+
+    async def close(self, timeout: float | None = 5.0) -> None:
+        """
+        Deliver what is queued, giving up after ``timeout`` seconds.
+
+        Events still queued at the deadline are discarded. The emitter may
+        be used again afterwards.
+        """
+        task = self._task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Event emitter: discarding %s unsent event(s) on close",
+                len(self._queue) + (1 if self._omitted else 0),
+            )
+            self._queue.clear()
+            self._omitted = 0
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+
+    def _make_room(self, message_type: str) -> bool:
+        """Evict the oldest queued thought for a higher-priority event."""
+        if message_type == "thought":
+            return False
+        for index, (_, queued_type, _) in enumerate(self._queue):
+            if queued_type == "thought":
+                del self._queue[index]
+                self._omitted += 1
+                return True
+        # Nothing droppable; tool and task events exceed the bound instead.
+        return True
+
+    async def _run(self) -> None:
+        while self._queue or self._omitted:
+            if self._omitted:
+                count, self._omitted = self._omitted, 0
+                await self._deliver(self._summary.format(count=count), "thought", None)
+                continue
+            await self._deliver(*self._queue.popleft())
+
+    async def _deliver(
+        self, content: str, message_type: str, metadata: dict[str, Any] | None
+    ) -> None:
+        try:
+            await self._send(content, message_type, metadata)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Failed to send %s event: %s", message_type, e)
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import (
@@ -29,6 +30,8 @@ from typing import (
 )
 
 from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
+from thenvoi.client.streaming import MessageCreatedPayload, MessageMetadata
+from thenvoi.core.history_store import HistoryStore
 from thenvoi.platform.event import (
     MessageEvent,
     ParticipantAddedEvent,
@@ -45,13 +48,37 @@ from .types import (
     SYNTHETIC_SENDER_TYPE,
     SYNTHETIC_CONTACT_EVENTS_SENDER_ID,
 )
+from .event_emitter import EventEmitter
+from .participant_cache import ParticipantCache
 from .retry_tracker import MessageRetryTracker
 
 if TYPE_CHECKING:
     from thenvoi.platform.link import ThenvoiLink
 
+    from .broadcast_log import BroadcastLog
+
 logger = logging.getLogger(__name__)
 
+# Resuming from a history checkpoint reads the context from the newest page
+# back; a checkpoint older than this many pages falls back to full hydration.
+_RESUME_PAGE_SIZE = 50
+_RESUME_MAX_PAGES = 4
+
+
+def _context_message(item: Any) -> dict[str, Any]:
+    """Convert a chat context item into a history message dict."""
+    sender_name = getattr(item, "sender_name", None) or getattr(item, "name", None)
+    return {
+        "id": item.id,
+        "content": getattr(item, "content", ""),
+        "sender_id": getattr(item, "sender_id", ""),
+        "sender_type": getattr(item, "sender_type", ""),
+        "sender_name": sender_name,
+        "message_type": getattr(item, "message_type", "text"),
+        "metadata": getattr(item, "metadata", {}),
+        "created_at": getattr(item, "inserted_at", None),
+    }
+
 
 def _error_label(e: Exception) -> str:
     """Return a non-empty label for an exception, falling back to the class name."""
@@ -156,6 +183,7 @@ class ExecutionContext:
         on_participant_removed: ParticipantRemovedCallback | None = None,
         *,
         hub_room_id: str | None = None,
+        broadcast_log: BroadcastLog | None = None,
     ):
         """
         Initialize execution context for a specific room.
@@ -171,6 +199,9 @@ class ExecutionContext:
             hub_room_id: Optional hub-room ID. Forwarded to AgentTools so the
                 schema methods can auto-enable contact tools when this context
                 belongs to the hub room.
+            broadcast_log: Optional shared log of contact broadcasts. The
+                context subscribes on start and reads unseen broadcasts
+                through get_pending_system_messages().
         """
         self.room_id = room_id
         self.link = link
@@ -196,6 +227,8 @@ class ExecutionContext:
 
         # LLM context tracking
         self._llm_initialized = False
+        # Adapter history restored from link.history_store on first hydration
+        self._restored_history: list[Any] | None = None
 
         # Dedupe cache (LRU for detecting duplicates during sync)
         self._processed_ids: OrderedDict[str, bool] = OrderedDict()
@@ -213,8 +246,19 @@ class ExecutionContext:
         self._idle_event: asyncio.Event = asyncio.Event()
         self._idle_event.set()  # Start as idle
 
-        # Pending system messages to inject (e.g., contact broadcasts)
+        # Pending system messages to inject (e.g., hub-room prompt). Contact
+        # broadcasts are read from the shared broadcast log instead.
         self._pending_system_messages: list[str] = []
+        self._broadcast_log = broadcast_log
+
+        # Background sender for execution events (AgentTools.send_event)
+        self.event_emitter: EventEmitter | None = (
+            EventEmitter.for_room(
+                link.rest, room_id, max_pending=self.config.max_pending_events
+            )
+            if self.config.defer_execution_events
+            else None
+        )
 
     @property
     def thread_id(self) -> str:
@@ -275,6 +319,8 @@ class ExecutionContext:
 
         logger.info("Starting ExecutionContext for room: %s", self.room_id)
         self._is_running = True
+        if self._broadcast_log is not None:
+            self._broadcast_log.subscribe(self.room_id)
         self._process_loop_task = asyncio.create_task(
             self._process_loop(),
             name=f"execution-{self.room_id}",
@@ -296,6 +342,9 @@ class ExecutionContext:
             True if stopped gracefully (processing completed or was idle),
             False if had to cancel mid-processing after timeout.
         """
+        if self._broadcast_log is not None:
+            self._broadcast_log.unsubscribe(self.room_id)
+
         if self._process_loop_task is None:
             return True
 
@@ -321,6 +370,8 @@ class ExecutionContext:
         except asyncio.CancelledError:
             pass
         self._process_loop_task = None
+        if self.event_emitter is not None:
+            await self.event_emitter.close(timeout=timeout or 0)
         return graceful
 
     async def _wait_for_idle(self, timeout: float) -> bool:
@@ -360,6 +411,9 @@ class ExecutionContext:
 
         self.queue.put_nowait(event)
         logger.debug("Event %s enqueued for room %s", event.type, self.room_id)
+        metrics = self.link.metrics
+        if metrics.enabled:
+            metrics.record_queue_depth(self.room_id, self.queue.qsize())
 
     # --- Participant management ---
 
@@ -435,11 +489,16 @@ class ExecutionContext:
         """
         Get and clear pending system messages.
 
+        Includes contact broadcasts not yet seen by this room, read from the
+        shared broadcast log (capped, with older ones summarized).
+
         Returns:
             List of pending messages (cleared after call)
         """
         messages = self._pending_system_messages.copy()
         self._pending_system_messages.clear()
+        if self._broadcast_log is not None:
+            messages.extend(self._broadcast_log.read(self.room_id))
         return messages
 
     async def load_participants(self) -> list[dict[str, Any]]:
@@ -448,11 +507,16 @@ class ExecutionContext:
             return self._participants
 
         try:
-            response = await self.link.rest.agent_api_participants.list_agent_chat_participants(
-                chat_id=self.room_id,
-                request_options=DEFAULT_REQUEST_OPTIONS,
-            )
-            if response.data:
+            cache = getattr(self.link, "participant_cache", None)
+            if isinstance(cache, ParticipantCache):
+                data = await cache.get(self.room_id)
+            else:
+                response = await self.link.rest.agent_api_participants.list_agent_chat_participants(
+                    chat_id=self.room_id,
+                    request_options=DEFAULT_REQUEST_OPTIONS,
+                )
+                data = response.data
+            if data:
                 self._participants = [
                     {
                         "id": p.id,
@@ -460,7 +524,7 @@ class ExecutionContext:
                         "type": p.type,
                         "handle": getattr(p, "handle", None),
                     }
-                    for p in response.data
+                    for p in data
                 ]
             self._participants_loaded = True
         except Exception as e:
@@ -502,6 +566,20 @@ class ExecutionContext:
             self._context_hydrated = True
             return
 
+        # First hydration after a restart: resume from the adapter's saved
+        # history and fetch only the messages newer than its checkpoint
+        if not self._llm_initialized:
+            newer = await self._resume_from_history_store()
+            if newer is not None:
+                self._context_cache = ConversationContext(
+                    room_id=self.room_id,
+                    messages=newer,
+                    participants=self._participants,
+                    hydrated_at=datetime.now(timezone.utc),
+                )
+                self._context_hydrated = True
+                return
+
         logger.debug("Hydrating context for room: %s", self.room_id)
 
         try:
@@ -513,24 +591,7 @@ class ExecutionContext:
                 )
             )
 
-            messages = []
-            if context_response.data:
-                for item in context_response.data:
-                    sender_name = getattr(item, "sender_name", None) or getattr(
-                        item, "name", None
-                    )
-                    messages.append(
-                        {
-                            "id": item.id,
-                            "content": getattr(item, "content", ""),
-                            "sender_id": getattr(item, "sender_id", ""),
-                            "sender_type": getattr(item, "sender_type", ""),
-                            "sender_name": sender_name,
-                            "message_type": getattr(item, "message_type", "text"),
-                            "metadata": getattr(item, "metadata", {}),
-                            "created_at": getattr(item, "inserted_at", None),
-                        }
-                    )
+            messages = [_context_message(item) for item in context_response.data or []]
 
             self._context_cache = ConversationContext(
                 room_id=self.room_id,
@@ -556,6 +617,105 @@ class ExecutionContext:
             )
             self._context_hydrated = True
 
+    async def _resume_from_history_store(self) -> list[dict[str, Any]] | None:
+        """
+        Load this room's history checkpoint and fetch the messages after it.
+
+        Returns:
+            Messages newer than the checkpoint (possibly empty), or None when
+            there is no usable checkpoint and a full hydration is needed.
+        """
+        store = getattr(self.link, "history_store", None)
+        if not isinstance(store, HistoryStore):
+            return None
+        try:
+            state = await store.load(self.room_id)
+            if state is None:
+                return None
+            messages = await self._fetch_messages_after(state.last_message_id)
+        except Exception as e:
+            logger.warning(
+                "Room %s: Could not resume from saved history: %s", self.room_id, e
+            )
+            return None
+        if messages is None:
+            logger.info(
+                "Room %s: Checkpoint %s not in recent context, hydrating fully",
+                self.room_id,
+                state.last_message_id,
+            )
+            return None
+
+        self._restored_history = state.history
+        logger.info(
+            "Room %s: Resumed %s saved history entries, %s newer messages",
+            self.room_id,
+            len(state.history),
+            len(messages),
+        )
+        return messages
+
+    async def _fetch_messages_after(
+        self, message_id: str
+    ) -> list[dict[str, Any]] | None:
+        """
+        Fetch context messages after ``message_id``, newest pages first.
+
+        The context endpoint is paged oldest-first, so a one-item probe reads
+        the total count and the walk starts from the last page. Own agent
+        messages are skipped: the adapter's saved history already has them.
+
+        Returns:
+            Newer messages in order, or None if ``message_id`` is not within
+            the last ``_RESUME_MAX_PAGES`` pages.
+        """
+        probe = await self.link.rest.agent_api_context.get_agent_chat_context(
+            chat_id=self.room_id,
+            page=1,
+            page_size=1,
+            request_options=DEFAULT_REQUEST_OPTIONS,
+        )
+        total = probe.meta.total_count
+        if not isinstance(total, int) or total <= 0:
+            return None
+
+        newer: list[Any] = []
+        page = -(-total // _RESUME_PAGE_SIZE)
+        for _ in range(_RESUME_MAX_PAGES):
+            if page < 1:
+                break
+            response = await self.link.rest.agent_api_context.get_agent_chat_context(
+                chat_id=self.room_id,
+                page=page,
+                page_size=_RESUME_PAGE_SIZE,
+                request_options=DEFAULT_REQUEST_OPTIONS,
+            )
+            items = list(response.data or [])
+            ids = [item.id for item in items]
+            if message_id in ids:
+                newer = items[ids.index(message_id) + 1 :] + newer
+                return [
+                    _context_message(item)
+                    for item in newer
+                    if not (
+                        getattr(item, "sender_type", None) == "Agent"
+                        and getattr(item, "sender_id", None) == self._agent_id
+                    )
+                ]
+            newer = items + newer
+            page -= 1
+        return None
+
+    def pop_restored_history(self) -> list[Any] | None:
+        """
+        Take the adapter history restored from the history store, if any.
+
+        Set by the first hydration when it resumed from a checkpoint; the
+        context's messages are then only those newer than the checkpoint.
+        """
+        restored, self._restored_history = self._restored_history, None
+        return restored
+
     def _is_context_cache_expired(self) -> bool:
         """Check whether the hydrated context cache has exceeded its TTL."""
         if self._context_cache is None:
@@ -716,8 +876,11 @@ class ExecutionContext:
             )
 
             # Phase 2: Process from WebSocket queue only
+            metrics = self.link.metrics
             while True:
                 event = await self.queue.get()
+                if metrics.enabled:
+                    metrics.record_queue_depth(self.room_id, self.queue.qsize())
                 await self._process_event(event)
 
         except asyncio.CancelledError:
@@ -931,8 +1094,6 @@ class ExecutionContext:
                 metadata["status"] = "sent"
 
             # Create event from message for handler
-            from thenvoi.client.streaming import MessageCreatedPayload, MessageMetadata
-
             event = MessageEvent(
                 room_id=self.room_id,
                 payload=MessageCreatedPayload(
@@ -950,6 +1111,7 @@ class ExecutionContext:
 
             # Call execution handler
             await self._on_execute(self, event)
+            await self._flush_events()
 
             # SUCCESS: Mark as processed on server
             await self.link.mark_processed(self.room_id, msg_id)
@@ -1005,68 +1167,47 @@ class ExecutionContext:
         For message events, handles full lifecycle:
         1. Check if permanently failed or duplicate
         2. Record attempt with retry tracker
-        3. Mark as processing on server
-        4. Execute handler
-        5. Mark as processed (success) or failed (exception)
+        3. Coalesce other queued messages (if enabled)
+        4. Mark as processing on server
+        5. Execute handler
+        6. Mark as processed (success) or failed (exception)
         """
         payload = event.payload if isinstance(event, MessageEvent) else None
         msg_id = payload.id if payload else None
 
         # For messages: check if we should skip
         if isinstance(event, MessageEvent) and msg_id and payload:
-            # Skip messages from self (agent's own messages) to avoid infinite loops
-            if (
-                self._agent_id
-                and payload.sender_type == "Agent"
-                and payload.sender_id == self._agent_id
-            ):
-                logger.debug("Skipping self-message %s", msg_id)
-                return
-
             # Detect synthetic messages (e.g., contact events injected into hub room)
             # These don't exist in the database, so skip all tracking and marking
-            is_synthetic = (
-                payload.sender_type == SYNTHETIC_SENDER_TYPE
-                and payload.sender_id == SYNTHETIC_CONTACT_EVENTS_SENDER_ID
-            )
-            if is_synthetic:
+            if self._is_synthetic(payload):
                 logger.debug("Processing synthetic contact event message")
                 msg_id = None  # Clear to skip message marking later
                 # Skip all tracking for synthetic messages - go directly to processing
-            else:
-                # Only track retries and duplicates for real messages
-                # Skip permanently failed messages
-                if self._retry_tracker.is_permanently_failed(msg_id):
-                    logger.debug("Skipping permanently failed message %s", msg_id)
-                    return
-
-                # Skip duplicates
-                if msg_id in self._processed_ids:
-                    self._processed_ids.move_to_end(msg_id)
-                    logger.debug("Skipping duplicate message %s", msg_id)
-                    return
-
-                # Track attempts
-                attempts, exceeded = self._retry_tracker.record_attempt(msg_id)
-                if exceeded:
-                    logger.warning(
-                        "Message %s exceeded max retries (%s attempts)",
-                        msg_id,
-                        attempts,
-                    )
-                    return
+            elif not self._admit_message(payload):
+                return
+
+        msg_ids = [msg_id] if msg_id else []
+        if self.config.coalesce_messages and msg_id and payload:
+            assert isinstance(event, MessageEvent)
+            event, msg_ids = await self._coalesce_pending_messages(event, payload)
 
         self._set_state("processing")
         logger.debug("Processing %s in room %s", event.type, self.room_id)
+        timed = self.link.metrics.enabled
+        start = time.perf_counter() if timed else 0.0
 
         try:
             # For messages: mark as processing on server
-            if isinstance(event, MessageEvent) and msg_id:
-                await self.link.mark_processing(self.room_id, msg_id)
+            for pending_id in msg_ids:
+                await self.link.mark_processing(self.room_id, pending_id)
+            if timed and msg_ids:
+                start = self._record_stage("mark_processing", start)
 
             # Hydrate context on first event (loads participants always,
             # history only if enable_context_hydration is True)
             await self._ensure_fresh_context()
+            if timed:
+                start = self._record_stage("hydrate", start)
 
             # Handle participant events internally
             if isinstance(event, ParticipantAddedEvent) and event.payload:
@@ -1078,24 +1219,193 @@ class ExecutionContext:
 
             # Call execution handler
             await self._on_execute(self, event)
+            await self._flush_events()
+            if timed:
+                start = self._record_stage("execute", start)
 
             # For messages: mark as processed on server
-            if isinstance(event, MessageEvent) and msg_id:
-                await self.link.mark_processed(self.room_id, msg_id)
-                self._retry_tracker.mark_success(msg_id)
+            for done_id in msg_ids:
+                await self.link.mark_processed(self.room_id, done_id)
+                self._retry_tracker.mark_success(done_id)
 
                 # Track in dedupe cache
-                self._processed_ids[msg_id] = True
+                self._processed_ids[done_id] = True
                 if len(self._processed_ids) > self._max_processed_ids:
                     self._processed_ids.popitem(last=False)
+            if timed and msg_ids:
+                self._record_stage("mark_processed", start)
 
             logger.debug("Event %s processed successfully", event.type)
 
         except Exception as e:
             logger.error("Error processing %s: %s", event.type, e, exc_info=True)
             # For messages: mark as failed on server
-            if isinstance(event, MessageEvent) and msg_id:
-                await self.link.mark_failed(self.room_id, msg_id, _error_label(e))
+            for failed_id in msg_ids:
+                await self.link.mark_failed(self.room_id, failed_id, _error_label(e))
 
         finally:
             self._set_state("idle")
+
+    async def _flush_events(self) -> None:
+        """Wait for the turn's deferred events before marking it processed."""
+        if self.event_emitter is not None:
+            await self.event_emitter.flush()
+
+    def _record_stage(self, stage: str, start: float) -> float:
+        """Report a stage's duration to the link metrics; return the end time."""
+        now = time.perf_counter()
+        self.link.metrics.record_stage(stage, now - start, room_id=self.room_id)
+        return now
+
+    @staticmethod
+    def _is_synthetic(payload: MessageCreatedPayload) -> bool:
+        return (
+            payload.sender_type == SYNTHETIC_SENDER_TYPE
+            and payload.sender_id == SYNTHETIC_CONTACT_EVENTS_SENDER_ID
+        )
+
+    def _admit_message(self, payload: MessageCreatedPayload) -> bool:
+        """
+        Run the per-message skip checks and record a processing attempt.
+
+        Returns:
+            True if the message should be processed, False to skip it
+        """
+        msg_id = payload.id
+
+        # Skip messages from self (agent's own messages) to avoid infinite loops
+        if (
+            self._agent_id
+            and payload.sender_type == "Agent"
+            and payload.sender_id == self._agent_id
+        ):
+            logger.debug("Skipping self-message %s", msg_id)
+            return False
+
+        # Skip permanently failed messages
+        if self._retry_tracker.is_permanently_failed(msg_id):
+            logger.debug("Skipping permanently failed message %s", msg_id)
+            return False
+
+        # Skip duplicates
+        if msg_id in self._processed_ids:
+            self._processed_ids.move_to_end(msg_id)
+            logger.debug("Skipping duplicate message %s", msg_id)
+            return False
+
+        # Track attempts
+        attempts, exceeded = self._retry_tracker.record_attempt(msg_id)
+        if exceeded:
+            logger.warning(
+                "Message %s exceeded max retries (%s attempts)",
+                msg_id,
+                attempts,
+            )
+            return False
+        return True
+
+    async def _coalesce_pending_messages(
+        self, first: MessageEvent, first_payload: MessageCreatedPayload
+    ) -> tuple[MessageEvent, list[str]]:
+        """
+        Fold message events queued behind ``first`` into one combined event.
+
+        Takes consecutive message events from the head of the queue, up to
+        ``coalesce_max_messages`` in total, waiting up to
+        ``coalesce_window_seconds`` for more to arrive. Coalescing stops at
+        the first non-message or synthetic event so participant changes are
+        still applied in order.
+
+        Returns:
+            The event to execute and the IDs of every message it covers
+        """
+        batch = [first_payload]
+        limit = max(1, self.config.coalesce_max_messages)
+        deadline = (
+            asyncio.get_running_loop().time() + self.config.coalesce_window_seconds
+        )
+
+        while len(batch) < limit:
+            if not self.queue.empty():
+                event = self.queue.get_nowait()
+            else:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            if (
+                not isinstance(event, MessageEvent)
+                or event.payload is None
+                or self._is_synthetic(event.payload)
+            ):
+                self._requeue_front(event)
+                break
+            if self._admit_message(event.payload):
+                batch.append(event.payload)
+
+        msg_ids = [payload.id for payload in batch]
+        if len(batch) == 1:
+            return first, msg_ids
+
+        logger.info(
+            "ExecutionContext %s: Coalesced %d messages into one turn",
+            self.room_id,
+            len(batch),
+        )
+        return (
+            MessageEvent(
+                room_id=first.room_id,
+                payload=self._combine_payloads(batch),
+                batch=batch,
+            ),
+            msg_ids,
+        )
+
+    def _combine_payloads(
+        self, batch: list[MessageCreatedPayload]
+    ) -> MessageCreatedPayload:
+        """
+        Merge payloads into one message attributed to the first sender.
+
+        Later messages are appended as ``[Sender]: content`` lines, so the
+        combined message formats for the LLM as one line per message.
+        Mentions from every message are merged.
+        """
+        first = batch[0]
+        names = {p.get("id"): p.get("name") for p in self._participants}
+        lines = [first.content]
+        mentions: list[Any] = []
+        seen_mentions: set[str] = set()
+        for payload in batch:
+            if payload is not first:
+                sender = (
+                    payload.sender_name
+                    or names.get(payload.sender_id)
+                    or payload.sender_type
+                )
+                lines.append(f"[{sender}]: {payload.content}")
+            for mention in payload.metadata.mentions if payload.metadata else []:
+                if mention.id not in seen_mentions:
+                    seen_mentions.add(mention.id)
+                    mentions.append(mention)
+
+        metadata = (
+            first.metadata.model_copy(update={"mentions": mentions})
+            if first.metadata
+            else MessageMetadata(mentions=mentions)
+        )
+        return first.model_copy(
+            update={"content": "\n".join(lines), "metadata": metadata}
+        )
+
+    def _requeue_front(self, event: PlatformEvent) -> None:
+        """Put an event back at the head of the queue, keeping the rest in order."""
+        items = [event]
+        while not self.queue.empty():
+            items.append(self.queue.get_nowait())
+        for item in items:
+            self.queue.put_nowait(item)
@@ -0,0 +1,289 @@
+"""
+MemoryCache - Opt-in, write-through local cache of an agent's memories.
+
+Agents with memory enabled list their memories at the start of nearly every
+turn. The cache loads the active memories for a subject once, then answers
+``list_memories`` filters (scope, system, type, segment) and ``get_memory``
+locally. Writes made through AgentTools (store, supersede, archive) update
+the cache as they go. Entries older than ``ttl`` are still served while a
+background refresh revalidates them.
+
+Queries the cache cannot answer exactly -- full-text search, non-active
+status filters, or subjects with more memories than fit in one page -- go
+straight to the REST API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
+
+if TYPE_CHECKING:
+    from thenvoi.client.rest import AsyncRestClient
+
+logger = logging.getLogger(__name__)
+
+# (subject_id, page_size) -> list response with .data
+FetchMemories = Callable[[str | None, int], Awaitable[Any]]
+
+# Largest page the memories endpoint returns
+_FULL_PAGE = 50
+
+
+def _field(memory: Any, name: str) -> Any:
+    if isinstance(memory, dict):
+        return memory.get(name)
+    return getattr(memory, name, None)
+
+
+def _is_active(memory: Any) -> bool:
+    return (_field(memory, "status") or "active") == "active"
+
+
+@dataclass
+class _SubjectEntry:
+    """Active memories visible to one subject_id query (None = no subject)."""
+
+    response: Any
+    memories: dict[str, Any]
+    fetched_at: float
+    refresh_task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+
+class MemoryCache:
+    """
+    Write-through cache of agent memories with TTL revalidation.
+
+    Example:
+        cache = MemoryCache.for_agent(link.rest, ttl=60)
+        response = await cache.list_memories(subject_id=user_id, system="long_term")
+    """
+
+    def __init__(self, fetch: FetchMemories, *, ttl: float = 60.0):
+        """
+        Args:
+            fetch: Coroutine listing the active memories for a subject.
+            ttl: Seconds a loaded subject is served before a background
+                 revalidation is started.
+        """
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got: {ttl}")
+        self._fetch = fetch
+        self._ttl = ttl
+        self._subjects: dict[str | None, _SubjectEntry] = {}
+        # Subjects with too many memories to cache -> time of last check
+        self._uncacheable: dict[str | None, float] = {}
+        # memory_id -> (memory, time it was loaded or written)
+        self._by_id: dict[str, tuple[Any, float]] = {}
+        self._locks: dict[str | None, asyncio.Lock] = {}
+        # Bumped on every write; a refresh that overlapped a write re-runs.
+        self._generation = 0
+
+    @classmethod
+    def for_agent(cls, rest: "AsyncRestClient", **kwargs: Any) -> "MemoryCache":
+        """Build a cache over ``agent_api_memories.list_agent_memories``."""
+
+        async def fetch(subject_id: str | None, page_size: int) -> Any:
+            return await rest.agent_api_memories.list_agent_memories(
+                subject_id=subject_id,
+                scope="all",
+                page_size=page_size,
+                request_options=DEFAULT_REQUEST_OPTIONS,
+            )
+
+        return cls(fetch, **kwargs)
+
+    # --- Reads ---
+
+    @staticmethod
+    def can_serve(
+        *, content_query: str | None = None, status: str | None = None
+    ) -> bool:
+        """Whether a list query with these options can be answered locally."""
+        return content_query is None and status in (None, "active")
+
+    async def list_memories(
+        self,
+        subject_id: str | None = None,
+        scope: str | None = None,
+        system: str | None = None,
+        type: str | None = None,
+        segment: str | None = None,
+        page_size: int = _FULL_PAGE,
+    ) -> Any | None:
+        """
+        Answer a list query from the cache, loading the subject on first use.
+
+        Returns:
+            A copy of the list response with filtered ``data``, or None when
+            the subject cannot be cached (caller should query REST).
+        """
+        entry = await self._get_entry(subject_id)
+        if entry is None:
+            return None
+
+        wanted = {"system": system, "type": type, "segment": segment}
+        matches = [
+            memory
+            for memory in entry.memories.values()
+            if (scope in (None, "all") or _field(memory, "scope") == scope)
+            and all(
+                value is None or _field(memory, name) == value
+                for name, value in wanted.items()
+            )
+        ]
+        return entry.response.model_copy(update={"data": matches[:page_size]})
+
+    def get(self, memory_id: str) -> Any | None:
+        """Return a cached memory by ID if seen within ``ttl``, else None."""
+        cached = self._by_id.get(memory_id)
+        if cached is None or time.monotonic() - cached[1] >= self._ttl:
+            return None
+        return cached[0]
+
+    # --- Write-through ---
+
+    def on_stored(self, memory: Any) -> None:
+        """Record a memory created through store_memory."""
+        memory_id = _field(memory, "id")
+        if not memory_id:
+            return
+        self._generation += 1
+        self._by_id[memory_id] = (memory, time.monotonic())
+        subject_id = _field(memory, "subject_id")
+        organization = _field(memory, "scope") == "organization"
+        for key, entry in self._subjects.items():
+            if organization or key == subject_id:
+                entry.memories[memory_id] = memory
+            elif key is None:
+                # Whether subject memories show up in unscoped queries is
+                # the server's call; revalidate rather than guess.
+                entry.fetched_at = 0.0
+
+    def on_fetched(self, memory: Any) -> None:
+        """Record a memory read through get_memory."""
+        memory_id = _field(memory, "id")
+        if memory_id:
+            self._by_id[memory_id] = (memory, time.monotonic())
+
+    def on_updated(self, memory: Any) -> None:
+        """Record a memory superseded or archived (no longer active)."""
+        memory_id = _field(memory, "id")
+        if not memory_id:
+            return
+        self._generation += 1
+        self._by_id[memory_id] = (memory, time.monotonic())
+        for entry in self._subjects.values():
+            if _is_active(memory):
+                if memory_id in entry.memories:
+                    entry.memories[memory_id] = memory
+            else:
+                entry.memories.pop(memory_id, None)
+
+    def invalidate(self) -> None:
+        """Drop everything; the next query reloads from the platform."""
+        self._generation += 1
+        for entry in self._subjects.values():
+            if entry.refresh_task is not None:
+                entry.refresh_task.cancel()
+        self._subjects.clear()
+        self._uncacheable.clear()
+        self._by_id.clear()
+
+    async def close(self) -> None:
+        """Cancel background refresh work."""
+        tasks = [
+            entry.refresh_task
+            for entry in self._subjects.values()
+            if entry.refresh_task is not None and not entry.refresh_task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # --- Loading and refresh ---
+
+    async def _get_entry(self, subject_id: str | None) -> _SubjectEntry | None:
+        checked_at = self._uncacheable.get(subject_id)
+        if checked_at is not None and time.monotonic() - checked_at < self._ttl:
+            return None
+        entry = self._subjects.get(subject_id)
+        if entry is None:
+            lock = self._locks.setdefault(subject_id, asyncio.Lock())
+            async with lock:
+                entry = self._subjects.get(subject_id)
+                if entry is None:
+                    entry = await self._fetch_entry(subject_id)
+                    if entry is not None:
+                        self._install(subject_id, entry)
+            return entry
+
+        stale = time.monotonic() - entry.fetched_at >= self._ttl
+        if stale and (entry.refresh_task is None or entry.refresh_task.done()):
+            entry.refresh_task = asyncio.create_task(self._revalidate(subject_id))
+        return entry
+
+    async def _fetch_entry(self, subject_id: str | None) -> _SubjectEntry | None:
+        """Fetch a subject's active memories; None if they cannot be cached."""
+        response = await self._fetch(subject_id, _FULL_PAGE)
+        data = list(response.data or [])
+        if len(data) >= _FULL_PAGE:
+            # A full page may be truncated; local answers would be wrong.
+            logger.debug(
+                "Memory cache: subject %s has too many memories to cache",
+                subject_id,
+            )
+            self._uncacheable[subject_id] = time.monotonic()
+            self._subjects.pop(subject_id, None)
+            return None
+        self._uncacheable.pop(subject_id, None)
+
+        memories = {}
+        for memory in data:
+            memory_id = _field(memory, "id")
+            if memory_id and _is_active(memory):
+                memories[memory_id] = memory
+        return _SubjectEntry(
+            response=response, memories=memories, fetched_at=time.monotonic()
+        )
+
+    def _install(self, subject_id: str | None, entry: _SubjectEntry) -> None:
+        previous = self._subjects.get(subject_id)
+        if previous is not None:
+            # Drop memories that stopped being active since the last load
+            for memory_id in previous.memories.keys() - entry.memories.keys():
+                self._by_id.pop(memory_id, None)
+        self._subjects[subject_id] = entry
+        for memory_id, memory in entry.memories.items():
+            self._by_id[memory_id] = (memory, entry.fetched_at)
+        logger.debug(
+            "Memory cache: loaded %s memories for subject %s",
+            len(entry.memories),
+            subject_id,
+        )
+
+    async def _revalidate(self, subject_id: str | None) -> None:
+        generation = self._generation
+        try:
+            entry = await self._fetch_entry(subject_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Memory cache refresh failed for %s: %s", subject_id, e)
+            return
+        if entry is None:
+            return
+        if self._generation != generation:
+            # A write landed while the fetch was in flight, so the snapshot
+            # may predate it. Keep the write-through copy; retry next read.
+            current = self._subjects.get(subject_id)
+            if current is not None:
+                current.fetched_at = 0.0
+            return
+        self._install(subject_id, entry)
@@ -0,0 +1,316 @@
+"""
+Runtime metrics hooks.
+
+The runtime reports latency and load through a RuntimeMetrics object:
+
+- Per-stage message latency (mark_processing, hydrate, preprocess, adapter,
+  mark_processed)
+- Per-room execution queue depth and link queue wait
+- Event-loop lag
+- REST latency by endpoint
+- REST rate-limiter wait by request class
+- REST connection-pool wait
+
+The default NOOP_METRICS has ``enabled = False`` and the runtime skips all
+timing when it sees that, so uninstrumented agents pay nothing. Implement
+the protocol to feed your own backend, or use OpenTelemetryMetrics
+(``pip install 'thenvoi-sdk[otel]'``).
+
+Example:
+    from thenvoi.runtime.metrics import OpenTelemetryMetrics
+
+    agent = Agent.create(
+        adapter=adapter,
+        agent_id="...",
+        api_key="...",
+        metrics=OpenTelemetryMetrics(),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Path segments that identify a resource rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+)$",
+    re.IGNORECASE,
+)
+
+_REQUEST_START_KEY = "thenvoi_metrics_start"
+
+# First httpcore trace event once a request has a connection: opening a
+# new one, or sending on a reused one.
+_CONNECTION_READY_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "connection.connect_unix_socket.started",
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
+    }
+)
+
+
+@runtime_checkable
+class RuntimeMetrics(Protocol):
+    """Hook surface the runtime reports metrics through.
+
+    Durations are in seconds. Implementations must be cheap and must not
+    raise; they are called inline on the event loop.
+    """
+
+    enabled: bool
+    """False skips all timing at the call sites."""
+
+    def record_stage(self, stage: str, seconds: float, *, room_id: str) -> None:
+        """Record how long one message-processing stage took."""
+        ...
+
+    def record_queue_depth(self, room_id: str, depth: int) -> None:
+        """Record the number of events waiting in a room's execution queue."""
+        ...
+
+    def record_queue_wait(self, seconds: float) -> None:
+        """Record how long an event waited in the link's event queue."""
+        ...
+
+    def record_loop_lag(self, seconds: float) -> None:
+        """Record how late the event loop woke a periodic timer."""
+        ...
+
+    def record_rest_call(
+        self, method: str, endpoint: str, status: int, seconds: float
+    ) -> None:
+        """Record the latency of one REST request (time to response headers)."""
+        ...
+
+    def record_rest_throttle(self, request_class: str, seconds: float) -> None:
+        """Record how long the REST rate limiter held back one request."""
+        ...
+
+    def record_rest_pool_wait(self, seconds: float) -> None:
+        """Record how long a REST request waited for a pool connection."""
+        ...
+
+
+class NoopMetrics:
+    """Default metrics sink. Disabled, so call sites skip timing entirely."""
+
+    enabled = False
+
+    def record_stage(self, stage: str, seconds: float, *, room_id: str) -> None:
+        pass
+
+    def record_queue_depth(self, room_id: str, depth: int) -> None:
+        pass
+
+    def record_queue_wait(self, seconds: float) -> None:
+        pass
+
+    def record_loop_lag(self, seconds: float) -> None:
+        pass
+
+    def record_rest_call(
+        self, method: str, endpoint: str, status: int, seconds: float
+    ) -> None:
+        pass
+
+    def record_rest_throttle(self, request_class: str, seconds: float) -> None:
+        pass
+
+    def record_rest_pool_wait(self, seconds: float) -> None:
+        pass
+
+
+NOOP_METRICS = NoopMetrics()
+
+
+class OpenTelemetryMetrics:
+    """RuntimeMetrics backed by OpenTelemetry histograms and gauges.
+
+    Instruments (all durations in seconds):
+        thenvoi.message.stage.duration   histogram, attrs: stage, room_id
+        thenvoi.room.queue.depth         gauge, attrs: room_id
+        thenvoi.link.queue.wait          histogram
+        thenvoi.event_loop.lag           histogram
+        thenvoi.rest.duration            histogram, attrs: http.request.method,
+                                         url.template, http.response.status_code
+        thenvoi.rest.throttle.wait       histogram, attrs: request_class
+        thenvoi.rest.pool.wait           histogram
+    """
+
+    enabled = True
+
+    def __init__(self, meter: Any | None = None):
+        """
+        Args:
+            meter: OpenTelemetry Meter. Defaults to the global meter provider's
+                   ``thenvoi`` meter.
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics as otel_metrics
+            except ImportError as e:
+                raise ImportError(
+                    "opentelemetry-api is required for OpenTelemetryMetrics.\n"
+                    "Install with: pip install 'thenvoi-sdk[otel]'\n"
+                    "Or: uv add opentelemetry-api"
+                ) from e
+            meter = otel_metrics.get_meter("thenvoi")
+
+        self._stage = meter.create_histogram(
+            "thenvoi.message.stage.duration",
+            unit="s",
+            description="Duration of each message-processing stage",
+        )
+        self._queue_depth = meter.create_gauge(
+            "thenvoi.room.queue.depth",
+            description="Events waiting in a room's execution queue",
+        )
+        self._queue_wait = meter.create_histogram(
+            "thenvoi.link.queue.wait",
+            unit="s",
+            description="Time events wait in the link event queue",
+        )
+        self._loop_lag = meter.create_histogram(
+            "thenvoi.event_loop.lag",
+            unit="s",
+            description="Event-loop scheduling delay",
+        )
+        self._rest = meter.create_histogram(
+            "thenvoi.rest.duration",
+            unit="s",
+            description="REST request latency by endpoint",
+        )
+        self._rest_throttle = meter.create_histogram(
+            "thenvoi.rest.throttle.wait",
+            unit="s",
+            description="Time requests wait for the REST rate limiter",
+        )
+        self._rest_pool_wait = meter.create_histogram(
+            "thenvoi.rest.pool.wait",
+            unit="s",
+            description="Time REST requests wait for a pooled connection",
+        )
+
+    def record_stage(self, stage: str, seconds: float, *, room_id: str) -> None:
+        self._stage.record(seconds, {"stage": stage, "room_id": room_id})
+
+    def record_queue_depth(self, room_id: str, depth: int) -> None:
+        self._queue_depth.set(depth, {"room_id": room_id})
+
+    def record_queue_wait(self, seconds: float) -> None:
+        self._queue_wait.record(seconds)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        self._loop_lag.record(seconds)
+
+    def record_rest_call(
+        self, method: str, endpoint: str, status: int, seconds: float
+    ) -> None:
+        self._rest.record(
+            seconds,
+            {
+                "http.request.method": method,
+                "url.template": endpoint,
+                "http.response.status_code": status,
+            },
+        )
+
+    def record_rest_throttle(self, request_class: str, seconds: float) -> None:
+        self._rest_throttle.record(seconds, {"request_class": request_class})
+
+    def record_rest_pool_wait(self, seconds: float) -> None:
+        self._rest_pool_wait.record(seconds)
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag by timing how late a periodic sleep wakes up."""
+
+    def __init__(self, metrics: RuntimeMetrics, interval: float = 0.5):
+        self._metrics = metrics
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self._metrics.record_loop_lag(max(0.0, loop.time() - expected))
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse resource IDs in a URL path so latency groups by endpoint.
+
+    ``/api/v1/agent/chats/<uuid>/messages`` -> ``/api/v1/agent/chats/{id}/messages``
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def instrument_httpx_client(client: httpx.AsyncClient, metrics: RuntimeMetrics) -> None:
+    """Report REST latency and pool wait for every request made through ``client``.
+
+    Adds request/response event hooks, and an httpcore ``trace`` extension
+    that times how long each request waits for a pooled connection. Safe to call more than once per
+    client (e.g. several links sharing a pool); hooks are added only once.
+    """
+    if not metrics.enabled or getattr(client, "_thenvoi_metrics", None) is not None:
+        return
+
+    async def on_request(request: httpx.Request) -> None:
+        start = time.perf_counter()
+        request.extensions[_REQUEST_START_KEY] = start
+        previous = request.extensions.get("trace")
+        waiting = True
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal waiting
+            if waiting and event_name in _CONNECTION_READY_EVENTS:
+                waiting = False
+                metrics.record_rest_pool_wait(time.perf_counter() - start)
+            if previous is not None:
+                await previous(event_name, info)
+
+        request.extensions["trace"] = trace
+
+    async def on_response(response: httpx.Response) -> None:
+        request = response.request
+        start = request.extensions.get(_REQUEST_START_KEY)
+        if start is None:
+            return
+        metrics.record_rest_call(
+            request.method,
+            endpoint_template(request.url.path),
+            response.status_code,
+            time.perf_counter() - start,
+        )
+
+    client.event_hooks["request"].append(on_request)
+    client.event_hooks["response"].append(on_response)
+    client._thenvoi_metrics = metrics  # type: ignore[attr-defined]
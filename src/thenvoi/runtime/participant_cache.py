@@ -0,0 +1,144 @@
+"""
+ParticipantCache - Shared, single-flight cache of room participants.
+
+Room hydration, the participant tools (which re-read the room before every
+add/remove) and the bridge all list a room's participants. The cache puts
+one fetch per room in flight at a time: concurrent callers await the same
+request. A result is reused for ``ttl`` seconds unless a
+``participant_added`` / ``participant_removed`` event (or a reconnect)
+invalidates the room first, so the window only hides changes the platform
+has not announced yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
+
+if TYPE_CHECKING:
+    from thenvoi.client.rest import AsyncRestClient
+
+logger = logging.getLogger(__name__)
+
+# room_id -> participants (Fern ChatParticipant models)
+FetchParticipants = Callable[[str], Awaitable[list[Any]]]
+
+
+@dataclass
+class _RoomEntry:
+    participants: list[Any] | None = None
+    fetched_at: float = 0.0
+    # Bumped by invalidate(); a fetch started before the bump is not cached.
+    generation: int = 0
+    inflight: asyncio.Task[list[Any]] | None = field(default=None, repr=False)
+
+
+class ParticipantCache:
+    """
+    Per-room participant lists with request coalescing.
+
+    Example:
+        cache = ParticipantCache.for_agent(link.rest)
+        participants = await cache.get(room_id)
+    """
+
+    def __init__(self, fetch: FetchParticipants, *, ttl: float = 5.0):
+        """
+        Args:
+            fetch: Coroutine listing the participants of a room.
+            ttl: Seconds a fetched list is reused. Participant events
+                 invalidate a room sooner.
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must be >= 0, got: {ttl}")
+        self._fetch = fetch
+        self._ttl = ttl
+        self._rooms: dict[str, _RoomEntry] = {}
+
+    @classmethod
+    def for_agent(cls, rest: "AsyncRestClient", **kwargs: Any) -> "ParticipantCache":
+        """Build a cache over ``agent_api_participants.list_agent_chat_participants``."""
+
+        async def fetch(room_id: str) -> list[Any]:
+            response = await rest.agent_api_participants.list_agent_chat_participants(
+                chat_id=room_id,
+                request_options=DEFAULT_REQUEST_OPTIONS,
+            )
+            return list(response.data or [])
+
+        return cls(fetch, **kwargs)
+
+    async def get(self, room_id: str) -> list[Any]:
+        """
+        Return a room's participants, fetching them if the cached list is stale.
+
+        Concurrent calls for the same room share one request. Fetch errors
+        propagate to every waiter and are not cached.
+        """
+        entry = self._rooms.setdefault(room_id, _RoomEntry())
+        if (
+            entry.participants is not None
+            and time.monotonic() - entry.fetched_at < self._ttl
+        ):
+            return list(entry.participants)
+
+        task = entry.inflight
+        if task is None or task.done():
+            task = asyncio.create_task(self._load(room_id, entry, entry.generation))
+            # Retrieve the exception if every waiter was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            entry.inflight = task
+        # Shield: one cancelled caller must not cancel the others' fetch
+        return list(await asyncio.shield(task))
+
+    def invalidate(self, room_id: str | None = None) -> None:
+        """Mark one room (or every room) stale; the next get() refetches."""
+        entries = (
+            self._rooms.values()
+            if room_id is None
+            else [e for e in (self._rooms.get(room_id),) if e is not None]
+        )
+        for entry in entries:
+            entry.generation += 1
+            entry.participants = None
+            # Waiters keep the old fetch; new callers start a fresh one.
+            entry.inflight = None
+
+    def forget(self, room_id: str) -> None:
+        """Drop a room the agent has left."""
+        self._rooms.pop(room_id, None)
+
+    async def close(self) -> None:
+        """Cancel in-flight fetches and drop every room."""
+        tasks = [
+            entry.inflight
+            for entry in self._rooms.values()
+            if entry.inflight is not None and not entry.inflight.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._rooms.clear()
+
+    async def _load(
+        self, room_id: str, entry: _RoomEntry, generation: int
+    ) -> list[Any]:
+        try:
+            participants = await self._fetch(room_id)
+        finally:
+            if entry.inflight is asyncio.current_task():
+                entry.inflight = None
+        if entry.generation == generation and self._rooms.get(room_id) is entry:
+            entry.participants = participants
+            entry.fetched_at = time.monotonic()
+        else:
+            logger.debug(
+                "Participants for room %s changed during fetch; not caching", room_id
+            )
+        return participants
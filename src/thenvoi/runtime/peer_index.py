@@ -0,0 +1,323 @@
+"""
+PeerIndex - Shared, cached index of the peers an agent can reach.
+
+Replaces repeated page-by-page scans of ``list_agent_peers`` with a single
+in-memory index keyed by normalized handle, name and ID. The index is
+loaded once (optionally from a local JSON file for a warm start), refreshed
+periodically in the background, and marked stale on contact events so the
+next refresh picks up new peers. Lookups that miss trigger a coalesced
+refresh, rate limited by ``miss_refresh_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from thenvoi.client.rest import AsyncRestClient
+
+logger = logging.getLogger(__name__)
+
+# (page, page_size) -> (peers on that page, total_pages or None if unknown)
+FetchPeersPage = Callable[[int, int], Awaitable[tuple[list[Any], int | None]]]
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def _field(peer: Any, name: str) -> str:
+    value = peer.get(name) if isinstance(peer, dict) else getattr(peer, name, None)
+    return value if isinstance(value, str) else ""
+
+
+def _handle_key(handle: str) -> str:
+    return handle.lstrip("@").lower()
+
+
+class PeerIndex:
+    """
+    Cached peer directory with handle/name/ID lookup.
+
+    Example:
+        index = PeerIndex.for_agent(link.rest, cache_path="~/.thenvoi/peers.json")
+        peer = await index.find("@owner/weather-agent")
+    """
+
+    def __init__(
+        self,
+        fetch_page: FetchPeersPage,
+        *,
+        page_size: int = 100,
+        refresh_interval: float | None = None,
+        miss_refresh_seconds: float = 30.0,
+        cache_path: str | Path | None = None,
+        peer_model: "type[BaseModel] | None" = None,
+    ):
+        """
+        Args:
+            fetch_page: Coroutine returning one page of peers.
+            page_size: Page size passed to ``fetch_page``.
+            refresh_interval: Seconds between background refreshes. None
+                disables the background task.
+            miss_refresh_seconds: Minimum age of the index before a lookup
+                miss triggers a refresh.
+            cache_path: Optional JSON file used for warm start and written
+                after every full refresh.
+            peer_model: Pydantic model used to rebuild peers read from
+                ``cache_path``. Without it, cached peers are SimpleNamespaces.
+        """
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._refresh_interval = refresh_interval
+        self._miss_refresh_seconds = miss_refresh_seconds
+        self._cache_path = Path(cache_path).expanduser() if cache_path else None
+        self._peer_model = peer_model
+
+        self._peers: list[Any] = []
+        self._by_handle: dict[str, Any] = {}
+        self._by_name: dict[str, Any] = {}
+        self._by_id: dict[str, Any] = {}
+
+        self._loaded = False
+        self._stale = False
+        self._refreshed_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._background_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def for_agent(cls, rest: "AsyncRestClient", **kwargs: Any) -> "PeerIndex":
+        """Build an index over ``agent_api_peers.list_agent_peers``."""
+
+        async def fetch_page(page: int, page_size: int) -> tuple[list[Any], int | None]:
+            response = await rest.agent_api_peers.list_agent_peers(
+                page=page,
+                page_size=page_size,
+                request_options=DEFAULT_REQUEST_OPTIONS,
+            )
+            metadata = response.metadata
+            total_pages = getattr(metadata, "total_pages", None) if metadata else None
+            return list(response.data or []), (
+                total_pages if isinstance(total_pages, int) else None
+            )
+
+        if "peer_model" not in kwargs:
+            from thenvoi_rest import Peer
+
+            kwargs["peer_model"] = Peer
+        return cls(fetch_page, **kwargs)
+
+    # --- Lookup ---
+
+    @property
+    def peers(self) -> list[Any]:
+        """All indexed peers (copy)."""
+        return list(self._peers)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def get(self, identifier: str) -> Any | None:
+        """Look up a loaded peer by handle, then name, then ID (case-insensitive)."""
+        return (
+            self._by_handle.get(_handle_key(identifier))
+            or self._by_name.get(identifier.lower())
+            or self._by_id.get(identifier.lower())
+        )
+
+    def get_by_handle(self, handle: str) -> Any | None:
+        """Look up a loaded peer by handle only."""
+        return self._by_handle.get(_handle_key(handle))
+
+    async def find(self, identifier: str) -> Any | None:
+        """
+        Find a peer, loading the index on first use.
+
+        On a miss, refreshes the index once if it is older than
+        ``miss_refresh_seconds`` (or marked stale) and retries.
+        """
+        await self.ensure_loaded()
+        peer = self.get(identifier)
+        if peer is not None:
+            return peer
+
+        age = time.monotonic() - self._refreshed_at
+        if self._stale or age >= self._miss_refresh_seconds:
+            await self.refresh()
+            peer = self.get(identifier)
+        return peer
+
+    # --- Loading and refresh ---
+
+    async def ensure_loaded(self) -> None:
+        """Populate the index once, from the cache file if available."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if self._load_cache_file():
+                # Serve the warm copy now; revalidate in the background.
+                self._stale = True
+                self._schedule_refresh()
+            else:
+                await self.refresh()
+            self._loaded = True
+            self._start_background_refresh()
+
+    async def refresh(self) -> None:
+        """Re-scan all peers. Concurrent callers share one in-flight scan."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+        await asyncio.shield(self._refresh_task)
+
+    def invalidate(self) -> None:
+        """Mark the index stale and refresh it in the background.
+
+        Called on contact events, which change which peers are reachable.
+        """
+        self._stale = True
+        if self._loaded:
+            self._schedule_refresh()
+
+    async def close(self) -> None:
+        """Cancel background refresh work."""
+        for task in (self._background_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._background_task = None
+        self._refresh_task = None
+
+    async def _do_refresh(self) -> None:
+        peers: list[Any] = []
+        page = 1
+        while True:
+            data, total_pages = await self._fetch_page(page, self._page_size)
+            peers.extend(data)
+            if not data:
+                break
+            if total_pages is not None:
+                if page >= total_pages:
+                    break
+            elif len(data) < self._page_size:
+                break
+            page += 1
+
+        self._replace(peers)
+        self._loaded = True
+        self._stale = False
+        self._refreshed_at = time.monotonic()
+        logger.debug("Peer index refreshed: %d peers", len(peers))
+        self._write_cache_file()
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._do_refresh())
+        self._refresh_task.add_done_callback(self._log_refresh_failure)
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background peer refresh failed: %s", task.exception())
+
+    def _start_background_refresh(self) -> None:
+        if self._refresh_interval is None or self._background_task is not None:
+            return
+        self._background_task = asyncio.create_task(self._background_loop())
+
+    async def _background_loop(self) -> None:
+        assert self._refresh_interval is not None
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Background peer refresh failed: %s", e)
+
+    def _replace(self, peers: list[Any]) -> None:
+        by_handle: dict[str, Any] = {}
+        by_name: dict[str, Any] = {}
+        by_id: dict[str, Any] = {}
+        for peer in peers:
+            handle = _field(peer, "handle")
+            if handle:
+                by_handle.setdefault(_handle_key(handle), peer)
+            name = _field(peer, "name")
+            if name:
+                by_name.setdefault(name.lower(), peer)
+            peer_id = _field(peer, "id")
+            if peer_id:
+                by_id[peer_id.lower()] = peer
+        self._peers = peers
+        self._by_handle = by_handle
+        self._by_name = by_name
+        self._by_id = by_id
+
+    # --- Persistence ---
+
+    def _load_cache_file(self) -> bool:
+        if self._cache_path is None or not self._cache_path.exists():
+            return False
+        try:
+            raw = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            if raw.get("version") != _CACHE_FORMAT_VERSION:
+                return False
+            peers = [self._restore(item) for item in raw.get("peers", [])]
+        except Exception as e:
+            logger.warning("Ignoring unreadable peer cache %s: %s", self._cache_path, e)
+            return False
+
+        self._replace(peers)
+        logger.debug("Peer index warm-started from %s", self._cache_path)
+        return True
+
+    def _restore(self, item: dict[str, Any]) -> Any:
+        if self._peer_model is not None:
+            return self._peer_model.model_validate(item)
+        return SimpleNamespace(**item)
+
+    def _write_cache_file(self) -> None:
+        if self._cache_path is None:
+            return
+        payload = {
+            "version": _CACHE_FORMAT_VERSION,
+            "saved_at": time.time(),
+            "peers": [_dump(peer) for peer in self._peers],
+        }
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic replace so a crash mid-write never leaves a torn file
+            fd, tmp = tempfile.mkstemp(dir=self._cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self._cache_path)
+        except OSError as e:
+            logger.warning("Failed to write peer cache %s: %s", self._cache_path, e)
+
+
+def _dump(peer: Any) -> dict[str, Any]:
+    if hasattr(peer, "model_dump"):
+        return peer.model_dump(mode="json")
+    if isinstance(peer, dict):
+        return dict(peer)
+    return dict(vars(peer))
@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Awaitable, Callable
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from thenvoi.client.rest import DEFAULT_REQUEST_OPTIONS
 from thenvoi.platform.link import ThenvoiLink
 from thenvoi.platform.event import ContactEvent, MessageEvent, PlatformEvent
+from thenvoi.platform.rate_limit import RestRateLimiter
+from thenvoi.platform.transport import HttpTransportConfig
+from thenvoi.runtime.broadcast_log import BroadcastLog
 from thenvoi.runtime.contact_handler import ContactEventHandler
 from thenvoi.runtime.runtime import AgentRuntime
 from thenvoi.runtime.execution import ExecutionContext
+from thenvoi.runtime.memory_cache import MemoryCache
+from thenvoi.runtime.metrics import LoopLagMonitor, RuntimeMetrics
+from thenvoi.runtime.peer_index import PeerIndex
 from thenvoi.runtime.types import (
     AgentConfig,
     ContactEventConfig,
@@ -22,6 +28,9 @@ from thenvoi.runtime.types import (
 )
 from thenvoi_rest.core.api_error import ApiError
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +62,9 @@ class PlatformRuntime:
         contact_config: ContactEventConfig | None = None,
         on_participant_added: ParticipantAddedCallback | None = None,
         on_participant_removed: ParticipantRemovedCallback | None = None,
+        httpx_client: "httpx.AsyncClient | None" = None,
+        metrics: RuntimeMetrics | None = None,
+        transport: HttpTransportConfig | None = None,
     ):
         self._agent_id = agent_id
         self._api_key = api_key
@@ -63,13 +75,17 @@ class PlatformRuntime:
         self._contact_config = contact_config or ContactEventConfig()
         self._on_participant_added = on_participant_added
         self._on_participant_removed = on_participant_removed
+        self._httpx_client = httpx_client
+        self._metrics = metrics
+        self._transport = transport
+        self._loop_lag_monitor: LoopLagMonitor | None = None
 
         self._link: ThenvoiLink | None = None
         self._runtime: AgentRuntime | None = None
         self._agent_name: str = ""
         self._agent_description: str = ""
         self._contact_handler: ContactEventHandler | None = None
-        self._pending_broadcasts: list[str] = []
+        self._broadcast_log: BroadcastLog | None = None
         self._contacts_subscribed: bool = False
         self._pending_hub_room_id: str | None = (
             None  # Hub room waiting for ExecutionContext
@@ -130,7 +146,26 @@ class PlatformRuntime:
             api_key=self._api_key,
             ws_url=self._ws_url,
             rest_url=self._rest_url,
+            payload_validation=self._config.payload_validation,
+            httpx_client=self._httpx_client,
+            metrics=self._metrics,
+            rate_limiter=(
+                RestRateLimiter(metrics=self._metrics)
+                if self._config.rest_rate_limit
+                else None
+            ),
+            transport=self._transport,
         )
+        if self._config.peer_cache_path or self._config.peer_refresh_seconds:
+            self._link.peer_index = PeerIndex.for_agent(
+                self._link.rest,
+                cache_path=self._config.peer_cache_path,
+                refresh_interval=self._config.peer_refresh_seconds,
+            )
+        if self._config.memory_cache_ttl is not None:
+            self._link.memory_cache = MemoryCache.for_agent(
+                self._link.rest, ttl=self._config.memory_cache_ttl
+            )
 
         await self._fetch_agent_metadata()
         logger.debug("Platform runtime initialized for agent: %s", self._agent_name)
@@ -165,9 +200,19 @@ class PlatformRuntime:
             on_participant_added=self._on_participant_added,
             on_participant_removed=self._on_participant_removed,
         )
+        if self._contact_config.broadcast_changes:
+            # Set before start() so every room's execution gets a cursor
+            self._broadcast_log = BroadcastLog(
+                summary="[Contacts]: {count} earlier contact update(s) omitted"
+            )
+            self._runtime.set_broadcast_log(self._broadcast_log)
 
         await self._runtime.start()
 
+        if self._metrics is not None and self._metrics.enabled:
+            self._loop_lag_monitor = LoopLagMonitor(self._metrics)
+            self._loop_lag_monitor.start()
+
         # Set up contact event handling after WebSocket is connected
         await self._setup_contact_handling()
 
@@ -188,6 +233,10 @@ class PlatformRuntime:
         if self._runtime:
             graceful = await self._runtime.stop(timeout=timeout)
 
+        if self._loop_lag_monitor:
+            await self._loop_lag_monitor.stop()
+            self._loop_lag_monitor = None
+
         # Unsubscribe from contacts channel before disconnecting
         if self._link and self._contacts_subscribed:
             await self._link.unsubscribe_agent_contacts()
@@ -314,31 +363,16 @@ class PlatformRuntime:
         else:
             logger.warning("Contact event received but no handler configured")
 
-            # Process any pending broadcasts
-            await self._process_broadcasts()
-
     def _queue_broadcast(self, message: str) -> None:
-        """Queue a broadcast message for injection into all sessions."""
-        self._pending_broadcasts.append(message)
+        """Broadcast a contact change to all sessions.
 
-    async def _process_broadcasts(self) -> None:
-        """Inject pending broadcasts into all active sessions."""
-        if not self._pending_broadcasts or not self._runtime:
+        Appended once to the shared broadcast log; each room picks it up on
+        its next turn.
+        """
+        if not self._runtime:
             return
-
-        messages = self._pending_broadcasts.copy()
-        self._pending_broadcasts.clear()
-
-        # Inject into all active execution contexts
-        for room_id, execution in self._runtime.active_sessions.items():
-            for msg in messages:
-                try:
-                    execution.inject_system_message(f"[Contacts]: {msg}")
-                    logger.debug("Broadcast injected into room %s: %s", room_id, msg)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to inject broadcast into room %s: %s", room_id, e
-                    )
+        self._runtime.broadcast_system_message(f"[Contacts]: {message}")
+        logger.debug("Broadcast queued: %s", message)
 
     async def _inject_hub_event(self, hub_room_id: str, event: MessageEvent) -> None:
         """
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Awaitable, Callable, Protocol
 
+from thenvoi.core.history_store import HistoryStore
 from thenvoi.platform.event import PlatformEvent
 
 from .execution import Execution, ExecutionContext, ExecutionHandler
@@ -23,6 +24,8 @@ from .types import (
 if TYPE_CHECKING:
     from thenvoi.platform.link import ThenvoiLink
 
+    from .broadcast_log import BroadcastLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,6 +128,11 @@ class AgentRuntime:
         # auto-enable contact tools for the hub-room execution path.
         self._hub_room_id: str | None = None
 
+        # Shared contact-broadcast log (set by PlatformRuntime when
+        # ContactEventConfig.broadcast_changes is on). Default
+        # ExecutionContexts read broadcasts from it through a cursor.
+        self._broadcast_log: BroadcastLog | None = None
+
         # RoomPresence for cross-room management
         self.presence = RoomPresence(link, room_filter)
 
@@ -151,6 +159,33 @@ class AgentRuntime:
         """
         self._hub_room_id = hub_room_id
 
+    def set_broadcast_log(self, broadcast_log: BroadcastLog | None) -> None:
+        """Register the shared broadcast log for future default executions.
+
+        Must be set before rooms are joined. Custom executions from
+        ``execution_factory`` do not read the log.
+        """
+        self._broadcast_log = broadcast_log
+
+    def broadcast_system_message(self, message: str) -> None:
+        """Deliver a system message to every room.
+
+        With a broadcast log and default executions this is a single append;
+        each room reads it on its next turn. Otherwise the message is pushed
+        to every execution via ``inject_system_message``.
+        """
+        if self._broadcast_log is not None and self._execution_factory is None:
+            self._broadcast_log.append(message)
+            return
+
+        for room_id, execution in self.executions.items():
+            try:
+                execution.inject_system_message(message)
+            except Exception as e:
+                logger.warning(
+                    "Failed to inject broadcast into room %s: %s", room_id, e
+                )
+
     async def start(self) -> None:
         """
         Start the agent runtime.
@@ -209,9 +244,18 @@ class AgentRuntime:
         await self._create_execution(room_id)
 
     async def _on_room_left(self, room_id: str) -> None:
-        """Handle room left - destroy execution context."""
+        """Handle room left - destroy execution context and saved history."""
         await self._destroy_execution(room_id)
 
+        # Leaving is final, so drop the room's history checkpoint. stop()
+        # keeps checkpoints: rooms resume from them after a restart.
+        history_store = getattr(self.link, "history_store", None)
+        if isinstance(history_store, HistoryStore):
+            try:
+                await history_store.delete(room_id)
+            except Exception as e:
+                logger.warning("Failed to delete saved history for %s: %s", room_id, e)
+
     async def _on_room_event(self, room_id: str, event: PlatformEvent) -> None:
         """Handle room event - forward to execution context."""
         execution = self.executions.get(room_id)
@@ -250,6 +294,7 @@ class AgentRuntime:
                 on_participant_added=self._on_participant_added,
                 on_participant_removed=self._on_participant_removed,
                 hub_room_id=self._hub_room_id,
+                broadcast_log=self._broadcast_log,
             )
 
         self.executions[room_id] = execution
@@ -0,0 +1,133 @@
+"""
+FairScheduler - Bounded concurrency shared across agents.
+
+Used by AgentHost to cap the number of concurrent agent turns in a process
+while giving every agent identity a fair share of the slots. When the
+scheduler is saturated, waiting agents are served round-robin so one busy
+agent cannot starve the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchedulerStats:
+    """Per-key scheduler counters."""
+
+    running: int = 0
+    waiting: int = 0
+    completed: int = 0
+    total_wait_seconds: float = 0.0
+
+
+class FairScheduler:
+    """
+    Concurrency limiter with round-robin fairness between keys.
+
+    Example:
+        scheduler = FairScheduler(max_concurrent=8)
+
+        async with scheduler.slot(agent_id):
+            await adapter.on_event(inp)
+    """
+
+    def __init__(self, max_concurrent: int):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self._max_concurrent = max_concurrent
+        self._in_flight = 0
+        # key -> FIFO of waiters; dict order is the round-robin order
+        self._waiters: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+        self._stats: dict[str, SchedulerStats] = {}
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    def stats(self) -> dict[str, SchedulerStats]:
+        """Snapshot of per-key counters."""
+        return {
+            key: SchedulerStats(
+                running=s.running,
+                waiting=s.waiting,
+                completed=s.completed,
+                total_wait_seconds=s.total_wait_seconds,
+            )
+            for key, s in self._stats.items()
+        }
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """Hold one concurrency slot on behalf of ``key``."""
+        stats = self._stats.setdefault(key, SchedulerStats())
+        started = time.monotonic()
+        await self._acquire(key, stats)
+        stats.total_wait_seconds += time.monotonic() - started
+        stats.running += 1
+        try:
+            yield
+        finally:
+            stats.running -= 1
+            stats.completed += 1
+            self._release()
+
+    async def _acquire(self, key: str, stats: SchedulerStats) -> None:
+        if self._in_flight < self._max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(future)
+        stats.waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; hand it on.
+                self._release()
+            else:
+                self._discard_waiter(key, future)
+            raise
+        finally:
+            stats.waiting -= 1
+
+    def _discard_waiter(self, key: str, future: asyncio.Future[None]) -> None:
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            pass
+        if not queue:
+            del self._waiters[key]
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        while self._in_flight < self._max_concurrent and self._waiters:
+            key, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                # Rotate so the next waiter comes from a different key
+                self._waiters.move_to_end(key)
+            else:
+                del self._waiters[key]
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
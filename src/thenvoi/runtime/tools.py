@@ -6,6 +6,7 @@ Bound to a room_id. Uses AsyncRestClient directly for API calls.
 
 from __future__ import annotations
 
+import copy
 import logging
 import warnings
 from dataclasses import dataclass
@@ -17,6 +18,11 @@ from thenvoi.client.rest import ChatRoomRequest, DEFAULT_REQUEST_OPTIONS
 from thenvoi.core.exceptions import ThenvoiToolError
 from thenvoi.core.protocols import AgentToolsProtocol
 
+from .event_emitter import DEFERRABLE_EVENT_TYPES, EventEmitter
+from .memory_cache import MemoryCache
+from .participant_cache import ParticipantCache
+from .peer_index import PeerIndex
+
 if TYPE_CHECKING:
     from anthropic.types import ToolParam
 
@@ -525,6 +531,44 @@ def iter_tool_definitions(
     return [definition for definition in definitions if definition.name not in excluded]
 
 
+# (tool name, input model, format) -> provider schema. Built-in tool models are static, so
+# each schema is generated once. These objects are shared process-wide: public
+# getters hand out copies; get_shared_tool_schemas() hands out the objects
+# themselves for read-only use.
+_TOOL_SCHEMA_CACHE: dict[tuple[str, type[BaseModel], str], dict[str, Any]] = {}
+
+
+def _tool_schema(definition: ToolDefinition, format: str) -> dict[str, Any]:
+    """Return the cached provider-format schema for a built-in tool."""
+    key = (definition.name, definition.input_model, format)
+    cached = _TOOL_SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    schema = definition.input_model.model_json_schema()
+    # Remove Pydantic-specific keys
+    schema.pop("title", None)
+    description = definition.input_model.__doc__ or ""
+
+    if format == "openai":
+        cached = {
+            "type": "function",
+            "function": {
+                "name": definition.name,
+                "description": description,
+                "parameters": schema,
+            },
+        }
+    else:
+        cached = {
+            "name": definition.name,
+            "description": description,
+            "input_schema": schema,
+        }
+    _TOOL_SCHEMA_CACHE[key] = cached
+    return cached
+
+
 def format_tool_validation_error(tool_name: str, error: ValidationError) -> str:
     """Format Pydantic validation errors for LLM-readable tool feedback."""
     errors = [
@@ -583,6 +627,10 @@ class AgentTools(AgentToolsProtocol):
         participants: list[dict[str, Any]] | None = None,
         *,
         hub_room_id: str | None = None,
+        peer_index: PeerIndex | None = None,
+        memory_cache: MemoryCache | None = None,
+        participant_cache: ParticipantCache | None = None,
+        event_emitter: EventEmitter | None = None,
     ):
         """
         Initialize AgentTools for a specific room.
@@ -598,11 +646,24 @@ class AgentTools(AgentToolsProtocol):
                 hub-room system prompt instructs the LLM to call contact
                 tools, so they must be exposed even if the adapter would
                 otherwise gate them.
+            peer_index: Optional shared PeerIndex used to resolve peers by
+                handle, name, or ID without paging through lookup_peers.
+            memory_cache: Optional shared MemoryCache that serves memory
+                reads locally and is updated by memory writes.
+            participant_cache: Optional shared ParticipantCache; concurrent
+                participant reads for this room share one request.
+            event_emitter: Optional per-room EventEmitter. When set,
+                tool_call, tool_result, thought and task events are queued
+                and sent in the background instead of awaited.
         """
         self.room_id = room_id
         self.rest = rest
         self._participants = participants or []
         self._hub_room_id = hub_room_id
+        self._peer_index = peer_index
+        self._memory_cache = memory_cache
+        self._participant_cache = participant_cache
+        self._event_emitter = event_emitter
         self._ctx: ExecutionContext | None = None
 
     @property
@@ -623,11 +684,27 @@ class AgentTools(AgentToolsProtocol):
         Returns:
             AgentTools instance bound to the context's room
         """
+        peer_index = getattr(ctx.link, "peer_index", None)
+        memory_cache = getattr(ctx.link, "memory_cache", None)
+        participant_cache = getattr(ctx.link, "participant_cache", None)
+        event_emitter = getattr(ctx, "event_emitter", None)
         tools = cls(
             ctx.room_id,
             ctx.link.rest,
             ctx.participants,
             hub_room_id=getattr(ctx, "hub_room_id", None),
+            peer_index=peer_index if isinstance(peer_index, PeerIndex) else None,
+            memory_cache=(
+                memory_cache if isinstance(memory_cache, MemoryCache) else None
+            ),
+            participant_cache=(
+                participant_cache
+                if isinstance(participant_cache, ParticipantCache)
+                else None
+            ),
+            event_emitter=(
+                event_emitter if isinstance(event_emitter, EventEmitter) else None
+            ),
         )
         tools._ctx = ctx
         return tools
@@ -682,6 +759,9 @@ class AgentTools(AgentToolsProtocol):
             )
 
         logger.debug("Sending message to room %s", self.room_id)
+        if self._event_emitter is not None:
+            # Execution events reported during the turn precede the reply
+            await self._event_emitter.flush()
 
         # Convert to API format - use handle (not name) for mentions
         mention_items = [
@@ -716,10 +796,18 @@ class AgentTools(AgentToolsProtocol):
 
         Returns:
             Fern ChatEvent model (Pydantic). Serialized to dict by
-            execute_tool_call() at the adapter boundary.
+            execute_tool_call() at the adapter boundary. When the event
+            is queued on the event emitter, an acknowledgement dict
+            ``{"status": "queued", "message_type": ...}`` instead.
         """
         from thenvoi.client.rest import ChatEventRequest
 
+        if self._event_emitter is not None:
+            if message_type in DEFERRABLE_EVENT_TYPES:
+                self._event_emitter.emit(content, message_type, metadata)
+                return {"status": "queued", "message_type": message_type}
+            await self._event_emitter.flush()
+
         logger.debug("Sending %s event to room %s", message_type, self.room_id)
 
         response = await self.rest.agent_api_events.create_agent_chat_event(
@@ -777,8 +865,9 @@ class AgentTools(AgentToolsProtocol):
             self.room_id,
         )
 
-        # First check if participant is already in the room. Always prefer a
-        # fresh server snapshot to avoid stale-cache decisions after room updates.
+        # First check if participant is already in the room. Prefer a server
+        # snapshot (shared participant cache, invalidated by participant
+        # events) over the local list to avoid stale decisions after updates.
         fresh = await self.get_participants()
         snapshot = [p.model_dump() if hasattr(p, "model_dump") else p for p in fresh]
         if snapshot:
@@ -799,7 +888,7 @@ class AgentTools(AgentToolsProtocol):
                     "status": "already_in_room",
                 }
 
-        # Look up participant by identifier (paginates through all peers)
+        # Look up participant by identifier (peer index, or paginated scan)
         participant = await self._lookup_peer(identifier)
         if not participant:
             raise ValueError(
@@ -816,6 +905,8 @@ class AgentTools(AgentToolsProtocol):
             participant=ParticipantRequest(participant_id=participant_id, role=role),
             request_options=DEFAULT_REQUEST_OPTIONS,
         )
+        if self._participant_cache is not None:
+            self._participant_cache.invalidate(self.room_id)
 
         # Update internal participant cache for immediate mention resolution
         # NOTE: WebSocket will eventually deliver participant_added event, but this
@@ -858,8 +949,8 @@ class AgentTools(AgentToolsProtocol):
         """
         logger.debug("Removing participant '%s' from room %s", identifier, self.room_id)
 
-        # Look up participant by identifier. Always prefer a fresh server snapshot
-        # to avoid stale-cache decisions after room updates.
+        # Look up participant by identifier. Prefer a server snapshot (shared
+        # participant cache) over the local list to avoid stale decisions.
         fresh = await self.get_participants()
         snapshot = [p.model_dump() if hasattr(p, "model_dump") else p for p in fresh]
         if snapshot:
@@ -887,6 +978,8 @@ class AgentTools(AgentToolsProtocol):
             participant_id,
             request_options=DEFAULT_REQUEST_OPTIONS,
         )
+        if self._participant_cache is not None:
+            self._participant_cache.invalidate(self.room_id)
 
         # Update internal participant cache
         # NOTE: WebSocket will eventually deliver participant_removed event, but this
@@ -943,6 +1036,8 @@ class AgentTools(AgentToolsProtocol):
             list[dict] by execute_tool_call() at the adapter boundary.
         """
         logger.debug("Getting participants for room %s", self.room_id)
+        if self._participant_cache is not None:
+            return await self._participant_cache.get(self.room_id)
         response = await self.rest.agent_api_participants.list_agent_chat_participants(
             chat_id=self.room_id,
             request_options=DEFAULT_REQUEST_OPTIONS,
@@ -1137,6 +1232,20 @@ class AgentTools(AgentToolsProtocol):
             scope,
             system,
         )
+        if self._memory_cache is not None and self._memory_cache.can_serve(
+            content_query=content_query, status=status
+        ):
+            cached = await self._memory_cache.list_memories(
+                subject_id=subject_id,
+                scope=scope,
+                system=system,
+                type=type,
+                segment=segment,
+                page_size=page_size,
+            )
+            if cached is not None:
+                return cached
+
         response = await self.rest.agent_api_memories.list_agent_memories(
             subject_id=subject_id,
             scope=scope,
@@ -1201,6 +1310,8 @@ class AgentTools(AgentToolsProtocol):
         )
         if not response.data:
             raise RuntimeError("Failed to store memory - no response data")
+        if self._memory_cache is not None:
+            self._memory_cache.on_stored(response.data)
         return response.data
 
     async def get_memory(self, memory_id: str) -> Any:
@@ -1215,9 +1326,15 @@ class AgentTools(AgentToolsProtocol):
             execute_tool_call() at the adapter boundary.
         """
         logger.debug("Getting memory: id=%s", memory_id)
+        if self._memory_cache is not None:
+            cached = self._memory_cache.get(memory_id)
+            if cached is not None:
+                return cached
         response = await self.rest.agent_api_memories.get_agent_memory(id=memory_id)
         if not response.data:
             raise RuntimeError("Failed to get memory - no response data")
+        if self._memory_cache is not None:
+            self._memory_cache.on_fetched(response.data)
         return response.data
 
     async def supersede_memory(self, memory_id: str) -> Any:
@@ -1237,6 +1354,8 @@ class AgentTools(AgentToolsProtocol):
         )
         if not response.data:
             raise RuntimeError("Failed to supersede memory - no response data")
+        if self._memory_cache is not None:
+            self._memory_cache.on_updated(response.data)
         return response.data
 
     async def archive_memory(self, memory_id: str) -> Any:
@@ -1254,6 +1373,8 @@ class AgentTools(AgentToolsProtocol):
         response = await self.rest.agent_api_memories.archive_agent_memory(id=memory_id)
         if not response.data:
             raise RuntimeError("Failed to archive memory - no response data")
+        if self._memory_cache is not None:
+            self._memory_cache.on_updated(response.data)
         return response.data
 
     # --- Mention resolution ---
@@ -1323,7 +1444,10 @@ class AgentTools(AgentToolsProtocol):
 
     async def _lookup_peer(self, identifier: str) -> Any | None:
         """
-        Find a peer by identifier (handle, name, or ID), paginating through all results.
+        Find a peer by identifier (handle, name, or ID).
+
+        Uses the shared PeerIndex when available; otherwise paginates
+        through all lookup_peers results.
 
         Args:
             identifier: Handle, name, or ID to search for (case-insensitive)
@@ -1331,6 +1455,9 @@ class AgentTools(AgentToolsProtocol):
         Returns:
             Fern peer model if found, None otherwise
         """
+        if self._peer_index is not None:
+            return await self._peer_index.find(identifier)
+
         page = 1
         while True:
             result = await self.lookup_peers(page=page, page_size=100)
@@ -1386,11 +1513,35 @@ class AgentTools(AgentToolsProtocol):
                 tools are always included.
 
         Returns:
-            List of tool definitions in the requested format
+            List of tool definitions in the requested format, in registry
+            order. Each call returns fresh copies that the caller may modify.
 
         Raises:
             ValueError: If format is not "openai" or "anthropic"
         """
+        return copy.deepcopy(
+            self.get_shared_tool_schemas(
+                format,
+                include_memory=include_memory,
+                include_contacts=include_contacts,
+            )
+        )
+
+    def get_shared_tool_schemas(
+        self,
+        format: str,
+        *,
+        include_memory: bool = False,
+        include_contacts: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the cached tool schema objects without copying them.
+
+        Same arguments as get_tool_schemas(). The dicts are shared by every
+        AgentTools in the process, which keeps request prefixes byte-stable
+        for prompt caching. Callers must never modify them; use
+        get_tool_schemas() for schemas that will be edited.
+        """
         if format not in ("openai", "anthropic"):
             raise ValueError(
                 f"Invalid format: {format}. Must be 'openai' or 'anthropic'"
@@ -1402,35 +1553,13 @@ class AgentTools(AgentToolsProtocol):
         # preference.
         effective_include_contacts = include_contacts or self.is_hub_room
 
-        tools: list[Any] = []
-        for definition in iter_tool_definitions(
-            include_memory=include_memory,
-            include_contacts=effective_include_contacts,
-        ):
-            schema = definition.input_model.model_json_schema()
-            # Remove Pydantic-specific keys
-            schema.pop("title", None)
-
-            if format == "openai":
-                tools.append(
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": definition.name,
-                            "description": definition.input_model.__doc__ or "",
-                            "parameters": schema,
-                        },
-                    }
-                )
-            elif format == "anthropic":
-                tools.append(
-                    {
-                        "name": definition.name,
-                        "description": definition.input_model.__doc__ or "",
-                        "input_schema": schema,
-                    }
-                )
-        return tools
+        return [
+            _tool_schema(definition, format)
+            for definition in iter_tool_definitions(
+                include_memory=include_memory,
+                include_contacts=effective_include_contacts,
+            )
+        ]
 
     def get_anthropic_tool_schemas(
         self,
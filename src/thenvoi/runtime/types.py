@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal
 
 # --- Constants for synthetic messages (injected by SDK, not from platform) ---
 #
@@ -72,6 +72,22 @@ class AgentConfig:
     """Configuration for agent runtime."""
 
     auto_subscribe_existing_rooms: bool = True
+    payload_validation: Literal["strict", "trust_server"] = "strict"
+    """How WebSocket payloads are decoded. ``"trust_server"`` skips full
+    Pydantic validation and only checks required fields are present."""
+    peer_cache_path: str | None = None
+    """Local JSON file used to warm-start the peer index across restarts."""
+    peer_refresh_seconds: float | None = None
+    """Interval for background peer index refreshes. None refreshes only
+    on contact events and lookup misses."""
+    memory_cache_ttl: float | None = None
+    """Enable the local write-through memory cache. Loaded memories are
+    revalidated in the background once older than this many seconds.
+    None (default) sends every memory tool call to the platform."""
+    rest_rate_limit: bool = False
+    """Pace REST calls through a shared RestRateLimiter once the platform
+    answers 429: requests are prioritized (messages, then events, then
+    lifecycle marks) and retries draw on a global budget."""
 
 
 @dataclass
@@ -83,6 +99,14 @@ class SessionConfig:
     max_context_messages: int = 100
     max_message_retries: int = 1  # Max attempts per message before permanently failing
     enable_context_hydration: bool = True  # Whether to fetch history from platform API
+    # Fold messages queued while the agent is busy into one agent turn
+    coalesce_messages: bool = False
+    coalesce_max_messages: int = 10  # Max messages folded into one turn
+    coalesce_window_seconds: float = 0.0  # Extra wait for more messages to arrive
+    # Send tool_call/tool_result/thought/task events from a background task
+    # instead of awaiting each one inside the agent turn
+    defer_execution_events: bool = False
+    max_pending_events: int = 100  # Queued events before thoughts are dropped
 
 
 @dataclass
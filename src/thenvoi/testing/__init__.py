@@ -1,5 +1,53 @@
-"""Testing utilities."""
+"""Testing utilities.
+
+FakePlatform and LoadDriver are lazily imported: they need ``websockets``
+and ``httpx``, which FakeAgentTools does not.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from thenvoi.testing.fake_tools import FakeAgentTools
 
-__all__ = ["FakeAgentTools"]
+# Type-only imports for static analysis (pyrefly, mypy, etc.)
+if TYPE_CHECKING:
+    from thenvoi.testing.fake_platform import (
+        FakeMessage as FakeMessage,
+        FakePlatform as FakePlatform,
+        FakePlatformStats as FakePlatformStats,
+        FakeRoom as FakeRoom,
+        FaultConfig as FaultConfig,
+    )
+    from thenvoi.testing.load import (
+        LoadDriver as LoadDriver,
+        LoadReport as LoadReport,
+    )
+
+__all__ = [
+    "FakeAgentTools",
+    "FakeMessage",
+    "FakePlatform",
+    "FakePlatformStats",
+    "FakeRoom",
+    "FaultConfig",
+    "LoadDriver",
+    "LoadReport",
+]
+
+_FAKE_PLATFORM_NAMES = frozenset(
+    {"FakeMessage", "FakePlatform", "FakePlatformStats", "FakeRoom", "FaultConfig"}
+)
+
+
+def __getattr__(name: str) -> type:
+    """Lazy import the fake platform to avoid loading its dependencies."""
+    if name in _FAKE_PLATFORM_NAMES:
+        from thenvoi.testing import fake_platform
+
+        return getattr(fake_platform, name)
+    elif name in ("LoadDriver", "LoadReport"):
+        from thenvoi.testing import load
+
+        return getattr(load, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,716 @@
+"""
+In-process fake Thenvoi platform for load and end-to-end testing.
+
+FakePlatform serves the parts of the platform the runtime actually uses,
+so the full ThenvoiLink -> RoomPresence -> ExecutionContext ->
+DefaultPreprocessor -> adapter path can run offline:
+
+- A local WebSocket server speaking the Phoenix Channels v2 protocol
+  (join/leave/heartbeat replies, ``agent_rooms``, ``chat_room`` and
+  ``room_participants`` broadcasts).
+- The agent REST endpoints, served in-process through an
+  ``httpx.MockTransport``: identity, chats, context, participants,
+  messages (including ``/next`` and processing/processed/failed), events
+  and peers.
+
+Latency and error injection are configured with FaultConfig.
+
+Example:
+    async with FakePlatform() as platform:
+        host = AgentHost(
+            ws_url=platform.ws_url,
+            rest_url=platform.rest_url,
+            httpx_client=platform.http_client(),
+        )
+        host.add_agent(adapter=MyAdapter(), agent_id=platform.agent_id, api_key="k")
+        await host.start()
+
+        room_id = await platform.create_room()
+        message_id = await platform.post_message(room_id, "hello")
+        await platform.wait_until_processed([message_id])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.exceptions import ConnectionClosed
+
+logger = logging.getLogger(__name__)
+
+_OK_REPLY: dict[str, Any] = {"status": "ok", "response": {}}
+
+
+@dataclass
+class FaultConfig:
+    """Latency and error injection for FakePlatform."""
+
+    rest_latency_s: float = 0.0
+    """Fixed delay added to every REST response."""
+    rest_jitter_s: float = 0.0
+    """Extra uniformly random delay (0..jitter) added to REST responses."""
+    ws_latency_s: float = 0.0
+    """Delay before each WebSocket broadcast is delivered (order is kept)."""
+    rest_error_rate: float = 0.0
+    """Probability that an eligible REST request fails with ``error_status``."""
+    error_status: int = 500
+    error_routes: frozenset[str] | None = None
+    """Route names eligible for error injection (e.g. ``"get_agent_chat_context"``).
+    None makes every route eligible."""
+    seed: int | None = None
+
+
+@dataclass
+class FakeMessage:
+    """A message stored by FakePlatform, with its processing state."""
+
+    id: str
+    room_id: str
+    content: str
+    sender_id: str
+    sender_type: str
+    sender_name: str | None
+    message_type: str = "text"
+    metadata: dict[str, Any] = field(default_factory=dict)
+    inserted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    status: str = "pending"  # pending, processing, processed, failed
+    attempts: int = 0
+    posted_at: float = field(default_factory=time.monotonic)
+    processed_at: float | None = None
+    error: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        timestamp = self.inserted_at.isoformat().replace("+00:00", "Z")
+        return {
+            "id": self.id,
+            "chat_room_id": self.room_id,
+            "content": self.content,
+            "sender_id": self.sender_id,
+            "sender_type": self.sender_type,
+            "sender_name": self.sender_name,
+            "message_type": self.message_type,
+            "metadata": self.metadata,
+            "thread_id": None,
+            "inserted_at": timestamp,
+            "updated_at": timestamp,
+        }
+
+
+@dataclass
+class FakeRoom:
+    """A chat room stored by FakePlatform."""
+
+    id: str
+    title: str | None
+    participants: list[dict[str, Any]]
+    messages: list[FakeMessage] = field(default_factory=list)
+    inserted_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_json(self) -> dict[str, Any]:
+        timestamp = self.inserted_at.isoformat().replace("+00:00", "Z")
+        return {
+            "id": self.id,
+            "title": self.title,
+            "task_id": None,
+            "inserted_at": timestamp,
+            "updated_at": timestamp,
+        }
+
+
+@dataclass
+class FakePlatformStats:
+    """Counters collected by FakePlatform."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    injected_errors: Counter[str] = field(default_factory=Counter)
+    ws_connections: int = 0
+    ws_broadcasts: int = 0
+
+
+class _Connection:
+    """One agent WebSocket connection and its joined topics."""
+
+    def __init__(self, ws: ServerConnection, agent_id: str | None):
+        self.ws = ws
+        self.agent_id = agent_id
+        self.topics: dict[str, str | None] = {}  # topic -> join_ref
+        self._outbox: asyncio.Queue[tuple[float, list[Any]]] = asyncio.Queue()
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def send(self, frame: list[Any], delay: float = 0.0) -> None:
+        self._outbox.put_nowait((time.monotonic() + delay, frame))
+
+    async def close(self) -> None:
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass
+
+    async def _write_loop(self) -> None:
+        # FIFO with per-frame delivery time: latency never reorders frames.
+        while True:
+            deliver_at, frame = await self._outbox.get()
+            delay = deliver_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.ws.send(json.dumps(frame))
+            except ConnectionClosed:
+                return
+
+
+_Route = Callable[[httpx.Request, "re.Match[str]"], Awaitable[httpx.Response]]
+
+
+class FakePlatform:
+    """
+    Local stand-in for the Thenvoi platform, for one agent identity.
+
+    Rooms created with ``create_room()`` include the agent and a fake user.
+    Messages posted with ``post_message()`` are broadcast over the
+    WebSocket and served by ``/next``; the platform records when the agent
+    marks each one processed, which is what load tests measure.
+    """
+
+    def __init__(
+        self,
+        *,
+        agent_id: str | None = None,
+        agent_name: str = "Load Agent",
+        agent_handle: str = "load/agent",
+        user_id: str = "user-load",
+        user_name: str = "Load User",
+        peers: list[dict[str, Any]] | None = None,
+        faults: FaultConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            agent_id: Agent identity served by ``/agent/me`` (random if None)
+            agent_name: Agent display name
+            agent_handle: Agent handle (used for mentions)
+            user_id: Sender ID used for posted messages
+            user_name: Sender name used for posted messages
+            peers: Peer dicts returned by ``/agent/peers``
+            faults: Latency and error injection settings
+            host: Interface for the WebSocket server
+            port: Port for the WebSocket server (0 picks a free port)
+        """
+        self.agent_id = agent_id or str(uuid.uuid4())
+        self.agent_name = agent_name
+        self.agent_handle = agent_handle
+        self.user_id = user_id
+        self.user_name = user_name
+        self.peers = list(peers or [])
+        self.faults = faults or FaultConfig()
+        self.stats = FakePlatformStats()
+        self.rest_url = "http://thenvoi.fake"
+
+        self._host = host
+        self._port = port
+        self._server: Server | None = None
+        self._rng = random.Random(self.faults.seed)
+        self._rooms: dict[str, FakeRoom] = {}
+        self._messages: dict[str, FakeMessage] = {}
+        self._connections: set[_Connection] = set()
+        self._processed = asyncio.Condition()
+        self._started_at = datetime.now(timezone.utc)
+        self._routes: list[tuple[str, re.Pattern[str], str, _Route]] = (
+            self._build_routes()
+        )
+
+    # --- Lifecycle ---
+
+    @property
+    def ws_url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("FakePlatform is not started")
+        port = next(iter(self._server.sockets)).getsockname()[1]
+        return f"ws://{self._host}:{port}/api/v1/socket/websocket"
+
+    async def start(self) -> None:
+        """Start the WebSocket server."""
+        if self._server is not None:
+            return
+        self._server = await serve(self._handle_socket, self._host, self._port)
+        logger.debug("FakePlatform listening on %s", self.ws_url)
+
+    async def stop(self) -> None:
+        """Close all connections and stop the WebSocket server."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        for conn in list(self._connections):
+            await conn.close()
+        self._connections.clear()
+
+    async def __aenter__(self) -> "FakePlatform":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def http_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """HTTP client whose requests are served by this platform in-process."""
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(self._handle_rest), **kwargs
+        )
+
+    # --- Driving the platform ---
+
+    @property
+    def rooms(self) -> dict[str, FakeRoom]:
+        return self._rooms
+
+    async def create_room(self, title: str | None = None) -> str:
+        """Create a room with the agent and the fake user as participants.
+
+        Connected agents receive ``room_added``.
+        """
+        room = FakeRoom(
+            id=str(uuid.uuid4()),
+            title=title,
+            participants=[
+                {
+                    "id": self.user_id,
+                    "name": self.user_name,
+                    "handle": self.user_id,
+                    "type": "User",
+                    "role": "owner",
+                    "status": "active",
+                },
+                {
+                    "id": self.agent_id,
+                    "name": self.agent_name,
+                    "handle": self.agent_handle,
+                    "type": "Agent",
+                    "role": "member",
+                    "status": "active",
+                },
+            ],
+        )
+        self._rooms[room.id] = room
+        self._broadcast(f"agent_rooms:{self.agent_id}", "room_added", room.to_json())
+        return room.id
+
+    async def post_message(
+        self,
+        room_id: str,
+        content: str,
+        *,
+        sender_id: str | None = None,
+        sender_name: str | None = None,
+        mention_agent: bool = True,
+    ) -> str:
+        """Post a user message to a room and broadcast ``message_created``."""
+        room = self._rooms[room_id]
+        metadata: dict[str, Any] = {"mentions": [], "status": "sent"}
+        if mention_agent:
+            metadata["mentions"].append(
+                {
+                    "id": self.agent_id,
+                    "handle": self.agent_handle,
+                    "name": self.agent_name,
+                }
+            )
+        message = FakeMessage(
+            id=str(uuid.uuid4()),
+            room_id=room_id,
+            content=content,
+            sender_id=sender_id or self.user_id,
+            sender_type="User",
+            sender_name=sender_name or self.user_name,
+            metadata=metadata,
+        )
+        self._store(room, message)
+        self._broadcast(f"chat_room:{room_id}", "message_created", message.to_json())
+        return message.id
+
+    def message(self, message_id: str) -> FakeMessage:
+        return self._messages[message_id]
+
+    def agent_messages(self, room_id: str) -> list[FakeMessage]:
+        """Messages the agent sent to a room."""
+        return [
+            m
+            for m in self._rooms[room_id].messages
+            if m.sender_id == self.agent_id and m.message_type == "text"
+        ]
+
+    def processing_latencies(self) -> list[float]:
+        """Seconds from post to ``processed`` for every processed user message."""
+        return [
+            m.processed_at - m.posted_at
+            for m in self._messages.values()
+            if m.processed_at is not None and m.sender_id != self.agent_id
+        ]
+
+    async def wait_until_processed(
+        self, message_ids: Iterable[str], timeout: float | None = None
+    ) -> None:
+        """Wait until every message is marked processed or failed."""
+        pending = set(message_ids)
+
+        def done() -> bool:
+            return all(
+                self._messages[m].status in ("processed", "failed") for m in pending
+            )
+
+        async with self._processed:
+            await asyncio.wait_for(self._processed.wait_for(done), timeout)
+
+    # --- WebSocket ---
+
+    def _broadcast(self, topic: str, event: str, payload: dict[str, Any]) -> None:
+        for conn in self._connections:
+            if topic in conn.topics:
+                self.stats.ws_broadcasts += 1
+                conn.send(
+                    [conn.topics[topic], None, topic, event, payload],
+                    delay=self.faults.ws_latency_s,
+                )
+
+    async def _handle_socket(self, ws: ServerConnection) -> None:
+        query = parse_qs(urlsplit(ws.request.path).query) if ws.request else {}
+        conn = _Connection(ws, (query.get("agent_id") or [None])[0])
+        self._connections.add(conn)
+        self.stats.ws_connections += 1
+        try:
+            async for raw in ws:
+                join_ref, ref, topic, event, _payload = json.loads(raw)
+                if topic == "phoenix" and event == "heartbeat":
+                    conn.send([None, ref, topic, "phx_reply", _OK_REPLY])
+                elif event == "phx_join":
+                    conn.topics[topic] = join_ref
+                    conn.send([join_ref, ref, topic, "phx_reply", _OK_REPLY])
+                elif event == "phx_leave":
+                    conn.topics.pop(topic, None)
+                    conn.send([join_ref, ref, topic, "phx_reply", _OK_REPLY])
+        except ConnectionClosed:
+            pass
+        finally:
+            self._connections.discard(conn)
+            await conn.close()
+
+    # --- REST ---
+
+    def _build_routes(self) -> list[tuple[str, re.Pattern[str], str, _Route]]:
+        chat = r"/api/v1/agent/chats/(?P<chat_id>[^/]+)"
+        message = chat + r"/messages/(?P<message_id>[^/]+)"
+        table: list[tuple[str, str, str, _Route]] = [
+            ("GET", r"/api/v1/agent/me", "get_agent_me", self._get_agent_me),
+            ("GET", r"/api/v1/agent/peers", "list_agent_peers", self._list_peers),
+            ("GET", r"/api/v1/agent/chats", "list_agent_chats", self._list_chats),
+            ("GET", chat, "get_agent_chat", self._get_chat),
+            ("GET", chat + "/context", "get_agent_chat_context", self._get_context),
+            (
+                "GET",
+                chat + "/participants",
+                "list_agent_chat_participants",
+                self._list_participants,
+            ),
+            ("GET", chat + "/messages/next", "get_agent_next_message", self._next),
+            ("GET", chat + "/messages", "list_agent_messages", self._list_messages),
+            (
+                "POST",
+                chat + "/messages",
+                "create_agent_chat_message",
+                self._create_message,
+            ),
+            ("POST", chat + "/events", "create_agent_chat_event", self._create_event),
+            (
+                "POST",
+                message + "/processing",
+                "mark_agent_message_processing",
+                self._mark("processing"),
+            ),
+            (
+                "POST",
+                message + "/processed",
+                "mark_agent_message_processed",
+                self._mark("processed"),
+            ),
+            (
+                "POST",
+                message + "/failed",
+                "mark_agent_message_failed",
+                self._mark("failed"),
+            ),
+        ]
+        return [
+            (method, re.compile(pattern + r"/?$"), name, handler)
+            for method, pattern, name, handler in table
+        ]
+
+    async def _handle_rest(self, request: httpx.Request) -> httpx.Response:
+        for method, pattern, name, handler in self._routes:
+            if request.method != method:
+                continue
+            match = pattern.match(request.url.path)
+            if match is None:
+                continue
+
+            self.stats.requests[name] += 1
+            await self._inject_latency()
+            if self._should_fail(name):
+                self.stats.injected_errors[name] += 1
+                return httpx.Response(
+                    self.faults.error_status, json={"error": "injected fault"}
+                )
+            return await handler(request, match)
+
+        return httpx.Response(404, json={"error": "not found"})
+
+    async def _inject_latency(self) -> None:
+        delay = self.faults.rest_latency_s
+        if self.faults.rest_jitter_s:
+            delay += self._rng.uniform(0, self.faults.rest_jitter_s)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _should_fail(self, route: str) -> bool:
+        if self.faults.rest_error_rate <= 0:
+            return False
+        if (
+            self.faults.error_routes is not None
+            and route not in self.faults.error_routes
+        ):
+            return False
+        return self._rng.random() < self.faults.rest_error_rate
+
+    def _room_or_404(self, match: re.Match[str]) -> FakeRoom | httpx.Response:
+        room = self._rooms.get(match["chat_id"])
+        if room is None:
+            return httpx.Response(404, json={"error": "chat not found"})
+        return room
+
+    async def _get_agent_me(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        timestamp = self._started_at.isoformat().replace("+00:00", "Z")
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "id": self.agent_id,
+                    "name": self.agent_name,
+                    "handle": self.agent_handle,
+                    "description": "Fake platform agent",
+                    "owner_uuid": self.user_id,
+                    "inserted_at": timestamp,
+                    "updated_at": timestamp,
+                }
+            },
+        )
+
+    async def _list_peers(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        return self._paginated(request, self.peers)
+
+    async def _list_chats(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        return self._paginated(request, [r.to_json() for r in self._rooms.values()])
+
+    async def _get_chat(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        return httpx.Response(200, json={"data": room.to_json()})
+
+    async def _get_context(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        return self._paginated(
+            request, [m.to_json() for m in room.messages], metadata_key="meta"
+        )
+
+    async def _list_participants(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        return httpx.Response(200, json={"data": room.participants})
+
+    async def _next(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        for message in room.messages:
+            if message.status == "pending" and message.sender_id != self.agent_id:
+                return httpx.Response(200, json={"data": message.to_json()})
+        return httpx.Response(204)
+
+    async def _list_messages(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        status = request.url.params.get("status")
+        messages = [
+            m.to_json()
+            for m in room.messages
+            if m.sender_id != self.agent_id and (status is None or m.status == status)
+        ]
+        return self._paginated(request, messages)
+
+    async def _create_message(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        body = json.loads(request.content or b"{}").get("message", {})
+        mentions = body.get("mentions") or []
+        message = FakeMessage(
+            id=str(uuid.uuid4()),
+            room_id=room.id,
+            content=body.get("content", ""),
+            sender_id=self.agent_id,
+            sender_type="Agent",
+            sender_name=self.agent_name,
+            metadata={"mentions": mentions, "status": "sent"},
+            status="processed",
+        )
+        self._store(room, message)
+        self._broadcast(f"chat_room:{room.id}", "message_created", message.to_json())
+        recipients = [
+            {
+                "id": m.get("id", ""),
+                "handle": m.get("handle") or "",
+                "name": m.get("name"),
+            }
+            for m in mentions
+        ]
+        return httpx.Response(
+            201,
+            json={
+                "data": {"id": message.id, "success": True, "recipients": recipients}
+            },
+        )
+
+    async def _create_event(
+        self, request: httpx.Request, match: re.Match[str]
+    ) -> httpx.Response:
+        room = self._room_or_404(match)
+        if isinstance(room, httpx.Response):
+            return room
+        body = json.loads(request.content or b"{}").get("event", {})
+        message = FakeMessage(
+            id=str(uuid.uuid4()),
+            room_id=room.id,
+            content=body.get("content", ""),
+            sender_id=self.agent_id,
+            sender_type="Agent",
+            sender_name=self.agent_name,
+            message_type=body.get("message_type", "thought"),
+            metadata=body.get("metadata") or {},
+            status="processed",
+        )
+        self._store(room, message)
+        return httpx.Response(
+            201,
+            json={
+                "data": {
+                    "id": message.id,
+                    "success": True,
+                    "message_type": message.message_type,
+                }
+            },
+        )
+
+    def _mark(self, status: str) -> _Route:
+        async def handler(
+            request: httpx.Request, match: re.Match[str]
+        ) -> httpx.Response:
+            message = self._messages.get(match["message_id"])
+            if message is None or message.room_id != match["chat_id"]:
+                return httpx.Response(404, json={"error": "message not found"})
+
+            if status == "processing":
+                message.attempts += 1
+            elif status == "failed":
+                message.error = json.loads(request.content or b"{}").get("error")
+            message.status = status
+            if status in ("processed", "failed"):
+                message.processed_at = time.monotonic()
+                async with self._processed:
+                    self._processed.notify_all()
+
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": message.id,
+                        "status": status,
+                        "attempt_number": max(message.attempts, 1),
+                        "success": True,
+                    }
+                },
+            )
+
+        return handler
+
+    # --- Helpers ---
+
+    def _store(self, room: FakeRoom, message: FakeMessage) -> None:
+        room.messages.append(message)
+        self._messages[message.id] = message
+
+    @staticmethod
+    def _paginated(
+        request: httpx.Request,
+        items: list[dict[str, Any]],
+        metadata_key: str = "metadata",
+    ) -> httpx.Response:
+        page = int(request.url.params.get("page") or 1)
+        page_size = int(request.url.params.get("page_size") or 50)
+        start = (page - 1) * page_size
+        total_pages = max(1, -(-len(items) // page_size))
+        return httpx.Response(
+            200,
+            json={
+                "data": items[start : start + page_size],
+                metadata_key: {
+                    "page": page,
+                    "page_size": page_size,
+                    "total_count": len(items),
+                    "total_pages": total_pages,
+                },
+            },
+        )
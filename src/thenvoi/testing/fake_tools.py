@@ -232,6 +232,15 @@ class FakeAgentTools:
     ) -> list[dict[str, Any]]:
         return []
 
+    def get_shared_tool_schemas(
+        self,
+        format: str,
+        *,
+        include_memory: bool = False,
+        include_contacts: bool = True,
+    ) -> list[dict[str, Any]]:
+        return []
+
     def get_anthropic_tool_schemas(
         self,
         *,
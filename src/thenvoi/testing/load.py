@@ -0,0 +1,168 @@
+"""Load driver for FakePlatform: N rooms x M messages per second."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+
+from thenvoi.testing.fake_platform import FakePlatform
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class LoadReport:
+    """Result of one LoadDriver run."""
+
+    rooms: int
+    messages_sent: int
+    messages_processed: int
+    messages_failed: int
+    duration_s: float
+    latencies_s: list[float] = field(default_factory=list, repr=False)
+    rest_requests: int = 0
+    injected_errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Processed messages per second of wall time."""
+        return self.messages_processed / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def p50_s(self) -> float:
+        return _percentile(self.latencies_s, 50)
+
+    @property
+    def p95_s(self) -> float:
+        return _percentile(self.latencies_s, 95)
+
+    @property
+    def p99_s(self) -> float:
+        return _percentile(self.latencies_s, 99)
+
+    @property
+    def max_s(self) -> float:
+        return max(self.latencies_s, default=0.0)
+
+    def summary(self) -> str:
+        return (
+            f"rooms={self.rooms} sent={self.messages_sent} "
+            f"processed={self.messages_processed} failed={self.messages_failed} "
+            f"duration={self.duration_s:.2f}s throughput={self.throughput:.1f}/s "
+            f"p50={self.p50_s * 1000:.1f}ms p95={self.p95_s * 1000:.1f}ms "
+            f"p99={self.p99_s * 1000:.1f}ms max={self.max_s * 1000:.1f}ms "
+            f"rest_requests={self.rest_requests} injected_errors={self.injected_errors}"
+        )
+
+
+class LoadDriver:
+    """
+    Generates steady message load against a FakePlatform.
+
+    Each room gets its own sender posting ``messages_per_second`` messages
+    for ``duration_s``. After sending stops, the driver waits up to
+    ``drain_timeout_s`` for the agent to finish, then reports throughput
+    and post-to-processed latency as seen by the platform.
+
+    Example:
+        driver = LoadDriver(platform, rooms=50, messages_per_second=2, duration_s=10)
+        await driver.setup()
+        await host.start()          # agent under test
+        report = await driver.run()
+        print(report.summary())
+    """
+
+    def __init__(
+        self,
+        platform: FakePlatform,
+        *,
+        rooms: int = 10,
+        messages_per_second: float = 1.0,
+        duration_s: float = 10.0,
+        drain_timeout_s: float = 30.0,
+    ):
+        if rooms < 1:
+            raise ValueError("rooms must be >= 1")
+        if messages_per_second <= 0:
+            raise ValueError("messages_per_second must be > 0")
+        self.platform = platform
+        self.rooms = rooms
+        self.messages_per_second = messages_per_second
+        self.duration_s = duration_s
+        self.drain_timeout_s = drain_timeout_s
+        self.room_ids: list[str] = []
+
+    async def setup(self) -> list[str]:
+        """Create the load rooms (idempotent)."""
+        while len(self.room_ids) < self.rooms:
+            self.room_ids.append(
+                await self.platform.create_room(title=f"load-{len(self.room_ids)}")
+            )
+        return self.room_ids
+
+    async def run(self) -> LoadReport:
+        """Send load, wait for the agent to drain it, and report."""
+        await self.setup()
+        started = time.monotonic()
+
+        per_room = await asyncio.gather(
+            *(self._send_to_room(room_id) for room_id in self.room_ids)
+        )
+        message_ids = [m for ids in per_room for m in ids]
+
+        try:
+            await self.platform.wait_until_processed(
+                message_ids, timeout=self.drain_timeout_s
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Load drain timed out after %.1fs; reporting partial results",
+                self.drain_timeout_s,
+            )
+        duration = time.monotonic() - started
+
+        messages = [self.platform.message(m) for m in message_ids]
+        processed = [m for m in messages if m.status == "processed"]
+        stats = self.platform.stats
+        return LoadReport(
+            rooms=len(self.room_ids),
+            messages_sent=len(messages),
+            messages_processed=len(processed),
+            messages_failed=sum(1 for m in messages if m.status == "failed"),
+            duration_s=duration,
+            latencies_s=[
+                m.processed_at - m.posted_at
+                for m in processed
+                if m.processed_at is not None
+            ],
+            rest_requests=sum(stats.requests.values()),
+            injected_errors=sum(stats.injected_errors.values()),
+        )
+
+    async def _send_to_room(self, room_id: str) -> list[str]:
+        interval = 1.0 / self.messages_per_second
+        deadline = time.monotonic() + self.duration_s
+        next_at = time.monotonic()
+        message_ids: list[str] = []
+        while next_at < deadline:
+            delay = next_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            message_ids.append(
+                await self.platform.post_message(
+                    room_id, f"load message {len(message_ids)}"
+                )
+            )
+            # Fixed schedule: a slow post does not lower the offered rate.
+            next_at += interval
+        return message_ids
@@ -7,6 +7,7 @@ This file contains Anthropic-specific behavior: system prompt rendering,
 message history management, tool execution, custom tools, and error handling.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -186,6 +187,23 @@ class TestOnCleanup:
         assert "room-123" not in adapter._message_history
 
 
+class TestHistoryPersistence:
+    """Tests for dump_history() used by the history store."""
+
+    def test_dump_history_returns_copy(self):
+        """Should persist a snapshot that later turns don't mutate."""
+        adapter = AnthropicAdapter()
+        adapter._message_history["room-123"] = [{"role": "user", "content": "hi"}]
+
+        dumped = adapter.dump_history("room-123")
+        adapter._message_history["room-123"].append(
+            {"role": "assistant", "content": "hello"}
+        )
+
+        assert dumped == [{"role": "user", "content": "hi"}]
+        assert adapter.dump_history("other-room") is None
+
+
 class TestHelperMethods:
     """Tests for internal helper methods."""
 
@@ -438,7 +456,7 @@ class TestCustomTools:
         await adapter.on_started("TestBot", "Test bot")
 
         # Mock platform tools returning some schemas
-        mock_tools.get_anthropic_tool_schemas = MagicMock(
+        mock_tools.get_shared_tool_schemas = MagicMock(
             return_value=[
                 {"name": "thenvoi_send_message", "description": "Send a message"}
             ]
@@ -473,6 +491,36 @@ class TestCustomTools:
         assert "thenvoi_send_message" in tool_names
         assert "echo" in tool_names
 
+    @pytest.mark.asyncio
+    async def test_falls_back_without_shared_schema_getter(
+        self, sample_message, mock_tools
+    ):
+        """Tools without get_shared_tool_schemas() still provide schemas."""
+        adapter = AnthropicAdapter()
+        await adapter.on_started("TestBot", "Test bot")
+        del mock_tools.get_shared_tool_schemas
+        mock_tools.get_anthropic_tool_schemas = MagicMock(
+            return_value=[
+                {"name": "thenvoi_send_message", "description": "Send a message"}
+            ]
+        )
+
+        with patch.object(adapter, "_call_anthropic") as mock_call:
+            mock_call.return_value = MagicMock(stop_reason="end_turn", content=[])
+
+            await adapter.on_message(
+                msg=sample_message,
+                tools=mock_tools,
+                history=[],
+                participants_msg=None,
+                contacts_msg=None,
+                is_session_bootstrap=True,
+                room_id="room-123",
+            )
+
+        sent_tools = mock_call.call_args.kwargs["tools"]
+        assert [t["name"] for t in sent_tools] == ["thenvoi_send_message"]
+
     @pytest.mark.asyncio
     async def test_routes_to_custom_tool(self, mock_tools):
         """Tool call for custom tool should execute custom function."""
@@ -641,3 +689,386 @@ class TestCustomTools:
         assert (
             "message" in results[0]["content"].lower()
         )  # Error mentions missing field
+
+
+class TestPromptCaching:
+    """Tests for prompt_caching cache_control breakpoints."""
+
+    @staticmethod
+    def _mock_client(adapter: AnthropicAdapter) -> AsyncMock:
+        create = AsyncMock()
+        create.return_value = MagicMock(
+            usage=MagicMock(
+                input_tokens=10,
+                output_tokens=5,
+                cache_creation_input_tokens=100,
+                cache_read_input_tokens=2000,
+            )
+        )
+        adapter.client = MagicMock()
+        adapter.client.messages.create = create
+        return create
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Without prompt_caching the request carries no breakpoints."""
+        adapter = AnthropicAdapter(system_prompt="System.")
+        await adapter.on_started("TestBot", "Test bot")
+        create = self._mock_client(adapter)
+        tools = [{"name": "t1", "description": "", "input_schema": {}}]
+
+        await adapter._call_anthropic(
+            messages=[{"role": "user", "content": "hi"}], tools=tools
+        )
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["system"] == "System."
+        assert kwargs["tools"] is tools
+        assert kwargs["messages"] == [{"role": "user", "content": "hi"}]
+
+    @pytest.mark.asyncio
+    async def test_places_breakpoints_without_mutating_inputs(self):
+        """System, last tool and last message get cache_control on copies."""
+        adapter = AnthropicAdapter(system_prompt="System.", prompt_caching=True)
+        await adapter.on_started("TestBot", "Test bot")
+        create = self._mock_client(adapter)
+        tools = [
+            {"name": "t1", "description": "", "input_schema": {}},
+            {"name": "t2", "description": "", "input_schema": {}},
+        ]
+        messages = [
+            {"role": "user", "content": "hi"},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": "x", "content": "ok"}
+                ],
+            },
+        ]
+
+        await adapter._call_anthropic(messages=messages, tools=tools)
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "System.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"][0] == {"role": "user", "content": "hi"}
+        assert kwargs["messages"][1]["content"][0]["cache_control"] == {
+            "type": "ephemeral"
+        }
+        # Shared schemas and stored room history are untouched
+        assert "cache_control" not in tools[1]
+        assert "cache_control" not in messages[1]["content"][0]
+
+    @pytest.mark.asyncio
+    async def test_string_content_becomes_text_block(self):
+        """A plain-string final message is converted to a cached text block."""
+        adapter = AnthropicAdapter(system_prompt="System.", prompt_caching=True)
+        await adapter.on_started("TestBot", "Test bot")
+        create = self._mock_client(adapter)
+
+        await adapter._call_anthropic(
+            messages=[{"role": "user", "content": "hi"}], tools=[]
+        )
+
+        assert create.call_args.kwargs["messages"] == [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "hi",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_accumulates_cache_usage(self):
+        """token_usage should total cache reads and writes across requests."""
+        adapter = AnthropicAdapter(system_prompt="System.", prompt_caching=True)
+        await adapter.on_started("TestBot", "Test bot")
+        self._mock_client(adapter)
+
+        for _ in range(2):
+            await adapter._call_anthropic(
+                messages=[{"role": "user", "content": "hi"}], tools=[]
+            )
+
+        usage = adapter.token_usage
+        assert usage.requests == 2
+        assert usage.input_tokens == 20
+        assert usage.output_tokens == 10
+        assert usage.cache_creation_input_tokens == 200
+        assert usage.cache_read_input_tokens == 4000
+
+
+class _FakeStream:
+    """Async context manager mimicking AsyncMessageStream."""
+
+    def __init__(self, events, final_message, on_event=None, error=None):
+        self._events = events
+        self._final = final_message
+        self._on_event = on_event
+        self._error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self._events:
+            if self._on_event is not None:
+                await self._on_event(event)
+            yield event
+        if self._error is not None:
+            raise self._error
+
+    async def get_final_message(self):
+        return self._final
+
+
+def _block_stop(block):
+    event = MagicMock()
+    event.type = "content_block_stop"
+    event.content_block = block
+    return event
+
+
+class TestStreaming:
+    """Tests for streaming=True tool execution and progress relay."""
+
+    @pytest.mark.asyncio
+    async def test_runs_tool_before_response_completes(self, mock_tools):
+        """A tool_use block executes while later blocks are still streaming."""
+        from anthropic.types import TextBlock, ToolUseBlock
+
+        adapter = AnthropicAdapter(system_prompt="System.", streaming=True)
+        await adapter.on_started("TestBot", "Test bot")
+        tool_block = ToolUseBlock(
+            type="tool_use",
+            id="tool-1",
+            name="thenvoi_send_message",
+            input={"content": "Hi", "mentions": ["Alice"]},
+        )
+        text_block = TextBlock(type="text", text="Done.")
+        order: list[str] = []
+
+        async def execute(name, _args):
+            order.append(f"exec:{name}")
+            return {"status": "sent"}
+
+        async def on_event(event):
+            # Let the tool runner pick up completed blocks between events
+            await asyncio.sleep(0)
+            order.append(f"event:{event.content_block.type}")
+
+        mock_tools.execute_tool_call = AsyncMock(side_effect=execute)
+        final = MagicMock(
+            stop_reason="tool_use", content=[tool_block, text_block], usage=None
+        )
+        adapter.client = MagicMock()
+        adapter.client.messages.stream = MagicMock(
+            return_value=_FakeStream(
+                [_block_stop(tool_block), _block_stop(text_block)],
+                final,
+                on_event=on_event,
+            )
+        )
+
+        response, results = await adapter._stream_anthropic(
+            messages=[{"role": "user", "content": "hi"}],
+            tools=[],
+            agent_tools=mock_tools,
+        )
+
+        assert response is final
+        assert order.index("exec:thenvoi_send_message") < order.index("event:text")
+        assert results == [
+            {
+                "type": "tool_result",
+                "tool_use_id": "tool-1",
+                "content": '{"status": "sent"}',
+                "is_error": False,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_relays_text_as_thought_when_enabled(self, mock_tools):
+        """Completed text blocks are sent as thought events with Emit.THOUGHTS."""
+        from anthropic.types import TextBlock
+
+        from thenvoi.core.types import AdapterFeatures, Emit
+
+        adapter = AnthropicAdapter(
+            system_prompt="System.",
+            streaming=True,
+            features=AdapterFeatures(emit={Emit.THOUGHTS}),
+        )
+        await adapter.on_started("TestBot", "Test bot")
+        text_block = TextBlock(type="text", text="Let me check.")
+        final = MagicMock(stop_reason="end_turn", content=[text_block], usage=None)
+        adapter.client = MagicMock()
+        adapter.client.messages.stream = MagicMock(
+            return_value=_FakeStream([_block_stop(text_block)], final)
+        )
+
+        await adapter._stream_anthropic(
+            messages=[{"role": "user", "content": "hi"}],
+            tools=[],
+            agent_tools=mock_tools,
+        )
+
+        mock_tools.send_event.assert_awaited_once_with(
+            content="Let me check.", message_type="thought"
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_message_uses_streamed_tool_results(
+        self, sample_message, mock_tools
+    ):
+        """on_message appends streamed tool results without re-executing tools."""
+        from anthropic.types import ToolUseBlock
+
+        adapter = AnthropicAdapter(system_prompt="System.", streaming=True)
+        await adapter.on_started("TestBot", "Test bot")
+        tool_block = ToolUseBlock(
+            type="tool_use", id="tool-1", name="thenvoi_get_participants", input={}
+        )
+        streamed_results = [
+            {
+                "type": "tool_result",
+                "tool_use_id": "tool-1",
+                "content": "[]",
+                "is_error": False,
+            }
+        ]
+        responses = [
+            (MagicMock(stop_reason="tool_use", content=[tool_block]), streamed_results),
+            (MagicMock(stop_reason="end_turn", content=[]), []),
+        ]
+
+        with patch.object(
+            adapter, "_stream_anthropic", AsyncMock(side_effect=responses)
+        ):
+            await adapter.on_message(
+                msg=sample_message,
+                tools=mock_tools,
+                history=[],
+                participants_msg=None,
+                contacts_msg=None,
+                is_session_bootstrap=True,
+                room_id="room-123",
+            )
+
+        mock_tools.execute_tool_call.assert_not_called()
+        assert adapter._message_history["room-123"][-1] == {
+            "role": "user",
+            "content": streamed_results,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_keeps_tools_that_already_ran(
+        self, sample_message, mock_tools
+    ):
+        """A stream failing after a tool ran keeps the call and its result."""
+        from anthropic.types import ToolUseBlock
+
+        adapter = AnthropicAdapter(system_prompt="System.", streaming=True)
+        await adapter.on_started("TestBot", "Test bot")
+        tool_block = ToolUseBlock(
+            type="tool_use",
+            id="tool-1",
+            name="thenvoi_send_message",
+            input={"content": "Hi", "mentions": ["Alice"]},
+        )
+        adapter.client = MagicMock()
+        adapter.client.messages.stream = MagicMock(
+            return_value=_FakeStream(
+                [_block_stop(tool_block)],
+                None,
+                error=RuntimeError("overloaded"),
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="overloaded"):
+            await adapter.on_message(
+                msg=sample_message,
+                tools=mock_tools,
+                history=[],
+                participants_msg=None,
+                contacts_msg=None,
+                is_session_bootstrap=True,
+                room_id="room-123",
+            )
+
+        mock_tools.execute_tool_call.assert_awaited_once()
+        assert adapter._message_history["room-123"][-2:] == [
+            {
+                "role": "assistant",
+                "content": [
+                    {
+                        "type": "tool_use",
+                        "id": "tool-1",
+                        "name": "thenvoi_send_message",
+                        "input": {"content": "Hi", "mentions": ["Alice"]},
+                    }
+                ],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": "tool-1",
+                        "content": '{"status": "success"}',
+                        "is_error": False,
+                    }
+                ],
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_relays_thoughts_without_streaming(self, sample_message, mock_tools):
+        """Emit.THOUGHTS also relays text blocks from non-streaming responses."""
+        from anthropic.types import TextBlock
+
+        from thenvoi.core.types import AdapterFeatures, Emit
+
+        adapter = AnthropicAdapter(
+            system_prompt="System.", features=AdapterFeatures(emit={Emit.THOUGHTS})
+        )
+        await adapter.on_started("TestBot", "Test bot")
+        response = MagicMock(
+            stop_reason="end_turn",
+            content=[TextBlock(type="text", text="Nothing to do.")],
+            usage=None,
+        )
+        adapter.client = MagicMock()
+        adapter.client.messages.create = AsyncMock(return_value=response)
+
+        await adapter.on_message(
+            msg=sample_message,
+            tools=mock_tools,
+            history=[],
+            participants_msg=None,
+            contacts_msg=None,
+            is_session_bootstrap=True,
+            room_id="room-123",
+        )
+
+        mock_tools.send_event.assert_awaited_once_with(
+            content="Nothing to do.", message_type="thought"
+        )
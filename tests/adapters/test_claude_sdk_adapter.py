@@ -108,6 +108,47 @@ class TestOnStarted:
             assert adapter._session_manager is not None
             assert adapter._mcp_server is not None
 
+    @pytest.mark.asyncio
+    async def test_prewarms_configured_rooms_after_start(self):
+        """prewarm_rooms are spawned through the session manager on start."""
+        adapter = ClaudeSDKAdapter(prewarm_rooms=["room-1", "room-2"])
+        mock_manager = AsyncMock()
+
+        with patch(
+            "thenvoi.adapters.claude_sdk.ClaudeSessionManager",
+            return_value=mock_manager,
+        ):
+            await adapter.on_started(
+                agent_name="TestBot", agent_description="A test bot"
+            )
+        assert adapter._prewarm_task is not None
+        await adapter._prewarm_task
+
+        mock_manager.prewarm.assert_awaited_once_with(["room-1", "room-2"])
+
+        await adapter.cleanup_all()
+        assert adapter._prewarm_task is None
+
+
+class TestPrewarm:
+    """Tests for prewarm()."""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_delegates_to_session_manager(self):
+        adapter = ClaudeSDKAdapter()
+        adapter._session_manager = AsyncMock()
+
+        await adapter.prewarm(["room-1"])
+
+        adapter._session_manager.prewarm.assert_awaited_once_with(["room-1"])
+
+    @pytest.mark.asyncio
+    async def test_prewarm_before_start_raises(self):
+        adapter = ClaudeSDKAdapter()
+
+        with pytest.raises(RuntimeError, match="on_started"):
+            await adapter.prewarm(["room-1"])
+
 
 class TestOnMessage:
     """Tests for on_message() method (bootstrap, history, invoke and response)."""
@@ -119,6 +160,7 @@ class TestOnMessage:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with (
@@ -160,6 +202,7 @@ class TestOnMessage:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
         prior_context = "[Alice]: Hello\n[Bot]: Hi there."
 
@@ -195,6 +238,7 @@ class TestOnMessage:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with (
@@ -236,6 +280,7 @@ class TestErrorHandling:
         mock_client = MagicMock()
         mock_client.query = AsyncMock(side_effect=Exception("API Error"))
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with patch(
@@ -279,6 +324,7 @@ class TestCLIConnectionError:
             side_effect=CLIConnectionError("Cannot write to terminated process")
         )
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
         mock_manager.invalidate_session = AsyncMock()
 
@@ -317,6 +363,7 @@ class TestCLIConnectionError:
         mock_client = MagicMock()
         mock_client.query = AsyncMock(side_effect=CLIConnectionError("Process dead"))
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
         mock_manager.invalidate_session = AsyncMock()
 
@@ -359,6 +406,7 @@ class TestCLIConnectionError:
         mock_client = MagicMock()
         mock_client.query = AsyncMock(side_effect=CLIConnectionError("Dead"))
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
         mock_manager.invalidate_session = AsyncMock()
 
@@ -743,6 +791,7 @@ class TestSessionPersistence:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with (
@@ -778,6 +827,7 @@ class TestSessionPersistence:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with (
@@ -815,6 +865,7 @@ class TestSessionPersistence:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         # First call (with resume) fails, second call (without) succeeds
         mock_manager.get_or_create_session = AsyncMock(
             side_effect=[Exception("Resume failed"), mock_client]
@@ -1503,6 +1554,8 @@ class TestOnMessageCommandInterception:
         )
 
         mock_manager = AsyncMock()
+
+        mock_manager.turn = MagicMock()
         adapter._session_manager = mock_manager
 
         await adapter.on_message(
@@ -1564,6 +1617,7 @@ class TestOnMessageCommandInterception:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         msg = PlatformMessage(
@@ -1608,6 +1662,7 @@ class TestOnMessageCommandInterception:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         msg = PlatformMessage(
@@ -1652,6 +1707,7 @@ class TestOnMessageCommandInterception:
         mock_client = MagicMock()
         mock_client.query = AsyncMock()
         mock_manager = AsyncMock()
+        mock_manager.turn = MagicMock()
         mock_manager.get_or_create_session = AsyncMock(return_value=mock_client)
 
         with (
@@ -14,6 +14,7 @@ import pytest
 from pydantic import BaseModel
 
 from thenvoi.adapters.codex import CodexAdapter, CodexAdapterConfig
+from thenvoi.core.exceptions import ThenvoiConfigError
 from thenvoi.core.types import AgentInput, HistoryProvider, PlatformMessage
 from thenvoi.integrations.codex import CodexJsonRpcError, RpcEvent
 from thenvoi.integrations.codex.types import CodexSessionState
@@ -1519,7 +1520,7 @@ class TestCodexAdapter:
 
     @pytest.mark.asyncio
     async def test_transport_closed_resets_client_state(self) -> None:
-        """After transport/closed, _client and _initialized should be reset
+        """After transport/closed, the room's pool member should be reset
         so the next message rebuilds the client via _ensure_client_ready()."""
         events = [
             _event_notification(
@@ -1546,8 +1547,122 @@ class TestCodexAdapter:
         )
 
         # After transport/closed, client state should be reset
-        assert adapter._client is None
-        assert adapter._initialized is False
+        member = adapter._pool.member_for("room-1")
+        assert member is not None
+        assert member.client is None
+        assert member.initialized is False
+        assert member.restarts == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_closed_resumes_thread_on_restarted_client(self) -> None:
+        """The next message after a crash resumes the room's thread on a new client."""
+        crashed = FakeCodexClient(
+            events=[
+                _event_notification(
+                    "transport/closed",
+                    {"reason": "Codex process exited unexpectedly"},
+                )
+            ]
+        )
+        restarted = FakeCodexClient(
+            events=[
+                _event_notification(
+                    "turn/completed",
+                    {"turn": {"id": "turn-1", "status": "completed", "error": None}},
+                )
+            ]
+        )
+        clients = iter([crashed, restarted])
+        adapter = CodexAdapter(
+            config=CodexAdapterConfig(transport="ws"),
+            client_factory=lambda _config: next(clients),
+        )
+        tools = ToolSchemaFakeTools()
+
+        await adapter.on_started("Codex Agent", "A coding agent")
+        for is_bootstrap in (True, False):
+            await adapter.on_message(
+                make_platform_message(),
+                tools,
+                CodexSessionState(),
+                participants_msg=None,
+                contacts_msg=None,
+                is_session_bootstrap=is_bootstrap,
+                room_id="room-1",
+            )
+
+        assert ("thread/resume", {"threadId": "thr-1", "personality": "pragmatic"}) in (
+            restarted.requests
+        )
+        assert not any(method == "thread/start" for method, _ in restarted.requests)
+        assert adapter._room_threads["room-1"] == "thr-1"
+
+    @pytest.mark.asyncio
+    async def test_pool_pins_rooms_to_least_loaded_client(self) -> None:
+        """Rooms spread across pool members and stay on their member."""
+        created: list[FakeCodexClient] = []
+
+        def factory(_config: CodexAdapterConfig) -> FakeCodexClient:
+            client = FakeCodexClient(
+                events=[
+                    _event_notification(
+                        "turn/completed",
+                        {"turn": {"id": f"turn-{i}", "status": "completed"}},
+                    )
+                    for i in (1, 2)
+                ]
+            )
+            created.append(client)
+            return client
+
+        adapter = CodexAdapter(
+            config=CodexAdapterConfig(transport="ws", pool_size=2),
+            client_factory=factory,
+        )
+        tools = ToolSchemaFakeTools()
+
+        await adapter.on_started("Codex Agent", "A coding agent")
+        for room_id in ("room-1", "room-2", "room-1"):
+            await adapter.on_message(
+                make_platform_message(room_id=room_id),
+                tools,
+                CodexSessionState(),
+                participants_msg=None,
+                contacts_msg=None,
+                is_session_bootstrap=False,
+                room_id=room_id,
+            )
+
+        assert len(created) == 2
+        turns = [
+            [method for method, _ in client.requests if method == "turn/start"]
+            for client in created
+        ]
+        assert [len(t) for t in turns] == [2, 1]
+        stats = adapter.pool_stats()
+        assert [(s.index, s.rooms, s.restarts) for s in stats] == [(0, 1, 0), (1, 1, 0)]
+
+        await adapter.on_cleanup("room-2")
+        assert created[1].closed is True
+        assert created[0].closed is False
+
+    def test_pool_size_must_be_positive(self) -> None:
+        with pytest.raises(ThenvoiConfigError, match="pool_size"):
+            CodexAdapter(config=CodexAdapterConfig(pool_size=0))
+
+    @pytest.mark.parametrize("transport", ["stdio", "ws"])
+    def test_built_clients_only_queue_handled_notifications(
+        self, transport: str
+    ) -> None:
+        adapter = CodexAdapter(config=CodexAdapterConfig(transport=transport))
+
+        client = adapter._build_client(adapter.config)
+
+        subscribed = client._notification_methods
+        assert {"item/agentMessage/delta", "item/completed", "turn/completed"} <= (
+            subscribed
+        )
+        assert "item/started" not in subscribed
 
     @pytest.mark.asyncio
     async def test_turn_timeout_sends_interrupt_and_clean_error(self) -> None:
@@ -3093,6 +3208,38 @@ class TestHistoryInjection:
         assert turn_start_calls[1][1]["model"] == "gpt-5.2"
         assert adapter._selected_model == "gpt-5.2"
 
+    @pytest.mark.asyncio
+    async def test_model_fallback_keeps_model_set_during_lookup(self) -> None:
+        """A model set while the fallback is looked up is not overwritten."""
+        adapter = CodexAdapter(
+            config=CodexAdapterConfig(model=None, enable_self_config_tools=True)
+        )
+        adapter._selected_model = "gpt-5.3-codex"
+        set_model_input, set_model = next(
+            (model, func)
+            for model, func in adapter._custom_tools
+            if model.__name__ == "SetModelInput"
+        )
+
+        class RacingClient:
+            async def request(self, method: str, params: dict[str, Any]) -> Any:
+                if method == "model/list":
+                    # A turn in another room switches the model meanwhile
+                    set_model(set_model_input(model="o3"))
+                    return {"data": [{"id": "gpt-5.2", "hidden": False}]}
+                if params["model"] == "gpt-5.3-codex":
+                    raise CodexJsonRpcError(
+                        code=-32000,
+                        message="Model gpt-5.3-codex is not available",
+                    )
+                return {"turn": {"id": "turn-1"}}
+
+        params: dict[str, Any] = {"threadId": "t-1", "model": "gpt-5.3-codex"}
+        await adapter._start_turn_with_model_fallback(RacingClient(), params)
+
+        assert params["model"] == "gpt-5.2"
+        assert adapter._selected_model == "o3"
+
     @pytest.mark.asyncio
     async def test_model_fallback_prefers_gpt_5_2(self) -> None:
         """Fallback prefers gpt-5.2 over other models."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -366,6 +367,25 @@ class TestOnCleanup:
         await adapter.on_cleanup("room-never-used")  # Should not raise
 
 
+class TestHistoryPersistence:
+    def test_dump_and_restore_history_round_trip(self):
+        adapter = GeminiAdapter(api_key="test-key")
+        call_part = types.Part(
+            function_call=types.FunctionCall(name="lookup", args={"q": "x"}),
+            thought_signature=b"\x00\xffsig",
+        )
+        adapter._message_history["room-1"] = [
+            types.Content(role="user", parts=[types.Part.from_text(text="hi")]),
+            types.Content(role="model", parts=[call_part]),
+        ]
+
+        data = adapter.dump_history("room-1")
+
+        assert json.loads(json.dumps(data)) == data
+        assert adapter.restore_history(data) == adapter._message_history["room-1"]
+        assert adapter.dump_history("room-2") is None
+
+
 class TestValidationErrorHandling:
     @pytest.mark.asyncio
     async def test_validation_error_returns_friendly_message(self, mock_tools):
@@ -459,6 +459,97 @@ class TestHistoryInjection:
         count = await adapter_with_app._inject_history("session-123", [])
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_caps_history_and_digests_overflow(
+        self, mock_parlant_server, mock_parlant_agent
+    ):
+        """Should inject only the newest messages and fold the rest into a digest."""
+        adapter = ParlantAdapter(
+            server=mock_parlant_server,
+            parlant_agent=mock_parlant_agent,
+            max_history_messages=2,
+        )
+        mock_app = MagicMock()
+        mock_app.sessions = AsyncMock()
+        mock_app.sessions.create_event = AsyncMock()
+        adapter._app = mock_app
+
+        history = []
+        for n in range(3):
+            history.append(
+                {"role": "user", "content": f"[Alice]: q{n}", "sender": "Alice"}
+            )
+            history.append({"role": "assistant", "content": f"a{n}", "sender": "Bot"})
+
+        with patch.dict(
+            sys.modules,
+            {
+                "parlant.core.sessions": MagicMock(
+                    EventKind=MagicMock(MESSAGE="message"),
+                    EventSource=MagicMock(CUSTOMER="customer", AI_AGENT="ai_agent"),
+                ),
+            },
+        ):
+            count = await adapter._inject_history(
+                "session-123", history, customer_id="customer-123"
+            )
+
+        assert count == 3
+        calls = mock_app.sessions.create_event.await_args_list
+        digest = calls[0].kwargs
+        assert digest["metadata"] == {"historical": True, "digest": True}
+        assert digest["data"]["message"].splitlines() == [
+            "[Earlier conversation: 4 messages]",
+            "[Alice]: q0",
+            "[Bot]: a0",
+            "[Alice]: q1",
+            "[Bot]: a1",
+        ]
+        assert [c.kwargs["data"]["message"] for c in calls[1:]] == ["[Alice]: q2", "a2"]
+        assert calls[1].kwargs["data"]["participant"] == {
+            "id": "customer-123",
+            "display_name": "Alice",
+        }
+
+    @pytest.mark.asyncio
+    async def test_does_not_reinject_on_reconnect(
+        self, adapter_with_app, sample_message, mock_tools
+    ):
+        """Bootstrapping an already-injected session should not inject again."""
+        adapter_with_app._room_sessions["room-123"] = "session-123"
+        adapter_with_app._app.sessions.wait_for_update = AsyncMock(return_value=True)
+        adapter_with_app._app.sessions.find_events = AsyncMock(return_value=[])
+        history = [
+            {"role": "user", "content": "Hello", "sender": "Alice"},
+            {"role": "assistant", "content": "Hi there!", "sender": "TestBot"},
+        ]
+
+        with patch.dict(
+            sys.modules,
+            {
+                "parlant.core.app_modules.sessions": MagicMock(
+                    Moderation=MagicMock(NONE="none")
+                ),
+                "parlant.core.sessions": MagicMock(
+                    EventKind=MagicMock(MESSAGE="message"),
+                    EventSource=MagicMock(CUSTOMER="customer", AI_AGENT="ai_agent"),
+                ),
+                "parlant.core.async_utils": MagicMock(Timeout=lambda x: x),
+            },
+        ):
+            for _ in range(2):
+                await adapter_with_app.on_message(
+                    msg=sample_message,
+                    tools=mock_tools,
+                    history=history,
+                    participants_msg=None,
+                    contacts_msg=None,
+                    is_session_bootstrap=True,
+                    room_id="room-123",
+                )
+
+        assert adapter_with_app._app.sessions.create_event.await_count == 2
+
 
 class TestCleanupAll:
     """Tests for cleanup_all() method."""
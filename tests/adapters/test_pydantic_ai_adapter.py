@@ -7,6 +7,7 @@ This file contains PydanticAI-specific behavior: agent creation, tool registrati
 stream event handling, execution reporting, and custom tools.
 """
 
+import json
 from datetime import datetime, timezone
 from typing import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -409,6 +410,20 @@ class TestHistoryManagement:
         # Should have created empty history
         assert "new-room" in adapter._message_history
 
+    def test_dump_and_restore_history_round_trip(self):
+        """Persisted history rebuilds the same ModelMessages."""
+        adapter = PydanticAIAdapter(model="openai:gpt-4o")
+        adapter._message_history["room-123"] = [
+            ModelRequest(parts=[UserPromptPart(content="Q1")]),
+            ModelResponse(parts=[TextPart(content="A1")]),
+        ]
+
+        data = adapter.dump_history("room-123")
+
+        assert json.loads(json.dumps(data)) == data
+        assert adapter.restore_history(data) == adapter._message_history["room-123"]
+        assert adapter.dump_history("other-room") is None
+
 
 class TestExecutionReporting:
     """Tests for execution reporting (tool_call and tool_result events)."""
@@ -0,0 +1,95 @@
+"""End-to-end load benchmark against the in-process FakePlatform.
+
+Runs one agent with an echo adapter through the full runtime
+(ThenvoiLink -> RoomPresence -> ExecutionContext -> DefaultPreprocessor)
+and reports throughput and post-to-processed latency.
+
+Usage:
+    uv run python tests/benchmarks/bench_runtime_load.py \
+        [--rooms 50] [--rate 2] [--duration 10] [--rest-latency-ms 5] \
+        [--ws-latency-ms 1] [--error-rate 0.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from thenvoi import AgentHost
+from thenvoi.core.protocols import AgentToolsProtocol
+from thenvoi.core.simple_adapter import SimpleAdapter
+from thenvoi.core.types import PlatformMessage
+from thenvoi.testing import FakePlatform, FaultConfig, LoadDriver
+
+
+class EchoAdapter(SimpleAdapter[list]):
+    """Replies to every message; isolates runtime overhead from LLM time."""
+
+    async def on_message(
+        self,
+        msg: PlatformMessage,
+        tools: AgentToolsProtocol,
+        history: list,
+        participants_msg: str | None,
+        contacts_msg: str | None,
+        *,
+        is_session_bootstrap: bool,
+        room_id: str,
+    ) -> None:
+        await tools.send_message(f"echo: {msg.content}", mentions=[msg.sender_id])
+
+
+async def _run(args: argparse.Namespace) -> None:
+    faults = FaultConfig(
+        rest_latency_s=args.rest_latency_ms / 1000,
+        ws_latency_s=args.ws_latency_ms / 1000,
+        rest_error_rate=args.error_rate,
+        # Fail only idempotent reads so retries do not duplicate replies
+        error_routes=frozenset(
+            {"get_agent_chat_context", "list_agent_chat_participants"}
+        ),
+        seed=0,
+    )
+    async with FakePlatform(faults=faults) as platform:
+        driver = LoadDriver(
+            platform,
+            rooms=args.rooms,
+            messages_per_second=args.rate,
+            duration_s=args.duration,
+        )
+        await driver.setup()
+
+        host = AgentHost(
+            ws_url=platform.ws_url,
+            rest_url=platform.rest_url,
+            httpx_client=platform.http_client(),
+        )
+        host.add_agent(
+            adapter=EchoAdapter(), agent_id=platform.agent_id, api_key="bench"
+        )
+        await host.start()
+        try:
+            report = await driver.run()
+        finally:
+            await host.stop()
+
+    print(report.summary())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=2.0, help="msgs/s per room")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--rest-latency-ms", type=float, default=5.0)
+    parser.add_argument("--ws-latency-ms", type=float, default=1.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
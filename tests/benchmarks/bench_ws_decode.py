@@ -0,0 +1,72 @@
+"""Microbenchmark for WebSocket payload decoding.
+
+Measures how many ``message_created`` payloads per second a single core can
+decode through ``WebSocketClient._handle_events`` in each validation mode.
+CPU time (not wall time) is used, so the figure is events/s per core.
+
+Usage:
+    uv run python tests/benchmarks/bench_ws_decode.py [--events 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from thenvoi.client.streaming import WebSocketClient
+
+PAYLOAD: dict = {
+    "id": "msg-123",
+    "content": "@TestBot can you summarize the last three messages?",
+    "message_type": "text",
+    "metadata": {
+        "mentions": [
+            {"id": "agent-123", "handle": "testbot", "name": "TestBot"},
+            {"id": "user-789", "handle": "alice", "name": "Alice"},
+        ],
+        "status": "sent",
+    },
+    "sender_id": "user-456",
+    "sender_type": "User",
+    "sender_name": "Bob",
+    "chat_room_id": "room-123",
+    "thread_id": None,
+    "inserted_at": "2025-11-17T11:20:10.284136Z",
+    "updated_at": "2025-11-17T11:20:10.284136Z",
+}
+
+
+class _Message:
+    event = "message_created"
+    payload = PAYLOAD
+
+
+async def _noop(_payload: object) -> None:
+    return None
+
+
+async def _run(mode: str, events: int) -> float:
+    client = WebSocketClient("ws://localhost", "bench-key", payload_validation=mode)
+    handlers = {"message_created": _noop}
+    message = _Message()
+
+    start = time.process_time()
+    for _ in range(events):
+        await client._handle_events(message, handlers)
+    elapsed = time.process_time() - start
+    return events / elapsed if elapsed > 0 else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for mode in ("strict", "trust_server"):
+        rate = asyncio.run(_run(mode, args.events))
+        print(f"{mode:>13}: {rate:>12,.0f} events/s per core")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Synthetic room fixtures for the hot-path benchmarks.
+
+Rooms are sized after busy production rooms: 40 participants (users and
+agents) and a 300-message history with a realistic mix of chat text,
+UUID mentions, thoughts, and paired tool_call/tool_result events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import pytest
+
+AGENT_ID = "agent-bench"
+AGENT_NAME = "BenchBot"
+ROOM_ID = "room-bench"
+
+PARTICIPANT_COUNT = 40
+HISTORY_LENGTH = 300
+
+
+def make_participants(count: int = PARTICIPANT_COUNT) -> list[dict[str, Any]]:
+    participants: list[dict[str, Any]] = [
+        {
+            "id": AGENT_ID,
+            "name": AGENT_NAME,
+            "type": "Agent",
+            "handle": "bench/benchbot",
+        }
+    ]
+    for i in range(count - 1):
+        if i % 3 == 0:
+            participants.append(
+                {
+                    "id": f"agent-{i:04d}",
+                    "name": f"Helper Agent {i}",
+                    "type": "Agent",
+                    "handle": f"owner{i}/helper-{i}",
+                }
+            )
+        else:
+            participants.append(
+                {
+                    "id": f"user-{i:04d}",
+                    "name": f"User {i}",
+                    "type": "User",
+                    "handle": f"user{i}",
+                }
+            )
+    return participants
+
+
+def _tool_call(name: str, args: dict[str, Any], call_id: str) -> str:
+    return json.dumps(
+        {"name": name, "args": args, "data": {"input": args}, "tool_call_id": call_id}
+    )
+
+
+def _tool_result(name: str, output: str, call_id: str) -> str:
+    return json.dumps(
+        {
+            "name": name,
+            "output": output,
+            "data": {"output": output},
+            "tool_call_id": call_id,
+        }
+    )
+
+
+def make_platform_history(
+    participants: list[dict[str, Any]], length: int = HISTORY_LENGTH
+) -> list[dict[str, Any]]:
+    """Platform-shaped messages as returned by the context endpoint."""
+    humans = [p for p in participants if p["type"] == "User"]
+    messages: list[dict[str, Any]] = []
+    i = 0
+    while len(messages) < length:
+        sender = humans[i % len(humans)]
+        other = participants[(i * 7) % len(participants)]
+        base = {
+            "inserted_at": "2025-11-17T11:20:10.284136Z",
+            "metadata": {"mentions": [{"id": AGENT_ID, "handle": "bench/benchbot"}]},
+        }
+        messages.append(
+            {
+                **base,
+                "id": f"msg-{i}-u",
+                "sender_id": sender["id"],
+                "sender_type": "User",
+                "sender_name": sender["name"],
+                "message_type": "text",
+                "content": (
+                    f"@[[{AGENT_ID}]] can you check with @[[{other['id']}]] about "
+                    f"ticket #{i}? The customer reported the issue twice this week "
+                    "and wants an update before the end of the day."
+                ),
+            }
+        )
+        agent = {
+            "sender_id": AGENT_ID,
+            "sender_type": "Agent",
+            "sender_name": AGENT_NAME,
+        }
+        if i % 2 == 0:
+            call_id = f"toolu_{i:06d}"
+            messages.append(
+                {
+                    **base,
+                    **agent,
+                    "id": f"msg-{i}-t",
+                    "message_type": "thought",
+                    "content": "Looking up the ticket before replying.",
+                }
+            )
+            messages.append(
+                {
+                    **base,
+                    **agent,
+                    "id": f"msg-{i}-c",
+                    "message_type": "tool_call",
+                    "content": _tool_call(
+                        "lookup_ticket", {"ticket_id": i, "verbose": True}, call_id
+                    ),
+                }
+            )
+            messages.append(
+                {
+                    **base,
+                    **agent,
+                    "id": f"msg-{i}-r",
+                    "message_type": "tool_result",
+                    "content": _tool_result(
+                        "lookup_ticket",
+                        f"Ticket #{i}: open, priority high, 3 comments",
+                        call_id,
+                    ),
+                }
+            )
+        messages.append(
+            {
+                **base,
+                **agent,
+                "id": f"msg-{i}-a",
+                "message_type": "text",
+                "content": (
+                    f"@[[{sender['id']}]] ticket #{i} is still open; I've asked "
+                    f"@[[{other['id']}]] to take a look."
+                ),
+            }
+        )
+        i += 1
+    return messages[:length]
+
+
+@pytest.fixture(scope="session")
+def participants() -> list[dict[str, Any]]:
+    return make_participants()
+
+
+@pytest.fixture(scope="session")
+def platform_history(participants: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return make_platform_history(participants)
+
+
+@pytest.fixture(scope="session")
+def llm_history(
+    platform_history: list[dict[str, Any]], participants: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """History as handed to adapters (HistoryProvider.raw)."""
+    from thenvoi.runtime.formatters import format_history_for_llm
+
+    return format_history_for_llm(platform_history, participants=participants)
+
+
+@pytest.fixture
+def run_async() -> Iterator[Callable[[Callable[[], Awaitable[Any]]], Any]]:
+    """Run a coroutine factory to completion on a private event loop.
+
+    pytest-benchmark times synchronous callables, so async hot paths are
+    wrapped as ``benchmark(run_async, lambda: coro(...))``.
+    """
+    loop = asyncio.new_event_loop()
+
+    def run(factory: Callable[[], Awaitable[Any]]) -> Any:
+        return loop.run_until_complete(factory())
+
+    yield run
+    loop.close()
@@ -0,0 +1,325 @@
+"""Benchmarks for the per-message hot path.
+
+Each benchmark covers one step a message goes through between the
+WebSocket and the adapter. Benchmarks are disabled by default (see
+``--benchmark-disable`` in pyproject addopts), so a plain ``pytest`` run
+executes each one once as a smoke test. To measure::
+
+    uv run pytest tests/benchmarks --benchmark-enable --benchmark-only
+
+To check a change for regressions, save a baseline on the base branch and
+compare on yours (CI does this for every PR)::
+
+    uv run pytest tests/benchmarks --benchmark-enable --benchmark-only \\
+        --benchmark-save=base
+    uv run pytest tests/benchmarks --benchmark-enable --benchmark-only \\
+        --benchmark-compare --benchmark-compare-fail=min:20%
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from tests.benchmarks.conftest import AGENT_ID, AGENT_NAME, ROOM_ID
+from thenvoi.client.streaming import (
+    MessageCreatedPayload,
+    MessageMetadata,
+    WebSocketClient,
+)
+from thenvoi.converters.anthropic import AnthropicHistoryConverter
+from thenvoi.core._history_offload import HistoryConversionCache, convert_history
+from thenvoi.platform.event import MessageEvent
+from thenvoi.preprocessing.default import DefaultPreprocessor
+from thenvoi.runtime.execution import ExecutionContext
+from thenvoi.runtime.formatters import format_history_for_llm
+from thenvoi.runtime.tools import AgentTools
+from thenvoi.runtime.types import SessionConfig
+
+WS_PAYLOAD: dict[str, Any] = {
+    "id": "msg-live",
+    "content": "@BenchBot can you summarize the last three messages?",
+    "message_type": "text",
+    "metadata": {
+        "mentions": [
+            {"id": AGENT_ID, "handle": "bench/benchbot", "name": AGENT_NAME},
+            {"id": "user-0001", "handle": "user1", "name": "User 1"},
+        ],
+        "status": "sent",
+    },
+    "sender_id": "user-0001",
+    "sender_type": "User",
+    "sender_name": "User 1",
+    "chat_room_id": ROOM_ID,
+    "thread_id": None,
+    "inserted_at": "2025-11-17T11:20:10.284136Z",
+    "updated_at": "2025-11-17T11:20:10.284136Z",
+}
+
+# (module, class) for every HistoryConverter shipped in thenvoi.converters.
+CONVERTERS = [
+    ("a2a", "A2AHistoryConverter"),
+    ("a2a_gateway", "GatewayHistoryConverter"),
+    ("acp_client", "ACPClientHistoryConverter"),
+    ("acp_server", "ACPServerHistoryConverter"),
+    ("anthropic", "AnthropicHistoryConverter"),
+    ("claude_sdk", "ClaudeSDKHistoryConverter"),
+    ("codex", "CodexHistoryConverter"),
+    ("crewai", "CrewAIHistoryConverter"),
+    ("gemini", "GeminiHistoryConverter"),
+    ("google_adk", "GoogleADKHistoryConverter"),
+    ("langchain", "LangChainHistoryConverter"),
+    ("letta", "LettaHistoryConverter"),
+    ("opencode", "OpencodeHistoryConverter"),
+    ("parlant", "ParlantHistoryConverter"),
+    ("pydantic_ai", "PydanticAIHistoryConverter"),
+]
+
+
+def _fake_rest() -> SimpleNamespace:
+    """REST stub that answers send_message without I/O."""
+
+    async def create_agent_chat_message(**_kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(data={"id": "msg-reply"})
+
+    return SimpleNamespace(
+        agent_api_messages=SimpleNamespace(
+            create_agent_chat_message=create_agent_chat_message
+        )
+    )
+
+
+def _make_ctx(
+    participants: list[dict[str, Any]],
+    platform_history: list[dict[str, Any]],
+    *,
+    initialized: bool,
+) -> ExecutionContext:
+    link = SimpleNamespace(rest=_fake_rest(), peer_index=None)
+
+    async def on_execute(_ctx: ExecutionContext, _event: Any) -> None:
+        return None
+
+    ctx = ExecutionContext(
+        ROOM_ID,
+        link,  # type: ignore[arg-type]
+        on_execute,
+        config=SessionConfig(),
+        agent_id=AGENT_ID,
+    )
+    for participant in participants:
+        ctx.add_participant(participant)
+    ctx.mark_participants_sent()
+    if initialized:
+        ctx.mark_llm_initialized()
+
+    context = SimpleNamespace(messages=platform_history)
+
+    async def get_context(force_refresh: bool = False) -> SimpleNamespace:
+        return context
+
+    ctx.get_context = get_context  # type: ignore[method-assign]
+    return ctx
+
+
+def _message_event() -> MessageEvent:
+    return MessageEvent(
+        room_id=ROOM_ID,
+        payload=MessageCreatedPayload(
+            id="msg-live",
+            content=WS_PAYLOAD["content"],
+            message_type="text",
+            metadata=MessageMetadata(mentions=[], status="sent"),
+            sender_id="user-0001",
+            sender_type="User",
+            chat_room_id=ROOM_ID,
+            thread_id=None,
+            inserted_at=datetime.now(timezone.utc).isoformat(),
+            updated_at=datetime.now(timezone.utc).isoformat(),
+        ),
+    )
+
+
+class TestWebSocketDecode:
+    @pytest.mark.parametrize("mode", ["strict", "trust_server"])
+    def test_decode_message_created(self, benchmark, mode):
+        benchmark.group = "ws-decode"
+        client = WebSocketClient("ws://localhost", "bench-key", payload_validation=mode)
+
+        result = benchmark(client.decode_payload, MessageCreatedPayload, WS_PAYLOAD)
+
+        assert result.id == "msg-live"
+
+
+class TestPreprocessor:
+    def test_process_steady_state(
+        self, benchmark, run_async, participants, platform_history
+    ):
+        benchmark.group = "preprocess"
+        ctx = _make_ctx(participants, platform_history, initialized=True)
+        event = _message_event()
+        preprocessor = DefaultPreprocessor()
+
+        result = benchmark(
+            run_async, lambda: preprocessor.process(ctx, event, AGENT_ID)
+        )
+
+        assert result is not None
+        assert result.is_session_bootstrap is False
+
+    def test_process_session_bootstrap(
+        self, benchmark, run_async, participants, platform_history
+    ):
+        benchmark.group = "preprocess"
+        event = _message_event()
+        preprocessor = DefaultPreprocessor()
+
+        def bootstrap() -> Any:
+            ctx = _make_ctx(participants, platform_history, initialized=False)
+            return run_async(lambda: preprocessor.process(ctx, event, AGENT_ID))
+
+        result = benchmark(bootstrap)
+
+        assert result.is_session_bootstrap is True
+        assert len(result.history.raw) == len(platform_history)
+
+
+class TestHistoryFormatting:
+    def test_format_history_for_llm(self, benchmark, participants, platform_history):
+        benchmark.group = "history"
+
+        result = benchmark(
+            format_history_for_llm,
+            platform_history,
+            exclude_id="msg-live",
+            participants=participants,
+        )
+
+        assert len(result) == len(platform_history)
+
+    @pytest.mark.parametrize(
+        ("module", "class_name"), CONVERTERS, ids=[c[0] for c in CONVERTERS]
+    )
+    def test_converter(self, benchmark, llm_history, module, class_name):
+        benchmark.group = "convert"
+        try:
+            converter_module = importlib.import_module(f"thenvoi.converters.{module}")
+            converter_cls = getattr(converter_module, class_name)
+            try:
+                converter = converter_cls(agent_name=AGENT_NAME)
+            except TypeError:
+                converter = converter_cls()
+            # Some converters import their framework types lazily on first use.
+            converter.convert(llm_history[:1])
+        except ImportError as e:
+            pytest.skip(f"{module} converter dependencies not installed: {e}")
+
+        result = benchmark(converter.convert, llm_history)
+
+        assert result is not None
+
+
+class TestHistoryOffload:
+    """Event-loop stall while a large bootstrap history is converted.
+
+    ``max_loop_stall_ms`` in each result's extra_info is the longest gap a
+    1 ms ticker saw -- what every other room and the WebSocket heartbeat
+    would wait for.
+    """
+
+    @pytest.mark.parametrize("threshold", [None, 0], ids=["inline", "offload"])
+    def test_bootstrap_conversion_loop_stall(
+        self, benchmark, run_async, llm_history, threshold
+    ):
+        benchmark.group = "convert-offload"
+        # ~10k messages, the size of a long-lived tool-heavy room
+        raw = llm_history * (10_000 // len(llm_history) + 1)
+        converter = AnthropicHistoryConverter(agent_name=AGENT_NAME)
+        stalls: list[float] = []
+
+        async def convert_with_ticker() -> Any:
+            stall = 0.0
+            done = False
+
+            async def ticker() -> None:
+                nonlocal stall
+                last = time.perf_counter()
+                while not done:
+                    await asyncio.sleep(0.001)
+                    now = time.perf_counter()
+                    stall = max(stall, now - last)
+                    last = now
+
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)
+            try:
+                # Fresh cache so every round measures a real conversion
+                return await convert_history(
+                    converter,
+                    raw,
+                    room_id=ROOM_ID,
+                    threshold=threshold,
+                    cache=HistoryConversionCache(),
+                )
+            finally:
+                done = True
+                await task
+                stalls.append(stall * 1000)
+
+        result = benchmark(run_async, convert_with_ticker)
+
+        benchmark.extra_info["max_loop_stall_ms"] = max(stalls)
+        assert len(result) > 0
+
+
+class TestAgentTools:
+    @pytest.mark.parametrize("fmt", ["openai", "anthropic"])
+    def test_get_tool_schemas(self, benchmark, participants, fmt):
+        benchmark.group = "tools"
+        tools = AgentTools(ROOM_ID, _fake_rest(), participants)  # type: ignore[arg-type]
+
+        result = benchmark(tools.get_tool_schemas, fmt)
+
+        assert result
+
+    def test_resolve_mentions(self, benchmark, participants):
+        benchmark.group = "tools"
+        tools = AgentTools(ROOM_ID, _fake_rest(), participants)  # type: ignore[arg-type]
+        # Handle, @handle, display name and raw ID, as LLMs produce them.
+        mentions = ["user1", "@owner0/helper-0", "User 4", "user-0007", "@user10"]
+
+        result = benchmark(tools._resolve_mentions, mentions)
+
+        assert len(result) == len(mentions)
+
+    def test_execute_tool_call_send_message(self, benchmark, run_async, participants):
+        benchmark.group = "tools"
+        tools = AgentTools(ROOM_ID, _fake_rest(), participants)  # type: ignore[arg-type]
+        arguments = {"content": "Ticket is resolved.", "mentions": ["@user1"]}
+
+        result = benchmark(
+            run_async,
+            lambda: tools.execute_tool_call("thenvoi_send_message", arguments),
+        )
+
+        assert result == {"id": "msg-reply"}
+
+    def test_execute_tool_call_rejects_invalid_arguments(
+        self, benchmark, run_async, participants
+    ):
+        benchmark.group = "tools"
+        tools = AgentTools(ROOM_ID, _fake_rest(), participants)  # type: ignore[arg-type]
+        arguments = {"mentions": "not-a-list"}
+
+        result = benchmark(
+            run_async,
+            lambda: tools.execute_tool_call("thenvoi_send_message", arguments),
+        )
+
+        assert isinstance(result, str)
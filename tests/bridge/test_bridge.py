@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -22,6 +23,7 @@ from thenvoi.platform.event import (
     RoomAddedEvent,
     RoomRemovedEvent,
 )
+from thenvoi.runtime.participant_cache import ParticipantCache
 
 from bridge_core.bridge import BridgeConfig, ReconnectConfig, ThenvoiBridge
 
@@ -98,6 +100,17 @@ class TestBridgeConfig:
         config = BridgeConfig.from_env()
         assert config.session_ttl == 3600.0
 
+    def test_from_env_with_session_db_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("THENVOI_AGENT_ID", "test-agent")
+        monkeypatch.setenv("THENVOI_API_KEY", "test-key")
+        monkeypatch.setenv("AGENT_MAPPING", "alice:handler_a")
+        monkeypatch.setenv("SESSION_DB_PATH", "/data/sessions.db")
+
+        config = BridgeConfig.from_env()
+        assert config.session_db_path == "/data/sessions.db"
+
     def test_from_env_invalid_session_ttl(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -763,6 +776,32 @@ class TestThenvoiBridgeParticipantCache:
         assert call_kwargs["sender_name"] is None
         assert call_kwargs["sender_handle"] is None
 
+    async def test_concurrent_cache_misses_share_one_fetch(
+        self, bridge_with_full_mock: ThenvoiBridge
+    ) -> None:
+        bridge = bridge_with_full_mock
+        mock_participant = MagicMock()
+        mock_participant.id = "user-1"
+        mock_participant.name = "Jane"
+        mock_participant.type = "User"
+        mock_participant.handle = "jane"
+        mock_response = MagicMock()
+        mock_response.data = [mock_participant]
+        list_participants = AsyncMock(return_value=mock_response)
+        bridge._link.rest.agent_api_participants.list_agent_chat_participants = (
+            list_participants
+        )
+        bridge._link.participant_cache = ParticipantCache.for_agent(
+            bridge._link.rest, ttl=60
+        )
+
+        records = await asyncio.gather(
+            *[bridge._get_room_participants("room-1") for _ in range(3)]
+        )
+
+        list_participants.assert_awaited_once()
+        assert all(r[0]["name"] == "Jane" for r in records)
+
 
 class TestThenvoiBridgeFetchExistingRooms:
     async def test_returns_room_ids(self, bridge_config: BridgeConfig) -> None:
@@ -4,10 +4,29 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
-from bridge_core.session import InMemorySessionStore, SessionData
+from bridge_core import session as session_module
+from bridge_core.session import InMemorySessionStore, SessionData, SQLiteSessionStore
+
+
+class FakeClock:
+    """Controllable replacement for the session module's clock."""
+
+    def __init__(self) -> None:
+        self.now = datetime.now(timezone.utc)
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(session_module, "_utcnow", lambda: fake.now)
+    return fake
 
 
 class TestSessionData:
@@ -150,16 +169,57 @@ class TestInMemorySessionStoreTTL:
         assert sessions[0].room_id == "room-2"
 
     async def test_expired_evicted_from_count(
-        self, store: InMemorySessionStore
+        self, store: InMemorySessionStore, clock: FakeClock
     ) -> None:
-        s1 = await store.get_or_create("room-1")
+        await store.get_or_create("room-1")
+        clock.advance(40)
         await store.get_or_create("room-2")
 
         # Expire room-1 only
-        s1.last_activity = datetime.now(timezone.utc) - timedelta(seconds=120)
+        clock.advance(40)
 
         assert await store.count() == 1
 
+    async def test_activity_postpones_eviction(
+        self, store: InMemorySessionStore, clock: FakeClock
+    ) -> None:
+        await store.get_or_create("room-1")
+        clock.advance(40)
+        await store.get_or_create("room-1")
+        clock.advance(40)
+
+        assert await store.evict_expired() == 0
+        clock.advance(40)
+        assert await store.evict_expired() == 1
+        assert await store.get("room-1") is None
+
+    async def test_removed_session_not_resurrected(
+        self, store: InMemorySessionStore, clock: FakeClock
+    ) -> None:
+        await store.get_or_create("room-1")
+        await store.remove("room-1")
+        clock.advance(120)
+
+        assert await store.evict_expired() == 0
+        assert await store.count() == 0
+
+    async def test_sweeper_evicts_in_background(self) -> None:
+        store = InMemorySessionStore(session_ttl=0.02)
+        await store.get_or_create("room-1")
+        await store.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert sum(len(shard.sessions) for shard in store._shards) == 0
+        finally:
+            await store.stop()
+        assert store._sweep_task is None
+
+    async def test_sweeper_not_started_without_ttl(self) -> None:
+        store = InMemorySessionStore()
+        await store.start()
+        assert store._sweep_task is None
+        await store.stop()
+
     async def test_get_or_create_does_not_evict(
         self, store: InMemorySessionStore
     ) -> None:
@@ -193,3 +253,76 @@ class TestInMemorySessionStoreTTL:
 
         assert await store.count() == 3
         assert await store.count() == len(await store.list_sessions())
+
+    async def test_sessions_spread_across_shards(self) -> None:
+        store = InMemorySessionStore(shards=4)
+        for i in range(32):
+            await store.get_or_create(f"room-{i}")
+
+        assert sum(1 for shard in store._shards if shard.sessions) > 1
+        assert await store.count() == 32
+
+    def test_rejects_zero_shards(self) -> None:
+        with pytest.raises(ValueError, match="shards"):
+            InMemorySessionStore(shards=0)
+
+
+class TestSQLiteSessionStore:
+    @pytest.fixture
+    async def store(self, tmp_path: Path):
+        store = SQLiteSessionStore(tmp_path / "sessions.db", session_ttl=60.0)
+        yield store
+        await store.stop()
+
+    async def test_get_or_create_keeps_created_at(
+        self, store: SQLiteSessionStore, clock: FakeClock
+    ) -> None:
+        first = await store.get_or_create("room-1")
+        clock.advance(10)
+        second = await store.get_or_create("room-1")
+
+        assert second.created_at == first.created_at
+        assert second.last_activity > first.last_activity
+
+    async def test_get_and_remove(self, store: SQLiteSessionStore) -> None:
+        await store.get_or_create("room-1")
+        assert (await store.get("room-1")).room_id == "room-1"
+
+        await store.remove("room-1")
+        assert await store.get("room-1") is None
+
+    async def test_evicts_expired(
+        self, store: SQLiteSessionStore, clock: FakeClock
+    ) -> None:
+        await store.get_or_create("room-1")
+        clock.advance(40)
+        await store.get_or_create("room-2")
+        clock.advance(40)
+
+        assert await store.get("room-1") is None
+        assert [s.room_id for s in await store.list_sessions()] == ["room-2"]
+        assert await store.count() == 1
+
+    async def test_sessions_survive_reopen(self, tmp_path: Path) -> None:
+        path = tmp_path / "sessions.db"
+        store = SQLiteSessionStore(path)
+        created = await store.get_or_create("room-1")
+        await store.stop()
+
+        reopened = SQLiteSessionStore(path)
+        try:
+            session = await reopened.get("room-1")
+            assert session is not None
+            assert session.created_at == created.created_at
+            assert await reopened.count() == 1
+        finally:
+            await reopened.stop()
+
+
+class TestSweepingStore:
+    def test_requires_evict_expired(self) -> None:
+        class NoEviction(session_module._SweepingStore):
+            _session_ttl = None
+
+        with pytest.raises(TypeError, match="evict_expired"):
+            NoEviction()  # type: ignore[abstract]
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import io
+import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from thenvoi.cli.trigger import (
+    PeerCache,
+    RateLimitGate,
     _format_api_error,
     build_parser,
     find_peer_by_handle,
     main,
+    read_jobs,
     run,
+    run_batch,
 )
 from thenvoi_rest.core.api_error import ApiError
 
@@ -666,3 +673,179 @@ class TestMain:
             main()
 
         assert "bad input" in capsys.readouterr().err
+
+
+# --- Batch mode tests ---
+
+
+class TestReadJobs:
+    def test_parses_jsonl(self):
+        stream = io.StringIO(
+            '{"target": "@a/one", "message": "hi"}\n'
+            "\n"
+            '{"target_handle": "a/two", "message": "yo"}\n'
+        )
+        jobs, errors = read_jobs(stream, "jsonl")
+
+        assert errors == []
+        assert [(j.index, j.target, j.message) for j in jobs] == [
+            (1, "@a/one", "hi"),
+            (3, "a/two", "yo"),
+        ]
+
+    def test_parses_csv(self):
+        stream = io.StringIO("target,message\n@a/one,hello there\n")
+        jobs, errors = read_jobs(stream, "csv")
+
+        assert errors == []
+        assert jobs[0].target == "@a/one"
+        assert jobs[0].message == "hello there"
+
+    def test_reports_malformed_lines(self):
+        stream = io.StringIO('not json\n{"target": "@a/b"}\n[1, 2]\n')
+        jobs, errors = read_jobs(stream, "jsonl")
+
+        assert jobs == []
+        assert [e["index"] for e in errors] == [1, 2, 3]
+        assert all(e["status"] == "error" for e in errors)
+
+
+class TestPeerCache:
+    @pytest.mark.asyncio
+    async def test_scans_peers_once_for_many_lookups(self):
+        client = AsyncMock()
+        client.agent_api_peers.list_agent_peers.side_effect = [
+            _make_peers_response(
+                [_make_peer(peer_id="p1", handle="a/one")], total_pages=2, page=1
+            ),
+            _make_peers_response(
+                [_make_peer(peer_id="p2", handle="@a/two")], total_pages=2, page=2
+            ),
+        ]
+        cache = PeerCache(client, "agent")
+
+        one = await cache.resolve("@A/One")
+        two = await cache.resolve("a/two")
+        missing = await cache.resolve("@a/three")
+
+        assert one is not None and one["id"] == "p1"
+        assert two is not None and two["id"] == "p2"
+        assert missing is None
+        assert client.agent_api_peers.list_agent_peers.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_scan_fails_every_lookup_without_rescanning(self):
+        client = AsyncMock()
+        client.agent_api_peers.list_agent_peers.side_effect = RuntimeError("down")
+        cache = PeerCache(client, "agent")
+
+        results = await asyncio.gather(
+            *(cache.resolve(f"a/{i}") for i in range(5)), return_exceptions=True
+        )
+        with pytest.raises(RuntimeError, match="down"):
+            await cache.resolve("a/late")
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert client.agent_api_peers.list_agent_peers.call_count == 1
+
+
+class TestRateLimitGate:
+    @pytest.mark.asyncio
+    async def test_retries_after_429(self):
+        gate = RateLimitGate(max_retries=2)
+        factory = AsyncMock(
+            side_effect=[
+                ApiError(status_code=429, headers={"Retry-After": "0"}, body=None),
+                "ok",
+            ]
+        )
+
+        assert await gate.call(factory) == "ok"
+        assert factory.call_count == 2
+        assert gate.throttled_count == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_errors(self):
+        gate = RateLimitGate()
+        factory = AsyncMock(side_effect=ApiError(status_code=500, body=None))
+
+        with pytest.raises(ApiError):
+            await gate.call(factory)
+        assert factory.call_count == 1
+
+
+class TestRunBatch:
+    @pytest.mark.asyncio
+    async def test_runs_jobs_and_emits_jsonl(self, tmp_path):
+        batch = tmp_path / "jobs.jsonl"
+        batch.write_text(
+            '{"target": "@owner/agent", "message": "one"}\n'
+            '{"target": "@owner/agent", "message": "two"}\n'
+            '{"target": "@owner/missing", "message": "three"}\n'
+        )
+        args = _make_args(
+            batch=str(batch), batch_format="auto", concurrency=2, timeout=5
+        )
+        out = io.StringIO()
+
+        with patch("thenvoi.cli.trigger.AsyncRestClient") as MockClient:
+            mock_client = _make_mock_client()
+            MockClient.return_value = mock_client
+            mock_client.agent_api_peers.list_agent_peers.return_value = (
+                _make_peers_response([_make_peer(peer_id="peer-1")])
+            )
+            mock_client.agent_api_chats.create_agent_chat.return_value = (
+                _make_chat_response("room-1")
+            )
+
+            failures = await run_batch(args, out=out)
+
+        results = sorted(
+            (json.loads(line) for line in out.getvalue().splitlines()),
+            key=lambda r: r["index"],
+        )
+        assert failures == 1
+        assert [r["status"] for r in results] == ["ok", "ok", "error"]
+        assert results[0]["room_id"] == "room-1"
+        assert "not found" in results[2]["error"]
+        # Peer list fetched once for all jobs
+        assert mock_client.agent_api_peers.list_agent_peers.call_count == 1
+        assert mock_client.agent_api_messages.create_agent_chat_message.call_count == 2
+        mock_client._client_wrapper.httpx_client.httpx_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_job_timeout_covers_peer_scan(self, tmp_path):
+        batch = tmp_path / "jobs.jsonl"
+        batch.write_text('{"target": "@owner/agent", "message": "one"}\n')
+        args = _make_args(
+            batch=str(batch), batch_format="auto", concurrency=1, timeout=0.05
+        )
+        out = io.StringIO()
+
+        async def slow_peers(**kwargs):
+            await asyncio.sleep(10)
+
+        with patch("thenvoi.cli.trigger.AsyncRestClient") as MockClient:
+            mock_client = _make_mock_client()
+            MockClient.return_value = mock_client
+            mock_client.agent_api_peers.list_agent_peers.side_effect = slow_peers
+
+            failures = await run_batch(args, out=out)
+
+        result = json.loads(out.getvalue())
+        assert failures == 1
+        assert result["error"] == "timed out after 0.05 seconds"
+
+    def test_main_exits_1_when_a_job_fails(self, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv", ["thenvoi-trigger", "--api-key", "k", "--batch", "jobs.jsonl"]
+        )
+        with (
+            patch(
+                "thenvoi.cli.trigger.asyncio.run",
+                side_effect=_fake_asyncio_run(return_value=1),
+            ),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+        assert exc_info.value.code == 1
@@ -0,0 +1,204 @@
+"""Tests for process-pool history conversion offload."""
+
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from thenvoi.core import _history_offload
+from thenvoi.core._history_offload import (
+    HistoryConversionCache,
+    convert_history,
+    shutdown_history_pool,
+)
+from thenvoi.core.protocols import HistoryConverter
+
+RAW = [{"content": f"m{i}"} for i in range(5)]
+
+
+class PidHistoryConverter(HistoryConverter[tuple[int, list[str]]]):
+    """Records which process ran the conversion."""
+
+    def convert(self, raw: list[dict[str, Any]]) -> tuple[int, list[str]]:
+        return os.getpid(), [h["content"] for h in raw]
+
+
+class UnpicklableHistoryConverter(HistoryConverter[list[str]]):
+    """Holds a lambda, so it cannot be shipped to a worker."""
+
+    def __init__(self) -> None:
+        self._fmt = lambda h: h["content"]
+
+    def convert(self, raw: list[dict[str, Any]]) -> list[str]:
+        return [self._fmt(h) for h in raw]
+
+
+class RefusingHistoryConverter(HistoryConverter[list[str]]):
+    """Counts attempts to pickle it, all of which fail."""
+
+    pickle_attempts = 0
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        type(self).pickle_attempts += 1
+        raise TypeError("not picklable")
+
+    def convert(self, raw: list[dict[str, Any]]) -> list[str]:
+        return [h["content"] for h in raw]
+
+
+class GeneratorHistoryConverter(HistoryConverter[Iterator[str]]):
+    """Returns a generator, which cannot be sent back from a worker."""
+
+    def convert(self, raw: list[dict[str, Any]]) -> Iterator[str]:
+        return (h["content"] for h in raw)
+
+
+class BrokenHistoryConverter(HistoryConverter[list[str]]):
+    """Fails inside convert(), in whichever process runs it."""
+
+    def convert(self, raw: list[dict[str, Any]]) -> list[str]:
+        raise TypeError(f"converter bug in {os.getpid()}")
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pool():
+    yield
+    shutdown_history_pool()
+    _history_offload._offloadable.clear()
+
+
+class TestConvertHistory:
+    async def test_converts_inline_without_threshold(self):
+        pid, contents = await convert_history(
+            PidHistoryConverter(),
+            RAW,
+            room_id="room-1",
+            threshold=None,
+            cache=HistoryConversionCache(),
+        )
+
+        assert pid == os.getpid()
+        assert contents == ["m0", "m1", "m2", "m3", "m4"]
+
+    async def test_converts_inline_at_or_below_threshold(self):
+        pid, _ = await convert_history(
+            PidHistoryConverter(),
+            RAW,
+            room_id="room-1",
+            threshold=5,
+            cache=HistoryConversionCache(),
+        )
+
+        assert pid == os.getpid()
+
+    async def test_offloads_above_threshold(self):
+        pid, contents = await convert_history(
+            PidHistoryConverter(),
+            RAW,
+            room_id="room-1",
+            threshold=2,
+            cache=HistoryConversionCache(),
+        )
+
+        assert pid != os.getpid()
+        assert contents == ["m0", "m1", "m2", "m3", "m4"]
+
+    async def test_reuses_cached_result_for_same_history(self, monkeypatch):
+        cache = HistoryConversionCache()
+        pool_requests = 0
+        get_pool = _history_offload._get_pool
+
+        def counting_get_pool():
+            nonlocal pool_requests
+            pool_requests += 1
+            return get_pool()
+
+        monkeypatch.setattr(_history_offload, "_get_pool", counting_get_pool)
+
+        first = await convert_history(
+            PidHistoryConverter(), RAW, room_id="room-1", threshold=2, cache=cache
+        )
+        second = await convert_history(
+            PidHistoryConverter(), RAW, room_id="room-1", threshold=2, cache=cache
+        )
+        changed = await convert_history(
+            PidHistoryConverter(),
+            [*RAW, {"content": "m5"}],
+            room_id="room-1",
+            threshold=2,
+            cache=cache,
+        )
+
+        assert second == first
+        assert second[1] is not first[1]  # Fresh copy per hit
+        assert changed[1][-1] == "m5"
+        assert pool_requests == 2
+
+    async def test_falls_back_inline_for_unpicklable_converter(self):
+        result = await convert_history(
+            UnpicklableHistoryConverter(),
+            RAW,
+            room_id="room-1",
+            threshold=2,
+            cache=HistoryConversionCache(),
+        )
+
+        assert result == ["m0", "m1", "m2", "m3", "m4"]
+        assert _history_offload._offloadable[UnpicklableHistoryConverter] is False
+
+    async def test_checks_converter_picklability_once_per_type(self):
+        for _ in range(3):
+            await convert_history(
+                RefusingHistoryConverter(),
+                RAW,
+                room_id="room-1",
+                threshold=2,
+                cache=HistoryConversionCache(),
+            )
+
+        assert RefusingHistoryConverter.pickle_attempts == 1
+
+    async def test_falls_back_inline_for_unpicklable_output(self):
+        result = await convert_history(
+            GeneratorHistoryConverter(),
+            RAW,
+            room_id="room-1",
+            threshold=2,
+            cache=HistoryConversionCache(),
+        )
+
+        assert list(result) == ["m0", "m1", "m2", "m3", "m4"]
+        assert _history_offload._offloadable[GeneratorHistoryConverter] is False
+
+    async def test_propagates_converter_errors_from_worker(self):
+        with pytest.raises(TypeError, match="converter bug") as exc_info:
+            await convert_history(
+                BrokenHistoryConverter(),
+                RAW,
+                room_id="room-1",
+                threshold=2,
+                cache=HistoryConversionCache(),
+            )
+
+        # Raised in the worker, not by an inline retry on the event loop
+        assert str(os.getpid()) not in str(exc_info.value)
+
+
+class TestHistoryConversionCache:
+    def test_evicts_least_recently_used_room(self):
+        cache = HistoryConversionCache(max_rooms=2)
+        cache.put("room-1", b"v1", b"r1")
+        cache.put("room-2", b"v2", b"r2")
+        cache.get("room-1", b"v1")
+        cache.put("room-3", b"v3", b"r3")
+
+        assert cache.get("room-1", b"v1") == b"r1"
+        assert cache.get("room-2", b"v2") is None
+        assert len(cache) == 2
+
+    def test_misses_on_new_version(self):
+        cache = HistoryConversionCache()
+        cache.put("room-1", b"v1", b"r1")
+
+        assert cache.get("room-1", b"v2") is None
@@ -0,0 +1,222 @@
+"""Tests for durable adapter history (HistoryStore + SimpleAdapter hooks)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from thenvoi.core.history_store import (
+    HistoryStore,
+    RoomHistoryState,
+    SQLiteHistoryStore,
+)
+from thenvoi.core.protocols import HistoryConverter
+from thenvoi.core.simple_adapter import SimpleAdapter
+from thenvoi.core.types import AgentInput, HistoryProvider, PlatformMessage
+from thenvoi.testing import FakeAgentTools
+
+
+class ContentConverter(HistoryConverter[list[str]]):
+    def convert(self, raw: list[dict[str, Any]]) -> list[str]:
+        return [h.get("content", "") for h in raw]
+
+
+class ListHistoryAdapter(SimpleAdapter[list[str]]):
+    """Keeps per-room history the way the built-in adapters do."""
+
+    def __init__(self, history_store: HistoryStore | None = None):
+        super().__init__(
+            history_converter=ContentConverter(), history_store=history_store
+        )
+        self._message_history: dict[str, list[str]] = {}
+
+    async def on_message(
+        self,
+        msg,
+        tools,
+        history,
+        participants_msg,
+        contacts_msg,
+        *,
+        is_session_bootstrap: bool,
+        room_id: str,
+    ) -> None:
+        if is_session_bootstrap:
+            self._message_history[room_id] = list(history)
+        self._message_history.setdefault(room_id, []).append(msg.content)
+        self._message_history[room_id].append(f"reply to {msg.content}")
+
+    def dump_history(self, room_id: str) -> list[Any] | None:
+        return self._message_history.get(room_id)
+
+
+class NoPersistenceAdapter(SimpleAdapter[list[str]]):
+    async def on_message(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def make_input(
+    msg_id: str,
+    content: str,
+    *,
+    raw_history: list[dict[str, Any]] | None = None,
+    bootstrap: bool = False,
+    restored_history: list[Any] | None = None,
+    last_message_id: str | None = None,
+) -> AgentInput:
+    return AgentInput(
+        msg=PlatformMessage(
+            id=msg_id,
+            room_id="room-1",
+            content=content,
+            sender_id="user-1",
+            sender_type="User",
+            sender_name="Alice",
+            message_type="text",
+            metadata={},
+            created_at=datetime.now(timezone.utc),
+        ),
+        tools=FakeAgentTools(),
+        history=HistoryProvider(raw=raw_history or []),
+        participants_msg=None,
+        contacts_msg=None,
+        is_session_bootstrap=bootstrap,
+        room_id="room-1",
+        restored_history=restored_history,
+        last_message_id=last_message_id,
+    )
+
+
+class TestSQLiteHistoryStore:
+    async def test_round_trip(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        state = RoomHistoryState(
+            history=[{"role": "user", "content": "hi"}], last_message_id="msg-1"
+        )
+
+        await store.save("room-1", state)
+
+        assert await store.load("room-1") == state
+        assert await store.load("room-2") is None
+        assert isinstance(store, HistoryStore)
+
+    async def test_save_replaces_previous_state(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        await store.save("room-1", RoomHistoryState(["a"], "msg-1"))
+        await store.save("room-1", RoomHistoryState(["a", "b"], "msg-2"))
+
+        assert await store.load("room-1") == RoomHistoryState(["a", "b"], "msg-2")
+
+    async def test_save_appends_only_new_entries(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        await store.save("room-1", RoomHistoryState(["a", "b", "c"], "msg-1"))
+        conn = store._connect()
+        changes = conn.total_changes
+
+        await store.save("room-1", RoomHistoryState(["a", "b", "c", "d"], "msg-2"))
+
+        # One entry row plus the checkpoint row
+        assert conn.total_changes - changes == 2
+        assert await store.load("room-1") == RoomHistoryState(
+            ["a", "b", "c", "d"], "msg-2"
+        )
+
+    async def test_trimmed_history_is_rewritten(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        await store.save("room-1", RoomHistoryState(["a", "b", "c"], "msg-1"))
+        await store.save("room-1", RoomHistoryState(["b", "c", "d"], "msg-2"))
+        await store.save("room-1", RoomHistoryState(["b"], "msg-3"))
+
+        assert await store.load("room-1") == RoomHistoryState(["b"], "msg-3")
+
+    async def test_appends_after_loading_in_new_instance(self, tmp_path: Path):
+        path = tmp_path / "history.db"
+        await SQLiteHistoryStore(path).save("room-1", RoomHistoryState(["a"], "msg-1"))
+        store = SQLiteHistoryStore(path)
+
+        state = await store.load("room-1")
+        assert state is not None
+        await store.save("room-1", RoomHistoryState([*state.history, "b"], "msg-2"))
+
+        assert await SQLiteHistoryStore(path).load("room-1") == RoomHistoryState(
+            ["a", "b"], "msg-2"
+        )
+
+    async def test_survives_close_and_new_instance(self, tmp_path: Path):
+        path = tmp_path / "history.db"
+        store = SQLiteHistoryStore(path)
+        await store.save("room-1", RoomHistoryState(["a"], "msg-1"))
+        await store.close()
+
+        assert await SQLiteHistoryStore(path).load("room-1") == RoomHistoryState(
+            ["a"], "msg-1"
+        )
+        # Closed stores reopen on next use
+        assert await store.load("room-1") is not None
+
+    async def test_delete(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        await store.save("room-1", RoomHistoryState(["a"], "msg-1"))
+
+        await store.delete("room-1")
+
+        assert await store.load("room-1") is None
+
+
+class TestSimpleAdapterHistoryStore:
+    async def test_checkpoints_after_each_message(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        adapter = ListHistoryAdapter(store)
+
+        await adapter.on_event(
+            make_input("msg-1", "one", raw_history=[{"content": "old"}], bootstrap=True)
+        )
+        await adapter.on_event(make_input("msg-2", "two"))
+
+        assert await store.load("room-1") == RoomHistoryState(
+            ["old", "one", "reply to one", "two", "reply to two"], "msg-2"
+        )
+
+    async def test_coalesced_turn_checkpoints_last_message(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        adapter = ListHistoryAdapter(store)
+
+        await adapter.on_event(
+            make_input("msg-1", "one\n[Alice]: two", last_message_id="msg-2")
+        )
+
+        state = await store.load("room-1")
+        assert state is not None
+        assert state.last_message_id == "msg-2"
+
+    async def test_restored_history_is_prepended_to_newer_messages(self):
+        adapter = ListHistoryAdapter()
+
+        await adapter.on_event(
+            make_input(
+                "msg-3",
+                "three",
+                raw_history=[{"content": "while away"}],
+                bootstrap=True,
+                restored_history=["one", "reply to one"],
+            )
+        )
+
+        assert adapter.dump_history("room-1") == [
+            "one",
+            "reply to one",
+            "while away",
+            "three",
+            "reply to three",
+        ]
+
+    async def test_adapter_without_dump_history_saves_nothing(self, tmp_path: Path):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        adapter = NoPersistenceAdapter(
+            history_converter=ContentConverter(), history_store=store
+        )
+
+        await adapter.on_event(make_input("msg-1", "one", bootstrap=True))
+
+        assert await store.load("room-1") is None
@@ -333,3 +333,139 @@ def test_initialize_repo_local_only_with_branch(
     assert result.enabled is True
     assert result.cloned is False
     assert checkout_calls == ["feature"]
+
+
+# ---------------------------------------------------------------------------
+# Context indexing
+# ---------------------------------------------------------------------------
+
+
+def test_scan_repo_prunes_ignored_and_hidden_dirs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("", encoding="utf-8")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_app.py").write_text("", encoding="utf-8")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("", encoding="utf-8")
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / ".cache" / "blob.bin").write_text("", encoding="utf-8")
+
+    visited: list[str] = []
+    real_scandir = repo_init.os.scandir
+
+    def tracking_scandir(path: str):  # type: ignore[no-untyped-def]
+        visited.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(repo_init.os, "scandir", tracking_scandir)
+
+    lines, stats = repo_init._scan_repo(tmp_path)
+
+    assert not any("node_modules" in path or ".cache" in path for path in visited)
+    assert stats.total_files == 2
+    assert stats.test_files == 1
+    assert stats.ext_counts == {".py": 2}
+    assert lines == [
+        f"{tmp_path.name}/",
+        "  src/",
+        "    app.py",
+        "  tests/",
+        "    test_app.py",
+    ]
+
+
+def test_initialize_repo_reindexes_incrementally_from_git_diff(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    (repo_path / ".git").mkdir()
+    (repo_path / "app.py").write_text("", encoding="utf-8")
+    (repo_path / "notes.md").write_text("", encoding="utf-8")
+    state_dir = tmp_path / "state"
+    context_dir = tmp_path / "context"
+    head = {"commit": "abc123"}
+    diff_calls: list[tuple[str, ...]] = []
+
+    def fake_git(cwd: Path | None, *args: str) -> str:
+        if args == ("rev-parse", "HEAD"):
+            return head["commit"] + "\n"
+        if args[:2] == ("diff", "--name-status"):
+            diff_calls.append(args[-2:])
+            return "A\0test_app.py\0R100\0notes.md\0docs.rst\0M\0app.py\0"
+        raise AssertionError(f"Unexpected git args: cwd={cwd} args={args}")
+
+    monkeypatch.setattr(repo_init, "_git", fake_git)
+    config = {"repo": {"path": str(repo_path), "index": True}}
+
+    repo_init.initialize_repo(
+        config, agent_key="a", state_dir=state_dir, context_dir=context_dir
+    )
+    dependencies_mtime = (context_dir / "dependencies.md").stat().st_mtime_ns
+
+    (repo_path / "test_app.py").write_text("", encoding="utf-8")
+    (repo_path / "notes.md").rename(repo_path / "docs.rst")
+    head["commit"] = "def456"
+
+    def fail_full_scan(*_: object) -> None:
+        raise AssertionError("full rescan should not run")
+
+    monkeypatch.setattr(repo_init, "_generate_context", fail_full_scan)
+    result = repo_init.initialize_repo(
+        config, agent_key="a", state_dir=state_dir, context_dir=context_dir
+    )
+
+    assert result.indexed is True
+    assert diff_calls == [("abc123", "def456")]
+    patterns = (context_dir / "patterns.md").read_text(encoding="utf-8")
+    assert "Total files scanned: 3" in patterns
+    assert "Test-like files: 1" in patterns
+    assert "`.md`" not in patterns
+    assert "`.rst`: 1 files" in patterns
+    assert "test_app.py" in (context_dir / "structure.md").read_text(encoding="utf-8")
+    assert (context_dir / "dependencies.md").stat().st_mtime_ns == dependencies_mtime
+    meta = repo_init._read_metadata(state_dir / "repo_init_meta.json")
+    assert meta is not None
+    assert meta.head_commit == "def456"
+    assert meta.file_stats is not None
+    assert meta.file_stats.total_files == 3
+
+
+def test_initialize_repo_falls_back_to_full_scan_when_diff_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    (repo_path / ".git").mkdir()
+    (repo_path / "app.py").write_text("", encoding="utf-8")
+    state_dir = tmp_path / "state"
+    context_dir = tmp_path / "context"
+    head = {"commit": "abc123"}
+
+    def fake_git(cwd: Path | None, *args: str) -> str:
+        if args == ("rev-parse", "HEAD"):
+            return head["commit"] + "\n"
+        if args[:2] == ("diff", "--name-status"):
+            raise ValueError("bad object abc123")
+        raise AssertionError(f"Unexpected git args: cwd={cwd} args={args}")
+
+    monkeypatch.setattr(repo_init, "_git", fake_git)
+    config = {"repo": {"path": str(repo_path), "index": True}}
+
+    repo_init.initialize_repo(
+        config, agent_key="a", state_dir=state_dir, context_dir=context_dir
+    )
+    (repo_path / "lib.py").write_text("", encoding="utf-8")
+    head["commit"] = "def456"
+    result = repo_init.initialize_repo(
+        config, agent_key="a", state_dir=state_dir, context_dir=context_dir
+    )
+
+    assert result.indexed is True
+    patterns = (context_dir / "patterns.md").read_text(encoding="utf-8")
+    assert "Total files scanned: 2" in patterns
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -231,3 +232,204 @@ class TestBuildOptions:
 
         # base_options should be unmodified
         assert not hasattr(real_options, "resume") or real_options.resume is None
+
+
+def _slow_client(state: dict[str, int], delay: float = 0.02) -> MagicMock:
+    """Mock client whose connect() tracks peak concurrent connects."""
+
+    async def connect() -> None:
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(delay)
+        state["running"] -= 1
+
+    client = MagicMock()
+    client.connect = AsyncMock(side_effect=connect)
+    client.disconnect = AsyncMock()
+    return client
+
+
+class TestSessionConcurrency:
+    """Tests for per-room tasks, connect limits, LRU and idle eviction."""
+
+    @pytest.mark.asyncio
+    async def test_rooms_connect_in_parallel_up_to_limit(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options, max_concurrent_connects=3)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state),
+        ):
+            await asyncio.gather(
+                *(manager.get_or_create_session(f"room-{i}") for i in range(9))
+            )
+
+        assert manager.get_session_count() == 9
+        assert state["peak"] == 3
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_same_room_creates_one_client(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state),
+        ) as client_class:
+            clients = await asyncio.gather(
+                *(manager.get_or_create_session("room-1") for _ in range(5))
+            )
+
+        assert client_class.call_count == 1
+        assert all(c is clients[0] for c in clients)
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_lru_cap_disconnects_least_recent_room(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options, max_sessions=2)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state, delay=0),
+        ):
+            first = await manager.get_or_create_session("room-1")
+            await manager.get_or_create_session("room-2")
+            await manager.get_or_create_session("room-1")  # touch room-1
+            await manager.get_or_create_session("room-3")
+            await asyncio.sleep(0.01)
+
+        assert manager.get_active_rooms() == ["room-1", "room-3"]
+        first.disconnect.assert_not_awaited()
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_disconnected(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options, idle_timeout_s=0.01)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state, delay=0),
+        ):
+            client = await manager.get_or_create_session("room-1")
+            await asyncio.sleep(0.05)
+
+        assert not manager.has_session("room-1")
+        client.disconnect.assert_awaited_once()
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_lru_cap_skips_room_with_open_turn(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options, max_sessions=1)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state, delay=0),
+        ):
+            with manager.turn("room-1"):
+                first = await manager.get_or_create_session("room-1")
+                await manager.get_or_create_session("room-2")
+                await asyncio.sleep(0.01)
+
+                assert manager.has_session("room-1")
+                first.disconnect.assert_not_awaited()
+
+            # The cap is enforced again once the turn ends
+            await asyncio.sleep(0.01)
+
+        assert manager.get_active_rooms() == ["room-1"]
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_timer_restarts_when_turn_ends(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        manager = ClaudeSessionManager(mock_options, idle_timeout_s=0.05)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=lambda **_: _slow_client(state, delay=0),
+        ):
+            with manager.turn("room-1"):
+                client = await manager.get_or_create_session("room-1")
+                # A turn that streams longer than the idle timeout
+                await asyncio.sleep(0.1)
+                assert manager.has_session("room-1")
+
+            await asyncio.sleep(0.03)
+            assert manager.has_session("room-1")
+
+            await asyncio.sleep(0.07)
+
+        assert not manager.has_session("room-1")
+        client.disconnect.assert_awaited_once()
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_creates_sessions_and_tolerates_failures(
+        self, mock_options: ClaudeAgentOptions
+    ) -> None:
+        from thenvoi.integrations.claude_sdk.session_manager import (
+            ClaudeSessionManager,
+        )
+
+        state = {"running": 0, "peak": 0}
+        broken = MagicMock()
+        broken.connect = AsyncMock(side_effect=RuntimeError("spawn failed"))
+        clients = [_slow_client(state), broken, _slow_client(state)]
+        manager = ClaudeSessionManager(mock_options)
+
+        with patch(
+            "thenvoi.integrations.claude_sdk.session_manager.ClaudeSDKClient",
+            side_effect=clients,
+        ):
+            await manager.prewarm(["room-1", "room-2", "room-3"])
+
+        assert sorted(manager.get_active_rooms()) == ["room-1", "room-3"]
+
+        await manager.stop()
@@ -0,0 +1,83 @@
+"""Tests for the Codex app-server client pool."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from thenvoi.integrations.codex import CodexClientPool
+
+
+class FakeClient:
+    def __init__(self, pid: int | None = None, queued_events: int = 0) -> None:
+        self.pid = pid
+        self.queued_events = queued_events
+
+
+def test_assign_is_sticky_and_least_loaded() -> None:
+    pool = CodexClientPool(size=2)
+
+    first = pool.assign("room-1")
+    second = pool.assign("room-2")
+    third = pool.assign("room-3")
+
+    assert (first.index, second.index, third.index) == (0, 1, 0)
+    assert pool.assign("room-2") is second
+    assert pool.member_for("room-3") is first
+
+
+def test_release_frees_capacity_for_new_rooms() -> None:
+    pool = CodexClientPool(size=2)
+    pool.assign("room-1")
+    pool.assign("room-2")
+    pool.assign("room-3")
+
+    released = pool.release("room-1")
+    assert released is not None and released.index == 0
+    pool.release("room-3")
+
+    assert pool.assign("room-4").index == 0
+    assert pool.release("unknown") is None
+    assert pool.has_rooms()
+
+
+def test_mark_failed_resets_only_that_member() -> None:
+    pool = CodexClientPool(size=2)
+    crashed = pool.assign("room-1")
+    healthy = pool.assign("room-2")
+    crashed.client, crashed.initialized = FakeClient(), True
+    healthy.client, healthy.initialized = FakeClient(), True
+
+    crashed.mark_failed()
+    crashed.mark_failed()  # Already reset; not another restart
+
+    assert crashed.client is None and crashed.initialized is False
+    assert crashed.restarts == 1
+    assert crashed.rooms == {"room-1"}
+    assert healthy.initialized is True and healthy.restarts == 0
+
+
+async def test_stats_report_per_member_resources() -> None:
+    pool = CodexClientPool(size=2)
+    member = pool.assign("room-1")
+    member.client = FakeClient(pid=os.getpid(), queued_events=3)
+
+    async with member.lock:
+        assert pool.busy()
+        stats = pool.stats()
+
+    assert [s.index for s in stats] == [0, 1]
+    assert stats[0].pid == os.getpid()
+    assert stats[0].rooms == 1
+    assert stats[0].queued_events == 3
+    assert stats[0].busy is True
+    if os.path.exists("/proc/self/status"):
+        assert stats[0].rss_bytes and stats[0].rss_bytes > 0
+    assert (stats[1].pid, stats[1].rooms, stats[1].rss_bytes) == (None, 0, None)
+    assert not pool.busy()
+
+
+def test_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="size"):
+        CodexClientPool(size=0)
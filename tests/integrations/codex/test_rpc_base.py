@@ -0,0 +1,149 @@
+"""Tests for shared JSON-RPC event queueing, filtering and coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from thenvoi.integrations.codex.rpc_base import BaseJsonRpcClient
+
+
+def _notification(n: int) -> str:
+    return json.dumps({"method": "item/started", "params": {"n": n}})
+
+
+def _delta(item_id: str, delta: str) -> str:
+    return json.dumps(
+        {
+            "method": "item/agentMessage/delta",
+            "params": {"threadId": "thr-1", "itemId": item_id, "delta": delta},
+        },
+        separators=(",", ":"),
+    )
+
+
+async def test_full_queue_applies_backpressure_instead_of_dropping() -> None:
+    client = BaseJsonRpcClient(max_queued_events=2)
+    for n in range(2):
+        await client._dispatch_rpc_message(_notification(n))
+
+    blocked = asyncio.create_task(client._dispatch_rpc_message(_notification(2)))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert client.queued_events == 2
+
+    first = await client.recv_event(timeout_s=1)
+    await asyncio.wait_for(blocked, timeout=1)
+
+    rest = [await client.recv_event(timeout_s=1) for _ in range(2)]
+    assert [e.params["n"] for e in [first, *rest]] == [0, 1, 2]
+
+
+async def test_enqueue_timeout_drops_event() -> None:
+    client = BaseJsonRpcClient(max_queued_events=1, enqueue_timeout_s=0.01)
+    await client._dispatch_rpc_message(_notification(0))
+
+    await client._dispatch_rpc_message(_notification(1))
+
+    assert client.queued_events == 1
+    assert (await client.recv_event(timeout_s=1)).params["n"] == 0
+
+
+async def test_disconnect_event_replaces_oldest_when_full() -> None:
+    client = BaseJsonRpcClient(max_queued_events=2)
+    for n in range(2):
+        await client._dispatch_rpc_message(_notification(n))
+
+    client._fail_pending("Codex process exited unexpectedly")
+
+    events = [await client.recv_event(timeout_s=1) for _ in range(2)]
+    assert [e.method for e in events] == [
+        "item/started",
+        "transport/closed",
+    ]
+    assert events[0].params["n"] == 1
+
+
+async def test_disconnect_event_wakes_waiting_consumer() -> None:
+    client = BaseJsonRpcClient()
+    waiting = asyncio.create_task(client.recv_event(timeout_s=1))
+    await asyncio.sleep(0)
+
+    client._fail_pending("Codex websocket disconnected")
+
+    event = await waiting
+    assert event.method == "transport/closed"
+    assert client.queued_events == 0
+
+
+async def test_notification_filter_skips_unsubscribed_methods() -> None:
+    client = BaseJsonRpcClient(notification_methods={"turn/completed"})
+
+    await client._dispatch_rpc_message(_notification(0))
+    # Nested "id" forces the full decode path; still filtered afterwards.
+    await client._dispatch_rpc_message(
+        json.dumps({"method": "codex/event/agent_message", "params": {"id": "0"}})
+    )
+    await client._dispatch_rpc_message(
+        json.dumps({"params": {"turn": {"id": "t"}}, "method": "turn/completed"})
+    )
+
+    assert client.queued_events == 1
+    assert (await client.recv_event(timeout_s=1)).method == "turn/completed"
+
+
+async def test_notification_filter_never_drops_requests_or_responses() -> None:
+    client = BaseJsonRpcClient(notification_methods=set())
+    future = asyncio.get_running_loop().create_future()
+    client._pending[7] = future
+
+    await client._dispatch_rpc_message(
+        json.dumps({"method": "item/tool/call", "params": {}, "id": 3})
+    )
+    await client._dispatch_rpc_message(json.dumps({"id": 7, "result": {}}))
+
+    event = await client.recv_event(timeout_s=1)
+    assert (event.kind, event.id) == ("request", 3)
+    assert future.result() == {"id": 7, "result": {}}
+
+
+async def test_consecutive_deltas_for_same_item_are_coalesced() -> None:
+    client = BaseJsonRpcClient()
+
+    for line in (
+        _delta("msg-1", "Hel"),
+        _delta("msg-1", "lo"),
+        _delta("msg-2", "!"),
+        _delta("msg-1", "?"),
+    ):
+        await client._dispatch_rpc_message(line)
+
+    events = [await client.recv_event(timeout_s=1) for _ in range(3)]
+    assert [(e.params["itemId"], e.params["delta"]) for e in events] == [
+        ("msg-1", "Hello"),
+        ("msg-2", "!"),
+        ("msg-1", "?"),
+    ]
+    assert events[0].raw["params"]["delta"] == "Hello"
+
+
+async def test_delta_is_merged_while_reads_are_paused() -> None:
+    client = BaseJsonRpcClient(max_queued_events=1)
+    await client._dispatch_rpc_message(_delta("msg-1", "a"))
+
+    # The queue is full, but a delta for the queued item folds into it.
+    await asyncio.wait_for(client._dispatch_rpc_message(_delta("msg-1", "b")), 1)
+
+    assert client.queued_events == 1
+    assert (await client.recv_event(timeout_s=1)).params["delta"] == "ab"
+
+
+async def test_delta_is_not_merged_once_consumed() -> None:
+    client = BaseJsonRpcClient()
+
+    await client._dispatch_rpc_message(_delta("msg-1", "a"))
+    first = await client.recv_event(timeout_s=1)
+    await client._dispatch_rpc_message(_delta("msg-1", "b"))
+
+    assert first.params["delta"] == "a"
+    assert (await client.recv_event(timeout_s=1)).params["delta"] == "b"
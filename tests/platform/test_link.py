@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from thenvoi.platform.link import ThenvoiLink
+from thenvoi.platform.transport import HttpTransportConfig
 
 
 @pytest.fixture
@@ -77,6 +79,12 @@ class TestThenvoiLinkConstruction:
         assert link._ws is None
         assert link._subscribed_rooms == set()
 
+    def test_ws_validation_error_count_is_zero_when_disconnected(self):
+        """ws_validation_error_count should be 0 without a WebSocket."""
+        link = ThenvoiLink(agent_id="agent-123", api_key="test-key")
+
+        assert link.ws_validation_error_count == 0
+
     def test_init_empty_event_queue(self):
         """Should start with empty event queue."""
         link = ThenvoiLink(agent_id="agent-123", api_key="test-key")
@@ -101,6 +109,7 @@ class TestThenvoiLinkConnection:
             link.agent_id,
             on_reconnect=link._on_reconnected,
             on_disconnect=link._on_disconnected,
+            payload_validation="strict",
         )
         mock_ws_client.__aenter__.assert_called_once()
         assert link.is_connected is True
@@ -166,6 +175,54 @@ class TestThenvoiLinkConnection:
 
         assert link.is_connected is False
 
+    @patch("thenvoi.platform.link.WebSocketClient")
+    async def test_ws_validation_error_count_reads_websocket(
+        self, mock_ws_class, mock_ws_client
+    ):
+        """ws_validation_error_count should report the WebSocket's count."""
+        mock_ws_client.validation_error_count = 2
+        mock_ws_class.return_value = mock_ws_client
+
+        link = ThenvoiLink(agent_id="agent-123", api_key="test-key")
+        await link.connect()
+
+        assert link.ws_validation_error_count == 2
+
+    @patch("thenvoi.platform.link.WebSocketClient")
+    async def test_disconnect_closes_client_built_from_transport(
+        self, mock_ws_class, mock_ws_client
+    ):
+        """disconnect() should close the REST client the link built itself."""
+        mock_ws_class.return_value = mock_ws_client
+        client = httpx.AsyncClient()
+        transport = MagicMock(spec=HttpTransportConfig)
+        transport.build_client.return_value = client
+
+        link = ThenvoiLink(
+            agent_id="agent-123", api_key="test-key", transport=transport
+        )
+        await link.connect()
+        await link.disconnect()
+
+        assert client.is_closed
+
+    async def test_disconnect_leaves_caller_client_open(self):
+        """disconnect() should not close an httpx client the caller passed in."""
+        client = httpx.AsyncClient()
+        transport = MagicMock(spec=HttpTransportConfig)
+
+        link = ThenvoiLink(
+            agent_id="agent-123",
+            api_key="test-key",
+            httpx_client=client,
+            transport=transport,
+        )
+        await link.disconnect()
+
+        assert not client.is_closed
+        transport.build_client.assert_not_called()
+        await client.aclose()
+
     @patch("thenvoi.platform.link.WebSocketClient")
     async def test_run_forever_delegates_to_websocket(
         self, mock_ws_class, mock_ws_client
@@ -343,6 +400,22 @@ class TestThenvoiLinkEventQueue:
         received = await link.__anext__()
         assert received is event
 
+    async def test_records_queue_wait_when_metrics_enabled(self):
+        """Dequeued events should report their wait to the metrics hooks."""
+        from tests.conftest import make_message_event
+
+        metrics = MagicMock(enabled=True)
+        with patch("thenvoi.platform.link.instrument_httpx_client"):
+            link = ThenvoiLink(
+                agent_id="agent-123", api_key="test-key", metrics=metrics
+            )
+
+        link._queue_event(make_message_event(room_id="room-123", msg_id="msg-1"))
+        await link.__anext__()
+
+        metrics.record_queue_wait.assert_called_once()
+        assert metrics.record_queue_wait.call_args.args[0] >= 0
+
     def test_queue_drops_when_full(self):
         """Queue should drop events when full (no blocking)."""
         from tests.conftest import make_message_event
@@ -473,6 +546,28 @@ class TestThenvoiLinkEventHandlers:
         assert isinstance(event, ParticipantRemovedEvent)
         assert event.room_id == "room-123"
 
+    async def test_participant_events_invalidate_participant_cache(self):
+        """Participant events mark the room's cached participant list stale."""
+        from thenvoi.client.streaming import (
+            ParticipantAddedPayload,
+            ParticipantRemovedPayload,
+        )
+
+        link = ThenvoiLink(agent_id="agent-123", api_key="test-key")
+        link.participant_cache = MagicMock()
+
+        await link._on_participant_added(
+            "room-123", ParticipantAddedPayload(id="u1", name="U", type="User")
+        )
+        await link._on_participant_removed(
+            "room-123", ParticipantRemovedPayload(id="u1")
+        )
+
+        assert [c.args for c in link.participant_cache.invalidate.call_args_list] == [
+            ("room-123",),
+            ("room-123",),
+        ]
+
     async def test_on_room_deleted_queues_room_deleted_event(self):
         """_on_room_deleted() should queue RoomDeletedEvent."""
         from thenvoi.client.streaming import RoomDeletedPayload
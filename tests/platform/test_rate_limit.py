@@ -0,0 +1,145 @@
+"""Tests for the shared REST rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.runtime.test_metrics import RecordingMetrics
+from thenvoi.platform.rate_limit import (
+    RestRateLimiter,
+    classify_request,
+    install_rate_limiter,
+)
+from thenvoi_rest.core.api_error import ApiError
+
+CHAT = "/api/v1/agent/chats/room-1"
+
+
+class TestClassifyRequest:
+    @pytest.mark.parametrize(
+        ("method", "path", "expected"),
+        [
+            ("POST", f"{CHAT}/messages", "message"),
+            ("POST", f"{CHAT}/events", "event"),
+            ("POST", f"{CHAT}/messages/m1/processing", "lifecycle"),
+            ("POST", f"{CHAT}/messages/m1/processed", "lifecycle"),
+            ("POST", f"{CHAT}/messages/m1/failed", "lifecycle"),
+            ("GET", f"{CHAT}/messages", "other"),
+            ("GET", f"{CHAT}/participants", "other"),
+        ],
+    )
+    def test_classes(self, method, path, expected):
+        assert classify_request(method, path) == expected
+
+
+class TestRestRateLimiter:
+    async def test_unthrottled_until_first_429(self):
+        limiter = RestRateLimiter()
+
+        for _ in range(50):
+            await limiter.acquire("event")
+
+        assert limiter.rate is None
+        assert limiter.stats()["event"].requests == 50
+        assert limiter.stats()["event"].throttled == 0
+
+    async def test_429_pauses_for_retry_after_and_paces(self):
+        metrics = RecordingMetrics()
+        limiter = RestRateLimiter(min_rate=100, metrics=metrics)
+
+        assert limiter.on_response("event", 429, {"Retry-After": "0.05"})
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire("event")
+
+        assert loop.time() - start >= 0.04
+        assert limiter.rate == 100
+        assert limiter.stats()["event"].rate_limited == 1
+        assert limiter.stats()["event"].throttled == 1
+        assert [c for c, _ in metrics.rest_throttles] == ["event"]
+
+    async def test_waiters_are_released_by_priority(self):
+        limiter = RestRateLimiter(min_rate=1000)
+        limiter.on_response("other", 429, {"Retry-After": "0.02"})
+        order: list[str] = []
+
+        async def request(request_class):
+            await limiter.acquire(request_class)
+            order.append(request_class)
+
+        tasks = [
+            asyncio.create_task(request(c))
+            for c in ("lifecycle", "other", "event", "message")
+        ]
+        await asyncio.gather(*tasks)
+
+        assert order == ["message", "event", "other", "lifecycle"]
+
+    async def test_first_429_seeds_rate_and_in_flight_429s_halve_it_once(self):
+        limiter = RestRateLimiter(min_rate=1)
+        for _ in range(16):
+            await limiter.acquire("other")
+
+        for _ in range(3):
+            limiter.on_response("other", 429, {"Retry-After": "10"})
+
+        assert limiter.rate == 8.0
+
+    def test_retry_budget_rejects_once_spent(self):
+        limiter = RestRateLimiter(retry_budget=1, budget_refill=0.5)
+
+        assert limiter.on_response("message", 429, {}) is True
+        assert limiter.on_response("message", 429, {}) is False
+        assert limiter.stats()["message"].rejected == 1
+
+        limiter.on_response("message", 200, {})
+        limiter.on_response("message", 200, {})
+        assert limiter.on_response("message", 429, {}) is True
+
+    def test_recovers_after_quiet_period(self):
+        limiter = RestRateLimiter(recover_after=0)
+        limiter.on_response("event", 429, {"Retry-After": "0"})
+        assert limiter.rate is not None
+
+        limiter.on_response("event", 200, {})
+
+        assert limiter.rate is None
+
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RestRateLimiter(min_rate=0)
+        with pytest.raises(ValueError):
+            RestRateLimiter(retry_budget=-1)
+
+
+class TestInstallRateLimiter:
+    async def test_raises_429_when_budget_is_spent(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(429, headers={"Retry-After": "0"})
+            )
+        )
+        limiter = install_rate_limiter(client, RestRateLimiter(retry_budget=0))
+
+        async with client:
+            with pytest.raises(ApiError):
+                await client.post(f"https://app.thenvoi.com{CHAT}/events")
+
+        assert limiter.stats()["event"].rejected == 1
+
+    async def test_passes_responses_through_and_is_shared(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(201))
+        )
+        first = install_rate_limiter(client, RestRateLimiter())
+        second = install_rate_limiter(client, RestRateLimiter())
+
+        async with client:
+            response = await client.post(f"https://app.thenvoi.com{CHAT}/messages")
+
+        assert response.status_code == 201
+        assert second is first
+        assert first.stats()["message"].requests == 1
@@ -0,0 +1,83 @@
+"""Tests for REST transport settings."""
+
+from __future__ import annotations
+
+import importlib.util
+
+import httpx
+import pytest
+
+from tests.runtime.test_metrics import RecordingMetrics
+from thenvoi.platform.transport import HttpTransportConfig
+from thenvoi.runtime.metrics import instrument_httpx_client
+
+ROOM = "5f0c7a1e-2b3d-4c5e-8f9a-0b1c2d3e4f5a"
+BASE = "https://app.thenvoi.com/api/v1/agent/chats"
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Transport that keeps request timeouts and replays httpcore trace events."""
+
+    def __init__(self, *trace_events: str) -> None:
+        self.timeouts: list[dict[str, float | None]] = []
+        self._trace_events = trace_events
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"])
+        trace = request.extensions.get("trace")
+        for event_name in self._trace_events:
+            if trace is not None:
+                await trace(event_name, {})
+        return httpx.Response(200)
+
+
+class TestHttpTransportConfig:
+    async def test_applies_endpoint_and_phase_timeouts(self):
+        transport = RecordingTransport()
+        config = HttpTransportConfig(
+            timeout=30.0,
+            connect_timeout=2.0,
+            pool_timeout=5.0,
+            endpoint_timeouts={"/api/v1/agent/chats/{id}/context": 120.0},
+        )
+
+        async with config.build_client(transport=transport) as client:
+            await client.get(f"{BASE}/{ROOM}/context")
+            # Per-request timeouts (as the REST client sends) keep read/write
+            await client.get(f"{BASE}/{ROOM}/participants", timeout=7.0)
+
+        assert transport.timeouts == [
+            {"connect": 2.0, "read": 120.0, "write": 120.0, "pool": 5.0},
+            {"connect": 2.0, "read": 7.0, "write": 7.0, "pool": 5.0},
+        ]
+
+    async def test_default_client_settings(self):
+        config = HttpTransportConfig()
+
+        async with config.build_client() as client:
+            assert client.timeout.read == 60.0
+            assert client.timeout.connect == 10.0
+
+    def test_http2_without_h2_explains_install(self):
+        if importlib.util.find_spec("h2") is not None:
+            pytest.skip("h2 is installed")
+
+        with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+            HttpTransportConfig(http2=True).build_client()
+
+
+class TestPoolWaitMetrics:
+    async def test_records_wait_until_connection_is_ready(self):
+        metrics = RecordingMetrics()
+        transport = RecordingTransport(
+            "connection.connect_tcp.started",
+            "http11.send_request_headers.started",
+        )
+        client = httpx.AsyncClient(transport=transport)
+        instrument_httpx_client(client, metrics)
+
+        async with client:
+            await client.post(f"{BASE}/{ROOM}/events")
+
+        assert len(metrics.rest_pool_waits) == 1
+        assert metrics.rest_pool_waits[0] >= 0
@@ -75,6 +75,7 @@ def make_mock_ctx(
     ctx.participants_changed = MagicMock(return_value=participants_changed)
     ctx.mark_llm_initialized = MagicMock()
     ctx.mark_participants_sent = MagicMock()
+    ctx.pop_restored_history = MagicMock(return_value=None)
     ctx.get_context = AsyncMock(
         return_value=MagicMock(
             messages=history_messages or [],
@@ -369,6 +370,62 @@ class TestHistoryLoading:
         # History should be empty
         assert len(result.history) == 0
 
+    async def test_excludes_coalesced_messages_from_history(self):
+        """Every message in a coalesced batch is left out of bootstrap history."""
+        preprocessor = DefaultPreprocessor()
+        ctx = make_mock_ctx(
+            is_llm_initialized=False,
+            enable_context_hydration=True,
+            history_messages=[
+                {"id": "msg-0", "content": "Previous message"},
+                {"id": "msg-1", "content": "Hello"},
+                {"id": "msg-2", "content": "Are you there?"},
+            ],
+        )
+        event = MessageEvent(
+            room_id="room-1",
+            payload=make_message_payload(content="Hello\n[Alice]: Are you there?"),
+            batch=[
+                make_message_payload(id="msg-1"),
+                make_message_payload(id="msg-2", content="Are you there?"),
+            ],
+        )
+
+        with patch("thenvoi.preprocessing.default.AgentTools") as mock_tools:
+            mock_tools.from_context.return_value = MagicMock()
+            with patch(
+                "thenvoi.preprocessing.default.check_and_format_participants"
+            ) as mock_participants:
+                mock_participants.return_value = None
+                with patch(
+                    "thenvoi.preprocessing.default.format_history_for_llm"
+                ) as mock_format:
+                    mock_format.return_value = []
+                    result = await preprocessor.process(ctx, event, agent_id="agent-1")
+
+        formatted = mock_format.call_args[0][0]
+        assert [m["id"] for m in formatted] == ["msg-0"]
+        assert result.msg.content == "Hello\n[Alice]: Are you there?"
+        assert result.last_message_id == "msg-2"
+
+    async def test_passes_restored_history_on_bootstrap(self):
+        """History resumed from a checkpoint is handed to the adapter."""
+        preprocessor = DefaultPreprocessor()
+        ctx = make_mock_ctx(is_llm_initialized=False, enable_context_hydration=True)
+        ctx.pop_restored_history.return_value = [{"role": "user", "content": "Old"}]
+        event = make_message_event()
+
+        with patch("thenvoi.preprocessing.default.AgentTools") as mock_tools:
+            mock_tools.from_context.return_value = MagicMock()
+            with patch(
+                "thenvoi.preprocessing.default.check_and_format_participants"
+            ) as mock_participants:
+                mock_participants.return_value = None
+                result = await preprocessor.process(ctx, event, agent_id="agent-1")
+
+        assert result.restored_history == [{"role": "user", "content": "Old"}]
+        assert result.is_session_bootstrap is True
+
 
 class TestParticipantsHandling:
     """Tests for participant change handling."""
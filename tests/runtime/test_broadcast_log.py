@@ -0,0 +1,69 @@
+"""Tests for the shared broadcast log."""
+
+import pytest
+
+from thenvoi.runtime.broadcast_log import BroadcastLog
+
+
+class TestBroadcastLog:
+    def test_room_reads_only_messages_after_subscribe(self):
+        log = BroadcastLog()
+        log.append("before")
+        log.subscribe("room-1")
+        log.append("a")
+        log.append("b")
+
+        assert log.read("room-1") == ["a", "b"]
+        assert log.read("room-1") == []
+
+    def test_rooms_have_independent_cursors(self):
+        log = BroadcastLog()
+        log.subscribe("room-1")
+        log.subscribe("room-2")
+        log.append("a")
+        assert log.read("room-1") == ["a"]
+        log.append("b")
+
+        assert log.read("room-1") == ["b"]
+        assert log.read("room-2") == ["a", "b"]
+
+    def test_unsubscribed_room_reads_nothing(self):
+        log = BroadcastLog()
+        log.subscribe("room-1")
+        log.unsubscribe("room-1")
+        log.append("a")
+
+        assert "room-1" not in log
+        assert log.read("room-1") == []
+
+    def test_backlog_is_capped_and_summarized(self):
+        log = BroadcastLog(summary="{count} omitted", max_backlog=3, max_entries=10)
+        log.subscribe("room-1")
+        for i in range(5):
+            log.append(f"m{i}")
+
+        assert log.read("room-1") == ["2 omitted", "m2", "m3", "m4"]
+
+    def test_compacts_entries_read_by_every_room(self):
+        log = BroadcastLog(max_backlog=2, max_entries=4)
+        log.subscribe("room-1")
+        for i in range(4):
+            log.append(f"m{i}")
+        log.read("room-1")
+        log.append("m4")
+
+        assert len(log) == 1
+        assert log.read("room-1") == ["m4"]
+
+    def test_dormant_room_does_not_grow_log(self):
+        log = BroadcastLog(summary="{count} omitted", max_backlog=2, max_entries=6)
+        log.subscribe("dormant")
+        for i in range(100):
+            log.append(f"m{i}")
+
+        assert len(log) <= 6
+        assert log.read("dormant") == ["98 omitted", "m98", "m99"]
+
+    def test_rejects_log_smaller_than_twice_backlog(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            BroadcastLog(max_backlog=10, max_entries=15)
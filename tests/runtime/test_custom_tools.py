@@ -1,16 +1,25 @@
 """Tests for custom tools utilities."""
 
+import asyncio
+import threading
+import time
+
 import pytest
 from pydantic import BaseModel, Field
 
+from thenvoi.runtime import custom_tools
 from thenvoi.runtime.custom_tools import (
     CustomToolDef,
+    build_custom_tool_index,
     custom_tool_to_anthropic_schema,
     custom_tool_to_openai_schema,
     custom_tools_to_schemas,
     execute_custom_tool,
     find_custom_tool,
     get_custom_tool_name,
+    release_custom_tool_executor,
+    retain_custom_tool_executor,
+    tool_options,
 )
 
 
@@ -233,6 +242,20 @@ class TestFindCustomTool:
         assert result is not None
         assert result[1] is first_func
 
+    def test_finds_tool_in_index(self):
+        """Should look up by name in a prebuilt index, first match winning."""
+        index = build_custom_tool_index(
+            [
+                (WeatherInput, async_weather),
+                (WeatherInput, failing_tool),
+                (CalculatorInput, sync_calculator),
+            ]
+        )
+
+        assert list(index) == ["weather", "calculator"]
+        assert find_custom_tool(index, "weather") == (WeatherInput, async_weather)
+        assert find_custom_tool(index, "unknown") is None
+
 
 class TestExecuteCustomTool:
     """Test custom tool execution with validation."""
@@ -331,3 +354,106 @@ class TestExecuteCustomTool:
         await execute_custom_tool(tool, {"query": "test"})  # No max_results
 
         assert received_args[0].max_results == 10  # Default value
+
+
+class TestCustomToolExecutionOptions:
+    """Test thread-pool execution, timeouts and concurrency limits."""
+
+    async def test_sync_tool_runs_off_event_loop_thread(self):
+        """Sync tools should not block the event loop."""
+        loop_thread = threading.get_ident()
+        tool_threads = []
+
+        def blocking_weather(args: WeatherInput) -> str:
+            tool_threads.append(threading.get_ident())
+            time.sleep(0.05)
+            return args.city
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        result = await execute_custom_tool(
+            (WeatherInput, blocking_weather), {"city": "NYC"}
+        )
+        ticker_task.cancel()
+
+        assert result == "NYC"
+        assert tool_threads[0] != loop_thread
+        assert ticks >= 3
+
+    async def test_run_in_thread_false_runs_inline(self):
+        """Opted-out sync tools should run on the event loop thread."""
+        threads = []
+
+        @tool_options(run_in_thread=False)
+        def inline_weather(args: WeatherInput) -> str:
+            threads.append(threading.get_ident())
+            return args.city
+
+        await execute_custom_tool((WeatherInput, inline_weather), {"city": "NYC"})
+
+        assert threads == [threading.get_ident()]
+
+    async def test_timeout_raises_timeout_error(self):
+        """A tool exceeding its timeout should fail with TimeoutError."""
+
+        @tool_options(timeout=0.01)
+        async def slow_weather(args: WeatherInput) -> str:
+            await asyncio.sleep(1)
+            return args.city
+
+        with pytest.raises(TimeoutError, match="weather timed out"):
+            await execute_custom_tool((WeatherInput, slow_weather), {"city": "NYC"})
+
+    async def test_max_concurrency_limits_parallel_calls(self):
+        """No more than max_concurrency calls of one tool should run at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        @tool_options(max_concurrency=2)
+        def busy_weather(args: WeatherInput) -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return args.city
+
+        results = await asyncio.gather(
+            *(
+                execute_custom_tool((WeatherInput, busy_weather), {"city": str(i)})
+                for i in range(6)
+            )
+        )
+
+        assert results == [str(i) for i in range(6)]
+        assert peak == 2
+
+    def test_rejects_invalid_options(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            tool_options(max_concurrency=0)
+        with pytest.raises(ValueError, match="timeout"):
+            tool_options(timeout=0)
+
+    def test_last_release_shuts_down_pool(self, monkeypatch):
+        """The pool should shut down once every retaining agent has stopped."""
+        monkeypatch.setattr(custom_tools, "_executor_users", 0)
+        retain_custom_tool_executor()
+        retain_custom_tool_executor()
+        executor = custom_tools._get_executor()
+
+        release_custom_tool_executor()
+        assert custom_tools._executor is executor
+
+        release_custom_tool_executor()
+        assert custom_tools._executor is None
+        assert executor._shutdown
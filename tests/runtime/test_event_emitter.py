@@ -0,0 +1,190 @@
+"""Tests for EventEmitter."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from thenvoi.runtime.event_emitter import EventEmitter
+from thenvoi.runtime.execution import ExecutionContext
+from thenvoi.runtime.tools import AgentTools
+from thenvoi.runtime.types import SessionConfig
+
+
+class GatedSend:
+    """Send that records events and blocks until released."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(
+        self, content: str, message_type: str, metadata: dict[str, Any] | None
+    ) -> None:
+        await self.gate.wait()
+        self.sent.append((message_type, content))
+
+
+class TestEventEmitter:
+    async def test_emit_does_not_wait_for_send(self):
+        send = GatedSend()
+        send.gate.clear()
+        emitter = EventEmitter(send)
+
+        emitter.emit("calling search", "tool_call")
+
+        assert emitter.pending == 1
+        send.gate.set()
+        await emitter.flush()
+        assert send.sent == [("tool_call", "calling search")]
+        assert emitter.pending == 0
+
+    async def test_events_are_sent_in_order(self):
+        send = GatedSend()
+        emitter = EventEmitter(send)
+
+        for i in range(5):
+            emitter.emit(f"event {i}", "thought")
+            if i == 2:
+                await asyncio.sleep(0)
+        await emitter.flush()
+
+        assert [content for _, content in send.sent] == [f"event {i}" for i in range(5)]
+
+    async def test_full_buffer_drops_thoughts_and_summarizes(self):
+        send = GatedSend()
+        send.gate.clear()
+        emitter = EventEmitter(send, max_pending=2)
+
+        emitter.emit("first", "thought")
+        await asyncio.sleep(0)  # sender picks up "first"
+        emitter.emit("second", "thought")
+        emitter.emit("third", "thought")
+        emitter.emit("fourth", "thought")  # dropped
+        emitter.emit("result", "tool_result")  # evicts "second"
+        send.gate.set()
+        await emitter.flush()
+
+        assert send.sent == [
+            ("thought", "first"),
+            ("thought", "2 thought(s) omitted"),
+            ("thought", "third"),
+            ("tool_result", "result"),
+        ]
+
+    async def test_tool_events_are_never_dropped(self):
+        send = GatedSend()
+        send.gate.clear()
+        emitter = EventEmitter(send, max_pending=1)
+
+        for i in range(3):
+            emitter.emit(f"call {i}", "tool_call")
+        send.gate.set()
+        await emitter.flush()
+
+        assert [content for _, content in send.sent] == ["call 0", "call 1", "call 2"]
+
+    async def test_send_failure_does_not_stop_delivery(self):
+        send = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        emitter = EventEmitter(send)
+
+        emitter.emit("one", "thought")
+        emitter.emit("two", "thought")
+        await emitter.flush()
+
+        assert send.await_count == 2
+
+    async def test_close_discards_events_after_timeout(self):
+        send = GatedSend()
+        send.gate.clear()
+        emitter = EventEmitter(send)
+        emitter.emit("stuck", "thought")
+        emitter.emit("queued", "thought")
+
+        await emitter.close(timeout=0.01)
+
+        assert emitter.pending == 0
+        assert send.sent == []
+
+    def test_rejects_non_positive_max_pending(self):
+        with pytest.raises(ValueError):
+            EventEmitter(AsyncMock(), max_pending=0)
+
+
+class TestAgentToolsWithEmitter:
+    def _tools(self, emitter: EventEmitter) -> tuple[AgentTools, MagicMock]:
+        rest = MagicMock()
+        rest.agent_api_events.create_agent_chat_event = AsyncMock(
+            return_value=MagicMock(data=MagicMock(id="evt-1"))
+        )
+        rest.agent_api_messages.create_agent_chat_message = AsyncMock(
+            return_value=MagicMock(data=MagicMock(id="msg-1"))
+        )
+        participants = [{"id": "user-1", "name": "Alice", "handle": "@alice"}]
+        tools = AgentTools("room-1", rest, participants, event_emitter=emitter)
+        return tools, rest
+
+    async def test_deferrable_events_are_queued(self):
+        send = GatedSend()
+        send.gate.clear()
+        tools, rest = self._tools(EventEmitter(send))
+
+        result = await tools.send_event("thinking", "thought")
+
+        assert result == {"status": "queued", "message_type": "thought"}
+        rest.agent_api_events.create_agent_chat_event.assert_not_awaited()
+        send.gate.set()
+        await tools._event_emitter.flush()
+        assert send.sent == [("thought", "thinking")]
+
+    async def test_send_message_flushes_queued_events_first(self):
+        order: list[str] = []
+
+        async def send(content: str, message_type: str, metadata: Any) -> None:
+            await asyncio.sleep(0.01)
+            order.append(message_type)
+
+        tools, rest = self._tools(EventEmitter(send))
+        rest.agent_api_messages.create_agent_chat_message.side_effect = lambda **_: (
+            order.append("message") or MagicMock(data=MagicMock())
+        )
+
+        await tools.send_event("search", "tool_call")
+        await tools.send_event("found", "tool_result")
+        await tools.send_message("Done", mentions=["@alice"])
+
+        assert order == ["tool_call", "tool_result", "message"]
+
+    async def test_error_events_are_sent_inline_after_queue(self):
+        send = GatedSend()
+        tools, rest = self._tools(EventEmitter(send))
+
+        await tools.send_event("thinking", "thought")
+        result = await tools.send_event("failed", "error")
+
+        assert send.sent == [("thought", "thinking")]
+        assert result.id == "evt-1"
+        rest.agent_api_events.create_agent_chat_event.assert_awaited_once()
+
+
+class TestExecutionContextEmitter:
+    def test_disabled_by_default(self):
+        ctx = ExecutionContext("room-1", MagicMock(), AsyncMock())
+
+        assert ctx.event_emitter is None
+        assert AgentTools.from_context(ctx)._event_emitter is None
+
+    def test_enabled_by_session_config(self):
+        ctx = ExecutionContext(
+            "room-1",
+            MagicMock(),
+            AsyncMock(),
+            config=SessionConfig(defer_execution_events=True),
+        )
+
+        assert isinstance(ctx.event_emitter, EventEmitter)
+        assert AgentTools.from_context(ctx)._event_emitter is ctx.event_emitter
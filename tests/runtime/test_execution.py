@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from thenvoi.core.history_store import RoomHistoryState, SQLiteHistoryStore
 from thenvoi.runtime.execution import Execution, ExecutionContext, _error_label
 from thenvoi.runtime.types import ConversationContext, SessionConfig
 
@@ -17,6 +19,7 @@ from tests.conftest import (
     make_participant_added_event,
     make_participant_removed_event,
 )
+from tests.core.test_history_store import ListHistoryAdapter, make_input
 
 
 @pytest.fixture
@@ -57,6 +60,7 @@ def mock_link():
     link.mark_processed = AsyncMock()
     link.mark_failed = AsyncMock()
     link.get_next_message = AsyncMock(return_value=None)  # No backlog by default
+    link.history_store = None
 
     return link
 
@@ -727,6 +731,143 @@ class TestSessionConfigDefaults:
         assert config.max_message_retries == 1
 
 
+class TestMessageCoalescing:
+    """Test SessionConfig.coalesce_messages batching of queued messages."""
+
+    async def _run_queued(self, ctx: ExecutionContext, *events) -> None:
+        for event in events:
+            await ctx.on_event(event)
+        await ctx._process_event(await ctx.queue.get())
+
+    async def test_disabled_by_default(self, mock_link, mock_handler):
+        """Without coalescing each queued message is its own turn."""
+        ctx = ExecutionContext("room-123", mock_link, mock_handler)
+
+        await self._run_queued(
+            ctx,
+            make_message_event(msg_id="msg-1", content="one"),
+            make_message_event(msg_id="msg-2", content="two"),
+        )
+
+        assert mock_handler.call_count == 1
+        assert mock_handler.call_args[0][1].payload.content == "one"
+        assert ctx.queue.qsize() == 1
+
+    async def test_folds_queued_messages_into_one_turn(self, mock_link, mock_handler):
+        """Queued messages are combined and all marked processed together."""
+        ctx = ExecutionContext(
+            "room-123",
+            mock_link,
+            mock_handler,
+            config=SessionConfig(coalesce_messages=True),
+            agent_id="agent-123",
+        )
+        ctx.add_participant({"id": "user-2", "name": "Bob", "type": "User"})
+
+        await self._run_queued(
+            ctx,
+            make_message_event(msg_id="msg-1", content="one"),
+            make_message_event(msg_id="msg-2", content="two", sender_id="user-2"),
+            make_message_event(
+                msg_id="msg-self", sender_id="agent-123", sender_type="Agent"
+            ),
+            make_message_event(msg_id="msg-3", content="three"),
+        )
+
+        assert mock_handler.call_count == 1
+        event = mock_handler.call_args[0][1]
+        assert event.payload.id == "msg-1"
+        assert event.payload.content == "one\n[Bob]: two\n[User]: three"
+        assert [p.id for p in event.batch] == ["msg-1", "msg-2", "msg-3"]
+        processed = [c.args[1] for c in mock_link.mark_processed.call_args_list]
+        assert processed == ["msg-1", "msg-2", "msg-3"]
+        assert ctx.queue.empty()
+
+    async def test_stops_at_non_message_event(self, mock_link, mock_handler):
+        """Participant events are not reordered past coalesced messages."""
+        ctx = ExecutionContext(
+            "room-123",
+            mock_link,
+            mock_handler,
+            config=SessionConfig(coalesce_messages=True),
+        )
+        participant_event = make_participant_added_event(participant_id="user-9")
+
+        await self._run_queued(
+            ctx,
+            make_message_event(msg_id="msg-1"),
+            make_message_event(msg_id="msg-2"),
+            participant_event,
+            make_message_event(msg_id="msg-3"),
+        )
+
+        assert [p.id for p in mock_handler.call_args[0][1].batch] == [
+            "msg-1",
+            "msg-2",
+        ]
+        assert ctx.queue.get_nowait() is participant_event
+        assert ctx.queue.get_nowait().payload.id == "msg-3"
+
+    async def test_respects_max_messages(self, mock_link, mock_handler):
+        """No more than coalesce_max_messages are folded into one turn."""
+        ctx = ExecutionContext(
+            "room-123",
+            mock_link,
+            mock_handler,
+            config=SessionConfig(coalesce_messages=True, coalesce_max_messages=2),
+        )
+
+        await self._run_queued(
+            ctx,
+            *(make_message_event(msg_id=f"msg-{i}") for i in range(4)),
+        )
+
+        assert len(mock_handler.call_args[0][1].batch) == 2
+        assert ctx.queue.qsize() == 2
+
+    async def test_waits_for_window(self, mock_link, mock_handler):
+        """Messages arriving within the window join the turn."""
+        ctx = ExecutionContext(
+            "room-123",
+            mock_link,
+            mock_handler,
+            config=SessionConfig(coalesce_messages=True, coalesce_window_seconds=0.2),
+        )
+
+        async def late_message() -> None:
+            await asyncio.sleep(0.05)
+            await ctx.on_event(make_message_event(msg_id="msg-2"))
+
+        late = asyncio.create_task(late_message())
+        await self._run_queued(ctx, make_message_event(msg_id="msg-1"))
+        await late
+
+        assert [p.id for p in mock_handler.call_args[0][1].batch] == [
+            "msg-1",
+            "msg-2",
+        ]
+
+    async def test_failure_marks_every_message_failed(self, mock_link):
+        """A failed coalesced turn marks all of its messages failed."""
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+        ctx = ExecutionContext(
+            "room-123",
+            mock_link,
+            handler,
+            config=SessionConfig(coalesce_messages=True),
+        )
+
+        await self._run_queued(
+            ctx,
+            make_message_event(msg_id="msg-1"),
+            make_message_event(msg_id="msg-2"),
+        )
+
+        failed = [c.args[1] for c in mock_link.mark_failed.call_args_list]
+        assert failed == ["msg-1", "msg-2"]
+        mock_link.mark_processed.assert_not_called()
+
+
 class TestInstantShutdown:
     """Tests for instant cancellation without timeout waiting."""
 
@@ -1023,6 +1164,124 @@ class TestContextCacheTTL:
         await ctx.stop()
 
 
+def make_context_item(msg_id: str, sender_id: str = "user-1") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=msg_id,
+        content=f"content of {msg_id}",
+        sender_id=sender_id,
+        sender_type="Agent" if sender_id == "agent-123" else "User",
+        sender_name="Someone",
+        message_type="text",
+        metadata={},
+        inserted_at="2024-01-01T00:00:00Z",
+    )
+
+
+def paged_context(items: list[SimpleNamespace]) -> AsyncMock:
+    """get_agent_chat_context mock paging ``items`` oldest-first."""
+
+    async def get_context(chat_id, page=1, page_size=50, request_options=None):
+        start = (page - 1) * page_size
+        return SimpleNamespace(
+            data=items[start : start + page_size],
+            meta=SimpleNamespace(total_count=len(items)),
+        )
+
+    return AsyncMock(side_effect=get_context)
+
+
+class TestHistoryStoreResume:
+    """First hydration resumes from the adapter's history checkpoint."""
+
+    def _ctx(self, mock_link, mock_handler, items, state):
+        mock_link.rest.agent_api_context.get_agent_chat_context = paged_context(items)
+        mock_link.history_store = MagicMock(spec=["load", "save", "delete", "close"])
+        mock_link.history_store.load = AsyncMock(return_value=state)
+        return ExecutionContext(
+            "room-123", mock_link, mock_handler, agent_id="agent-123"
+        )
+
+    async def test_fetches_only_messages_after_checkpoint(
+        self, mock_link, mock_handler
+    ):
+        items = [make_context_item(f"msg-{i}") for i in range(120)]
+        items.insert(118, make_context_item("own-reply", sender_id="agent-123"))
+        state = RoomHistoryState(history=["saved"], last_message_id="msg-117")
+        ctx = self._ctx(mock_link, mock_handler, items, state)
+
+        context = await ctx.get_context()
+
+        assert [m["id"] for m in context.messages] == ["msg-118", "msg-119"]
+        assert ctx.pop_restored_history() == ["saved"]
+        assert ctx.pop_restored_history() is None
+        # One-item probe plus the last page
+        calls = mock_link.rest.agent_api_context.get_agent_chat_context.await_args_list
+        assert [(c.kwargs["page"], c.kwargs["page_size"]) for c in calls] == [
+            (1, 1),
+            (3, 50),
+        ]
+
+    async def test_walks_back_pages_to_find_checkpoint(self, mock_link, mock_handler):
+        items = [make_context_item(f"msg-{i}") for i in range(120)]
+        state = RoomHistoryState(history=[], last_message_id="msg-60")
+        ctx = self._ctx(mock_link, mock_handler, items, state)
+
+        context = await ctx.get_context()
+
+        assert [m["id"] for m in context.messages] == [
+            f"msg-{i}" for i in range(61, 120)
+        ]
+
+    async def test_unknown_checkpoint_falls_back_to_full_hydration(
+        self, mock_link, mock_handler
+    ):
+        items = [make_context_item(f"msg-{i}") for i in range(10)]
+        state = RoomHistoryState(history=["saved"], last_message_id="gone")
+        ctx = self._ctx(mock_link, mock_handler, items, state)
+
+        context = await ctx.get_context()
+
+        assert len(context.messages) == 10
+        assert ctx.pop_restored_history() is None
+
+    async def test_resumes_after_coalesced_turn(
+        self, mock_link, mock_handler, tmp_path
+    ):
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        adapter = ListHistoryAdapter(store)
+        # msg-1..msg-3 were coalesced into one turn before the restart
+        await adapter.on_event(
+            make_input(
+                "msg-1",
+                "one\n[Alice]: two\n[Alice]: three",
+                bootstrap=True,
+                last_message_id="msg-3",
+            )
+        )
+        items = [make_context_item(f"msg-{i}") for i in range(5)]
+        mock_link.rest.agent_api_context.get_agent_chat_context = paged_context(items)
+        mock_link.history_store = store
+        ctx = ExecutionContext("room-1", mock_link, mock_handler, agent_id="agent-123")
+
+        context = await ctx.get_context()
+
+        assert [m["id"] for m in context.messages] == ["msg-4"]
+        assert ctx.pop_restored_history() == [
+            "one\n[Alice]: two\n[Alice]: three",
+            "reply to one\n[Alice]: two\n[Alice]: three",
+        ]
+        await store.close()
+
+    async def test_no_checkpoint_hydrates_fully(self, mock_link, mock_handler):
+        items = [make_context_item(f"msg-{i}") for i in range(3)]
+        ctx = self._ctx(mock_link, mock_handler, items, None)
+
+        context = await ctx.get_context()
+
+        assert len(context.messages) == 3
+        mock_link.rest.agent_api_context.get_agent_chat_context.assert_awaited_once()
+
+
 class TestParticipantCallbacks:
     """Tests for participant callbacks in ExecutionContext."""
 
@@ -0,0 +1,185 @@
+"""Unit tests for MemoryCache."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from thenvoi.runtime.memory_cache import MemoryCache
+from thenvoi.runtime.tools import AgentTools
+
+
+class MemoryList(BaseModel):
+    data: list[Any]
+
+
+def make_memory(memory_id: str, **fields: Any) -> SimpleNamespace:
+    defaults = {
+        "scope": "subject",
+        "subject_id": "user-1",
+        "system": "long_term",
+        "type": "semantic",
+        "segment": "user",
+        "status": "active",
+    }
+    return SimpleNamespace(id=memory_id, **{**defaults, **fields})
+
+
+MEMORIES = [
+    make_memory("m1"),
+    make_memory("m2", system="working", type="episodic"),
+    make_memory("m3", scope="organization", subject_id=None, segment="guideline"),
+]
+
+
+def memory_source(memories: list[SimpleNamespace]):
+    calls: list[str | None] = []
+
+    async def fetch(subject_id: str | None, page_size: int) -> MemoryList:
+        calls.append(subject_id)
+        await asyncio.sleep(0)
+        return MemoryList(data=list(memories))
+
+    return fetch, calls
+
+
+class TestMemoryCacheReads:
+    async def test_filters_locally_after_one_fetch(self):
+        fetch, calls = memory_source(MEMORIES)
+        cache = MemoryCache(fetch, ttl=60)
+
+        everything = await cache.list_memories(subject_id="user-1")
+        working = await cache.list_memories(subject_id="user-1", system="working")
+        org = await cache.list_memories(subject_id="user-1", scope="organization")
+
+        assert [m.id for m in everything.data] == ["m1", "m2", "m3"]
+        assert [m.id for m in working.data] == ["m2"]
+        assert [m.id for m in org.data] == ["m3"]
+        assert calls == ["user-1"]
+        assert cache.get("m2") is MEMORIES[1]
+
+    async def test_concurrent_first_reads_share_one_fetch(self):
+        fetch, calls = memory_source(MEMORIES)
+        cache = MemoryCache(fetch, ttl=60)
+
+        await asyncio.gather(
+            *(cache.list_memories(subject_id="user-1") for _ in range(5))
+        )
+
+        assert calls == ["user-1"]
+
+    async def test_full_page_is_not_cached(self):
+        fetch, calls = memory_source([make_memory(f"m{i}") for i in range(50)])
+        cache = MemoryCache(fetch, ttl=60)
+
+        assert await cache.list_memories(subject_id="user-1") is None
+        assert await cache.list_memories(subject_id="user-1") is None
+        assert calls == ["user-1"]
+
+    async def test_stale_entry_served_while_revalidating(self):
+        memories = list(MEMORIES)
+        fetch, calls = memory_source(memories)
+        cache = MemoryCache(fetch, ttl=60)
+        await cache.list_memories(subject_id="user-1")
+        cache._subjects["user-1"].fetched_at -= 61
+        memories.append(make_memory("m4"))
+
+        stale = await cache.list_memories(subject_id="user-1")
+        await asyncio.sleep(0.01)
+        fresh = await cache.list_memories(subject_id="user-1")
+
+        assert len(stale.data) == 3
+        assert len(fresh.data) == 4
+        assert calls == ["user-1", "user-1"]
+
+    def test_can_serve_only_exact_queries(self):
+        assert MemoryCache.can_serve()
+        assert MemoryCache.can_serve(status="active")
+        assert not MemoryCache.can_serve(status="archived")
+        assert not MemoryCache.can_serve(content_query="coffee")
+
+    def test_rejects_non_positive_ttl(self):
+        with pytest.raises(ValueError, match="ttl"):
+            MemoryCache(AsyncMock(), ttl=0)
+
+
+class TestMemoryCacheWriteThrough:
+    async def test_store_adds_to_matching_subjects(self):
+        fetch, calls = memory_source(MEMORIES)
+        cache = MemoryCache(fetch, ttl=60)
+        await cache.list_memories(subject_id="user-1")
+        await cache.list_memories(subject_id="user-2")
+
+        cache.on_stored(make_memory("m4"))
+        cache.on_stored(make_memory("m5", scope="organization", subject_id=None))
+
+        user1 = await cache.list_memories(subject_id="user-1")
+        user2 = await cache.list_memories(subject_id="user-2")
+        assert {m.id for m in user1.data} == {"m1", "m2", "m3", "m4", "m5"}
+        assert {m.id for m in user2.data} == {"m1", "m2", "m3", "m5"}
+        assert cache.get("m4").id == "m4"
+        assert calls == ["user-1", "user-2"]
+
+    async def test_superseded_memory_leaves_lists(self):
+        fetch, _ = memory_source(MEMORIES)
+        cache = MemoryCache(fetch, ttl=60)
+        await cache.list_memories(subject_id="user-1")
+
+        cache.on_updated(make_memory("m1", status="superseded"))
+
+        listed = await cache.list_memories(subject_id="user-1")
+        assert [m.id for m in listed.data] == ["m2", "m3"]
+        assert cache.get("m1").status == "superseded"
+
+
+class TestAgentToolsMemoryCache:
+    def _tools(self, cache: MemoryCache | None) -> tuple[AgentTools, MagicMock]:
+        rest = MagicMock()
+        rest.agent_api_memories.list_agent_memories = AsyncMock(
+            return_value=MemoryList(data=[])
+        )
+        rest.agent_api_memories.get_agent_memory = AsyncMock(
+            return_value=SimpleNamespace(data=make_memory("m9"))
+        )
+        rest.agent_api_memories.archive_agent_memory = AsyncMock(
+            return_value=SimpleNamespace(data=make_memory("m1", status="archived"))
+        )
+        return AgentTools("room-1", rest, memory_cache=cache), rest
+
+    async def test_list_and_get_served_from_cache(self):
+        fetch, calls = memory_source(MEMORIES)
+        tools, rest = self._tools(MemoryCache(fetch, ttl=60))
+
+        listed = await tools.list_memories(subject_id="user-1", segment="guideline")
+        memory = await tools.get_memory("m2")
+
+        assert [m.id for m in listed.data] == ["m3"]
+        assert memory.id == "m2"
+        assert calls == ["user-1"]
+        rest.agent_api_memories.list_agent_memories.assert_not_awaited()
+        rest.agent_api_memories.get_agent_memory.assert_not_awaited()
+
+    async def test_search_bypasses_cache(self):
+        fetch, calls = memory_source(MEMORIES)
+        tools, rest = self._tools(MemoryCache(fetch, ttl=60))
+
+        await tools.list_memories(subject_id="user-1", content_query="coffee")
+
+        assert calls == []
+        rest.agent_api_memories.list_agent_memories.assert_awaited_once()
+
+    async def test_archive_writes_through(self):
+        fetch, _ = memory_source(MEMORIES)
+        cache = MemoryCache(fetch, ttl=60)
+        tools, _ = self._tools(cache)
+        await tools.list_memories(subject_id="user-1")
+
+        await tools.archive_memory("m1")
+
+        listed = await tools.list_memories(subject_id="user-1")
+        assert [m.id for m in listed.data] == ["m2", "m3"]
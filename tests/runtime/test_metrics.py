@@ -0,0 +1,169 @@
+"""Tests for runtime metrics hooks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from tests.conftest import make_message_event
+from thenvoi.runtime.execution import ExecutionContext
+from thenvoi.runtime.metrics import (
+    NOOP_METRICS,
+    LoopLagMonitor,
+    OpenTelemetryMetrics,
+    RuntimeMetrics,
+    endpoint_template,
+    instrument_httpx_client,
+)
+
+
+class RecordingMetrics:
+    """RuntimeMetrics that keeps every recorded value."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.stages: list[tuple[str, str]] = []
+        self.queue_depths: list[tuple[str, int]] = []
+        self.queue_waits: list[float] = []
+        self.loop_lags: list[float] = []
+        self.rest_calls: list[tuple[str, str, int]] = []
+        self.rest_throttles: list[tuple[str, float]] = []
+        self.rest_pool_waits: list[float] = []
+
+    def record_stage(self, stage: str, seconds: float, *, room_id: str) -> None:
+        self.stages.append((stage, room_id))
+
+    def record_queue_depth(self, room_id: str, depth: int) -> None:
+        self.queue_depths.append((room_id, depth))
+
+    def record_queue_wait(self, seconds: float) -> None:
+        self.queue_waits.append(seconds)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        self.loop_lags.append(seconds)
+
+    def record_rest_call(
+        self, method: str, endpoint: str, status: int, seconds: float
+    ) -> None:
+        self.rest_calls.append((method, endpoint, status))
+
+    def record_rest_throttle(self, request_class: str, seconds: float) -> None:
+        self.rest_throttles.append((request_class, seconds))
+
+    def record_rest_pool_wait(self, seconds: float) -> None:
+        self.rest_pool_waits.append(seconds)
+
+
+class TestNoopMetrics:
+    def test_is_disabled_runtime_metrics(self):
+        assert isinstance(NOOP_METRICS, RuntimeMetrics)
+        assert NOOP_METRICS.enabled is False
+
+
+class TestEndpointTemplate:
+    def test_collapses_uuid_and_numeric_segments(self):
+        path = "/api/v1/agent/chats/5f0c7a1e-2b3d-4c5e-8f9a-0b1c2d3e4f5a/messages/42"
+
+        assert endpoint_template(path) == "/api/v1/agent/chats/{id}/messages/{id}"
+
+    def test_keeps_named_segments(self):
+        assert endpoint_template("/api/v1/agent/me") == "/api/v1/agent/me"
+
+
+class TestInstrumentHttpxClient:
+    async def test_records_latency_by_endpoint(self):
+        metrics = RecordingMetrics()
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(204))
+        )
+        instrument_httpx_client(client, metrics)
+        instrument_httpx_client(client, metrics)  # Idempotent
+
+        async with client:
+            await client.post(
+                "https://app.thenvoi.com/api/v1/agent/chats/"
+                "5f0c7a1e-2b3d-4c5e-8f9a-0b1c2d3e4f5a/messages/m1/processed"
+            )
+
+        assert metrics.rest_calls == [
+            ("POST", "/api/v1/agent/chats/{id}/messages/m1/processed", 204)
+        ]
+
+    def test_skips_disabled_metrics(self):
+        client = httpx.AsyncClient()
+
+        instrument_httpx_client(client, NOOP_METRICS)
+
+        assert client.event_hooks == {"request": [], "response": []}
+
+
+class TestLoopLagMonitor:
+    async def test_records_lag_when_loop_is_blocked(self):
+        metrics = RecordingMetrics()
+        monitor = LoopLagMonitor(metrics, interval=0.01)
+        monitor.start()
+
+        await asyncio.sleep(0)
+        time.sleep(0.05)  # noqa: ASYNC251 - block the loop past the monitor wakeup
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert metrics.loop_lags
+        assert max(metrics.loop_lags) >= 0.03
+
+
+class TestOpenTelemetryMetrics:
+    def test_records_to_meter_instruments(self):
+        meter = MagicMock()
+        metrics = OpenTelemetryMetrics(meter=meter)
+
+        metrics.record_stage("adapter", 0.5, room_id="room-1")
+        metrics.record_rest_call("GET", "/api/v1/agent/me", 200, 0.1)
+        metrics.record_rest_throttle("event", 0.2)
+
+        stage_histogram = meter.create_histogram.return_value
+        stage_histogram.record.assert_any_call(
+            0.5, {"stage": "adapter", "room_id": "room-1"}
+        )
+        stage_histogram.record.assert_any_call(
+            0.1,
+            {
+                "http.request.method": "GET",
+                "url.template": "/api/v1/agent/me",
+                "http.response.status_code": 200,
+            },
+        )
+        stage_histogram.record.assert_any_call(0.2, {"request_class": "event"})
+
+
+class TestExecutionStageMetrics:
+    async def test_records_stages_for_message(self):
+        metrics = RecordingMetrics()
+        link = MagicMock()
+        link.metrics = metrics
+        link.mark_processing = AsyncMock()
+        link.mark_processed = AsyncMock()
+        link.mark_failed = AsyncMock()
+        ctx = ExecutionContext(
+            room_id="room-1",
+            link=link,
+            on_execute=AsyncMock(),
+            agent_id="agent-123",
+        )
+        ctx._ensure_fresh_context = AsyncMock()
+
+        await ctx.on_event(make_message_event(room_id="room-1", msg_id="msg-1"))
+        await ctx._process_event(ctx.queue.get_nowait())
+
+        assert metrics.queue_depths == [("room-1", 1)]
+        assert [stage for stage, _ in metrics.stages] == [
+            "mark_processing",
+            "hydrate",
+            "execute",
+            "mark_processed",
+        ]
+        assert all(room_id == "room-1" for _, room_id in metrics.stages)
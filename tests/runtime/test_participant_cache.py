@@ -0,0 +1,171 @@
+"""Tests for ParticipantCache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from thenvoi.runtime.participant_cache import ParticipantCache
+from thenvoi.runtime.tools import AgentTools
+
+
+class Participant(BaseModel):
+    id: str
+    name: str
+    type: str
+    handle: str | None = None
+
+
+def make_participant(pid: str) -> Participant:
+    return Participant(id=pid, name=pid.title(), type="User", handle=f"@{pid}")
+
+
+class GatedFetch:
+    """Fetch that records calls and blocks until released."""
+
+    def __init__(self, *results: list[Participant]) -> None:
+        self.calls: list[str] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self._results = list(results)
+
+    async def __call__(self, room_id: str) -> list[Participant]:
+        self.calls.append(room_id)
+        result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        await self.gate.wait()
+        return result
+
+
+class TestParticipantCache:
+    async def test_concurrent_gets_share_one_fetch(self):
+        fetch = GatedFetch([make_participant("alice")])
+        fetch.gate.clear()
+        cache = ParticipantCache(fetch, ttl=60)
+
+        waiters = [asyncio.create_task(cache.get("room-1")) for _ in range(5)]
+        await asyncio.sleep(0)
+        fetch.gate.set()
+        results = await asyncio.gather(*waiters)
+
+        assert fetch.calls == ["room-1"]
+        assert all([p.id for p in r] == ["alice"] for r in results)
+
+    async def test_reuses_result_until_invalidated(self):
+        fetch = GatedFetch(
+            [make_participant("alice")],
+            [make_participant("alice"), make_participant("bob")],
+        )
+        cache = ParticipantCache(fetch, ttl=60)
+
+        await cache.get("room-1")
+        await cache.get("room-1")
+        assert fetch.calls == ["room-1"]
+
+        cache.invalidate("room-1")
+        participants = await cache.get("room-1")
+
+        assert [p.id for p in participants] == ["alice", "bob"]
+        assert fetch.calls == ["room-1", "room-1"]
+
+    async def test_returned_list_is_a_copy(self):
+        cache = ParticipantCache(GatedFetch([make_participant("alice")]), ttl=60)
+
+        (await cache.get("room-1")).clear()
+
+        assert len(await cache.get("room-1")) == 1
+
+    async def test_zero_ttl_still_coalesces_concurrent_calls(self):
+        fetch = GatedFetch([make_participant("alice")])
+        cache = ParticipantCache(fetch, ttl=0)
+
+        await asyncio.gather(cache.get("room-1"), cache.get("room-1"))
+        await cache.get("room-1")
+
+        assert fetch.calls == ["room-1", "room-1"]
+
+    async def test_invalidate_during_fetch_is_not_cached(self):
+        fetch = GatedFetch([make_participant("alice")], [make_participant("bob")])
+        fetch.gate.clear()
+        cache = ParticipantCache(fetch, ttl=60)
+
+        stale = asyncio.create_task(cache.get("room-1"))
+        await asyncio.sleep(0)
+        cache.invalidate("room-1")
+        fresh = asyncio.create_task(cache.get("room-1"))
+        await asyncio.sleep(0)
+        fetch.gate.set()
+
+        assert [p.id for p in await stale] == ["alice"]
+        assert [p.id for p in await fresh] == ["bob"]
+        assert [p.id for p in await cache.get("room-1")] == ["bob"]
+        assert len(fetch.calls) == 2
+
+    async def test_errors_reach_every_waiter_and_are_not_cached(self):
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), [make_participant("a")]])
+        cache = ParticipantCache(fetch, ttl=60)
+
+        results = await asyncio.gather(
+            cache.get("room-1"), cache.get("room-1"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert [p.id for p in await cache.get("room-1")] == ["a"]
+        assert fetch.await_count == 2
+
+    async def test_cancelled_waiter_does_not_cancel_shared_fetch(self):
+        fetch = GatedFetch([make_participant("alice")])
+        fetch.gate.clear()
+        cache = ParticipantCache(fetch, ttl=60)
+
+        cancelled = asyncio.create_task(cache.get("room-1"))
+        other = asyncio.create_task(cache.get("room-1"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        fetch.gate.set()
+
+        assert [p.id for p in await other] == ["alice"]
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    async def test_invalidate_all_and_forget(self):
+        fetch = GatedFetch([make_participant("alice")])
+        cache = ParticipantCache(fetch, ttl=60)
+        await cache.get("room-1")
+        await cache.get("room-2")
+
+        cache.invalidate()
+        await cache.get("room-1")
+        cache.forget("room-2")
+        await cache.get("room-2")
+
+        assert fetch.calls == ["room-1", "room-2", "room-1", "room-2"]
+
+    def test_rejects_negative_ttl(self):
+        with pytest.raises(ValueError, match="ttl"):
+            ParticipantCache(AsyncMock(), ttl=-1)
+
+
+class TestAgentToolsParticipantCache:
+    async def test_add_and_remove_share_cached_snapshot(self):
+        fetch = GatedFetch([make_participant("alice"), make_participant("bob")])
+        cache = ParticipantCache(fetch, ttl=60)
+        rest = MagicMock()
+        rest.agent_api_participants.list_agent_chat_participants = AsyncMock()
+        rest.agent_api_participants.remove_agent_chat_participant = AsyncMock()
+        tools = AgentTools("room-1", rest, participant_cache=cache)
+
+        participants = await tools.get_participants()
+        already = await tools.add_participant("alice")
+        removed = await tools.remove_participant("bob")
+
+        assert [p.id for p in participants] == ["alice", "bob"]
+        assert already["status"] == "already_in_room"
+        assert removed["status"] == "removed"
+        # Both snapshots came from one fetch; the removal invalidated it
+        assert fetch.calls == ["room-1"]
+        rest.agent_api_participants.list_agent_chat_participants.assert_not_awaited()
+        await tools.get_participants()
+        assert fetch.calls == ["room-1", "room-1"]
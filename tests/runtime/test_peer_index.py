@@ -0,0 +1,155 @@
+"""Unit tests for PeerIndex."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from thenvoi.runtime.peer_index import PeerIndex
+from thenvoi.runtime.tools import AgentTools
+
+
+def make_peer(peer_id: str, name: str, handle: str) -> SimpleNamespace:
+    return SimpleNamespace(id=peer_id, name=name, handle=handle, type="Agent")
+
+
+def paged_source(peers: list[SimpleNamespace], page_size: int = 2):
+    calls: list[int] = []
+    total_pages = max(1, -(-len(peers) // page_size))
+
+    async def fetch_page(page: int, size: int):
+        calls.append(page)
+        await asyncio.sleep(0)
+        start = (page - 1) * size
+        return peers[start : start + size], total_pages
+
+    return fetch_page, calls
+
+
+PEERS = [
+    make_peer("id-1", "Weather Agent", "@alice/weather"),
+    make_peer("id-2", "Stock Agent", "@alice/stocks"),
+    make_peer("id-3", "Bob", "@bob"),
+]
+
+
+class TestPeerIndexLookup:
+    async def test_find_by_handle_name_and_id(self):
+        fetch_page, calls = paged_source(PEERS)
+        index = PeerIndex(fetch_page, page_size=2)
+
+        assert (await index.find("alice/weather")).id == "id-1"
+        assert (await index.find("@ALICE/STOCKS")).id == "id-2"
+        assert (await index.find("bob")).id == "id-3"
+        assert (await index.find("ID-3")).name == "Bob"
+        # One full scan (two pages) served every lookup
+        assert calls == [1, 2]
+
+    async def test_concurrent_first_lookups_share_one_scan(self):
+        fetch_page, calls = paged_source(PEERS)
+        index = PeerIndex(fetch_page, page_size=2)
+
+        results = await asyncio.gather(*(index.find("@bob") for _ in range(10)))
+
+        assert all(r.id == "id-3" for r in results)
+        assert calls == [1, 2]
+
+    async def test_stops_on_short_page_without_total_pages(self):
+        fetch_page = AsyncMock(side_effect=[(PEERS[:2], None), (PEERS[2:], None)])
+        index = PeerIndex(fetch_page, page_size=2)
+
+        await index.ensure_loaded()
+
+        assert fetch_page.await_count == 2
+        assert len(index.peers) == 3
+
+    async def test_miss_refreshes_when_index_is_old(self):
+        peers = list(PEERS)
+        fetch_page, calls = paged_source(peers, page_size=10)
+        index = PeerIndex(fetch_page, page_size=10, miss_refresh_seconds=0)
+        await index.ensure_loaded()
+
+        peers.append(make_peer("id-4", "New Agent", "@carol/new"))
+
+        assert (await index.find("@carol/new")).id == "id-4"
+        assert calls == [1, 1]
+
+    async def test_miss_does_not_refresh_fresh_index(self):
+        fetch_page, calls = paged_source(PEERS, page_size=10)
+        index = PeerIndex(fetch_page, page_size=10, miss_refresh_seconds=60)
+
+        assert await index.find("@nobody") is None
+        assert calls == [1]
+
+    async def test_invalidate_refreshes_in_background(self):
+        peers = list(PEERS)
+        fetch_page, calls = paged_source(peers, page_size=10)
+        index = PeerIndex(fetch_page, page_size=10, miss_refresh_seconds=60)
+        await index.ensure_loaded()
+
+        peers.append(make_peer("id-4", "New Agent", "@carol/new"))
+        index.invalidate()
+        await asyncio.sleep(0.01)
+
+        assert index.get("@carol/new").id == "id-4"
+        assert calls == [1, 1]
+        await index.close()
+
+
+class TestPeerIndexCacheFile:
+    async def test_refresh_persists_and_warm_starts(self, tmp_path):
+        cache = tmp_path / "peers.json"
+        fetch_page, _ = paged_source(PEERS, page_size=10)
+        await PeerIndex(fetch_page, page_size=10, cache_path=cache).ensure_loaded()
+
+        saved = json.loads(cache.read_text())
+        assert [p["handle"] for p in saved["peers"]] == [
+            "@alice/weather",
+            "@alice/stocks",
+            "@bob",
+        ]
+
+        never_finishes = asyncio.Event()
+
+        async def slow_fetch(page: int, size: int):
+            await never_finishes.wait()
+            return [], None
+
+        warm = PeerIndex(slow_fetch, page_size=10, cache_path=cache)
+        await asyncio.wait_for(warm.ensure_loaded(), timeout=1)
+
+        assert warm.get("@bob").id == "id-3"
+        await warm.close()
+
+    async def test_ignores_corrupt_cache(self, tmp_path):
+        cache = tmp_path / "peers.json"
+        cache.write_text("{not json")
+        fetch_page, calls = paged_source(PEERS, page_size=10)
+        index = PeerIndex(fetch_page, page_size=10, cache_path=cache)
+
+        await index.ensure_loaded()
+
+        assert calls == [1]
+        assert index.get("@bob") is not None
+
+
+class TestAgentToolsPeerIndex:
+    async def test_add_participant_resolves_through_index(self):
+        fetch_page, calls = paged_source(PEERS, page_size=10)
+        index = PeerIndex(fetch_page, page_size=10)
+
+        rest = MagicMock()
+        rest.agent_api_participants.list_agent_chat_participants = AsyncMock(
+            return_value=MagicMock(data=[])
+        )
+        rest.agent_api_participants.add_agent_chat_participant = AsyncMock()
+        rest.agent_api_peers.list_agent_peers = AsyncMock()
+
+        tools = AgentTools("room-1", rest, peer_index=index)
+        result = await tools.add_participant("@alice/weather")
+
+        assert result["id"] == "id-1"
+        assert calls == [1]
+        rest.agent_api_peers.list_agent_peers.assert_not_awaited()
@@ -7,6 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from thenvoi.core.history_store import RoomHistoryState, SQLiteHistoryStore
+from thenvoi.runtime.broadcast_log import BroadcastLog
 from thenvoi.runtime.execution import ExecutionContext
 from thenvoi.runtime.runtime import AgentRuntime
 
@@ -174,6 +176,25 @@ class TestAgentRuntimeExecutionManagement:
 
         assert "room-123" not in runtime.executions
 
+    async def test_room_left_deletes_saved_history(
+        self, mock_link, mock_handler, tmp_path
+    ):
+        """Leaving a room should drop its checkpoint; stopping should keep it."""
+        store = SQLiteHistoryStore(tmp_path / "history.db")
+        state = RoomHistoryState(history=[], last_message_id="msg-1")
+        await store.save("room-left", state)
+        await store.save("room-kept", state)
+        mock_link.history_store = store
+        runtime = AgentRuntime(mock_link, "agent-123", mock_handler)
+
+        await runtime._on_room_left("room-left")
+        await runtime._create_execution("room-kept")
+        await runtime.stop()
+
+        assert await store.load("room-left") is None
+        assert await store.load("room-kept") == state
+        await store.close()
+
     async def test_execution_idempotent(self, mock_link, mock_handler):
         """Creating execution twice should return same instance."""
         runtime = AgentRuntime(mock_link, "agent-123", mock_handler)
@@ -286,6 +307,54 @@ class TestAgentRuntimeCustomFactory:
         await runtime.stop()
 
 
+class TestAgentRuntimeBroadcast:
+    """Test system-message broadcasts to all rooms."""
+
+    async def test_default_executions_read_from_shared_log(
+        self, mock_link, mock_handler
+    ):
+        """One append reaches every room through its log cursor."""
+        log = BroadcastLog()
+        runtime = AgentRuntime(mock_link, "agent-123", mock_handler)
+        runtime.set_broadcast_log(log)
+        await runtime._create_execution("room-1")
+        await runtime._create_execution("room-2")
+
+        runtime.broadcast_system_message("[Contacts]: @bob is now a contact")
+
+        assert len(log) == 1
+        for room_id in ("room-1", "room-2"):
+            execution = runtime.executions[room_id]
+            assert execution._pending_system_messages == []
+            assert execution.get_pending_system_messages() == [
+                "[Contacts]: @bob is now a contact"
+            ]
+
+        await runtime.stop()
+        assert "room-1" not in log
+
+    async def test_custom_executions_get_message_pushed(self, mock_link, mock_handler):
+        """Executions from a custom factory do not read the log."""
+        custom_execution = MagicMock()
+        custom_execution.start = AsyncMock()
+        custom_execution.stop = AsyncMock()
+        runtime = AgentRuntime(
+            mock_link,
+            "agent-123",
+            mock_handler,
+            execution_factory=lambda room_id, link: custom_execution,
+        )
+        runtime.set_broadcast_log(BroadcastLog())
+        await runtime._create_execution("room-1")
+
+        runtime.broadcast_system_message("[Contacts]: update")
+
+        custom_execution.inject_system_message.assert_called_once_with(
+            "[Contacts]: update"
+        )
+        await runtime.stop()
+
+
 class TestAgentRuntimePresenceIntegration:
     """Test integration between AgentRuntime and RoomPresence."""
 
@@ -0,0 +1,90 @@
+"""Unit tests for FairScheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from thenvoi.runtime.scheduler import FairScheduler
+
+
+class TestFairScheduler:
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            FairScheduler(max_concurrent=0)
+
+    async def test_runs_immediately_under_capacity(self):
+        scheduler = FairScheduler(max_concurrent=2)
+        async with scheduler.slot("a"):
+            assert scheduler.in_flight == 1
+        assert scheduler.in_flight == 0
+        assert scheduler.stats()["a"].completed == 1
+
+    async def test_limits_concurrency(self):
+        scheduler = FairScheduler(max_concurrent=2)
+        peak = 0
+        running = 0
+
+        async def work(key: str) -> None:
+            nonlocal peak, running
+            async with scheduler.slot(key):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work(f"agent-{i % 3}") for i in range(9)))
+        assert peak == 2
+        assert scheduler.in_flight == 0
+
+    async def test_round_robin_between_keys(self):
+        """A busy key must not starve a key that queued later."""
+        scheduler = FairScheduler(max_concurrent=1)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def work(key: str) -> None:
+            async with scheduler.slot(key):
+                order.append(key)
+                await gate.wait()
+
+        holder = asyncio.create_task(work("busy"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(work("busy")) for _ in range(3)]
+        await asyncio.sleep(0)
+        waiters.append(asyncio.create_task(work("quiet")))
+        await asyncio.sleep(0)
+
+        gate.set()
+        await asyncio.gather(holder, *waiters)
+        assert order[:3] == ["busy", "busy", "quiet"]
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        scheduler = FairScheduler(max_concurrent=1)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with scheduler.slot("a"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        async def wait_for_slot() -> None:
+            async with scheduler.slot("b"):
+                pass
+
+        waiter = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        release.set()
+        await holder
+        assert scheduler.in_flight == 0
+        assert scheduler.stats()["b"].waiting == 0
+
+        async with scheduler.slot("b"):
+            assert scheduler.in_flight == 1
@@ -751,6 +751,29 @@ class TestAgentToolsSchemas:
         assert "thenvoi_send_message" in tool_names
         assert "thenvoi_list_contacts" in tool_names
 
+    def test_get_tool_schemas_returns_independent_copies(self, mock_rest_client):
+        """Editing a returned schema must not affect other callers."""
+        first = AgentTools("room-1", mock_rest_client).get_tool_schemas("anthropic")
+        first[0]["description"] = "changed"
+        first[0]["input_schema"]["properties"].clear()
+
+        second = AgentTools("room-2", mock_rest_client).get_tool_schemas("anthropic")
+
+        assert second[0]["description"] != "changed"
+        assert second[0]["input_schema"]["properties"]
+
+    def test_shared_tool_schemas_are_stable_across_calls(self, mock_rest_client):
+        """The cached schema objects are reused across AgentTools instances."""
+        first = AgentTools("room-1", mock_rest_client).get_shared_tool_schemas(
+            "anthropic"
+        )
+        second = AgentTools("room-2", mock_rest_client).get_shared_tool_schemas(
+            "anthropic"
+        )
+
+        assert [s["name"] for s in first] == [s["name"] for s in second]
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
 
 class TestAgentToolsExecuteToolCall:
     """Test execute_tool_call dispatch."""
@@ -93,6 +93,9 @@ class TestCreateFactory:
                 contact_config=None,
                 on_participant_added=None,
                 on_participant_removed=None,
+                metrics=None,
+                transport=None,
+                httpx_client=None,
             )
 
     def test_creates_with_custom_urls(self, mock_adapter):
@@ -246,6 +249,22 @@ class TestStop:
 
         mock_runtime.stop.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_releases_custom_tool_executor(self, mock_runtime, mock_adapter):
+        """Should shut down the sync custom-tool pool when the last agent stops."""
+        mock_runtime.stop.return_value = True
+        agent = Agent(runtime=mock_runtime, adapter=mock_adapter)
+
+        with (
+            patch("thenvoi.agent.release_custom_tool_executor") as release,
+            patch("thenvoi.agent.retain_custom_tool_executor") as retain,
+        ):
+            await agent.start()
+            await agent.stop()
+
+        retain.assert_called_once_with()
+        release.assert_called_once_with()
+
 
 class TestRun:
     """Tests for Agent.run() method."""
@@ -0,0 +1,126 @@
+"""Tests for AgentHost."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from thenvoi.host import AgentHost
+
+
+@pytest.fixture
+def mock_adapter():
+    adapter = AsyncMock()
+    adapter.on_started = AsyncMock()
+    adapter.on_cleanup = AsyncMock()
+    adapter.on_event = AsyncMock()
+    return adapter
+
+
+class TestAddAgent:
+    def test_shares_http_client_across_agents(self, mock_adapter):
+        shared = httpx.AsyncClient()
+        host = AgentHost(httpx_client=shared)
+
+        with patch("thenvoi.host.PlatformRuntime") as mock_runtime_class:
+            host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k1")
+            host.add_agent(adapter=mock_adapter, agent_id="a-2", api_key="k2")
+
+        clients = [
+            call.kwargs["httpx_client"] for call in mock_runtime_class.call_args_list
+        ]
+        assert clients == [shared, shared]
+        assert set(host.agents) == {"a-1", "a-2"}
+
+    def test_rejects_duplicate_agent(self, mock_adapter):
+        host = AgentHost()
+        with patch("thenvoi.host.PlatformRuntime"):
+            host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k1")
+            with pytest.raises(ValueError):
+                host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k1")
+
+    def test_agents_share_scheduler(self, mock_adapter):
+        host = AgentHost(max_concurrent_turns=4)
+        with patch("thenvoi.host.PlatformRuntime"):
+            agent = host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k")
+        assert agent._scheduler is host.scheduler
+        assert host.scheduler is not None
+        assert host.scheduler.max_concurrent == 4
+
+
+class TestLifecycle:
+    async def test_start_and_stop_all_agents(self, mock_adapter):
+        host = AgentHost()
+        agents = []
+        with patch("thenvoi.host.PlatformRuntime"):
+            for i in range(3):
+                agents.append(
+                    host.add_agent(adapter=mock_adapter, agent_id=f"a-{i}", api_key="k")
+                )
+        for agent in agents:
+            agent.start = AsyncMock()
+            agent.stop = AsyncMock(return_value=True)
+
+        await host.start()
+        assert host.is_running
+        assert await host.stop() is True
+
+        for agent in agents:
+            agent.start.assert_awaited_once()
+            agent.stop.assert_awaited_once()
+
+    async def test_start_failure_stops_started_agents(self, mock_adapter):
+        host = AgentHost()
+        with patch("thenvoi.host.PlatformRuntime"):
+            ok = host.add_agent(adapter=mock_adapter, agent_id="ok", api_key="k")
+            bad = host.add_agent(adapter=mock_adapter, agent_id="bad", api_key="k")
+        ok.start = AsyncMock()
+        ok.stop = AsyncMock(return_value=True)
+        bad.start = AsyncMock(side_effect=RuntimeError("boom"))
+        bad.stop = AsyncMock(return_value=True)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await host.start()
+
+        ok.stop.assert_awaited_once()
+        assert not host.is_running
+
+    async def test_refuses_restart_after_closing_owned_client(self):
+        host = AgentHost()
+        await host.start()
+        await host.stop()
+
+        with pytest.raises(RuntimeError, match="restarted"):
+            await host.start()
+        assert not host.is_running
+
+    async def test_does_not_close_caller_owned_client(self):
+        shared = MagicMock(spec=httpx.AsyncClient)
+        shared.aclose = AsyncMock()
+        host = AgentHost(httpx_client=shared)
+        await host.stop()
+        shared.aclose.assert_not_awaited()
+
+
+class TestMetrics:
+    def test_metrics_for_stopped_agent(self, mock_adapter):
+        host = AgentHost(max_concurrent_turns=2)
+        with patch("thenvoi.host.PlatformRuntime"):
+            host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k")
+
+        metrics = host.metrics()
+        assert metrics["a-1"].running is False
+        assert metrics["a-1"].active_rooms == 0
+        assert metrics["a-1"].scheduler.completed == 0
+
+    def test_metrics_reads_link_validation_count(self, mock_adapter):
+        host = AgentHost()
+        with patch("thenvoi.host.PlatformRuntime"):
+            agent = host.add_agent(adapter=mock_adapter, agent_id="a-1", api_key="k")
+        agent.runtime.link.ws_validation_error_count = 3
+        agent.runtime.runtime.active_sessions = {}
+
+        with patch.object(type(agent), "is_running", True):
+            metrics = host.metrics()
+
+        assert metrics["a-1"].ws_validation_errors == 3
@@ -170,6 +170,11 @@ class TestStart:
                     api_key="test-key",
                     ws_url="wss://app.thenvoi.com/api/v1/socket/websocket",
                     rest_url="https://app.thenvoi.com",
+                    payload_validation="strict",
+                    httpx_client=None,
+                    metrics=None,
+                    rate_limiter=None,
+                    transport=None,
                 )
 
     @pytest.mark.asyncio
@@ -0,0 +1,107 @@
+"""Tests for FakePlatform and LoadDriver."""
+
+from __future__ import annotations
+
+from thenvoi import AgentHost
+from thenvoi.core.protocols import AgentToolsProtocol
+from thenvoi.core.simple_adapter import SimpleAdapter
+from thenvoi.core.types import PlatformMessage
+from thenvoi.testing import FakePlatform, FaultConfig, LoadDriver
+
+
+class EchoAdapter(SimpleAdapter[list]):
+    async def on_message(
+        self,
+        msg: PlatformMessage,
+        tools: AgentToolsProtocol,
+        history: list,
+        participants_msg: str | None,
+        contacts_msg: str | None,
+        *,
+        is_session_bootstrap: bool,
+        room_id: str,
+    ) -> None:
+        await tools.send_message(f"echo: {msg.content}", mentions=[msg.sender_id])
+
+
+def make_host(platform: FakePlatform) -> AgentHost:
+    host = AgentHost(
+        ws_url=platform.ws_url,
+        rest_url=platform.rest_url,
+        httpx_client=platform.http_client(),
+    )
+    host.add_agent(adapter=EchoAdapter(), agent_id=platform.agent_id, api_key="k")
+    return host
+
+
+class TestFakePlatformEndToEnd:
+    async def test_backlog_and_live_messages_are_processed(self):
+        async with FakePlatform() as platform:
+            room_id = await platform.create_room("existing")
+            backlog_id = await platform.post_message(room_id, "sent while offline")
+
+            host = make_host(platform)
+            await host.start()
+            try:
+                await platform.wait_until_processed([backlog_id], timeout=10)
+
+                live_room = await platform.create_room("new")
+                live_id = await platform.post_message(live_room, "hello")
+                await platform.wait_until_processed([live_id], timeout=10)
+            finally:
+                await host.stop()
+
+            assert platform.message(backlog_id).status == "processed"
+            assert platform.message(live_id).status == "processed"
+            assert [m.content for m in platform.agent_messages(live_room)] == [
+                "echo: hello"
+            ]
+            assert platform.stats.requests["mark_agent_message_processed"] >= 2
+
+    async def test_load_driver_reports_throughput_and_latency(self):
+        async with FakePlatform() as platform:
+            driver = LoadDriver(
+                platform, rooms=3, messages_per_second=10, duration_s=0.3
+            )
+            await driver.setup()
+            host = make_host(platform)
+            await host.start()
+            try:
+                report = await driver.run()
+            finally:
+                await host.stop()
+
+        assert report.rooms == 3
+        assert report.messages_sent > 0
+        assert report.messages_processed == report.messages_sent
+        assert len(report.latencies_s) == report.messages_processed
+        assert report.throughput > 0
+        assert report.p50_s <= report.p99_s <= report.max_s
+
+
+class TestFaultInjection:
+    async def test_injects_errors_on_selected_routes(self):
+        platform = FakePlatform(
+            faults=FaultConfig(
+                rest_error_rate=1.0,
+                error_status=503,
+                error_routes=frozenset({"list_agent_chats"}),
+            )
+        )
+        async with platform.http_client() as client:
+            chats = await client.get(f"{platform.rest_url}/api/v1/agent/chats")
+            me = await client.get(f"{platform.rest_url}/api/v1/agent/me")
+
+        assert chats.status_code == 503
+        assert me.status_code == 200
+        assert platform.stats.injected_errors == {"list_agent_chats": 1}
+
+    async def test_next_returns_204_when_nothing_pending(self):
+        platform = FakePlatform()
+        room_id = await platform.create_room()
+        async with platform.http_client() as client:
+            response = await client.get(
+                f"{platform.rest_url}/api/v1/agent/chats/{room_id}/messages/next"
+            )
+
+        assert response.status_code == 204
@@ -574,3 +574,92 @@ async def test_cancelled_error_propagates_through_callback():
         await client._handle_events(
             MockMessage(), {"message_created": cancelling_callback}
         )
+
+
+# --- trust_server payload validation mode ---
+
+
+def test_rejects_unknown_payload_validation_mode():
+    """Should raise for an unknown payload_validation mode."""
+    with pytest.raises(ValueError, match="payload_validation"):
+        WebSocketClient("ws://localhost", "test-key", payload_validation="lax")
+
+
+async def test_trust_server_builds_nested_message_payload():
+    """trust_server mode should still build typed metadata and mentions."""
+    client = WebSocketClient(
+        "ws://localhost", "test-key", "agent-123", payload_validation="trust_server"
+    )
+    received = []
+
+    class MockMessage:
+        event = "message_created"
+        payload = VALID_MESSAGE_CREATED_PAYLOAD
+
+    async def test_callback(payload):
+        received.append(payload)
+
+    await client._handle_events(MockMessage(), {"message_created": test_callback})
+
+    assert len(received) == 1
+    payload = received[0]
+    assert isinstance(payload, MessageCreatedPayload)
+    assert payload.id == "msg-123"
+    assert payload.metadata is not None
+    assert payload.metadata.status == "sent"
+    assert payload.metadata.mentions[0].handle == "testbot"
+
+
+async def test_trust_server_skips_payload_missing_required_fields(caplog):
+    """trust_server mode should still drop payloads missing required fields."""
+    client = WebSocketClient(
+        "ws://localhost", "test-key", "agent-123", payload_validation="trust_server"
+    )
+    callback_called = False
+
+    class MockMessage:
+        event = "participant_added"
+        payload = {"id": "user-1", "name": None}
+
+    async def dummy_callback(payload):
+        nonlocal callback_called
+        callback_called = True
+
+    with caplog.at_level(logging.ERROR):
+        await client._handle_events(
+            MockMessage(), {"participant_added": dummy_callback}
+        )
+
+    assert not callback_called
+    assert "Invalid participant_added payload" in caplog.text
+    assert "name" in caplog.text
+    assert "type" in caplog.text
+    assert client.validation_error_count == 1
+
+
+async def test_trust_server_does_not_coerce_types():
+    """trust_server mode passes field values through without validation."""
+    client = WebSocketClient(
+        "ws://localhost", "test-key", "agent-123", payload_validation="trust_server"
+    )
+    received = []
+
+    class MockMessage:
+        event = "room_added"
+        payload = {
+            "id": "room-1",
+            "inserted_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+            "title": 42,
+            "extra_field": "kept",
+        }
+
+    async def test_callback(payload):
+        received.append(payload)
+
+    await client._handle_events(MockMessage(), {"room_added": test_callback})
+
+    assert isinstance(received[0], RoomAddedPayload)
+    assert received[0].title == 42
+    assert received[0].task_id is None
+    assert received[0].extra_field == "kept"
@@ -4,17 +4,25 @@ from .bridge import BridgeConfig, ParticipantRecord, ReconnectConfig, ThenvoiBri
 from .handler import Handler
 from .health import HealthServer
 from .router import MentionRouter
-from .session import InMemorySessionStore, SessionData, SessionStore
+from .session import (
+    InMemorySessionStore,
+    ManagedSessionStore,
+    SessionData,
+    SessionStore,
+    SQLiteSessionStore,
+)
 
 __all__ = [
     "Handler",
     "BridgeConfig",
     "HealthServer",
     "InMemorySessionStore",
+    "ManagedSessionStore",
     "MentionRouter",
     "ParticipantRecord",
     "ReconnectConfig",
     "SessionData",
     "SessionStore",
+    "SQLiteSessionStore",
     "ThenvoiBridge",
 ]
@@ -21,11 +21,12 @@ from thenvoi.platform.event import (
     RoomRemovedEvent,
 )
 from thenvoi.platform.link import ThenvoiLink
+from thenvoi.runtime.participant_cache import ParticipantCache
 from thenvoi.runtime.tools import AgentTools
 
 from .health import HealthServer
 from .router import MentionRouter
-from .session import InMemorySessionStore
+from .session import InMemorySessionStore, ManagedSessionStore, SQLiteSessionStore
 
 if TYPE_CHECKING:
     from thenvoi.client.streaming import MessageCreatedPayload
@@ -55,6 +56,7 @@ class BridgeConfig(BaseModel):
     health_port: int = 8080
     health_host: str = "0.0.0.0"
     session_ttl: float = 86400.0  # 24 hours; 0 disables eviction
+    session_db_path: str | None = None  # SQLite file; None keeps sessions in memory
     handler_timeout: float = 300.0  # 5 minutes; 0 disables timeout
 
     @field_validator("agent_id")
@@ -141,6 +143,8 @@ class BridgeConfig(BaseModel):
             kwargs["rest_url"] = os.environ["THENVOI_REST_URL"]
         if "HEALTH_HOST" in os.environ:
             kwargs["health_host"] = os.environ["HEALTH_HOST"]
+        if os.environ.get("SESSION_DB_PATH"):
+            kwargs["session_db_path"] = os.environ["SESSION_DB_PATH"]
 
         if "HEALTH_PORT" in os.environ:
             health_port_str = os.environ["HEALTH_PORT"]
@@ -265,8 +269,15 @@ class ThenvoiBridge:
 
         # Session store — default 24h TTL prevents leaks if room-removed events
         # are missed during network interruptions. TTL of 0 disables eviction.
+        # A database path persists sessions across bridge restarts.
         effective_ttl = config.session_ttl if config.session_ttl > 0 else None
-        self._session_store = InMemorySessionStore(session_ttl=effective_ttl)
+        self._session_store: ManagedSessionStore
+        if config.session_db_path:
+            self._session_store = SQLiteSessionStore(
+                config.session_db_path, session_ttl=effective_ttl
+            )
+        else:
+            self._session_store = InMemorySessionStore(session_ttl=effective_ttl)
 
         # Router
         effective_timeout = (
@@ -332,6 +343,7 @@ class ThenvoiBridge:
         )
 
         try:
+            await self._session_store.start()
             await self._health.start()
             await self._run_with_reconnect()
         finally:
@@ -351,6 +363,10 @@ class ThenvoiBridge:
         except Exception:
             logger.warning("Error during link disconnect", exc_info=True)
         await self._health.stop()
+        try:
+            await self._session_store.stop()
+        except Exception:
+            logger.warning("Error during session store shutdown", exc_info=True)
         logger.info("Bridge shutdown complete")
 
     async def _run_with_reconnect(self) -> None:
@@ -641,6 +657,7 @@ class ThenvoiBridge:
             room_id=room_id,
             rest=self._link.rest,
             participants=participants,
+            participant_cache=self._shared_participant_cache(),
         )
 
         await self._router.route(
@@ -680,22 +697,34 @@ class ThenvoiBridge:
                 "Failed to cache participants for room %s", room_id, exc_info=True
             )
 
+    def _shared_participant_cache(self) -> ParticipantCache | None:
+        """The link's participant cache, shared with tools and hydration."""
+        cache = getattr(self._link, "participant_cache", None)
+        return cache if isinstance(cache, ParticipantCache) else None
+
     async def _get_room_participants(self, room_id: str) -> list[ParticipantRecord]:
         """Fetch participants for a room.
 
+        Goes through the link's participant cache, so concurrent cache
+        misses for one room share a single request.
+
         Args:
             room_id: The room ID.
 
         Returns:
             List of ParticipantRecord dicts with id, name, type.
         """
-        response = (
-            await self._link.rest.agent_api_participants.list_agent_chat_participants(
+        cache = self._shared_participant_cache()
+        if cache is not None:
+            data = await cache.get(room_id)
+        else:
+            participants_api = self._link.rest.agent_api_participants
+            response = await participants_api.list_agent_chat_participants(
                 chat_id=room_id,
                 request_options=DEFAULT_REQUEST_OPTIONS,
             )
-        )
-        if not response.data:
+            data = response.data
+        if not data:
             return []
 
         return [
@@ -705,7 +734,7 @@ class ThenvoiBridge:
                 type=p.type,
                 handle=getattr(p, "handle", None),
             )
-            for p in response.data
+            for p in data
         ]
 
 
@@ -71,9 +71,9 @@ class HealthServer:
     async def _health_handler(self, request: web.Request) -> web.Response:
         """Handle GET /health requests.
 
-        Note: ``count()`` triggers lazy eviction of expired sessions,
-        so the Docker healthcheck (default: every 30 s) doubles as the
-        eviction driver.  See ``InMemorySessionStore`` for details.
+        ``active_sessions`` excludes expired sessions: ``count()`` evicts
+        any that are due before counting. Regular eviction is done by the
+        session store's background sweeper.
         """
         connected = self._link.is_connected
         status = "healthy" if connected else "unhealthy"
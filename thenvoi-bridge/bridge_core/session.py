@@ -3,21 +3,39 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+from abc import ABC, abstractmethod
 import logging
+import sqlite3
+import threading
+from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Protocol
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
 
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+DEFAULT_SHARD_COUNT = 16
+"""Number of independently locked shards in InMemorySessionStore."""
+
+DEFAULT_SWEEP_INTERVAL = 60.0
+"""Upper bound in seconds between background eviction sweeps."""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class SessionData(BaseModel):
     """Data for an active bridge session."""
 
     room_id: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    last_activity: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: _utcnow())
+    last_activity: datetime = Field(default_factory=lambda: _utcnow())
 
 
 class SessionStore(Protocol):
@@ -70,99 +88,332 @@ class SessionStore(Protocol):
         ...
 
 
-class InMemorySessionStore:
-    """In-memory session store implementation.
+class ManagedSessionStore(SessionStore, Protocol):
+    """A SessionStore with background work started and stopped by its owner."""
+
+    async def start(self) -> None:
+        """Start background work such as expired-session eviction."""
+        ...
+
+    async def stop(self) -> None:
+        """Stop background work started by ``start``."""
+        ...
+
+
+class _SweepingStore(ABC):
+    """Background eviction task shared by the TTL-aware session stores.
+
+    Subclasses implement ``evict_expired``; ``start`` runs it periodically
+    until ``stop``. Without a TTL nothing ever expires and no task runs.
+    """
 
-    Eviction is lazy: expired sessions are removed only when
-    ``list_sessions`` or ``count`` is called.
+    _session_ttl: float | None
+    _sweep_task: asyncio.Task[None] | None = None
 
-    .. important::
+    @abstractmethod
+    async def evict_expired(self) -> int:
+        """Remove expired sessions and return how many were removed."""
 
-        Lazy eviction depends on periodic reads to prevent session
-        accumulation.  In production, the Docker healthcheck (configured in
-        ``docker-compose.yml``) polls ``GET /health`` every 30 s, which calls
-        ``list_sessions`` and triggers eviction.  If you run the bridge
-        without a healthcheck, consider adding a background eviction task.
+    def _sweep_interval(self) -> float:
+        assert self._session_ttl is not None
+        # Sweep often enough that sessions outlive their TTL by at most ~25%.
+        return min(DEFAULT_SWEEP_INTERVAL, max(self._session_ttl / 4, 0.01))
+
+    async def start(self) -> None:
+        """Start the background eviction sweeper (no-op without a TTL)."""
+        if self._session_ttl is None or self._sweep_task is not None:
+            return
+        self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop(self) -> None:
+        """Stop the background eviction sweeper."""
+        if self._sweep_task is None:
+            return
+        self._sweep_task.cancel()
+        try:
+            await self._sweep_task
+        except asyncio.CancelledError:
+            pass
+        self._sweep_task = None
+
+    async def _sweep_loop(self) -> None:
+        interval = self._sweep_interval()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                evicted = await self.evict_expired()
+            except Exception:
+                logger.warning("Session eviction sweep failed", exc_info=True)
+                continue
+            if evicted:
+                logger.debug("Evicted %d expired sessions", evicted)
+
+
+class _Shard:
+    """One independently locked slice of the in-memory session map."""
+
+    __slots__ = ("expiry", "lock", "sessions")
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, SessionData] = {}
+        # Min-heap of (deadline timestamp, room_id). Deadlines are only a
+        # lower bound: activity pushes a session's real deadline later, and
+        # the entry is re-queued when it comes due instead of on every touch.
+        self.expiry: list[tuple[float, str]] = []
+        self.lock = asyncio.Lock()
+
+
+class InMemorySessionStore(_SweepingStore):
+    """In-memory session store implementation.
+
+    Sessions are spread over independently locked shards, so ``get_or_create``
+    only ever waits on its own shard. Each shard keeps a heap of expiry
+    deadlines; eviction pops due entries instead of scanning every session.
+
+    Expired sessions are evicted by a background sweeper (call ``start()`` /
+    ``stop()``), and also when due entries are found by ``count`` and
+    ``list_sessions``. ``get`` never returns an expired session.
 
     Args:
         session_ttl: Optional TTL in seconds. Sessions inactive longer than
             this are evicted automatically. None means no expiration.
+        shards: Number of shards.
     """
 
-    def __init__(self, session_ttl: float | None = None) -> None:
-        self._sessions: dict[str, SessionData] = {}
-        self._lock = asyncio.Lock()
+    def __init__(
+        self, session_ttl: float | None = None, shards: int = DEFAULT_SHARD_COUNT
+    ) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got: {shards}")
+        self._shards = [_Shard() for _ in range(shards)]
         self._session_ttl = session_ttl
-        self._high_session_warned = False
 
-    _HIGH_SESSION_THRESHOLD = 10_000
-    """Warn once when session count exceeds this threshold."""
+    def _shard(self, room_id: str) -> _Shard:
+        return self._shards[hash(room_id) % len(self._shards)]
+
+    def _deadline(self, session: SessionData) -> float:
+        assert self._session_ttl is not None
+        return session.last_activity.timestamp() + self._session_ttl
 
     def _is_expired(self, session: SessionData) -> bool:
         """Check if a single session has exceeded the TTL."""
         if self._session_ttl is None:
             return False
-        elapsed = (datetime.now(timezone.utc) - session.last_activity).total_seconds()
+        elapsed = (_utcnow() - session.last_activity).total_seconds()
         return elapsed > self._session_ttl
 
-    def _evict_expired(self) -> None:
-        """Remove sessions that have exceeded the TTL. Must be called under lock.
+    def _evict_due(self, shard: _Shard, now: float) -> int:
+        """Evict sessions whose expiry entries are due. Must be called under lock."""
+        evicted = 0
+        expiry = shard.expiry
+        while expiry and expiry[0][0] <= now:
+            _, room_id = heapq.heappop(expiry)
+            session = shard.sessions.get(room_id)
+            if session is None:
+                continue  # Removed explicitly; stale entry
+            deadline = self._deadline(session)
+            if deadline <= now:
+                del shard.sessions[room_id]
+                evicted += 1
+            else:
+                heapq.heappush(expiry, (deadline, room_id))
+        return evicted
+
+    async def evict_expired(self) -> int:
+        """Evict all sessions past their TTL, one shard at a time.
 
-        This is O(n) over all sessions and runs on ``list_sessions`` and
-        ``count`` (not on the hot-path ``get``/``get_or_create``).
-        Acceptable for expected session counts (hundreds); consider a
-        background eviction task if this becomes a bottleneck.
+        Returns:
+            Number of sessions evicted.
         """
         if self._session_ttl is None:
-            return
-        now = datetime.now(timezone.utc)
-        expired = [
-            room_id
-            for room_id, session in self._sessions.items()
-            if (now - session.last_activity).total_seconds() > self._session_ttl
-        ]
-        for room_id in expired:
-            del self._sessions[room_id]
-
-        count = len(self._sessions)
-        if count >= self._HIGH_SESSION_THRESHOLD and not self._high_session_warned:
-            logger.warning(
-                "Session count (%d) exceeds %d — consider a background eviction task",
-                count,
-                self._HIGH_SESSION_THRESHOLD,
-            )
-            self._high_session_warned = True
-        elif count < self._HIGH_SESSION_THRESHOLD:
-            self._high_session_warned = False
+            return 0
+        evicted = 0
+        for shard in self._shards:
+            async with shard.lock:
+                evicted += self._evict_due(shard, _utcnow().timestamp())
+        return evicted
 
     async def get_or_create(self, room_id: str) -> SessionData:
-        async with self._lock:
-            if room_id in self._sessions:
-                self._sessions[room_id].last_activity = datetime.now(timezone.utc)
-                return self._sessions[room_id]
+        shard = self._shard(room_id)
+        async with shard.lock:
+            session = shard.sessions.get(room_id)
+            if session is not None:
+                session.last_activity = _utcnow()
+                return session
 
             session = SessionData(room_id=room_id)
-            self._sessions[room_id] = session
+            shard.sessions[room_id] = session
+            if self._session_ttl is not None:
+                heapq.heappush(shard.expiry, (self._deadline(session), room_id))
             return session
 
     async def get(self, room_id: str) -> SessionData | None:
-        async with self._lock:
-            session = self._sessions.get(room_id)
+        shard = self._shard(room_id)
+        async with shard.lock:
+            session = shard.sessions.get(room_id)
             if session is not None and self._is_expired(session):
-                del self._sessions[room_id]
+                del shard.sessions[room_id]
                 return None
             return session
 
     async def remove(self, room_id: str) -> None:
-        async with self._lock:
-            self._sessions.pop(room_id, None)
+        shard = self._shard(room_id)
+        async with shard.lock:
+            shard.sessions.pop(room_id, None)
+
+    async def list_sessions(self) -> list[SessionData]:
+        sessions: list[SessionData] = []
+        for shard in self._shards:
+            async with shard.lock:
+                # Listing visits every session anyway, so check each directly.
+                expired = [
+                    room_id
+                    for room_id, session in shard.sessions.items()
+                    if self._is_expired(session)
+                ]
+                for room_id in expired:
+                    del shard.sessions[room_id]
+                sessions.extend(shard.sessions.values())
+        return sessions
+
+    async def count(self) -> int:
+        await self.evict_expired()
+        return sum(len(shard.sessions) for shard in self._shards)
+
+
+class SQLiteSessionStore(_SweepingStore):
+    """Session store persisted to a SQLite file, so sessions survive restarts.
+
+    Queries run in a worker thread to keep the event loop free. An index on
+    ``last_activity`` makes TTL eviction a range delete; the background
+    sweeper (``start()`` / ``stop()``) runs it periodically.
+
+    Args:
+        path: Database file path (created if missing).
+        session_ttl: Optional TTL in seconds. None means no expiration.
+    """
+
+    def __init__(self, path: str | Path, session_ttl: float | None = None) -> None:
+        self._session_ttl = session_ttl
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn_lock = threading.Lock()
+        with self._conn_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bridge_sessions ("
+                "room_id TEXT PRIMARY KEY, "
+                "created_at REAL NOT NULL, "
+                "last_activity REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS bridge_sessions_last_activity "
+                "ON bridge_sessions (last_activity)"
+            )
+
+    @staticmethod
+    def _to_session(row: tuple[str, float, float]) -> SessionData:
+        room_id, created_at, last_activity = row
+        return SessionData(
+            room_id=room_id,
+            created_at=datetime.fromtimestamp(created_at, timezone.utc),
+            last_activity=datetime.fromtimestamp(last_activity, timezone.utc),
+        )
+
+    def _cutoff(self) -> float | None:
+        if self._session_ttl is None:
+            return None
+        return _utcnow().timestamp() - self._session_ttl
+
+    async def _run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run ``fn`` in a worker thread inside a transaction."""
+
+        def locked() -> _T:
+            with self._conn_lock, self._conn:
+                return fn(*args)
+
+        return await asyncio.to_thread(locked)
+
+    def _get_or_create(self, room_id: str, now: float) -> tuple[str, float, float]:
+        # Upsert then read back in the same transaction; RETURNING would need
+        # SQLite >= 3.35, newer than some distributions ship.
+        self._conn.execute(
+            "INSERT INTO bridge_sessions (room_id, created_at, last_activity) "
+            "VALUES (?, ?, ?) "
+            "ON CONFLICT (room_id) DO UPDATE SET last_activity = excluded.last_activity",
+            (room_id, now, now),
+        )
+        return self._conn.execute(
+            "SELECT room_id, created_at, last_activity FROM bridge_sessions "
+            "WHERE room_id = ?",
+            (room_id,),
+        ).fetchone()
+
+    def _get(
+        self, room_id: str, cutoff: float | None
+    ) -> tuple[str, float, float] | None:
+        row = self._conn.execute(
+            "SELECT room_id, created_at, last_activity FROM bridge_sessions "
+            "WHERE room_id = ?",
+            (room_id,),
+        ).fetchone()
+        if row is not None and cutoff is not None and row[2] < cutoff:
+            self._conn.execute(
+                "DELETE FROM bridge_sessions WHERE room_id = ?", (room_id,)
+            )
+            return None
+        return row
+
+    def _evict(self, cutoff: float) -> int:
+        return self._conn.execute(
+            "DELETE FROM bridge_sessions WHERE last_activity < ?", (cutoff,)
+        ).rowcount
+
+    async def evict_expired(self) -> int:
+        """Delete all sessions past their TTL.
+
+        Returns:
+            Number of sessions evicted.
+        """
+        cutoff = self._cutoff()
+        if cutoff is None:
+            return 0
+        return await self._run(self._evict, cutoff)
+
+    async def get_or_create(self, room_id: str) -> SessionData:
+        row = await self._run(self._get_or_create, room_id, _utcnow().timestamp())
+        return self._to_session(row)
+
+    async def get(self, room_id: str) -> SessionData | None:
+        row = await self._run(self._get, room_id, self._cutoff())
+        return self._to_session(row) if row is not None else None
+
+    async def remove(self, room_id: str) -> None:
+        await self._run(
+            self._conn.execute,
+            "DELETE FROM bridge_sessions WHERE room_id = ?",
+            (room_id,),
+        )
 
     async def list_sessions(self) -> list[SessionData]:
-        async with self._lock:
-            self._evict_expired()
-            return list(self._sessions.values())
+        await self.evict_expired()
+        rows = await self._run(
+            lambda: self._conn.execute(
+                "SELECT room_id, created_at, last_activity FROM bridge_sessions"
+            ).fetchall()
+        )
+        return [self._to_session(row) for row in rows]
 
     async def count(self) -> int:
-        async with self._lock:
-            self._evict_expired()
-            return len(self._sessions)
+        await self.evict_expired()
+        (count,) = await self._run(
+            lambda: self._conn.execute(
+                "SELECT COUNT(*) FROM bridge_sessions"
+            ).fetchone()
+        )
+        return count
+
+    async def stop(self) -> None:
+        """Stop the sweeper and close the database."""
+        await super().stop()
+        with self._conn_lock:
+            self._conn.close()